@@ -14,7 +14,7 @@
 """CLI functionality to interact with pipelines."""
 import json
 import os
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import click
 
@@ -23,7 +23,7 @@ from zenml.cli.cli import TagGroup, cli
 from zenml.cli.utils import list_options
 from zenml.client import Client
 from zenml.console import console
-from zenml.enums import CliCategories
+from zenml.enums import CliCategories, HydrationLevel
 from zenml.logger import get_logger
 from zenml.models import (
     PipelineBuildFilterModel,
@@ -33,7 +33,8 @@ from zenml.models import (
 from zenml.models.pipeline_build_models import PipelineBuildBaseModel
 from zenml.models.schedule_model import ScheduleFilterModel
 from zenml.new.pipelines.pipeline import Pipeline
-from zenml.utils import source_utils, uuid_utils
+from zenml.utils import source_utils, timing_utils, uuid_utils
+from zenml.utils.timing_utils import STEP_TIMINGS_METADATA_KEY
 
 logger = get_logger(__name__)
 
@@ -452,7 +453,9 @@ def list_pipeline_runs(**kwargs: Any) -> None:
     client = Client()
     try:
         with console.status("Listing pipeline runs...\n"):
-            pipeline_runs = client.list_pipeline_runs(**kwargs)
+            pipeline_runs = client.list_pipeline_runs(
+                hydration=HydrationLevel.BODY, **kwargs
+            )
     except KeyError as err:
         cli_utils.error(str(err))
     else:
@@ -502,6 +505,92 @@ def delete_pipeline_run(
         cli_utils.declare(f"Deleted pipeline run '{run_name_or_id}'.")
 
 
+@runs.command(
+    "timings",
+    help="Show how long the phases of the steps of pipeline runs took.",
+)
+@click.argument("run_names_or_ids", type=str, nargs=-1)
+@click.option(
+    "--pipeline",
+    "-p",
+    "pipeline_name_or_id",
+    type=str,
+    required=False,
+    help="Name or ID of a pipeline whose latest runs to report on.",
+)
+@click.option(
+    "--last",
+    "-n",
+    type=int,
+    default=10,
+    help="Number of latest runs of the pipeline to report on.",
+)
+def pipeline_run_timings(
+    run_names_or_ids: Tuple[str, ...],
+    pipeline_name_or_id: Optional[str] = None,
+    last: int = 10,
+) -> None:
+    """Show how long the phases of the steps of pipeline runs took.
+
+    The phase durations of all steps of the given runs are aggregated, so
+    the phases that take up most of the time of the steps are listed first.
+
+    Args:
+        run_names_or_ids: Names or IDs of the pipeline runs.
+        pipeline_name_or_id: Name or ID of a pipeline whose latest runs to
+            report on.
+        last: Number of latest runs of the pipeline to report on.
+    """
+    if bool(run_names_or_ids) == bool(pipeline_name_or_id):
+        cli_utils.error(
+            "Please specify either pipeline runs or a pipeline using the "
+            "`--pipeline` option."
+        )
+
+    client = Client()
+    try:
+        with console.status("Loading pipeline runs...\n"):
+            if pipeline_name_or_id:
+                pipeline_id = client.get_pipeline(pipeline_name_or_id).id
+                pipeline_runs = client.list_pipeline_runs(
+                    pipeline_id=pipeline_id, size=last
+                ).items
+            else:
+                pipeline_runs = [
+                    client.get_pipeline_run(run_name_or_id)
+                    for run_name_or_id in run_names_or_ids
+                ]
+    except KeyError as err:
+        cli_utils.error(str(err))
+
+    step_durations = [
+        step_run.metadata[STEP_TIMINGS_METADATA_KEY].value
+        for pipeline_run in pipeline_runs
+        for step_run in pipeline_run.steps.values()
+        if STEP_TIMINGS_METADATA_KEY in step_run.metadata
+    ]
+    if not step_durations:
+        cli_utils.declare("No step timings found for these pipeline runs.")
+        return
+
+    cli_utils.print_table(
+        [
+            {
+                "PHASE": entry["phase"],
+                "STEPS": entry["steps"],
+                "TOTAL (S)": f"{entry['total']:.3f}",
+                "MEAN (S)": f"{entry['mean']:.3f}",
+                "MAX (S)": f"{entry['max']:.3f}",
+            }
+            for entry in timing_utils.aggregate_durations(step_durations)
+        ],
+        caption=(
+            f"Phase durations of {len(step_durations)} steps of "
+            f"{len(pipeline_runs)} pipeline runs. Phases can be nested."
+        ),
+    )
+
+
 @pipeline.group()
 def builds() -> None:
     """Commands for pipeline builds."""
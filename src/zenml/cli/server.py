@@ -91,6 +91,12 @@ LOCAL_ZENML_SERVER_NAME = "local"
     default=None,
     help="Specify an ngrok auth token to use for exposing the ZenML server.",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="The number of worker processes used to serve requests.",
+)
 def up(
     docker: bool = False,
     ip_address: Union[
@@ -101,6 +107,7 @@ def up(
     connect: bool = False,
     image: Optional[str] = None,
     ngrok_token: Optional[str] = None,
+    workers: Optional[int] = None,
 ) -> None:
     """Start the ZenML dashboard locally and connect the client to it.
 
@@ -116,6 +123,7 @@ def up(
         ngrok_token: An ngrok auth token to use for exposing the ZenML dashboard
             on a public domain. Primarily used for accessing the dashboard in
             Colab.
+        workers: The number of worker processes used to serve requests.
     """
     with event_handler(
         AnalyticsEvent.ZENML_SERVER_STARTED
@@ -163,6 +171,8 @@ def up(
             config_attrs["image"] = image
         if port is not None:
             config_attrs["port"] = port
+        if workers is not None:
+            config_attrs["workers"] = workers
         if ip_address is not None and provider in [
             ServerProviderType.LOCAL,
             ServerProviderType.DOCKER,
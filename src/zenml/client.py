@@ -51,6 +51,8 @@ from zenml.constants import (
 )
 from zenml.enums import (
     ArtifactType,
+    HydrationLevel,
+    LineageDirection,
     LogicalOperators,
     PermissionType,
     SecretScope,
@@ -131,12 +133,17 @@ from zenml.models import (
 )
 from zenml.models.artifact_models import (
     ArtifactFilterModel,
+    ArtifactLineageModel,
     ArtifactResponseModel,
 )
 from zenml.models.base_models import BaseResponseModel
 from zenml.models.constants import TEXT_FIELD_MAX_LENGTH
 from zenml.models.page_model import Page
-from zenml.models.run_metadata_models import RunMetadataFilterModel
+from zenml.models.run_metadata_models import (
+    RunMetadataFilterModel,
+    RunMetadataLeaderboardFilterModel,
+    RunMetadataLeaderboardModel,
+)
 from zenml.models.schedule_model import (
     ScheduleFilterModel,
     ScheduleResponseModel,
@@ -2907,10 +2914,13 @@ class Client(metaclass=ClientMetaClass):
             version: The pipeline version. If left empty, will delete
                 the latest version.
         """
+        from zenml.new.pipelines.compile_cache import PipelineCompileCache
+
         pipeline = self.get_pipeline(
             name_id_or_prefix=name_id_or_prefix, version=version
         )
         self.zen_store.delete_pipeline(pipeline_id=pipeline.id)
+        PipelineCompileCache().remove_pipeline(pipeline.id)
 
     # ----------
     # - BUILDS -
@@ -3287,6 +3297,7 @@ class Client(metaclass=ClientMetaClass):
         end_time: Optional[Union[datetime, str]] = None,
         num_steps: Optional[Union[int, str]] = None,
         unlisted: Optional[bool] = None,
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> Page[PipelineRunResponseModel]:
         """List all pipeline runs.
 
@@ -3313,6 +3324,9 @@ class Client(metaclass=ClientMetaClass):
             end_time: The end_time for the pipeline run
             num_steps: The number of steps for the pipeline run
             unlisted: If the runs should be unlisted or not.
+            hydration: How much of the runs to hydrate. Listing runs on
+                `summary` or `body` level is a lot cheaper as the steps and
+                deployments of the runs are not fetched.
 
         Returns:
             A page with Pipeline Runs fitting the filter description
@@ -3342,7 +3356,9 @@ class Client(metaclass=ClientMetaClass):
             unlisted=unlisted,
         )
         runs_filter_model.set_scope_workspace(self.active_workspace.id)
-        return self.zen_store.list_runs(runs_filter_model=runs_filter_model)
+        return self.zen_store.list_runs(
+            runs_filter_model=runs_filter_model, hydration=hydration
+        )
 
     def list_runs(self, **kwargs: Any) -> Page[PipelineRunResponseModel]:
         """(Deprecated) List all pipeline runs.
@@ -3419,6 +3435,7 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         num_outputs: Optional[Union[int, str]] = None,
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> Page[StepRunResponseModel]:
         """List all pipelines.
 
@@ -3442,6 +3459,7 @@ class Client(metaclass=ClientMetaClass):
             cache_key: The cache_key of the run to filter by.
             status: The name of the run to filter by.
             num_outputs: The number of outputs for the step run
+            hydration: How much of the step runs to hydrate.
 
         Returns:
             A page with Pipeline fitting the filter description
@@ -3469,19 +3487,24 @@ class Client(metaclass=ClientMetaClass):
         )
         step_run_filter_model.set_scope_workspace(self.active_workspace.id)
         return self.zen_store.list_run_steps(
-            step_run_filter_model=step_run_filter_model
+            step_run_filter_model=step_run_filter_model, hydration=hydration
         )
 
-    def get_run_step(self, step_run_id: UUID) -> StepRunResponseModel:
+    def get_run_step(
+        self,
+        step_run_id: UUID,
+        hydration: HydrationLevel = HydrationLevel.FULL,
+    ) -> StepRunResponseModel:
         """Get a step run by ID.
 
         Args:
             step_run_id: The ID of the step run to get.
+            hydration: How much of the step run to hydrate.
 
         Returns:
             The step run.
         """
-        return self.zen_store.get_run_step(step_run_id)
+        return self.zen_store.get_run_step(step_run_id, hydration=hydration)
 
     # -------------
     # - Artifacts -
@@ -3505,6 +3528,7 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         only_unused: Optional[bool] = False,
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> Page[ArtifactResponseModel]:
         """Get all artifacts.
 
@@ -3525,6 +3549,7 @@ class Client(metaclass=ClientMetaClass):
             workspace_id: The id of the workspace to filter by.
             user_id: The  id of the user to filter by.
             only_unused: Only return artifacts that are not used in any runs.
+            hydration: How much of the artifacts to hydrate.
 
         Returns:
             A list of artifacts.
@@ -3548,18 +3573,94 @@ class Client(metaclass=ClientMetaClass):
             only_unused=only_unused,
         )
         artifact_filter_model.set_scope_workspace(self.active_workspace.id)
-        return self.zen_store.list_artifacts(artifact_filter_model)
+        return self.zen_store.list_artifacts(
+            artifact_filter_model, hydration=hydration
+        )
 
-    def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
+    def get_artifact(
+        self,
+        artifact_id: UUID,
+        hydration: HydrationLevel = HydrationLevel.FULL,
+    ) -> ArtifactResponseModel:
         """Get an artifact by ID.
 
         Args:
             artifact_id: The ID of the artifact to get.
+            hydration: How much of the artifact to hydrate.
 
         Returns:
             The artifact.
         """
-        return self.zen_store.get_artifact(artifact_id)
+        return self.zen_store.get_artifact(artifact_id, hydration=hydration)
+
+    def get_artifact_lineage(
+        self,
+        artifact_id: UUID,
+        direction: LineageDirection = LineageDirection.DOWNSTREAM,
+        max_depth: Optional[int] = None,
+    ) -> ArtifactLineageModel:
+        """Get the lineage of an artifact across pipeline runs.
+
+        The lineage is computed by the ZenML store, so answering questions
+        like "which pipeline runs consumed this artifact, directly or
+        transitively" doesn't require a request per step.
+
+        Args:
+            artifact_id: The ID of the artifact.
+            direction: Whether to follow the steps that consumed the artifact
+                (downstream) or the steps that produced it (upstream).
+            max_depth: The maximum number of steps to follow. If not given,
+                the lineage is followed up to `ARTIFACT_LINEAGE_MAX_DEPTH`
+                steps.
+
+        Returns:
+            The lineage of the artifact.
+        """
+        return self.zen_store.get_artifact_lineage(
+            artifact_id, direction=direction, max_depth=max_depth
+        )
+
+    def download_artifact_file(
+        self,
+        artifact_id: UUID,
+        destination: str,
+        path: Optional[str] = None,
+        visualization_index: Optional[int] = None,
+    ) -> None:
+        """Download a file of an artifact to a local path.
+
+        The file is streamed in chunks and never fully loaded into memory.
+        When connected to a ZenML server, the file is streamed by the server,
+        which means no access to the artifact store is required.
+
+        Args:
+            artifact_id: The ID of the artifact of which to download a file.
+            destination: The local path to which to write the file.
+            path: Path of the file relative to the artifact URI. Can be
+                omitted if the artifact URI itself is a file.
+            visualization_index: If given, the file of the visualization with
+                this index is downloaded instead of a file of the artifact
+                data.
+        """
+        if self.zen_store.type == StoreType.REST:
+            from zenml.zen_stores.rest_zen_store import RestZenStore
+
+            cast(RestZenStore, self.zen_store).download_artifact_file(
+                artifact_id=artifact_id,
+                destination=destination,
+                path=path,
+                visualization_index=visualization_index,
+            )
+        else:
+            from zenml.utils.artifact_utils import download_artifact_file
+
+            download_artifact_file(
+                artifact=self.get_artifact(artifact_id),
+                destination=destination,
+                path=path,
+                visualization_index=visualization_index,
+                zen_store=self.zen_store,
+            )
 
     def delete_artifact(
         self,
@@ -3756,6 +3857,8 @@ class Client(metaclass=ClientMetaClass):
         key: Optional[str] = None,
         value: Optional["MetadataType"] = None,
         type: Optional[str] = None,
+        numeric_value: Optional[Union[float, str]] = None,
+        string_value: Optional[str] = None,
     ) -> Page[RunMetadataResponseModel]:
         """List run metadata.
 
@@ -3777,6 +3880,9 @@ class Client(metaclass=ClientMetaClass):
             key: The key of the metadata.
             value: The value of the metadata.
             type: The type of the metadata.
+            numeric_value: The value of numeric metadata. Supports filter
+                operators like `gte:0.9`.
+            string_value: The value of string metadata.
 
         Returns:
             The run metadata.
@@ -3798,10 +3904,63 @@ class Client(metaclass=ClientMetaClass):
             key=key,
             value=value,
             type=type,
+            numeric_value=numeric_value,
+            string_value=string_value,
         )
         metadata_filter_model.set_scope_workspace(self.active_workspace.id)
         return self.zen_store.list_run_metadata(metadata_filter_model)
 
+    def get_run_metadata_leaderboard(
+        self,
+        key: str,
+        pipeline_name_or_id: Optional[Union[str, UUID]] = None,
+        pipeline_version: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        size: int = 10,
+        ascending: bool = False,
+    ) -> RunMetadataLeaderboardModel:
+        """Get the best pipeline runs according to a numeric metadata key.
+
+        The ranking and aggregation happen in the ZenML store, so only the
+        requested number of runs gets transferred. Each run is ranked by its
+        most recently created value for the key.
+
+        Args:
+            key: The numeric metadata key to rank the runs by.
+            pipeline_name_or_id: Name, ID or ID prefix of the pipeline to
+                which the runs should belong.
+            pipeline_version: Version of the pipeline. If not given, the
+                latest version is used.
+            start_time: Only consider metadata created after this time.
+            end_time: Only consider metadata created before this time.
+            size: The number of runs to return.
+            ascending: If `True`, runs with lower values rank higher.
+
+        Returns:
+            The best runs and aggregated statistics of the values of all
+            matching runs.
+        """
+        pipeline_id = None
+        if pipeline_name_or_id:
+            pipeline_id = self.get_pipeline(
+                name_id_or_prefix=pipeline_name_or_id,
+                version=pipeline_version,
+            ).id
+
+        leaderboard_filter_model = RunMetadataLeaderboardFilterModel(
+            key=key,
+            workspace_id=self.active_workspace.id,
+            pipeline_id=pipeline_id,
+            start_time=start_time,
+            end_time=end_time,
+            size=size,
+            ascending=ascending,
+        )
+        return self.zen_store.get_run_metadata_leaderboard(
+            leaderboard_filter_model
+        )
+
     # .---------.
     # | SECRETS |
     # '---------'
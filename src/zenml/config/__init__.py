@@ -24,9 +24,11 @@ deserialization of the configuration options that are stored in the file in
 order to persist the configuration across sessions.
 """
 from zenml.config.docker_settings import DockerSettings
+from zenml.config.input_artifact_settings import InputArtifactSettings
 from zenml.config.resource_settings import ResourceSettings
 
 __all__ = [
     "DockerSettings",
+    "InputArtifactSettings",
     "ResourceSettings",
 ]
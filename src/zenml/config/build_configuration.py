@@ -46,15 +46,24 @@ class BuildConfiguration(BaseModel):
         self,
         stack: "Stack",
         code_repository: Optional["BaseCodeRepository"] = None,
+        source_checksums: Optional[Dict[Optional[str], str]] = None,
     ) -> str:
         """Checksum for all build settings.
 
+        If the source files should be included in the image, the checksum
+        also covers the content of all files inside the source root that are
+        not excluded by the dockerignore file.
+
         Args:
             stack: The stack for which to compute the checksum. This is needed
                 to gather the stack integration requirements in case the
                 Docker settings specify to install them.
             code_repository: Optional code repository that will be used to
                 download files inside the image.
+            source_checksums: Checksums of the source root that were already
+                computed for the same build, keyed by dockerignore file.
+                Missing checksums will be computed and added to this
+                dictionary so the source root only needs to be read once.
 
         Returns:
             The checksum.
@@ -86,6 +95,24 @@ class BuildConfiguration(BaseModel):
         for _, requirements, _ in requirements_files:
             hash_.update(requirements.encode())
 
+        if self.should_include_files(code_repository=code_repository):
+            from zenml.image_builders import BuildContext
+            from zenml.utils import source_utils
+
+            if source_checksums is None:
+                source_checksums = {}
+
+            dockerignore = self.settings.dockerignore
+            if dockerignore not in source_checksums:
+                build_context = BuildContext(
+                    root=source_utils.get_source_root(),
+                    dockerignore_file=dockerignore,
+                )
+                source_checksums[
+                    dockerignore
+                ] = build_context.compute_checksum()
+            hash_.update(source_checksums[dockerignore].encode())
+
         return hash_.hexdigest()
 
     def should_include_files(
@@ -15,3 +15,4 @@
 
 DOCKER_SETTINGS_KEY = "docker"
 RESOURCE_SETTINGS_KEY = "resources"
+INPUT_ARTIFACT_SETTINGS_KEY = "input_artifacts"
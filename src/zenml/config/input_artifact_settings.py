@@ -0,0 +1,55 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Settings class used to configure how step input artifacts are loaded."""
+
+from typing import List
+
+from zenml.config.base_settings import BaseSettings
+
+
+class InputArtifactSettings(BaseSettings):
+    """Settings to configure how the input artifacts of a step are loaded.
+
+    Lazily loaded inputs are passed to the step function as proxies, which
+    only load the artifact data once it is accessed for the first time.
+
+    Usage example:
+
+    ```python
+    from zenml import step
+
+    @step(settings={"input_artifacts": {"lazy_inputs": ["dataset"]}})
+    def my_step(dataset: pd.DataFrame, use_dataset: bool) -> None:
+        if use_dataset:
+            print(dataset.shape)  # The dataset only gets loaded here
+    ```
+
+    Attributes:
+        lazy: Whether all input artifacts should be loaded lazily.
+        lazy_inputs: Names of the inputs that should be loaded lazily.
+    """
+
+    lazy: bool = False
+    lazy_inputs: List[str] = []
+
+    def is_lazy(self, input_name: str) -> bool:
+        """Checks whether an input should be loaded lazily.
+
+        Args:
+            input_name: The name of the input.
+
+        Returns:
+            Whether the input should be loaded lazily.
+        """
+        return self.lazy or input_name in self.lazy_inputs
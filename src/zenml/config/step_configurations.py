@@ -28,14 +28,22 @@ from uuid import UUID
 from pydantic import root_validator, validator
 
 from zenml.config.base_settings import BaseSettings, SettingsOrDict
-from zenml.config.constants import DOCKER_SETTINGS_KEY, RESOURCE_SETTINGS_KEY
+from zenml.config.constants import (
+    DOCKER_SETTINGS_KEY,
+    INPUT_ARTIFACT_SETTINGS_KEY,
+    RESOURCE_SETTINGS_KEY,
+)
 from zenml.config.source import Source, convert_source_validator
 from zenml.config.strict_base_model import StrictBaseModel
 from zenml.logger import get_logger
 from zenml.utils import deprecation_utils
 
 if TYPE_CHECKING:
-    from zenml.config import DockerSettings, ResourceSettings
+    from zenml.config import (
+        DockerSettings,
+        InputArtifactSettings,
+        ResourceSettings,
+    )
 
 logger = get_logger(__name__)
 
@@ -206,6 +214,20 @@ class StepConfiguration(PartialStepConfiguration):
         )
         return DockerSettings.parse_obj(model_or_dict)
 
+    @property
+    def input_artifact_settings(self) -> "InputArtifactSettings":
+        """Input artifact settings of this step configuration.
+
+        Returns:
+            The input artifact settings of this step configuration.
+        """
+        from zenml.config import InputArtifactSettings
+
+        model_or_dict: SettingsOrDict = self.settings.get(
+            INPUT_ARTIFACT_SETTINGS_KEY, {}
+        )
+        return InputArtifactSettings.parse_obj(model_or_dict)
+
 
 class InputSpec(StrictBaseModel):
     """Step input specification."""
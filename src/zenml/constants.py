@@ -52,6 +52,23 @@ def handle_int_env_var(var: str, default: int = 0) -> int:
         return default
 
 
+def handle_float_env_var(var: str, default: float = 0.0) -> float:
+    """Converts normal env var to float.
+
+    Args:
+        var: The environment variable to convert.
+        default: The default value to return if the env var is not set.
+
+    Returns:
+        The converted value.
+    """
+    value = os.getenv(var, "")
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+
 # Global constants
 APP_NAME = "zenml"
 CONFIG_VERSION = "1"
@@ -93,7 +110,27 @@ ENV_ZENML_DISABLE_CLIENT_SERVER_MISMATCH_WARNING = (
 ENV_ZENML_DISABLE_WORKSPACE_WARNINGS = "ZENML_DISABLE_WORKSPACE_WARNINGS"
 ENV_ZENML_SKIP_IMAGE_BUILDER_DEFAULT = "ZENML_SKIP_IMAGE_BUILDER_DEFAULT"
 ENV_ZENML_REQUIRES_CODE_DOWNLOAD = "ZENML_REQUIRES_CODE_DOWNLOAD"
+ENV_ZENML_STEP_WORKER_AUTH_KEY = "ZENML_STEP_WORKER_AUTH_KEY"
+ENV_ZENML_DEPLOYMENT_CACHE_DIR = "ZENML_DEPLOYMENT_CACHE_DIR"
+ENV_ZENML_ARTIFACT_STATISTICS_MAX_ROWS = "ZENML_ARTIFACT_STATISTICS_MAX_ROWS"
+ENV_ZENML_ARTIFACT_STATISTICS_MAX_BYTES = "ZENML_ARTIFACT_STATISTICS_MAX_BYTES"
+ENV_ZENML_ASYNC_ARTIFACT_UPLOAD = "ZENML_ASYNC_ARTIFACT_UPLOAD"
+ENV_ZENML_ARTIFACT_UPLOAD_MAX_WORKERS = "ZENML_ARTIFACT_UPLOAD_MAX_WORKERS"
+ENV_ZENML_INPUT_ARTIFACT_LOAD_MAX_WORKERS = (
+    "ZENML_INPUT_ARTIFACT_LOAD_MAX_WORKERS"
+)
+ENV_ZENML_DISABLE_PIPELINE_COMPILE_CACHE = (
+    "ZENML_DISABLE_PIPELINE_COMPILE_CACHE"
+)
+ENV_ZENML_DISABLE_STEP_TIMING_METADATA = "ZENML_DISABLE_STEP_TIMING_METADATA"
 ENV_ZENML_SERVER = "ZENML_SERVER"
+ENV_ZENML_SERVER_AUTH_CACHE_TTL = "ZENML_SERVER_AUTH_CACHE_TTL"
+ENV_ZENML_SERVER_READ_THREAD_POOL_SIZE = "ZENML_SERVER_READ_THREAD_POOL_SIZE"
+ENV_ZENML_SERVER_METRICS_ENABLED = "ZENML_SERVER_METRICS_ENABLED"
+ENV_ZENML_SERVER_SLOW_REQUEST_THRESHOLD_MS = (
+    "ZENML_SERVER_SLOW_REQUEST_THRESHOLD_MS"
+)
+ENV_ZENML_SERVER_PROFILE_SAMPLE_RATE = "ZENML_SERVER_PROFILE_SAMPLE_RATE"
 ENV_ZENML_HUB_URL = "ZENML_HUB_URL"
 ENV_ZENML_ENFORCE_TYPE_ANNOTATIONS = "ZENML_ENFORCE_TYPE_ANNOTATIONS"
 ENV_ZENML_ENABLE_IMPLICIT_AUTH_METHODS = "ZENML_ENABLE_IMPLICIT_AUTH_METHODS"
@@ -162,6 +199,7 @@ ENFORCE_TYPE_ANNOTATIONS = handle_bool_env_var(
 
 # Services
 DEFAULT_SERVICE_START_STOP_TIMEOUT = 60
+DEFAULT_SERVICE_STATUS_CHECK_TIMEOUT = 10
 DEFAULT_LOCAL_SERVICE_IP_ADDRESS = "127.0.0.1"
 ZEN_SERVER_ENTRYPOINT = "zenml.zen_server.zen_server_api:app"
 
@@ -170,6 +208,7 @@ STEP_SOURCE_PARAMETER_NAME = "step_source"
 # API Endpoint paths:
 API = "/api"
 HEALTH = "/health"
+METRICS = "/metrics"
 VERSION = "/version"
 STACKS_EMPTY = "/stacks-empty"
 STACKS = "/stacks"
@@ -193,12 +232,14 @@ PIPELINE_DEPLOYMENTS = "/pipeline_deployments"
 TRIGGERS = "/triggers"
 RUNS = "/runs"
 RUN_METADATA = "/run-metadata"
+LEADERBOARD = "/leaderboard"
 SCHEDULES = "/schedules"
 DEFAULT_STACK = "/default-stack"
 PIPELINE_SPEC = "/pipeline-spec"
 PIPELINE_CONFIGURATION = "/pipeline-configuration"
 STEP_CONFIGURATION = "/step-configuration"
 GRAPH = "/graph"
+LINEAGE = "/lineage"
 STEPS = "/steps"
 LOGS = "/logs"
 ARTIFACTS = "/artifacts"
@@ -211,8 +252,10 @@ INFO = "/info"
 VERSION_1 = "/v1"
 STATUS = "/status"
 GET_OR_CREATE = "/get-or-create"
+BATCH = "/batch"
 SECRETS = "/secrets"
 VISUALIZE = "/visualize"
+DOWNLOAD = "/download"
 CODE_REPOSITORIES = "/code_repositories"
 SERVICE_CONNECTORS = "/service_connectors"
 SERVICE_CONNECTOR_TYPES = "/service_connector_types"
@@ -244,6 +287,40 @@ PAGE_SIZE_MAXIMUM: int = handle_int_env_var(
 )
 FILTERING_DATETIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
 
+# Maximum number of steps followed when querying the lineage of an artifact
+# without a maximum depth. This also bounds the lineage query if artifacts
+# are linked in a cycle.
+ARTIFACT_LINEAGE_MAX_DEPTH: int = 1000
+
+# Server authentication cache defaults. The cache is kept in the memory of
+# each server worker process, so revoked credentials and changed permissions
+# are only picked up by the other workers and replicas once their cached
+# entries expire. The TTL therefore bounds how long such changes take to
+# apply everywhere.
+AUTH_CACHE_TTL: int = handle_int_env_var(
+    ENV_ZENML_SERVER_AUTH_CACHE_TTL, default=5
+)
+AUTH_CACHE_MAX_SIZE: int = 10000
+
+# Maximum number of threads used to concurrently serve heavy read requests
+READ_THREAD_POOL_SIZE: int = handle_int_env_var(
+    ENV_ZENML_SERVER_READ_THREAD_POOL_SIZE, default=10
+)
+
+# Server request metrics and profiling defaults
+SERVER_METRICS_ENABLED: bool = handle_bool_env_var(
+    ENV_ZENML_SERVER_METRICS_ENABLED, default=False
+)
+SLOW_REQUEST_THRESHOLD_MS: int = handle_int_env_var(
+    ENV_ZENML_SERVER_SLOW_REQUEST_THRESHOLD_MS, default=1000
+)
+PROFILE_SAMPLE_RATE: float = handle_float_env_var(
+    ENV_ZENML_SERVER_PROFILE_SAMPLE_RATE, default=0.01
+)
+
+# Size of the chunks in which artifact files are streamed
+ARTIFACT_FILE_CHUNK_SIZE: int = 1024 * 1024
+
 # Metadata constants
 METADATA_ORCHESTRATOR_URL = "orchestrator_url"
 METADATA_EXPERIMENT_TRACKER_URL = "experiment_tracker_url"
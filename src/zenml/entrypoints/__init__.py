@@ -19,5 +19,12 @@ from zenml.entrypoints.pipeline_entrypoint_configuration import (
 from zenml.entrypoints.step_entrypoint_configuration import (
     StepEntrypointConfiguration,
 )
+from zenml.entrypoints.step_worker_entrypoint_configuration import (
+    StepWorkerEntrypointConfiguration,
+)
 
-__all__ = ["StepEntrypointConfiguration", "PipelineEntrypointConfiguration"]
+__all__ = [
+    "StepEntrypointConfiguration",
+    "PipelineEntrypointConfiguration",
+    "StepWorkerEntrypointConfiguration",
+]
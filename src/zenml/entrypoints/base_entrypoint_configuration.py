@@ -27,7 +27,12 @@ from zenml.constants import (
     handle_bool_env_var,
 )
 from zenml.logger import get_logger
-from zenml.utils import code_repository_utils, source_utils, uuid_utils
+from zenml.utils import (
+    code_repository_utils,
+    deployment_cache_utils,
+    source_utils,
+    uuid_utils,
+)
 
 if TYPE_CHECKING:
     from zenml.models import (
@@ -188,7 +193,7 @@ class BaseEntrypointConfiguration(ABC):
             The deployment.
         """
         deployment_id = UUID(self.entrypoint_args[DEPLOYMENT_ID_OPTION])
-        return Client().zen_store.get_deployment(deployment_id=deployment_id)
+        return deployment_cache_utils.load_deployment(deployment_id)
 
     def download_code_if_necessary(
         self, deployment: "PipelineDeploymentResponseModel"
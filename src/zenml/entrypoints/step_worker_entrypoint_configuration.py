@@ -0,0 +1,89 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Entrypoint configuration for long-running step workers."""
+import os
+from multiprocessing.connection import Listener
+from typing import Any, List, Set
+
+from zenml.constants import ENV_ZENML_STEP_WORKER_AUTH_KEY
+from zenml.entrypoints.base_entrypoint_configuration import (
+    BaseEntrypointConfiguration,
+)
+from zenml.integrations.registry import integration_registry
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+PORT_OPTION = "port"
+
+
+class StepWorkerEntrypointConfiguration(BaseEntrypointConfiguration):
+    """Entrypoint configuration for long-running step workers.
+
+    Instead of running a single step, this entrypoint prepares everything
+    required to run the steps of a deployment and then listens on a port for
+    steps to execute. The authentication key for the connection needs to be
+    passed in the `ZENML_STEP_WORKER_AUTH_KEY` environment variable.
+    """
+
+    @classmethod
+    def get_entrypoint_options(cls) -> Set[str]:
+        """Gets all options required for running with this configuration.
+
+        Returns:
+            The superclass options as well as an option for the port on which
+            the worker listens.
+        """
+        return super().get_entrypoint_options() | {PORT_OPTION}
+
+    @classmethod
+    def get_entrypoint_arguments(
+        cls,
+        **kwargs: Any,
+    ) -> List[str]:
+        """Gets all arguments that the entrypoint command should be called with.
+
+        Args:
+            **kwargs: Kwargs, must include the port.
+
+        Returns:
+            The superclass arguments as well as arguments for the port on which
+            the worker listens.
+        """
+        return super().get_entrypoint_arguments(**kwargs) + [
+            f"--{PORT_OPTION}",
+            str(kwargs[PORT_OPTION]),
+        ]
+
+    def run(self) -> None:
+        """Warms up the worker and runs all steps it receives."""
+        from zenml.orchestrators.step_worker import StepWorker
+
+        deployment = self.load_deployment()
+
+        # Activate all the integrations. This makes sure that all materializers
+        # and stack component flavors are registered.
+        integration_registry.activate_integrations()
+
+        self.download_code_if_necessary(deployment=deployment)
+
+        worker = StepWorker()
+        worker.warm_up(deployment)
+
+        auth_key = os.environ[ENV_ZENML_STEP_WORKER_AUTH_KEY].encode()
+        address = ("0.0.0.0", int(self.entrypoint_args[PORT_OPTION]))  # nosec
+        with Listener(address, authkey=auth_key) as listener:
+            logger.debug("Step worker listening on port %s.", address[1])
+            with listener.accept() as connection:
+                worker.serve(connection)
@@ -48,6 +48,35 @@ class ExecutionStatus(StrEnum):
     CACHED = "cached"
 
 
+class HydrationLevel(StrEnum):
+    """How much of a response model gets hydrated.
+
+    - `summary`: Only the fields of the entity itself and its user and
+        workspace.
+    - `body`: Also lightweight related entities and metadata, e.g. the
+        pipeline and stack of a pipeline run.
+    - `full`: Everything, including heavy related entities like the
+        deployment and steps of a pipeline run.
+    """
+
+    SUMMARY = "summary"
+    BODY = "body"
+    FULL = "full"
+
+
+class LineageDirection(StrEnum):
+    """Direction in which the lineage of an artifact is followed.
+
+    - `upstream`: The steps that produced the artifact, the artifacts they
+        consumed, the steps that produced those, and so on.
+    - `downstream`: The steps that consumed the artifact, the artifacts they
+        produced, the steps that consumed those, and so on.
+    """
+
+    UPSTREAM = "upstream"
+    DOWNSTREAM = "downstream"
+
+
 class LoggingLevels(Enum):
     """Enum for logging levels."""
 
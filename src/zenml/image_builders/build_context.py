@@ -13,7 +13,10 @@
 #  permissions and limitations under the License.
 """Image build context."""
 
+import hashlib
+import json
 import os
+import tempfile
 from pathlib import Path
 from typing import IO, Dict, List, Optional, Set, Tuple, cast
 
@@ -24,6 +27,12 @@ from zenml.utils import io_utils, string_utils
 
 logger = get_logger(__name__)
 
+BUILD_CONTEXT_MANIFESTS_DIRECTORY_NAME = "build_context_manifests"
+
+# A manifest entry for a file in the build context root directory, consisting
+# of the file size, the modification time in ns and the MD5 content hash
+ManifestEntry = Tuple[int, int, str]
+
 
 class BuildContext:
     """Image build context.
@@ -151,6 +160,126 @@ class BuildContext:
                 os.path.join(self._root, ".dockerignore"),
             )
 
+    def compute_checksum(self) -> str:
+        """Computes a checksum of the contents of the build context.
+
+        The checksum includes the paths and contents of all files inside the
+        build context root directory that are not excluded by the dockerignore
+        file, as well as all extra files. To avoid reading and hashing all
+        files of the root directory each time, the content hashes are stored
+        in a manifest inside the global config directory and only recomputed
+        for files whose size or modification time changed.
+
+        Returns:
+            The checksum.
+        """
+        hash_ = hashlib.md5()
+
+        if self._root:
+            manifest = self._load_manifest()
+            updated_manifest: Dict[str, ManifestEntry] = {}
+
+            for file_path in sorted(self._get_files()):
+                full_path = os.path.join(self._root, file_path)
+                hash_.update(Path(file_path).as_posix().encode())
+
+                if os.path.isdir(full_path):
+                    continue
+
+                stat = os.stat(full_path)
+                entry = manifest.get(file_path)
+                if not (
+                    entry
+                    and entry[0] == stat.st_size
+                    and entry[1] == stat.st_mtime_ns
+                ):
+                    entry = (
+                        stat.st_size,
+                        stat.st_mtime_ns,
+                        self._compute_file_hash(full_path),
+                    )
+
+                updated_manifest[file_path] = entry
+                hash_.update(entry[2].encode())
+
+            if updated_manifest != manifest:
+                self._write_manifest(updated_manifest)
+
+        for destination, content in sorted(self._get_extra_files()):
+            hash_.update(destination.encode())
+            hash_.update(content.encode())
+
+        return hash_.hexdigest()
+
+    @staticmethod
+    def _compute_file_hash(file_path: str) -> str:
+        """Computes the MD5 hash of a file.
+
+        Args:
+            file_path: Path of the file.
+
+        Returns:
+            The hash of the file content.
+        """
+        hash_ = hashlib.md5()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hash_.update(chunk)
+
+        return hash_.hexdigest()
+
+    @property
+    def _manifest_path(self) -> str:
+        """Path of the manifest file for the build context root directory.
+
+        Returns:
+            The manifest path.
+        """
+        assert self._root
+        root_hash = hashlib.md5(
+            os.path.abspath(self._root).encode()
+        ).hexdigest()
+        return os.path.join(
+            io_utils.get_global_config_directory(),
+            BUILD_CONTEXT_MANIFESTS_DIRECTORY_NAME,
+            f"{root_hash}.json",
+        )
+
+    def _load_manifest(self) -> Dict[str, ManifestEntry]:
+        """Loads the manifest of the build context root directory.
+
+        Returns:
+            The manifest entries by file path. If no manifest exists or it
+            could not be read, an empty dictionary is returned.
+        """
+        try:
+            with open(self._manifest_path, "r") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        return {
+            file_path: (entry[0], entry[1], entry[2])
+            for file_path, entry in manifest.items()
+        }
+
+    def _write_manifest(self, manifest: Dict[str, ManifestEntry]) -> None:
+        """Writes the manifest of the build context root directory.
+
+        Args:
+            manifest: The manifest entries by file path.
+        """
+        manifest_path = self._manifest_path
+        manifest_dir = os.path.dirname(manifest_path)
+        try:
+            os.makedirs(manifest_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=manifest_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(manifest, f)
+            os.replace(tmp_path, manifest_path)
+        except OSError as e:
+            logger.debug("Unable to write build context manifest: %s", e)
+
     def _get_files(self) -> Set[str]:
         """Gets all non-ignored files in the build context root directory.
 
@@ -14,7 +14,6 @@
 """Materializer for BentoML Bento objects."""
 
 import os
-import tempfile
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple, Type
 
 import bentoml
@@ -23,10 +22,8 @@ from bentoml.exceptions import BentoMLException
 
 from zenml.enums import ArtifactType
 from zenml.integrations.bentoml.constants import DEFAULT_BENTO_FILENAME
-from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.utils import io_utils
 
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
@@ -49,23 +46,28 @@ class BentoMaterializer(BaseMaterializer):
         Returns:
             An bento.Bento object.
         """
-        # Create a temporary directory to store the model
-        temp_dir = tempfile.TemporaryDirectory()
 
-        # Copy from artifact store to temporary directory
-        io_utils.copy_dir(self.uri, temp_dir.name)
+        def _import_bento(path: str) -> bento.Bento:
+            """Imports a Bento from a local directory.
 
-        # Load the Bento from the temporary directory
-        imported_bento = Bento.import_from(
-            os.path.join(temp_dir.name, DEFAULT_BENTO_FILENAME)
-        )
+            Args:
+                path: The local directory.
+
+            Returns:
+                The imported Bento.
+            """
+            imported_bento = Bento.import_from(
+                os.path.join(path, DEFAULT_BENTO_FILENAME)
+            )
 
-        # Try save the Bento to the local BentoML store
-        try:
-            _ = bentoml.get(imported_bento.tag)
-        except BentoMLException:
-            imported_bento.save()
-        return imported_bento
+            # Try save the Bento to the local BentoML store
+            try:
+                _ = bentoml.get(imported_bento.tag)
+            except BentoMLException:
+                imported_bento.save()
+            return imported_bento
+
+        return self.load_from_local_directory(self.uri, _import_bento)
 
     def save(self, bento: bento.Bento) -> None:
         """Write to artifact store.
@@ -73,18 +75,12 @@ class BentoMaterializer(BaseMaterializer):
         Args:
             bento: An bento.Bento object.
         """
-        # Create a temporary directory to store the model
-        temp_dir = tempfile.TemporaryDirectory(prefix="zenml-temp-")
-        temp_bento_path = os.path.join(temp_dir.name, DEFAULT_BENTO_FILENAME)
-
-        # save the image in a temporary directory
-        bentoml.export_bento(bento.tag, temp_bento_path)
-
-        # copy the saved image to the artifact store
-        io_utils.copy_dir(temp_dir.name, self.uri)
-
-        # Remove the temporary directory
-        fileio.rmtree(temp_dir.name)
+        self.save_to_local_directory(
+            self.uri,
+            lambda path: bentoml.export_bento(
+                bento.tag, os.path.join(path, DEFAULT_BENTO_FILENAME)
+            ),
+        )
 
     def extract_metadata(
         self, bento: bento.Bento
@@ -14,7 +14,6 @@
 """Implementation of the BentoML Model Deployer."""
 import os
 import shutil
-from pathlib import Path
 from typing import ClassVar, Dict, List, Optional, Type, cast
 from uuid import UUID
 
@@ -32,7 +31,10 @@ from zenml.integrations.bentoml.services.bentoml_deployment import (
 from zenml.logger import get_logger
 from zenml.model_deployers import BaseModelDeployer, BaseModelDeployerFlavor
 from zenml.services import ServiceRegistry
-from zenml.services.local.local_service import SERVICE_DAEMON_CONFIG_FILE_NAME
+from zenml.services.local.local_service_index import (
+    LocalServiceIndex,
+    update_service_statuses,
+)
 from zenml.services.service import BaseService, ServiceConfig
 from zenml.utils.io_utils import create_dir_recursive_if_not_exists
 
@@ -48,6 +50,7 @@ class BentoMLModelDeployer(BaseModelDeployer):
     ] = BentoMLModelDeployerFlavor
 
     _service_path: Optional[str] = None
+    _service_index: Optional[LocalServiceIndex] = None
 
     @property
     def config(self) -> BentoMLModelDeployerConfig:
@@ -102,6 +105,17 @@ class BentoMLModelDeployer(BaseModelDeployer):
         create_dir_recursive_if_not_exists(self._service_path)
         return self._service_path
 
+    @property
+    def service_index(self) -> LocalServiceIndex:
+        """Returns the index of the services stored in the local path.
+
+        Returns:
+            The index of the local services.
+        """
+        if self._service_index is None:
+            self._service_index = LocalServiceIndex(self.local_path)
+        return self._service_index
+
     @staticmethod
     def get_model_server_info(  # type: ignore[override]
         service_instance: "BentoMLDeploymentService",
@@ -221,6 +235,7 @@ class BentoMLModelDeployer(BaseModelDeployer):
             service.stop(timeout=timeout, force=True)
             service.update(config)
             service.start(timeout=timeout)
+            self.service_index.add(service)
         else:
             # create a new BentoMLDeploymentService instance
             service = self._create_new_service(timeout, config)
@@ -240,6 +255,7 @@ class BentoMLModelDeployer(BaseModelDeployer):
         # delete the old configuration file
         if existing_service.status.runtime_path:
             shutil.rmtree(existing_service.status.runtime_path)
+        self.service_index.remove(existing_service.uuid)
 
     # the step will receive a config from the user that mentions the number
     # of workers etc.the step implementation will create a new config using
@@ -263,6 +279,7 @@ class BentoMLModelDeployer(BaseModelDeployer):
         # create a new service for the new model
         service = BentoMLDeploymentService(config)
         service.start(timeout=timeout)
+        self.service_index.add(service)
 
         return service
 
@@ -301,7 +318,7 @@ class BentoMLModelDeployer(BaseModelDeployer):
         Raises:
             TypeError: if any of the input arguments are of an invalid type.
         """
-        services = []
+        services: List[BaseService] = []
         config = BentoMLDeploymentConfig(
             model_name=model_name or "",
             bento="",
@@ -314,39 +331,42 @@ class BentoMLModelDeployer(BaseModelDeployer):
             pipeline_step_name=pipeline_step_name or "",
         )
 
-        # find all services that match the input criteria
-        for root, _, files in os.walk(self.local_path):
-            if service_uuid and Path(root).name != str(service_uuid):
+        # find all services that match the input criteria, the index is used
+        # to only load the configuration of potentially matching services
+        for service_config_path in self.service_index.find(
+            service_uuid=service_uuid,
+            pipeline_name=pipeline_name,
+            pipeline_step_name=pipeline_step_name,
+            model_name=model_name,
+        ):
+            logger.debug(
+                "Loading service daemon configuration from %s",
+                service_config_path,
+            )
+            try:
+                with open(service_config_path, "r") as f:
+                    existing_service_config = f.read()
+            except FileNotFoundError:
+                # the service was deleted in the meantime
                 continue
-            for file in files:
-                if file == SERVICE_DAEMON_CONFIG_FILE_NAME:
-                    service_config_path = os.path.join(root, file)
-                    logger.debug(
-                        "Loading service daemon configuration from %s",
-                        service_config_path,
-                    )
-                    existing_service_config = None
-                    with open(service_config_path, "r") as f:
-                        existing_service_config = f.read()
-                    existing_service = (
-                        ServiceRegistry().load_service_from_json(
-                            existing_service_config
-                        )
-                    )
-                    if not isinstance(
-                        existing_service, BentoMLDeploymentService
-                    ):
-                        raise TypeError(
-                            f"Expected service type BentoMLDeploymentService but got "
-                            f"{type(existing_service)} instead"
-                        )
-                    existing_service.update_status()
-                    if self._matches_search_criteria(existing_service, config):
-                        if not running or existing_service.is_running:
-                            services.append(
-                                cast(BaseService, existing_service)
-                            )
-
+            existing_service = ServiceRegistry().load_service_from_json(
+                existing_service_config
+            )
+            if not isinstance(existing_service, BentoMLDeploymentService):
+                raise TypeError(
+                    f"Expected service type BentoMLDeploymentService but got "
+                    f"{type(existing_service)} instead"
+                )
+            if self._matches_search_criteria(existing_service, config):
+                services.append(cast(BaseService, existing_service))
+
+        # only the matching services are checked, concurrently and with a
+        # timeout, as checking the status involves health check requests
+        updated_services = update_service_statuses(services)
+        if running:
+            return [
+                service for service in updated_services if service.is_running
+            ]
         return services
 
     def _matches_search_criteria(
@@ -15,17 +15,15 @@
 
 import os
 from collections import defaultdict
-from tempfile import TemporaryDirectory, mkdtemp
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple, Type, Union
 
 from datasets import Dataset, load_from_disk
 from datasets.dataset_dict import DatasetDict
 
 from zenml.enums import ArtifactType
-from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.materializers.pandas_materializer import PandasMaterializer
-from zenml.utils import io_utils
+from zenml.utils import statistics_utils
 
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
@@ -40,6 +38,7 @@ class HFDatasetMaterializer(BaseMaterializer):
     ASSOCIATED_ARTIFACT_TYPE: ClassVar[
         ArtifactType
     ] = ArtifactType.DATA_ANALYSIS
+    EXTRACT_METADATA_CONCURRENTLY: ClassVar[bool] = True
 
     def load(
         self, data_type: Union[Type[Dataset], Type[DatasetDict]]
@@ -52,12 +51,12 @@ class HFDatasetMaterializer(BaseMaterializer):
         Returns:
             The dataset read from the specified dir.
         """
-        temp_dir = mkdtemp()
-        io_utils.copy_dir(
+        return self.load_from_local_directory(
             os.path.join(self.uri, DEFAULT_DATASET_DIR),
-            temp_dir,
+            load_from_disk,
+            # The dataset memory-maps its files and reads them lazily
+            lazy=True,
         )
-        return load_from_disk(temp_dir)
 
     def save(self, ds: Union[Dataset, DatasetDict]) -> None:
         """Writes a Dataset to the specified dir.
@@ -65,16 +64,9 @@ class HFDatasetMaterializer(BaseMaterializer):
         Args:
             ds: The Dataset to write.
         """
-        temp_dir = TemporaryDirectory()
-        path = os.path.join(temp_dir.name, DEFAULT_DATASET_DIR)
-        try:
-            ds.save_to_disk(path)
-            io_utils.copy_dir(
-                path,
-                os.path.join(self.uri, DEFAULT_DATASET_DIR),
-            )
-        finally:
-            fileio.rmtree(temp_dir.name)
+        self.save_to_local_directory(
+            os.path.join(self.uri, DEFAULT_DATASET_DIR), ds.save_to_disk
+        )
 
     def extract_metadata(
         self, ds: Union[Dataset, DatasetDict]
@@ -90,16 +82,44 @@ class HFDatasetMaterializer(BaseMaterializer):
         Raises:
             ValueError: If the given object is not a `Dataset` or `DatasetDict`.
         """
-        pandas_materializer = PandasMaterializer(self.uri)
         if isinstance(ds, Dataset):
-            return pandas_materializer.extract_metadata(ds.to_pandas())
+            return self._extract_dataset_metadata(ds)
         elif isinstance(ds, DatasetDict):
             metadata: Dict[str, Dict[str, "MetadataType"]] = defaultdict(dict)
             for dataset_name, dataset in ds.items():
-                dataset_metadata = pandas_materializer.extract_metadata(
-                    dataset.to_pandas()
-                )
+                dataset_metadata = self._extract_dataset_metadata(dataset)
                 for key, value in dataset_metadata.items():
                     metadata[key][dataset_name] = value
             return dict(metadata)
         raise ValueError(f"Unsupported type {type(ds)}")
+
+    def _extract_dataset_metadata(
+        self, dataset: Dataset
+    ) -> Dict[str, "MetadataType"]:
+        """Extract metadata from a single `Dataset` object.
+
+        Only the rows that fit into the statistics budget get converted to
+        pandas to compute the statistics.
+
+        Args:
+            dataset: The `Dataset` object to extract metadata from.
+
+        Returns:
+            The extracted metadata as a dictionary.
+        """
+        num_rows = dataset.num_rows
+        indices = None
+        if num_rows > 0:
+            indices = statistics_utils.sample_indices(
+                num_rows=num_rows, row_size=dataset.data.nbytes // num_rows
+            )
+        if indices is not None:
+            dataset = dataset.select(indices)
+
+        metadata = PandasMaterializer(self.uri).extract_metadata(
+            dataset.to_pandas()
+        )
+        if indices is not None:
+            metadata["shape"] = (num_rows, dataset.num_columns)
+            metadata[statistics_utils.SAMPLE_SIZE_METADATA_KEY] = len(indices)
+        return metadata
@@ -15,7 +15,6 @@
 
 import importlib
 import os
-from tempfile import TemporaryDirectory
 from typing import Any, ClassVar, Dict, Tuple, Type
 
 from transformers import AutoConfig, TFPreTrainedModel  # type: ignore [import]
@@ -23,7 +22,6 @@ from transformers import AutoConfig, TFPreTrainedModel  # type: ignore [import]
 from zenml.enums import ArtifactType
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.metadata.metadata_types import MetadataType
-from zenml.utils import io_utils
 
 DEFAULT_TF_MODEL_DIR = "hf_tf_model"
 
@@ -43,17 +41,26 @@ class HFTFModelMaterializer(BaseMaterializer):
         Returns:
             The model read from the specified dir.
         """
-        temp_dir = TemporaryDirectory()
-        io_utils.copy_dir(
-            os.path.join(self.uri, DEFAULT_TF_MODEL_DIR), temp_dir.name
-        )
 
-        config = AutoConfig.from_pretrained(temp_dir.name)
-        architecture = "TF" + config.architectures[0]
-        model_cls = getattr(
-            importlib.import_module("transformers"), architecture
+        def _load(path: str) -> Any:
+            """Loads the model from a local directory.
+
+            Args:
+                path: The local directory.
+
+            Returns:
+                The model.
+            """
+            config = AutoConfig.from_pretrained(path)
+            architecture = "TF" + config.architectures[0]
+            model_cls = getattr(
+                importlib.import_module("transformers"), architecture
+            )
+            return model_cls.from_pretrained(path)
+
+        return self.load_from_local_directory(
+            os.path.join(self.uri, DEFAULT_TF_MODEL_DIR), _load
         )
-        return model_cls.from_pretrained(temp_dir.name)
 
     def save(self, model: TFPreTrainedModel) -> None:
         """Writes a Model to the specified dir.
@@ -61,11 +68,8 @@ class HFTFModelMaterializer(BaseMaterializer):
         Args:
             model: The TF Model to write.
         """
-        temp_dir = TemporaryDirectory()
-        model.save_pretrained(temp_dir.name)
-        io_utils.copy_dir(
-            temp_dir.name,
-            os.path.join(self.uri, DEFAULT_TF_MODEL_DIR),
+        self.save_to_local_directory(
+            os.path.join(self.uri, DEFAULT_TF_MODEL_DIR), model.save_pretrained
         )
 
     def extract_metadata(
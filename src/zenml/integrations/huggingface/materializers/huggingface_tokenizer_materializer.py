@@ -14,7 +14,6 @@
 """Implementation of the Huggingface tokenizer materializer."""
 
 import os
-from tempfile import TemporaryDirectory
 from typing import Any, ClassVar, Tuple, Type
 
 from transformers import AutoTokenizer  # type: ignore [import]
@@ -24,7 +23,6 @@ from transformers.tokenization_utils_base import (  # type: ignore [import]
 
 from zenml.enums import ArtifactType
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.utils import io_utils
 
 DEFAULT_TOKENIZER_DIR = "hf_tokenizer"
 
@@ -46,22 +44,18 @@ class HFTokenizerMaterializer(BaseMaterializer):
         Returns:
             The tokenizer read from the specified dir.
         """
-        temp_dir = TemporaryDirectory()
-        io_utils.copy_dir(
-            os.path.join(self.uri, DEFAULT_TOKENIZER_DIR), temp_dir.name
+        return self.load_from_local_directory(
+            os.path.join(self.uri, DEFAULT_TOKENIZER_DIR),
+            AutoTokenizer.from_pretrained,
         )
 
-        return AutoTokenizer.from_pretrained(temp_dir.name)
-
     def save(self, tokenizer: Type[Any]) -> None:
         """Writes a Tokenizer to the specified dir.
 
         Args:
             tokenizer: The HFTokenizer to write.
         """
-        temp_dir = TemporaryDirectory()
-        tokenizer.save_pretrained(temp_dir.name)
-        io_utils.copy_dir(
-            temp_dir.name,
+        self.save_to_local_directory(
             os.path.join(self.uri, DEFAULT_TOKENIZER_DIR),
+            tokenizer.save_pretrained,
         )
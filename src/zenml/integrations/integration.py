@@ -15,11 +15,10 @@
 
 from typing import Any, Dict, List, Optional, Tuple, Type, cast
 
-import pkg_resources
-
 from zenml.integrations.registry import integration_registry
 from zenml.logger import get_logger
 from zenml.stack.flavor import Flavor
+from zenml.utils import requirement_utils
 
 logger = get_logger(__name__)
 
@@ -58,29 +57,25 @@ class Integration(metaclass=IntegrationMeta):
     def check_installation(cls) -> bool:
         """Method to check whether the required packages are installed.
 
+        The results of this check are cached for the current Python
+        environment, see `zenml.utils.requirement_utils.is_installed`.
+
         Returns:
             True if all required packages are installed, False otherwise.
         """
-        try:
-            for r in cls.get_requirements():
-                pkg_resources.get_distribution(r)
+        requirements = cls.get_requirements()
+        if requirement_utils.is_installed(requirements):
             logger.debug(
                 f"Integration {cls.NAME} is installed correctly with "
-                f"requirements {cls.get_requirements()}."
+                f"requirements {requirements}."
             )
             return True
-        except pkg_resources.DistributionNotFound as e:
-            logger.debug(
-                f"Unable to find required package '{e.req}' for "
-                f"integration {cls.NAME}."
-            )
-            return False
-        except pkg_resources.VersionConflict as e:
-            logger.debug(
-                f"VersionConflict error when loading installation {cls.NAME}: "
-                f"{str(e)}"
-            )
-            return False
+
+        logger.debug(
+            f"Unable to find all required packages {requirements} for "
+            f"integration {cls.NAME}."
+        )
+        return False
 
     @classmethod
     def get_requirements(cls, target_os: Optional[str] = None) -> List[str]:
@@ -13,16 +13,13 @@
 #  permissions and limitations under the License.
 """Implementation of the TensorFlow Keras materializer."""
 
-import tempfile
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple, Type
 
 from tensorflow import keras
 from tensorflow.python.keras.utils.layer_utils import count_params
 
 from zenml.enums import ArtifactType
-from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.utils import io_utils
 
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
@@ -35,7 +32,7 @@ class KerasMaterializer(BaseMaterializer):
     ASSOCIATED_ARTIFACT_TYPE: ClassVar[ArtifactType] = ArtifactType.MODEL
 
     def load(self, data_type: Type[Any]) -> keras.Model:
-        """Reads and returns a Keras model after copying it to temporary path.
+        """Reads and returns a Keras model.
 
         Args:
             data_type: The type of the data to read.
@@ -43,19 +40,9 @@ class KerasMaterializer(BaseMaterializer):
         Returns:
             A tf.keras.Model model.
         """
-        # Create a temporary directory to store the model
-        temp_dir = tempfile.TemporaryDirectory()
-
-        # Copy from artifact store to temporary directory
-        io_utils.copy_dir(self.uri, temp_dir.name)
-
-        # Load the model from the temporary directory
-        model = keras.models.load_model(temp_dir.name)
-
-        # Cleanup and return
-        fileio.rmtree(temp_dir.name)
-
-        return model
+        return self.load_from_local_directory(
+            self.uri, keras.models.load_model
+        )
 
     def save(self, model: keras.Model) -> None:
         """Writes a keras model to the artifact store.
@@ -63,13 +50,7 @@ class KerasMaterializer(BaseMaterializer):
         Args:
             model: A tf.keras.Model model.
         """
-        # Create a temporary directory to store the model
-        temp_dir = tempfile.TemporaryDirectory()
-        model.save(temp_dir.name)
-        io_utils.copy_dir(temp_dir.name, self.uri)
-
-        # Remove the temporary directory
-        fileio.rmtree(temp_dir.name)
+        self.save_to_local_directory(self.uri, model.save)
 
     def extract_metadata(
         self, model: keras.Model
@@ -14,15 +14,12 @@
 """Implementation of the TensorFlow dataset materializer."""
 
 import os
-import tempfile
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple, Type
 
 import tensorflow as tf
 
 from zenml.enums import ArtifactType
-from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
-from zenml.utils import io_utils
 
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
@@ -45,13 +42,15 @@ class TensorflowDatasetMaterializer(BaseMaterializer):
         Returns:
             A tf.data.Dataset object.
         """
-        temp_dir = tempfile.mkdtemp()
-        io_utils.copy_dir(self.uri, temp_dir)
-        path = os.path.join(temp_dir, DEFAULT_FILENAME)
-        dataset = tf.data.experimental.load(path)
-        # Don't delete the temporary directory here as the dataset is lazily
-        # loaded and needs to read it when the object gets used
-        return dataset
+        return self.load_from_local_directory(
+            self.uri,
+            lambda path: tf.data.experimental.load(
+                os.path.join(path, DEFAULT_FILENAME)
+            ),
+            # The dataset is lazily loaded and reads the files when it gets
+            # used
+            lazy=True,
+        )
 
     def save(self, dataset: tf.data.Dataset) -> None:
         """Persists a tf.data.Dataset object.
@@ -59,15 +58,15 @@ class TensorflowDatasetMaterializer(BaseMaterializer):
         Args:
             dataset: The dataset to persist.
         """
-        temp_dir = tempfile.TemporaryDirectory()
-        path = os.path.join(temp_dir.name, DEFAULT_FILENAME)
-        try:
-            tf.data.experimental.save(
-                dataset, path, compression=None, shard_func=None
-            )
-            io_utils.copy_dir(temp_dir.name, self.uri)
-        finally:
-            fileio.rmtree(temp_dir.name)
+        self.save_to_local_directory(
+            self.uri,
+            lambda path: tf.data.experimental.save(
+                dataset,
+                os.path.join(path, DEFAULT_FILENAME),
+                compression=None,
+                shard_func=None,
+            ),
+        )
 
     def extract_metadata(
         self, dataset: tf.data.Dataset
@@ -16,7 +16,7 @@ import os
 from typing import Any, Callable, Iterable, List, Optional, Tuple, Type
 
 # this import required for CI to get local filesystem
-from zenml.io import local_filesystem  # noqa
+from zenml.io import local_filesystem, storage_tracking  # noqa
 from zenml.io.filesystem import BaseFilesystem, PathType
 from zenml.io.filesystem_registry import default_filesystem_registry
 from zenml.logger import get_logger
@@ -61,7 +61,8 @@ def open(path: "PathType", mode: str = "r") -> Any:  # noqa
     Returns:
         The opened file.
     """
-    return _get_filesystem(path).open(path, mode=mode)
+    file = _get_filesystem(path).open(path, mode=mode)
+    return storage_tracking.track_file(path, mode=mode, file=file)
 
 
 def copy(src: "PathType", dst: "PathType", overwrite: bool = False) -> None:
@@ -80,7 +81,14 @@ def copy(src: "PathType", dst: "PathType", overwrite: bool = False) -> None:
     dst_fs = _get_filesystem(dst)
     if src_fs is dst_fs:
         src_fs.copyfile(src, dst, overwrite=overwrite)
+        if storage_tracking.is_tracked(dst):
+            file_size = src_fs.size(src)
+            if file_size >= 0:
+                storage_tracking.record_bytes_written(dst, file_size)
+            else:
+                storage_tracking.record_unknown_write(dst)
     else:
+        # Writing to the destination file is tracked by `open(...)`
         if not overwrite and exists(dst):
             raise FileExistsError(
                 f"Destination file '{convert_to_str(dst)}' already exists "
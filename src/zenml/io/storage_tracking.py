@@ -0,0 +1,339 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Tracking of the bytes written to directories through ZenML's file IO."""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from zenml.io.filesystem import PathType
+
+_active_trackers: List["StorageSizeTracker"] = []
+_active_trackers_lock = threading.Lock()
+
+
+def _normalize(path: PathType) -> str:
+    """Normalizes a path for prefix comparisons.
+
+    Args:
+        path: The path to normalize.
+
+    Returns:
+        The normalized path using forward slashes and no trailing separator.
+    """
+    if isinstance(path, bytes):
+        path = path.decode("utf-8")
+    return path.replace(os.sep, "/").rstrip("/")
+
+
+class StorageSizeTracker:
+    """Records the sizes of all files written inside a directory."""
+
+    def __init__(self, root: PathType) -> None:
+        """Initializes the tracker.
+
+        Args:
+            root: The directory to track.
+        """
+        self.root = _normalize(root)
+        self.complete = True
+        self._file_sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def contains(self, path: PathType) -> bool:
+        """Checks whether a path is inside the tracked directory.
+
+        Args:
+            path: The path to check.
+
+        Returns:
+            Whether the path is inside the tracked directory.
+        """
+        path = _normalize(path)
+        return path == self.root or path.startswith(self.root + "/")
+
+    def add(self, path: PathType, num_bytes: int) -> None:
+        """Records the size of a written file.
+
+        Args:
+            path: The path of the file.
+            num_bytes: The size of the file.
+        """
+        with self._lock:
+            self._file_sizes[_normalize(path)] = num_bytes
+
+    @property
+    def bytes_written(self) -> int:
+        """The total size of all tracked files.
+
+        Returns:
+            The total size.
+        """
+        with self._lock:
+            return sum(self._file_sizes.values())
+
+    @property
+    def storage_size(self) -> Optional[int]:
+        """The total size of all files written inside the tracked directory.
+
+        Returns:
+            The total size or None if some files of unknown size were written
+            or no writes were tracked at all.
+        """
+        if not self.complete or not self._file_sizes:
+            return None
+        return self.bytes_written
+
+    def get_storage_size(self) -> Optional[int]:
+        """Gets the size of the directory if all its files were tracked.
+
+        Materializers might write some files with native libraries instead
+        of through `zenml.io.fileio`. The tracked size is therefore only used
+        if every file in the directory was tracked, which only requires
+        listing the directory instead of getting the size of each file.
+
+        Returns:
+            The total size or None if the size of the directory needs to be
+            measured.
+        """
+        from zenml.io import fileio
+
+        storage_size = self.storage_size
+        if storage_size is None:
+            return None
+
+        if not fileio.isdir(self.root):
+            return storage_size if self.root in self._file_sizes else None
+
+        for directory, _, files in fileio.walk(self.root):
+            for file in files:
+                path = _normalize(os.path.join(str(directory), str(file)))
+                if path not in self._file_sizes:
+                    return None
+        return storage_size
+
+
+@contextmanager
+def track_storage_size(root: PathType) -> Iterator[StorageSizeTracker]:
+    """Tracks the sizes of the files written inside a directory.
+
+    Only writes that happen through `zenml.io.fileio` (or get reported using
+    `record_bytes_written`) are tracked, from any thread.
+
+    Args:
+        root: The directory to track.
+
+    Yields:
+        The tracker holding the number of written bytes.
+    """
+    tracker = StorageSizeTracker(root)
+    with _active_trackers_lock:
+        _active_trackers.append(tracker)
+    try:
+        yield tracker
+    finally:
+        with _active_trackers_lock:
+            _active_trackers.remove(tracker)
+
+
+def is_tracked(path: PathType) -> bool:
+    """Checks whether writes to a path are tracked.
+
+    Args:
+        path: The path to check.
+
+    Returns:
+        Whether writes to the path are tracked.
+    """
+    if not _active_trackers:
+        return False
+
+    with _active_trackers_lock:
+        return any(tracker.contains(path) for tracker in _active_trackers)
+
+
+def record_bytes_written(path: PathType, num_bytes: int) -> None:
+    """Records bytes written to a path.
+
+    Args:
+        path: The path that was written to.
+        num_bytes: The number of written bytes.
+    """
+    if not _active_trackers or num_bytes < 0:
+        return
+
+    with _active_trackers_lock:
+        trackers = [
+            tracker for tracker in _active_trackers if tracker.contains(path)
+        ]
+    for tracker in trackers:
+        tracker.add(path, num_bytes)
+
+
+def record_unknown_write(path: PathType) -> None:
+    """Records that a file of unknown size was written to a path.
+
+    Args:
+        path: The path that was written to.
+    """
+    if not _active_trackers:
+        return
+
+    with _active_trackers_lock:
+        for tracker in _active_trackers:
+            if tracker.contains(path):
+                tracker.complete = False
+
+
+def record_local_directory(path: str) -> None:
+    """Records all files of a local directory as written.
+
+    This is used for files that were written directly to the local
+    filesystem instead of through `zenml.io.fileio`.
+
+    Args:
+        path: The local directory or file.
+    """
+    if not is_tracked(path):
+        return
+
+    if os.path.isfile(path):
+        record_bytes_written(path, os.path.getsize(path))
+        return
+
+    for directory, _, files in os.walk(path):
+        for file in files:
+            file_path = os.path.join(directory, file)
+            record_bytes_written(file_path, os.path.getsize(file_path))
+
+
+class _ByteCountingFile:
+    """Proxy for a writable file which records the bytes written to it."""
+
+    def __init__(self, path: PathType, file: Any) -> None:
+        """Initializes the proxy.
+
+        Args:
+            path: The path of the file.
+            file: The file object to wrap.
+        """
+        self._path = path
+        self._file = file
+        self._position = 0
+        self._size = 0
+        self._recorded = False
+
+    def write(self, data: Any) -> Any:
+        """Writes data to the file.
+
+        Args:
+            data: The data to write.
+
+        Returns:
+            The return value of the wrapped write call.
+        """
+        result = self._file.write(data)
+        if isinstance(data, str):
+            num_bytes = len(data.encode("utf-8"))
+        else:
+            num_bytes = memoryview(data).nbytes
+        self._position += num_bytes
+        self._size = max(self._size, self._position)
+        return result
+
+    def writelines(self, lines: Any) -> None:
+        """Writes lines to the file.
+
+        Args:
+            lines: The lines to write.
+        """
+        for line in lines:
+            self.write(line)
+
+    def seek(self, *args: Any, **kwargs: Any) -> Any:
+        """Changes the stream position of the file.
+
+        Args:
+            *args: Positional arguments of the wrapped seek call.
+            **kwargs: Keyword arguments of the wrapped seek call.
+
+        Returns:
+            The new stream position.
+        """
+        position = self._file.seek(*args, **kwargs)
+        if isinstance(position, int):
+            self._position = position
+        return position
+
+    def close(self) -> None:
+        """Closes the file and records the written bytes."""
+        try:
+            self._file.close()
+        finally:
+            if not self._recorded:
+                self._recorded = True
+                record_bytes_written(self._path, self._size)
+
+    def __enter__(self) -> "_ByteCountingFile":
+        """Enters the file context.
+
+        Returns:
+            The file proxy.
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Closes the file when exiting the file context.
+
+        Args:
+            *args: The exception information.
+        """
+        self.close()
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the wrapped file.
+
+        Returns:
+            The iterator of the wrapped file.
+        """
+        return iter(self._file)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegates attribute access to the wrapped file.
+
+        Args:
+            name: The attribute name.
+
+        Returns:
+            The attribute of the wrapped file.
+        """
+        return getattr(self._file, name)
+
+
+def track_file(path: PathType, mode: str, file: Any) -> Any:
+    """Wraps a file so that bytes written to it are recorded.
+
+    Args:
+        path: The path of the file.
+        mode: The mode in which the file was opened.
+        file: The opened file.
+
+    Returns:
+        The file itself if it isn't written to a tracked path, otherwise a
+        proxy recording the written bytes.
+    """
+    if not any(c in mode for c in "wax+") or not is_tracked(path):
+        return file
+    return _ByteCountingFile(path, file)
@@ -13,7 +13,9 @@
 #  permissions and limitations under the License.
 """Class for lineage graph generation."""
 
-from typing import List, Optional, Tuple, Union
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from uuid import UUID
 
 from pydantic import BaseModel
 
@@ -27,30 +29,55 @@ from zenml.lineage_graph.node import (
 )
 from zenml.models import PipelineRunResponseModel, StepRunResponseModel
 
+if TYPE_CHECKING:
+    from zenml.config.step_configurations import StepConfiguration
+
 ARTIFACT_PREFIX = "artifact_"
 STEP_PREFIX = "step_"
 
 
 class LineageGraph(BaseModel):
-    """A lineage graph representation of a PipelineRunResponseModel."""
+    """A lineage graph representation of a PipelineRunResponseModel.
+
+    Graphs loaded from a zen store have the `timestamp` of their generation
+    set, which can be used to only load the parts of the run that changed
+    afterwards. Such incremental graphs don't have a `root_step_id`.
+    """
 
     nodes: List[Union[StepNode, ArtifactNode]] = []
     edges: List[Edge] = []
     root_step_id: Optional[str] = None
     run_metadata: List[Tuple[str, str, str]] = []
+    timestamp: Optional[datetime] = None
 
-    def generate_step_nodes_and_edges(
-        self, step: StepRunResponseModel
-    ) -> None:
-        """Generates the step nodes and the edges between them.
+    def add_step_node(
+        self,
+        step_id: UUID,
+        name: str,
+        status: ExecutionStatus,
+        config: "StepConfiguration",
+        inputs: Dict[str, str],
+        outputs: Dict[str, str],
+        metadata: List[Tuple[str, str, str]],
+    ) -> str:
+        """Adds a step node to the graph.
 
         Args:
-            step: The step to generate the nodes and edges for.
+            step_id: The ID of the step run.
+            name: The name of the step.
+            status: The status of the step run.
+            config: The configuration of the step.
+            inputs: The URIs of the input artifacts by input name.
+            outputs: The URIs of the output artifacts by output name.
+            metadata: The metadata of the step run as (key, value, type).
+
+        Returns:
+            The ID of the added node.
         """
-        step_id = STEP_PREFIX + str(step.id)
+        node_id = STEP_PREFIX + str(step_id)
         if self.root_step_id is None:
-            self.root_step_id = step_id
-        step_config = step.config.dict()
+            self.root_step_id = node_id
+        step_config: Dict[str, Any] = config.dict()
         if step_config:
             step_config = {
                 key: value
@@ -59,63 +86,132 @@ class LineageGraph(BaseModel):
             }
         self.nodes.append(
             StepNode(
-                id=step_id,
+                id=node_id,
                 data=StepNodeDetails(
-                    execution_id=str(step.id),
-                    name=step.name,  # redundant for consistency
-                    status=step.status,
-                    entrypoint_name=step.config.name,  # redundant for consistency
-                    parameters=step.config.parameters,
+                    execution_id=str(step_id),
+                    name=name,  # redundant for consistency
+                    status=status,
+                    entrypoint_name=config.name,  # redundant for consistency
+                    parameters=config.parameters,
                     configuration=step_config,
-                    inputs={k: v.uri for k, v in step.inputs.items()},
-                    outputs={k: v.uri for k, v in step.outputs.items()},
-                    metadata=[
-                        (m.key, str(m.value), str(m.type))
-                        for m in step.metadata.values()
-                    ],
+                    inputs=inputs,
+                    outputs=outputs,
+                    metadata=metadata,
                 ),
             )
         )
+        return node_id
 
-        for artifact_name, artifact in step.outputs.items():
-            artifact_id = ARTIFACT_PREFIX + str(artifact.id)
-            self.nodes.append(
-                ArtifactNode(
-                    id=artifact_id,
-                    data=ArtifactNodeDetails(
-                        execution_id=str(artifact.id),
-                        name=artifact_name,
-                        status=step.status,
-                        is_cached=step.status == ExecutionStatus.CACHED,
-                        artifact_type=artifact.type,
-                        artifact_data_type=artifact.data_type.import_path,
-                        parent_step_id=str(step.id),
-                        producer_step_id=str(artifact.producer_step_run_id),
-                        uri=artifact.uri,
-                        metadata=[
-                            (m.key, str(m.value), str(m.type))
-                            for m in artifact.metadata.values()
-                        ],
-                    ),
-                )
+    def add_artifact_node(
+        self,
+        artifact_id: UUID,
+        name: str,
+        status: ExecutionStatus,
+        artifact_type: str,
+        artifact_data_type: str,
+        parent_step_id: UUID,
+        producer_step_id: Optional[UUID],
+        uri: str,
+        metadata: List[Tuple[str, str, str]],
+    ) -> str:
+        """Adds an artifact node to the graph.
+
+        Args:
+            artifact_id: The ID of the artifact.
+            name: The name of the step output.
+            status: The status of the step run that output the artifact.
+            artifact_type: The type of the artifact.
+            artifact_data_type: The import path of the artifact data type.
+            parent_step_id: The ID of the step run that output the artifact.
+            producer_step_id: The ID of the step run that produced the
+                artifact.
+            uri: The URI of the artifact.
+            metadata: The metadata of the artifact as (key, value, type).
+
+        Returns:
+            The ID of the added node.
+        """
+        node_id = ARTIFACT_PREFIX + str(artifact_id)
+        self.nodes.append(
+            ArtifactNode(
+                id=node_id,
+                data=ArtifactNodeDetails(
+                    execution_id=str(artifact_id),
+                    name=name,
+                    status=status,
+                    is_cached=status == ExecutionStatus.CACHED,
+                    artifact_type=artifact_type,
+                    artifact_data_type=artifact_data_type,
+                    parent_step_id=str(parent_step_id),
+                    producer_step_id=str(producer_step_id),
+                    uri=uri,
+                    metadata=metadata,
+                ),
             )
-            self.edges.append(
-                Edge(
-                    id=step_id + "_" + artifact_id,
-                    source=step_id,
-                    target=artifact_id,
-                )
+        )
+        return node_id
+
+    def add_artifact_edge(
+        self, step_id: UUID, artifact_id: UUID, is_output: bool
+    ) -> None:
+        """Adds an edge between a step and an artifact to the graph.
+
+        Args:
+            step_id: The ID of the step run.
+            artifact_id: The ID of the artifact.
+            is_output: Whether the artifact is an output of the step. If
+                not, it is an input of the step.
+        """
+        step_node_id = STEP_PREFIX + str(step_id)
+        artifact_node_id = ARTIFACT_PREFIX + str(artifact_id)
+        self.edges.append(
+            Edge(
+                id=step_node_id + "_" + artifact_node_id,
+                source=step_node_id if is_output else artifact_node_id,
+                target=artifact_node_id if is_output else step_node_id,
             )
+        )
 
-        for artifact_name, artifact in step.inputs.items():
-            artifact_id = ARTIFACT_PREFIX + str(artifact.id)
-            self.edges.append(
-                Edge(
-                    id=step_id + "_" + artifact_id,
-                    source=artifact_id,
-                    target=step_id,
-                )
+    def generate_step_nodes_and_edges(
+        self, step: StepRunResponseModel
+    ) -> None:
+        """Generates the step nodes and the edges between them.
+
+        Args:
+            step: The step to generate the nodes and edges for.
+        """
+        self.add_step_node(
+            step_id=step.id,
+            name=step.name,
+            status=step.status,
+            config=step.config,
+            inputs={k: v.uri for k, v in step.inputs.items()},
+            outputs={k: v.uri for k, v in step.outputs.items()},
+            metadata=[
+                (m.key, str(m.value), str(m.type))
+                for m in step.metadata.values()
+            ],
+        )
+
+        for artifact_name, artifact in step.outputs.items():
+            self.add_artifact_node(
+                artifact_id=artifact.id,
+                name=artifact_name,
+                status=step.status,
+                artifact_type=artifact.type,
+                artifact_data_type=artifact.data_type.import_path,
+                parent_step_id=step.id,
+                producer_step_id=artifact.producer_step_run_id,
+                uri=artifact.uri,
+                metadata=[
+                    (m.key, str(m.value), str(m.type))
+                    for m in artifact.metadata.values()
+                ],
             )
+            self.add_artifact_edge(step.id, artifact.id, is_output=True)
+
+        for artifact in step.inputs.values():
+            self.add_artifact_edge(step.id, artifact.id, is_output=False)
 
     def generate_run_nodes_and_edges(
         self, run: PipelineRunResponseModel
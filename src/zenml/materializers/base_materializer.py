@@ -14,17 +14,39 @@
 """Metaclass implementation for registering ZenML BaseMaterializer subclasses."""
 
 import inspect
-from typing import Any, ClassVar, Dict, Tuple, Type, cast
+import shutil
+import tempfile
+import weakref
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from zenml.enums import ArtifactType, VisualizationType
 from zenml.exceptions import MaterializerInterfaceError
-from zenml.io import fileio
+from zenml.io import fileio, storage_tracking
+from zenml.io.filesystem_registry import default_filesystem_registry
+from zenml.io.local_filesystem import LocalFilesystem
 from zenml.logger import get_logger
 from zenml.materializers.materializer_registry import materializer_registry
 from zenml.metadata.metadata_types import MetadataType
+from zenml.utils import io_utils
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Maximum number of files that get copied concurrently when transferring
+# directories from or to remote artifact stores
+DIRECTORY_COPY_MAX_WORKERS = 8
+
 
 class BaseMaterializerMeta(type):
     """Metaclass responsible for registering different BaseMaterializer subclasses.
@@ -112,6 +134,12 @@ class BaseMaterializer(metaclass=BaseMaterializerMeta):
     # it themselves.
     SKIP_REGISTRATION: ClassVar[bool] = True
 
+    # `EXTRACT_METADATA_CONCURRENTLY` can be set to True if `extract_metadata`
+    # is expensive and safe to run in a separate thread while the data is
+    # being saved, e.g. for materializers that compute statistics of large
+    # data. This requires `extract_metadata` and `save` to only read the data.
+    EXTRACT_METADATA_CONCURRENTLY: ClassVar[bool] = False
+
     def __init__(self, uri: str):
         """Initializes a materializer with the given URI.
 
@@ -202,6 +230,86 @@ class BaseMaterializer(metaclass=BaseMaterializerMeta):
     # Internal Methods
     # ================
 
+    def save_to_local_directory(
+        self, uri: str, save: Callable[[str], Any]
+    ) -> None:
+        """Saves data using a function that can only write to local paths.
+
+        For local artifact stores, the data is written to `uri` directly.
+        For remote artifact stores, it is written to a temporary directory
+        which gets uploaded to `uri` and removed afterwards.
+
+        Example:
+        ```
+        self.save_to_local_directory(
+            os.path.join(self.uri, "model"), model.save_pretrained
+        )
+        ```
+
+        Args:
+            uri: The artifact store directory in which to save the data.
+            save: Function that writes the data into the local directory it
+                receives.
+        """
+        if _is_local_path(uri):
+            save(uri)
+            # The files were written without ZenML's file IO
+            storage_tracking.record_local_directory(uri)
+            return
+
+        with tempfile.TemporaryDirectory(prefix="zenml-temp-") as temp_dir:
+            save(temp_dir)
+            io_utils.copy_dir(
+                temp_dir, uri, max_workers=DIRECTORY_COPY_MAX_WORKERS
+            )
+
+    def load_from_local_directory(
+        self, uri: str, load: Callable[[str], T], lazy: bool = False
+    ) -> T:
+        """Loads data using a function that can only read from local paths.
+
+        For local artifact stores, the data is read from `uri` directly. For
+        remote artifact stores, `uri` gets downloaded to a temporary directory
+        which is removed once it is no longer needed.
+
+        Args:
+            uri: The artifact store directory from which to load the data.
+            load: Function that reads the data from the local directory it
+                receives.
+            lazy: Whether the loaded object keeps reading from the directory
+                after `load` returned. If `True`, the temporary directory is
+                only removed once the loaded object gets garbage collected.
+
+        Returns:
+            The loaded data.
+        """
+        if _is_local_path(uri):
+            return load(uri)
+
+        temp_dir = tempfile.mkdtemp(prefix="zenml-temp-")
+        try:
+            io_utils.copy_dir(
+                uri, temp_dir, max_workers=DIRECTORY_COPY_MAX_WORKERS
+            )
+            data = load(temp_dir)
+        except BaseException:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+
+        if not lazy:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            return data
+
+        try:
+            weakref.finalize(data, shutil.rmtree, temp_dir, ignore_errors=True)
+        except TypeError:
+            logger.debug(
+                "Unable to track the lifetime of the loaded object, the "
+                "temporary directory `%s` will be kept.",
+                temp_dir,
+            )
+        return data
+
     def validate_type_compatibility(self, data_type: Type[Any]) -> None:
         """Checks whether the materializer can read/write the given type.
 
@@ -233,20 +341,36 @@ class BaseMaterializer(metaclass=BaseMaterializerMeta):
             for associated_type in cls.ASSOCIATED_TYPES
         )
 
-    def extract_full_metadata(self, data: Any) -> Dict[str, "MetadataType"]:
+    def extract_full_metadata(
+        self,
+        data: Any,
+        storage_size: Optional[int] = None,
+        custom_metadata: Optional[Dict[str, "MetadataType"]] = None,
+    ) -> Dict[str, "MetadataType"]:
         """Extract both base and custom metadata from the given data.
 
         Args:
             data: The data to extract metadata from.
+            storage_size: The size of the artifact files if it was tracked
+                while saving them. If not given, the size is computed by
+                walking the artifact directory.
+            custom_metadata: The metadata returned by `extract_metadata` if it
+                was already extracted, e.g. concurrently while saving the
+                data. If not given, `extract_metadata` will be called.
 
         Returns:
             A dictionary of metadata.
         """
-        base_metadata = self._extract_base_metadata(data)
-        custom_metadata = self.extract_metadata(data)
+        base_metadata = self._extract_base_metadata(
+            data, storage_size=storage_size
+        )
+        if custom_metadata is None:
+            custom_metadata = self.extract_metadata(data)
         return {**base_metadata, **custom_metadata}
 
-    def _extract_base_metadata(self, data: Any) -> Dict[str, "MetadataType"]:
+    def _extract_base_metadata(
+        self, data: Any, storage_size: Optional[int] = None
+    ) -> Dict[str, "MetadataType"]:
         """Extract metadata from the given data.
 
         This metadata will be extracted for all artifacts in addition to the
@@ -254,13 +378,30 @@ class BaseMaterializer(metaclass=BaseMaterializerMeta):
 
         Args:
             data: The data to extract metadata from.
+            storage_size: The size of the artifact files if it was tracked
+                while saving them. If not given, the size is computed by
+                walking the artifact directory.
 
         Returns:
             A dictionary of metadata.
         """
         from zenml.metadata.metadata_types import StorageSize
 
-        storage_size = fileio.size(self.uri)
+        if storage_size is None:
+            storage_size = fileio.size(self.uri)
         if isinstance(storage_size, int):
             return {"storage_size": StorageSize(storage_size)}
         return {}
+
+
+def _is_local_path(path: str) -> bool:
+    """Checks whether a path belongs to the local filesystem.
+
+    Args:
+        path: The path to check.
+
+    Returns:
+        Whether the path belongs to the local filesystem.
+    """
+    filesystem = default_filesystem_registry.get_filesystem_for_path(path)
+    return issubclass(filesystem, LocalFilesystem)
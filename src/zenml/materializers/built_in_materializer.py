@@ -200,7 +200,7 @@ def find_type_by_str(type_str: str) -> Type[Any]:
     Returns:
         The type whose string representation is `type_str`.
     """
-    registered_types = materializer_registry.materializer_types.keys()
+    registered_types = materializer_registry.get_materializer_types().keys()
     type_str_mapping = {str(type_): type_ for type_ in registered_types}
     if type_str in type_str_mapping:
         return type_str_mapping[type_str]
@@ -225,7 +225,7 @@ def find_materializer_registry_type(type_: Type[Any]) -> Type[Any]:
     materializer_registry[type_]
 
     # Check if the type itself is registered
-    registered_types = materializer_registry.materializer_types.keys()
+    registered_types = materializer_registry.get_materializer_types().keys()
     if type_ in registered_types:
         return type_
 
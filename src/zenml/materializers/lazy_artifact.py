@@ -0,0 +1,354 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Proxy for artifacts that are loaded on first access."""
+
+import operator
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+if TYPE_CHECKING:
+    from zenml.models.artifact_models import ArtifactResponseModel
+
+
+class LazyArtifact:
+    """Proxy for the data of an artifact that is loaded on first access.
+
+    The proxy forwards all attribute accesses and operators to the artifact
+    data, which gets loaded the first time it is required. Checking the type
+    of the proxy using `isinstance(...)` also loads the data.
+
+    Whether the data was loaded can be checked using the
+    `is_loaded(...)` function of this module.
+    """
+
+    __slots__ = (
+        "_zenml_artifact",
+        "_zenml_load_function",
+        "_zenml_lock",
+        "_zenml_loaded",
+        "_zenml_value",
+    )
+
+    def __init__(
+        self,
+        artifact: "ArtifactResponseModel",
+        load_function: Callable[[], Any],
+    ) -> None:
+        """Initializes the proxy.
+
+        Args:
+            artifact: The artifact whose data is proxied.
+            load_function: Function that loads the artifact data.
+        """
+        object.__setattr__(self, "_zenml_artifact", artifact)
+        object.__setattr__(self, "_zenml_load_function", load_function)
+        object.__setattr__(self, "_zenml_lock", threading.Lock())
+        object.__setattr__(self, "_zenml_loaded", False)
+        object.__setattr__(self, "_zenml_value", None)
+
+    def _zenml_load(self) -> Any:
+        """Loads the artifact data if it wasn't loaded yet.
+
+        Returns:
+            The artifact data.
+        """
+        if not self._zenml_loaded:
+            with self._zenml_lock:
+                if not self._zenml_loaded:
+                    object.__setattr__(
+                        self, "_zenml_value", self._zenml_load_function()
+                    )
+                    object.__setattr__(self, "_zenml_loaded", True)
+        return self._zenml_value
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type:  # type: ignore[override]
+        """The class of the artifact data.
+
+        Returns:
+            The class of the artifact data.
+        """
+        return type(self._zenml_load())
+
+    def __getattr__(self, name: str) -> Any:
+        """Gets an attribute of the artifact data.
+
+        Args:
+            name: The attribute name.
+
+        Returns:
+            The attribute of the artifact data.
+        """
+        return getattr(self._zenml_load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Sets an attribute of the artifact data.
+
+        Args:
+            name: The attribute name.
+            value: The attribute value.
+        """
+        setattr(self._zenml_load(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        """Deletes an attribute of the artifact data.
+
+        Args:
+            name: The attribute name.
+        """
+        delattr(self._zenml_load(), name)
+
+    def __dir__(self) -> Iterator[str]:
+        """Lists the attributes of the artifact data.
+
+        Returns:
+            The attributes of the artifact data.
+        """
+        return iter(dir(self._zenml_load()))
+
+    def __repr__(self) -> str:
+        """Returns the representation of the artifact data.
+
+        The data is not loaded just to represent it.
+
+        Returns:
+            The representation of the artifact data.
+        """
+        if not self._zenml_loaded:
+            return (
+                f"<LazyArtifact of artifact '{self._zenml_artifact.id}' "
+                "(not loaded)>"
+            )
+        return repr(self._zenml_value)
+
+    def __str__(self) -> str:
+        """Returns the string conversion of the artifact data.
+
+        Returns:
+            The string conversion of the artifact data.
+        """
+        return str(self._zenml_load())
+
+    def __bool__(self) -> bool:
+        """Returns the truth value of the artifact data.
+
+        Returns:
+            The truth value of the artifact data.
+        """
+        return bool(self._zenml_load())
+
+    def __hash__(self) -> int:
+        """Returns the hash of the artifact data.
+
+        Returns:
+            The hash of the artifact data.
+        """
+        return hash(self._zenml_load())
+
+    def __len__(self) -> int:
+        """Returns the length of the artifact data.
+
+        Returns:
+            The length of the artifact data.
+        """
+        return len(self._zenml_load())
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the artifact data.
+
+        Returns:
+            The iterator of the artifact data.
+        """
+        return iter(self._zenml_load())
+
+    def __contains__(self, item: Any) -> bool:
+        """Checks whether the artifact data contains an item.
+
+        Args:
+            item: The item to check.
+
+        Returns:
+            Whether the artifact data contains the item.
+        """
+        return item in self._zenml_load()
+
+    def __getitem__(self, key: Any) -> Any:
+        """Gets an item of the artifact data.
+
+        Args:
+            key: The item key.
+
+        Returns:
+            The item.
+        """
+        return self._zenml_load()[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Sets an item of the artifact data.
+
+        Args:
+            key: The item key.
+            value: The item value.
+        """
+        self._zenml_load()[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        """Deletes an item of the artifact data.
+
+        Args:
+            key: The item key.
+        """
+        del self._zenml_load()[key]
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Calls the artifact data.
+
+        Args:
+            *args: Positional arguments of the call.
+            **kwargs: Keyword arguments of the call.
+
+        Returns:
+            The return value of the call.
+        """
+        return self._zenml_load()(*args, **kwargs)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        """Pickles the artifact data instead of the proxy.
+
+        Args:
+            protocol: The pickle protocol.
+
+        Returns:
+            The reduced artifact data.
+        """
+        return self._zenml_load().__reduce_ex__(protocol)
+
+
+def _add_operator(name: str, function: Callable[..., Any]) -> None:
+    """Adds a method to the proxy that applies an operator to the data.
+
+    Args:
+        name: Name of the method.
+        function: The operator function.
+    """
+
+    def method(self: LazyArtifact, *args: Any) -> Any:
+        """Applies the operator to the artifact data.
+
+        Args:
+            self: The lazy artifact.
+            *args: The other operands.
+
+        Returns:
+            The result of the operator.
+        """
+        return function(self._zenml_load(), *args)
+
+    def reflected_method(self: LazyArtifact, other: Any) -> Any:
+        """Applies the reflected operator to the artifact data.
+
+        Args:
+            self: The lazy artifact.
+            other: The left operand.
+
+        Returns:
+            The result of the operator.
+        """
+        return function(other, self._zenml_load())
+
+    method.__name__ = f"__{name}__"
+    setattr(LazyArtifact, method.__name__, method)
+    if name in _REFLECTED_OPERATORS:
+        reflected_method.__name__ = f"__r{name}__"
+        setattr(LazyArtifact, reflected_method.__name__, reflected_method)
+
+
+_REFLECTED_OPERATORS = {
+    "add",
+    "sub",
+    "mul",
+    "matmul",
+    "truediv",
+    "floordiv",
+    "mod",
+    "pow",
+    "and",
+    "or",
+    "xor",
+    "lshift",
+    "rshift",
+}
+_OPERATORS = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "matmul": operator.matmul,
+    "truediv": operator.truediv,
+    "floordiv": operator.floordiv,
+    "mod": operator.mod,
+    "pow": operator.pow,
+    "and": operator.and_,
+    "or": operator.or_,
+    "xor": operator.xor,
+    "lshift": operator.lshift,
+    "rshift": operator.rshift,
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "neg": operator.neg,
+    "pos": operator.pos,
+    "abs": operator.abs,
+    "invert": operator.invert,
+    "int": int,
+    "float": float,
+    "complex": complex,
+    "index": operator.index,
+    "round": round,
+    "format": format,
+}
+for _name, _function in _OPERATORS.items():
+    _add_operator(_name, _function)
+
+
+def is_loaded(value: Any) -> bool:
+    """Checks whether a value is a lazy artifact that was not loaded yet.
+
+    Args:
+        value: The value to check.
+
+    Returns:
+        `False` if the value is a lazy artifact whose data was not loaded
+        yet, `True` otherwise.
+    """
+    if type(value) is not LazyArtifact:
+        return True
+    return bool(object.__getattribute__(value, "_zenml_loaded"))
+
+
+def unwrap(value: Any) -> Any:
+    """Gets the artifact data of a lazy artifact.
+
+    Args:
+        value: A lazy artifact or any other value.
+
+    Returns:
+        The loaded data if the value is a lazy artifact, otherwise the value
+        itself.
+    """
+    if type(value) is LazyArtifact:
+        return value._zenml_load()
+    return value
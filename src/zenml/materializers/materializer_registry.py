@@ -30,6 +30,30 @@ class MaterializerRegistry:
         """Initialize the materializer registry."""
         self.default_materializer: Optional[Type["BaseMaterializer"]] = None
         self.materializer_types: Dict[Type[Any], Type["BaseMaterializer"]] = {}
+        self._integrations_activated = False
+        self._activating_integrations = False
+
+    def _activate_integrations(self) -> None:
+        """Activates all installed integrations on first use of the registry.
+
+        Activating an integration imports its materializers, which registers
+        them in this registry. Deferring this until a materializer is actually
+        looked up avoids importing all integrations on process startup. If the
+        activation fails, it is retried on the next lookup.
+        """
+        if self._integrations_activated or self._activating_integrations:
+            return
+
+        from zenml.integrations.registry import integration_registry
+
+        # Lookups while the integrations are being activated must not
+        # trigger the activation again
+        self._activating_integrations = True
+        try:
+            integration_registry.activate_integrations()
+        finally:
+            self._activating_integrations = False
+        self._integrations_activated = True
 
     def register_materializer_type(
         self, key: Type[Any], type_: Type["BaseMaterializer"]
@@ -71,6 +95,7 @@ class MaterializerRegistry:
         Returns:
             `BaseMaterializer` subclass that was registered for this key.
         """
+        self._activate_integrations()
         for class_ in key.__mro__:
             materializer = self.materializer_types.get(class_, None)
             if materializer:
@@ -100,6 +125,7 @@ class MaterializerRegistry:
         Returns:
             A dictionary of registered materializer types.
         """
+        self._activate_integrations()
         return self.materializer_types
 
     def is_registered(self, key: Type[Any]) -> bool:
@@ -112,6 +138,7 @@ class MaterializerRegistry:
             True if a materializer is registered for the given type, False
             otherwise.
         """
+        self._activate_integrations()
         return any(issubclass(key, type_) for type_ in self.materializer_types)
 
 
@@ -15,7 +15,7 @@
 
 import os
 from collections import Counter
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Tuple, Type
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional, Tuple, Type
 
 import numpy as np
 
@@ -24,6 +24,7 @@ from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.metadata.metadata_types import DType, MetadataType
+from zenml.utils import statistics_utils
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
@@ -43,6 +44,7 @@ class NumpyMaterializer(BaseMaterializer):
 
     ASSOCIATED_TYPES: ClassVar[Tuple[Type[Any], ...]] = (np.ndarray,)
     ASSOCIATED_ARTIFACT_TYPE: ClassVar[ArtifactType] = ArtifactType.DATA
+    EXTRACT_METADATA_CONCURRENTLY: ClassVar[bool] = True
 
     def load(self, data_type: Type[Any]) -> "Any":
         """Reads a numpy array from a `.npy` file.
@@ -213,23 +215,31 @@ class NumpyMaterializer(BaseMaterializer):
     ) -> Dict[str, "MetadataType"]:
         """Extracts numeric metadata from a numpy array.
 
+        For large arrays, the statistics are computed on a sample of the
+        entries along the first axis.
+
         Args:
             arr: The numpy array to extract metadata from.
 
         Returns:
             A dictionary of metadata.
         """
-        min_val = np.min(arr).item()
-        max_val = np.max(arr).item()
+        sample, sample_size = _sample_rows(arr)
+        min_val = np.min(sample).item()
+        max_val = np.max(sample).item()
 
         numpy_metadata: Dict[str, "MetadataType"] = {
             "shape": tuple(arr.shape),
             "dtype": DType(arr.dtype.type),
-            "mean": np.mean(arr).item(),
-            "std": np.std(arr).item(),
+            "mean": np.mean(sample).item(),
+            "std": np.std(sample).item(),
             "min": min_val,
             "max": max_val,
         }
+        if sample_size is not None:
+            numpy_metadata[
+                statistics_utils.SAMPLE_SIZE_METADATA_KEY
+            ] = sample_size
         return numpy_metadata
 
     def _extract_text_metadata(
@@ -237,25 +247,57 @@ class NumpyMaterializer(BaseMaterializer):
     ) -> Dict[str, "MetadataType"]:
         """Extracts text metadata from a numpy array.
 
+        For large arrays, the words are counted in a sample of the entries
+        along the first axis.
+
         Args:
             arr: The numpy array to extract metadata from.
 
         Returns:
             A dictionary of metadata.
         """
-        text = " ".join(arr)
-        words = text.split()
-        word_counts = Counter(words)
-        unique_words = len(word_counts)
-        total_words = len(words)
-        most_common_word, most_common_count = word_counts.most_common(1)[0]
+        sample, sample_size = _sample_rows(arr)
+        word_counts: Counter[str] = Counter()
+        for text in sample.flat:
+            word_counts.update(str(text).split())
 
         text_metadata: Dict[str, "MetadataType"] = {
             "shape": tuple(arr.shape),
             "dtype": DType(arr.dtype.type),
-            "unique_words": unique_words,
-            "total_words": total_words,
-            "most_common_word": most_common_word,
-            "most_common_count": most_common_count,
+            "unique_words": len(word_counts),
+            "total_words": sum(word_counts.values()),
         }
+        if word_counts:
+            most_common_word, most_common_count = word_counts.most_common(1)[0]
+            text_metadata["most_common_word"] = most_common_word
+            text_metadata["most_common_count"] = most_common_count
+        if sample_size is not None:
+            text_metadata[
+                statistics_utils.SAMPLE_SIZE_METADATA_KEY
+            ] = sample_size
         return text_metadata
+
+
+def _sample_rows(
+    arr: "NDArray[Any]",
+) -> Tuple["NDArray[Any]", Optional[int]]:
+    """Samples entries along the first axis to compute statistics on.
+
+    Args:
+        arr: The numpy array to sample.
+
+    Returns:
+        The sample and its size, or the unchanged array and None if all
+        entries fit into the statistics budget.
+    """
+    if arr.ndim == 0 or arr.shape[0] == 0:
+        return arr, None
+
+    num_rows = arr.shape[0]
+    indices = statistics_utils.sample_indices(
+        num_rows=num_rows, row_size=arr.nbytes // num_rows
+    )
+    if indices is None:
+        return arr, None
+
+    return arr[indices], len(indices)
@@ -14,8 +14,9 @@
 """Materializer for Pandas."""
 
 import os
-from typing import Any, ClassVar, Dict, Tuple, Type, Union
+from typing import Any, ClassVar, Dict, Optional, Tuple, Type, Union
 
+import numpy as np
 import pandas as pd
 
 from zenml.enums import ArtifactType, VisualizationType
@@ -23,6 +24,7 @@ from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.metadata.metadata_types import DType, MetadataType
+from zenml.utils import statistics_utils
 
 logger = get_logger(__name__)
 
@@ -40,6 +42,7 @@ class PandasMaterializer(BaseMaterializer):
         pd.Series,
     )
     ASSOCIATED_ARTIFACT_TYPE: ClassVar[ArtifactType] = ArtifactType.DATA
+    EXTRACT_METADATA_CONCURRENTLY: ClassVar[bool] = True
 
     def __init__(self, uri: str):
         """Define `self.data_path`.
@@ -137,15 +140,19 @@ class PandasMaterializer(BaseMaterializer):
     ) -> Dict[str, VisualizationType]:
         """Save visualizations of the given pandas dataframe or series.
 
+        For large dataframes, the description is computed on a sample of the
+        rows.
+
         Args:
             df: The pandas dataframe or series to visualize.
 
         Returns:
             A dictionary of visualization URIs and their types.
         """
+        sample, _ = _sample_rows(df)
         describe_uri = os.path.join(self.uri, "describe.csv")
         with fileio.open(describe_uri, mode="wb") as f:
-            df.describe().to_csv(f)
+            sample.describe().to_csv(f)
         return {describe_uri: VisualizationType.CSV}
 
     def extract_metadata(
@@ -153,6 +160,9 @@ class PandasMaterializer(BaseMaterializer):
     ) -> Dict[str, "MetadataType"]:
         """Extract metadata from the given pandas dataframe or series.
 
+        The statistics of all numeric columns are computed together. For
+        large dataframes, they are computed on a sample of the rows.
+
         Args:
             df: The pandas dataframe or series to extract metadata from.
 
@@ -160,27 +170,71 @@ class PandasMaterializer(BaseMaterializer):
             The extracted metadata as a dictionary.
         """
         pandas_metadata: Dict[str, "MetadataType"] = {"shape": df.shape}
+        sample, sample_size = _sample_rows(df)
+        if sample_size is not None:
+            pandas_metadata[
+                statistics_utils.SAMPLE_SIZE_METADATA_KEY
+            ] = sample_size
 
         if isinstance(df, pd.Series):
             pandas_metadata["dtype"] = DType(df.dtype.type)
-            pandas_metadata["mean"] = float(df.mean().item())
-            pandas_metadata["std"] = float(df.std().item())
-            pandas_metadata["min"] = float(df.min().item())
-            pandas_metadata["max"] = float(df.max().item())
+            if pd.api.types.is_numeric_dtype(df.dtype):
+                statistics = statistics_utils.compute_numeric_statistics(
+                    _to_float_array(sample.to_frame()), ddof=1
+                )
+                for stat_name, values in statistics.items():
+                    pandas_metadata[stat_name] = float(values[0])
 
         else:
             pandas_metadata["dtype"] = {
                 str(key): DType(value.type) for key, value in df.dtypes.items()
             }
-            for stat_name, stat in {
-                "mean": df.mean,
-                "std": df.std,
-                "min": df.min,
-                "max": df.max,
-            }.items():
+            numeric_sample = sample.select_dtypes(include=["number", "bool"])
+            statistics = statistics_utils.compute_numeric_statistics(
+                _to_float_array(numeric_sample), ddof=1
+            )
+            for stat_name, values in statistics.items():
                 pandas_metadata[stat_name] = {
                     str(key): float(value)
-                    for key, value in stat(numeric_only=True).to_dict().items()
+                    for key, value in zip(numeric_sample.columns, values)
                 }
 
         return pandas_metadata
+
+
+def _sample_rows(
+    df: Union[pd.DataFrame, pd.Series]
+) -> Tuple[Union[pd.DataFrame, pd.Series], Optional[int]]:
+    """Samples the rows of a dataframe or series to compute statistics on.
+
+    Args:
+        df: The pandas dataframe or series to sample.
+
+    Returns:
+        The sample and its size, or the unchanged input and None if all rows
+        fit into the statistics budget.
+    """
+    num_rows = len(df)
+    if num_rows == 0:
+        return df, None
+
+    memory_usage = np.sum(df.memory_usage(index=False))
+    indices = statistics_utils.sample_indices(
+        num_rows=num_rows, row_size=int(memory_usage) // num_rows
+    )
+    if indices is None:
+        return df, None
+
+    return df.iloc[indices], len(indices)
+
+
+def _to_float_array(df: pd.DataFrame) -> Any:
+    """Converts the numeric columns of a dataframe to a 2D float array.
+
+    Args:
+        df: The dataframe containing only numeric columns.
+
+    Returns:
+        The float array of shape (rows, columns).
+    """
+    return df.to_numpy(dtype=np.float64, na_value=np.nan)
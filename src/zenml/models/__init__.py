@@ -15,6 +15,8 @@
 
 from zenml.models.artifact_models import (
     ArtifactFilterModel,
+    ArtifactLineageModel,
+    ArtifactLineageStepModel,
     ArtifactRequestModel,
     ArtifactResponseModel,
 )
@@ -69,6 +71,9 @@ from zenml.models.role_models import (
 )
 from zenml.models.run_metadata_models import (
     RunMetadataFilterModel,
+    RunMetadataLeaderboardEntryModel,
+    RunMetadataLeaderboardFilterModel,
+    RunMetadataLeaderboardModel,
     RunMetadataRequestModel,
     RunMetadataResponseModel,
 )
@@ -258,6 +263,8 @@ __all__ = [
     "ArtifactRequestModel",
     "ArtifactResponseModel",
     "ArtifactFilterModel",
+    "ArtifactLineageModel",
+    "ArtifactLineageStepModel",
     "BaseRequestModel",
     "BaseResponseModel",
     "PipelineBuildFilterModel",
@@ -305,6 +312,9 @@ __all__ = [
     "RoleUpdateModel",
     "RoleFilterModel",
     "RunMetadataFilterModel",
+    "RunMetadataLeaderboardEntryModel",
+    "RunMetadataLeaderboardFilterModel",
+    "RunMetadataLeaderboardModel",
     "RunMetadataRequestModel",
     "RunMetadataResponseModel",
     "ScheduleRequestModel",
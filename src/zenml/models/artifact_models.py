@@ -19,7 +19,7 @@ from uuid import UUID
 from pydantic import BaseModel, Field
 
 from zenml.config.source import Source, convert_source_validator
-from zenml.enums import ArtifactType
+from zenml.enums import ArtifactType, HydrationLevel, LineageDirection
 from zenml.logger import get_logger
 from zenml.models.base_models import (
     WorkspaceScopedRequestModel,
@@ -85,6 +85,12 @@ class ArtifactResponseModel(ArtifactBaseModel, WorkspaceScopedResponseModel):
     metadata: Dict[str, "RunMetadataResponseModel"] = Field(
         default={}, title="Metadata of the artifact."
     )
+    hydration: HydrationLevel = Field(
+        default=HydrationLevel.FULL,
+        title="How much of this artifact is hydrated. The producer step run "
+        "and visualizations are only included on `body` level or above, the "
+        "metadata only on `full` level.",
+    )
 
     @property
     def step(self) -> "StepRunResponseModel":
@@ -189,6 +195,66 @@ class ArtifactFilterModel(WorkspaceScopedFilterModel):
     )
 
 
+# ------- #
+# LINEAGE #
+# ------- #
+
+
+class ArtifactLineageStepModel(BaseModel):
+    """Step run in the lineage of an artifact."""
+
+    step_run_id: UUID = Field(title="The ID of the step run.")
+    pipeline_run_id: UUID = Field(title="The ID of the pipeline run.")
+    depth: int = Field(
+        title="The number of steps between the artifact and this step, "
+        "counting the step itself."
+    )
+    artifact_ids: List[UUID] = Field(
+        default=[],
+        title="The artifacts through which the step continues the lineage: "
+        "its outputs for downstream and its inputs for upstream lineage.",
+    )
+
+
+class ArtifactLineageModel(BaseModel):
+    """Upstream or downstream lineage of an artifact across pipeline runs."""
+
+    artifact_id: UUID = Field(title="The ID of the artifact.")
+    direction: LineageDirection = Field(
+        title="The direction in which the lineage was followed."
+    )
+    max_depth: Optional[int] = Field(
+        default=None, title="The maximum number of steps that were followed."
+    )
+    steps: List[ArtifactLineageStepModel] = Field(
+        default=[], title="The step runs in the lineage, ordered by depth."
+    )
+
+    @property
+    def artifact_ids(self) -> List[UUID]:
+        """The IDs of all artifacts in the lineage, ordered by depth.
+
+        Returns:
+            The artifact IDs.
+        """
+        artifact_ids = {
+            artifact_id: None
+            for step in self.steps
+            for artifact_id in step.artifact_ids
+            if artifact_id != self.artifact_id
+        }
+        return list(artifact_ids)
+
+    @property
+    def pipeline_run_ids(self) -> List[UUID]:
+        """The IDs of all pipeline runs in the lineage, ordered by depth.
+
+        Returns:
+            The pipeline run IDs.
+        """
+        return list({step.pipeline_run_id: None for step in self.steps})
+
+
 # ------- #
 # REQUEST #
 # ------- #
@@ -486,6 +486,14 @@ class BaseFilterModel(BaseModel):
                 value=int(value),
             )
 
+        # Create float filters
+        if cls.is_float_field(column):
+            return NumericFilter(
+                operation=GenericFilterOps(operator),
+                column=column,
+                value=float(value),
+            )
+
         # Create bool filters
         if cls.is_bool_field(column):
             return cls._define_bool_filter(
@@ -558,6 +566,21 @@ class BaseFilterModel(BaseModel):
             or cls.__fields__[k].type_ is int
         )
 
+    @classmethod
+    def is_float_field(cls, k: str) -> bool:
+        """Checks if it's a float field.
+
+        Args:
+            k: The key to check.
+
+        Returns:
+            True if the field is a float field, False otherwise.
+        """
+        return (
+            issubclass(float, get_args(cls.__fields__[k].type_))
+            or cls.__fields__[k].type_ is float
+        )
+
     @classmethod
     def is_bool_field(cls, k: str) -> bool:
         """Checks if it's a bool field.
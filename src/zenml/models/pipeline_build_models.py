@@ -44,6 +44,7 @@ class BuildItem(BaseModel):
         requirements: The pip requirements installed in the image. This is a
             string consisting of multiple concatenated requirements.txt files.
         settings_checksum: Checksum of the settings used for the build.
+        source_checksum: Checksum of the source files included in the image.
         contains_code: Whether the image contains user files.
         requires_code_download: Whether the image needs to download files.
     """
@@ -58,6 +59,9 @@ class BuildItem(BaseModel):
     settings_checksum: Optional[str] = Field(
         title="The checksum of the build settings."
     )
+    source_checksum: Optional[str] = Field(
+        title="The checksum of the source files included in the image."
+    )
     contains_code: bool = Field(
         default=True, title="Whether the image contains user files."
     )
@@ -30,7 +30,7 @@ from pydantic import BaseModel, Field
 
 from zenml import __version__ as current_zenml_version
 from zenml.config.pipeline_configurations import PipelineConfiguration
-from zenml.enums import ExecutionStatus, LogicalOperators
+from zenml.enums import ExecutionStatus, HydrationLevel, LogicalOperators
 from zenml.models.base_models import (
     WorkspaceScopedRequestModel,
     WorkspaceScopedResponseModel,
@@ -149,6 +149,12 @@ class PipelineRunResponseModel(
     steps: Dict[str, "StepRunResponseModel"] = Field(
         default={}, title="The steps of this run."
     )
+    hydration: HydrationLevel = Field(
+        default=HydrationLevel.FULL,
+        title="How much of this run is hydrated. The pipeline, stack, build "
+        "and metadata are only included on `body` level or above, the "
+        "deployment and steps only on `full` level.",
+    )
 
     @property
     def artifacts(self) -> List["ArtifactResponseModel"]:
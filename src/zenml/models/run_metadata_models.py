@@ -13,11 +13,13 @@
 #  permissions and limitations under the License.
 """Models representing run metadata."""
 
-from typing import Optional, Union
+from datetime import datetime
+from typing import List, Optional, Union
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from zenml.constants import PAGE_SIZE_MAXIMUM
 from zenml.metadata.metadata_types import MetadataType, MetadataTypeEnum
 from zenml.models.base_models import (
     WorkspaceScopedRequestModel,
@@ -79,6 +81,82 @@ class RunMetadataFilterModel(WorkspaceScopedFilterModel):
     stack_component_id: Optional[Union[str, UUID]] = None
     key: Optional[str] = None
     type: Optional[Union[str, MetadataTypeEnum]] = None
+    numeric_value: Optional[Union[float, str]] = Field(
+        default=None,
+        description="Value of numeric metadata (int, float or storage size).",
+    )
+    string_value: Optional[str] = Field(
+        default=None,
+        description="Value of string metadata (str, Uri, Path or DType).",
+    )
+
+
+# ----------- #
+# LEADERBOARD #
+# ----------- #
+
+
+class RunMetadataLeaderboardFilterModel(BaseModel):
+    """Model to query the best pipeline runs according to a metadata key."""
+
+    key: str = Field(title="The key of the numeric metadata to rank by.")
+    workspace_id: Optional[UUID] = Field(
+        default=None, title="The workspace to which the runs belong."
+    )
+    pipeline_id: Optional[UUID] = Field(
+        default=None, title="The pipeline to which the runs belong."
+    )
+    start_time: Optional[datetime] = Field(
+        default=None,
+        title="Only include metadata created at or after this time.",
+    )
+    end_time: Optional[datetime] = Field(
+        default=None,
+        title="Only include metadata created at or before this time.",
+    )
+    ascending: bool = Field(
+        default=False,
+        title="Whether lower metadata values rank higher.",
+    )
+    size: int = Field(
+        default=10,
+        ge=1,
+        le=PAGE_SIZE_MAXIMUM,
+        title="The number of entries to return.",
+    )
+
+
+class RunMetadataLeaderboardEntryModel(BaseModel):
+    """Entry of a run metadata leaderboard."""
+
+    metadata_id: UUID = Field(title="The ID of the metadata.")
+    pipeline_run_id: UUID = Field(title="The ID of the pipeline run.")
+    pipeline_run_name: str = Field(title="The name of the pipeline run.")
+    step_run_id: Optional[UUID] = Field(
+        default=None,
+        title="The ID of the step run if the metadata belongs to a step.",
+    )
+    value: float = Field(title="The metadata value.")
+    created: datetime = Field(title="The creation time of the metadata.")
+
+
+class RunMetadataLeaderboardModel(BaseModel):
+    """Leaderboard and aggregated statistics of a numeric metadata key."""
+
+    key: str = Field(title="The metadata key.")
+    count: int = Field(title="The number of ranked pipeline runs.")
+    min: Optional[float] = Field(
+        default=None, title="The minimum value of all ranked runs."
+    )
+    max: Optional[float] = Field(
+        default=None, title="The maximum value of all ranked runs."
+    )
+    mean: Optional[float] = Field(
+        default=None, title="The mean value of all ranked runs."
+    )
+    entries: List[RunMetadataLeaderboardEntryModel] = Field(
+        default=[], title="The best entries, ordered by rank."
+    )
 
 
 # ------- #
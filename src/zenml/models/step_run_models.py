@@ -20,7 +20,7 @@ from uuid import UUID
 from pydantic import BaseModel, Field
 
 from zenml.config.step_configurations import StepConfiguration, StepSpec
-from zenml.enums import ExecutionStatus
+from zenml.enums import ExecutionStatus, HydrationLevel
 from zenml.models.base_models import (
     WorkspaceScopedRequestModel,
     WorkspaceScopedResponseModel,
@@ -112,6 +112,13 @@ class StepRunResponseModel(StepRunBaseModel, WorkspaceScopedResponseModel):
         title="Logs associated with this step run.",
         default=None,
     )
+    hydration: HydrationLevel = Field(
+        title="How much of this step run is hydrated. The parent steps, "
+        "metadata, logs, inputs and outputs are only included on `body` "
+        "level or above. The inputs and outputs are only fully hydrated on "
+        "`full` level.",
+        default=HydrationLevel.FULL,
+    )
 
     @property
     def run(self) -> "PipelineRunResponseModel":
@@ -62,6 +62,7 @@ class JWTToken(BaseModel):
         token_type: The type of token.
         user_id: The id of the authenticated User
         permissions: The permissions scope of the authenticated user
+        expires: The expiration time of the token, if it expires.
     """
 
     JWT_ALGORITHM: ClassVar[str] = "HS256"
@@ -69,6 +70,7 @@ class JWTToken(BaseModel):
     token_type: JWTTokenType
     user_id: UUID
     permissions: List[str]
+    expires: Optional[datetime] = None
 
     @classmethod
     def decode(cls, token_type: JWTTokenType, token: str) -> "JWTToken":
@@ -110,11 +112,17 @@ class JWTToken(BaseModel):
                 "Invalid JWT token: the permissions scope is missing"
             )
 
+        expires: Optional[datetime] = None
+        expiration_claim = payload.get("exp")
+        if expiration_claim is not None:
+            expires = datetime.utcfromtimestamp(expiration_claim)
+
         try:
             return cls(
                 token_type=token_type,
                 user_id=UUID(subject),
                 permissions=set(permissions),
+                expires=expires,
             )
         except ValueError as e:
             raise AuthorizationException(
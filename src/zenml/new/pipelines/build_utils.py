@@ -38,6 +38,7 @@ from zenml.models.pipeline_build_models import (
 from zenml.models.pipeline_deployment_models import PipelineDeploymentBaseModel
 from zenml.stack import Stack
 from zenml.utils import (
+    docker_utils,
     source_utils,
 )
 from zenml.utils.pipeline_docker_image_builder import (
@@ -50,6 +51,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Number of settings checksum characters included in the tags of local images
+LOCAL_IMAGE_TAG_CHECKSUM_LENGTH = 12
+
 
 def reuse_or_create_pipeline_build(
     deployment: "PipelineDeploymentBaseModel",
@@ -57,6 +61,7 @@ def reuse_or_create_pipeline_build(
     pipeline_id: Optional[UUID] = None,
     build: Union["UUID", "PipelineBuildBaseModel", None] = None,
     code_repository: Optional["BaseCodeRepository"] = None,
+    source_checksums: Optional[Dict[Optional[str], str]] = None,
 ) -> Optional["PipelineBuildResponseModel"]:
     """Loads or creates a pipeline build.
 
@@ -71,18 +76,22 @@ def reuse_or_create_pipeline_build(
             be created.
         code_repository: If provided, this code repository will be used to
             download inside the build images.
+        source_checksums: Checksums of the source root that were already
+            computed, keyed by dockerignore file. Will be updated with all
+            checksums computed by this function.
 
     Returns:
         The build response.
     """
+    if source_checksums is None:
+        source_checksums = {}
+
     if not build:
-        if (
-            allow_build_reuse
-            and code_repository
-            and not deployment.requires_included_files
-        ):
+        if allow_build_reuse:
             existing_build = find_existing_build(
-                deployment=deployment, code_repository=code_repository
+                deployment=deployment,
+                code_repository=code_repository,
+                source_checksums=source_checksums,
             )
 
             if existing_build:
@@ -97,6 +106,7 @@ def reuse_or_create_pipeline_build(
             deployment=deployment,
             pipeline_id=pipeline_id,
             code_repository=code_repository,
+            source_checksums=source_checksums,
         )
 
     build_model = None
@@ -117,6 +127,7 @@ def reuse_or_create_pipeline_build(
         build=build_model,
         deployment=deployment,
         code_repository=code_repository,
+        source_checksums=source_checksums,
     )
 
     return build_model
@@ -124,20 +135,29 @@ def reuse_or_create_pipeline_build(
 
 def find_existing_build(
     deployment: "PipelineDeploymentBaseModel",
-    code_repository: "BaseCodeRepository",
+    code_repository: Optional["BaseCodeRepository"] = None,
+    source_checksums: Optional[Dict[Optional[str], str]] = None,
 ) -> Optional["PipelineBuildResponseModel"]:
     """Find an existing build for a deployment.
 
+    The build checksum covers the content of the source files for all images
+    that include them, which means builds that contain code can be reused as
+    long as the code didn't change.
+
     Args:
         deployment: The deployment for which to find an existing build.
         code_repository: The code repository that will be used to download
             files in the images.
+        source_checksums: Checksums of the source root that were already
+            computed, keyed by dockerignore file. Will be updated with all
+            checksums computed by this function.
 
     Returns:
         The existing build to reuse if found.
     """
     client = Client()
     stack = client.active_stack
+    is_local = stack.container_registry is None
 
     python_version_prefix = ".".join(platform.python_version_tuple()[:2])
     required_builds = stack.get_docker_builds(deployment=deployment)
@@ -146,21 +166,17 @@ def find_existing_build(
         return None
 
     build_checksum = compute_build_checksum(
-        required_builds, stack=stack, code_repository=code_repository
+        required_builds,
+        stack=stack,
+        code_repository=code_repository,
+        source_checksums=source_checksums,
     )
 
     matches = client.list_builds(
         sort_by="desc:created",
         size=1,
         stack_id=stack.id,
-        # The build is local and it's not clear whether the images
-        # exist on the current machine or if they've been overwritten.
-        # TODO: Should we support this by storing the unique Docker ID for
-        # the image and checking if an image with that ID exists locally?
-        is_local=False,
-        # The build contains some code which might be different than the
-        # local code the user is expecting to run
-        contains_code=False,
+        is_local=is_local,
         zenml_version=zenml.__version__,
         # Match all patch versions of the same Python major + minor
         python_version=f"startswith:{python_version_prefix}",
@@ -170,21 +186,74 @@ def find_existing_build(
     if not matches.items:
         return None
 
-    return matches[0]
+    existing_build = matches[0]
+    if existing_build.is_local and not _is_local_build_available(
+        existing_build
+    ):
+        return None
+
+    return existing_build
+
+
+def _is_local_build_available(build: "PipelineBuildResponseModel") -> bool:
+    """Checks whether the images of a local build are still available.
+
+    Local images are not pushed to a container registry. Their tags contain
+    the settings checksum, but images of builds that were created before
+    that might have been overwritten by subsequent builds. A local build is
+    therefore only considered available if it is the latest local build of
+    its stack and all its images still exist locally.
+
+    Args:
+        build: The local build to check.
+
+    Returns:
+        Whether the images of the build are still available.
+    """
+    latest_local_builds = Client().list_builds(
+        sort_by="desc:created",
+        size=1,
+        stack_id=build.stack.id if build.stack else None,
+        is_local=True,
+    )
+    if not latest_local_builds.items or latest_local_builds[0].id != build.id:
+        return False
+
+    try:
+        return all(
+            docker_utils.is_local_image(item.image)
+            for item in build.images.values()
+        )
+    except Exception:
+        logger.debug(
+            "Unable to check whether the images of build `%s` exist locally.",
+            build.id,
+            exc_info=True,
+        )
+        return False
 
 
 def create_pipeline_build(
     deployment: "PipelineDeploymentBaseModel",
     pipeline_id: Optional[UUID] = None,
     code_repository: Optional["BaseCodeRepository"] = None,
+    source_checksums: Optional[Dict[Optional[str], str]] = None,
 ) -> Optional["PipelineBuildResponseModel"]:
     """Builds images and registers the output in the server.
 
+    Local images are tagged with the checksum of their settings, which
+    prevents a build from overwriting the images of previous local builds.
+    Only the images of the previous local build of the stack that were
+    replaced by the new build are removed.
+
     Args:
         deployment: The pipeline deployment.
         pipeline_id: The ID of the pipeline.
         code_repository: If provided, this code repository will be used to
             download inside the build images.
+        source_checksums: Checksums of the source root that were already
+            computed, keyed by dockerignore file. Will be updated with all
+            checksums computed by this function.
 
     Returns:
         The build output.
@@ -195,12 +264,16 @@ def create_pipeline_build(
     """
     client = Client()
     stack = client.active_stack
+    is_local = stack.container_registry is None
     required_builds = stack.get_docker_builds(deployment=deployment)
 
     if not required_builds:
         logger.debug("No docker builds required.")
         return None
 
+    if source_checksums is None:
+        source_checksums = {}
+
     logger.info(
         "Building Docker image(s) for pipeline `%s`.",
         deployment.pipeline_configuration.name,
@@ -215,7 +288,9 @@ def create_pipeline_build(
             component_key=build_config.key, step=build_config.step_name
         )
         checksum = build_config.compute_settings_checksum(
-            stack=stack, code_repository=code_repository
+            stack=stack,
+            code_repository=code_repository,
+            source_checksums=source_checksums,
         )
 
         if combined_key in images:
@@ -235,6 +310,18 @@ def create_pipeline_build(
             else:
                 continue
 
+        include_files = build_config.should_include_files(
+            code_repository=code_repository,
+        )
+        download_files = build_config.should_download_files(
+            code_repository=code_repository,
+        )
+        source_checksum = (
+            source_checksums.get(build_config.settings.dockerignore)
+            if include_files
+            else None
+        )
+
         if checksum in checksums:
             item_key = checksums[checksum]
             image_name_or_digest = images[item_key].image
@@ -246,13 +333,8 @@ def create_pipeline_build(
             if build_config.step_name:
                 tag += f"-{build_config.step_name}"
             tag += f"-{build_config.key}"
-
-            include_files = build_config.should_include_files(
-                code_repository=code_repository,
-            )
-            download_files = build_config.should_download_files(
-                code_repository=code_repository,
-            )
+            if is_local:
+                tag += f"-{checksum[:LOCAL_IMAGE_TAG_CHECKSUM_LENGTH]}"
 
             (
                 image_name_or_digest,
@@ -275,6 +357,7 @@ def create_pipeline_build(
             dockerfile=dockerfile,
             requirements=requirements,
             settings_checksum=checksum,
+            source_checksum=source_checksum,
             contains_code=contains_code,
             requires_code_download=download_files,
         )
@@ -282,10 +365,23 @@ def create_pipeline_build(
 
     logger.info("Finished building Docker image(s).")
 
-    is_local = stack.container_registry is None
     contains_code = any(item.contains_code for item in images.values())
     build_checksum = compute_build_checksum(
-        required_builds, stack=stack, code_repository=code_repository
+        required_builds,
+        stack=stack,
+        code_repository=code_repository,
+        source_checksums=source_checksums,
+    )
+
+    previous_local_builds = (
+        client.list_builds(
+            sort_by="desc:created",
+            size=1,
+            stack_id=stack.id,
+            is_local=True,
+        )
+        if is_local
+        else None
     )
 
     build_request = PipelineBuildRequestModel(
@@ -300,13 +396,59 @@ def create_pipeline_build(
         python_version=platform.python_version(),
         checksum=build_checksum,
     )
-    return client.zen_store.create_build(build_request)
+    build = client.zen_store.create_build(build_request)
+
+    if previous_local_builds and previous_local_builds.items:
+        _prune_previous_local_images(
+            previous_build=previous_local_builds[0], build=build
+        )
+
+    return build
+
+
+def _prune_previous_local_images(
+    previous_build: "PipelineBuildResponseModel",
+    build: "PipelineBuildResponseModel",
+) -> None:
+    """Removes the images of the previous local build that were replaced.
+
+    Local images are tagged with their settings checksum, so every change of
+    the code or settings creates a new image. Only the latest local build of
+    a stack gets reused, which is why the images of the previous build are
+    removed once a new build replaced them for the same key.
+
+    Args:
+        previous_build: The previous local build of the stack.
+        build: The new local build.
+    """
+    new_images = {item.image for item in build.images.values()}
+    for key, item in previous_build.images.items():
+        new_item = build.images.get(key)
+        if not new_item or item.image in new_images:
+            continue
+
+        # Only remove images that were tagged by ZenML for the same key
+        prefix, _, _ = item.image.rpartition("-")
+        new_prefix, _, _ = new_item.image.rpartition("-")
+        if not prefix or prefix != new_prefix:
+            continue
+
+        try:
+            docker_utils.remove_image(item.image)
+            logger.debug("Removed outdated local image `%s`.", item.image)
+        except Exception as e:
+            logger.debug(
+                "Failed to remove outdated local image `%s`: %s",
+                item.image,
+                e,
+            )
 
 
 def compute_build_checksum(
     items: List["BuildConfiguration"],
     stack: "Stack",
     code_repository: Optional["BaseCodeRepository"] = None,
+    source_checksums: Optional[Dict[Optional[str], str]] = None,
 ) -> str:
     """Compute an overall checksum for a pipeline build.
 
@@ -317,10 +459,16 @@ def compute_build_checksum(
         code_repository: The code repository that will be used to download
             files inside the build. Will be used for its dependency
             specification.
+        source_checksums: Checksums of the source root that were already
+            computed, keyed by dockerignore file. Will be updated with all
+            checksums computed by this function.
 
     Returns:
         The build checksum.
     """
+    if source_checksums is None:
+        source_checksums = {}
+
     hash_ = hashlib.md5()
 
     for item in items:
@@ -331,6 +479,7 @@ def compute_build_checksum(
         settings_checksum = item.compute_settings_checksum(
             stack=stack,
             code_repository=code_repository,
+            source_checksums=source_checksums,
         )
 
         hash_.update(key.encode())
@@ -403,6 +552,7 @@ def verify_custom_build(
     build: "PipelineBuildResponseModel",
     deployment: "PipelineDeploymentBaseModel",
     code_repository: Optional["BaseCodeRepository"] = None,
+    source_checksums: Optional[Dict[Optional[str], str]] = None,
 ) -> None:
     """Verify a custom build for a pipeline deployment.
 
@@ -411,10 +561,16 @@ def verify_custom_build(
         deployment: The deployment for which to verify the build.
         code_repository: Code repository that will be used to download files
             for the deployment.
+        source_checksums: Checksums of the source root that were already
+            computed, keyed by dockerignore file. Will be updated with all
+            checksums computed by this function.
 
     Raises:
         RuntimeError: If the build can't be used for the deployment.
     """
+    if source_checksums is None:
+        source_checksums = {}
+
     stack = Client().active_stack
     required_builds = stack.get_docker_builds(deployment=deployment)
 
@@ -445,16 +601,18 @@ def verify_custom_build(
 
     if build.checksum:
         build_checksum = compute_build_checksum(
-            required_builds, stack=stack, code_repository=code_repository
+            required_builds,
+            stack=stack,
+            code_repository=code_repository,
+            source_checksums=source_checksums,
         )
         if build_checksum != build.checksum:
-            logger.warning(
-                "The Docker settings used for the build `%s` are "
-                "not the same as currently specified for your pipeline. "
-                "This means that the build you specified to run this "
-                "pipeline might be outdated and most likely contains "
-                "outdated requirements.",
-                build.id,
+            _warn_about_outdated_build(
+                build=build,
+                build_configs=required_builds,
+                stack=stack,
+                code_repository=code_repository,
+                name=f"build `{build.id}`",
             )
     else:
         # No checksum given for the entire build, we manually check that
@@ -472,17 +630,18 @@ def verify_custom_build(
                 )
 
             if build_config.compute_settings_checksum(
-                stack=stack, code_repository=code_repository
+                stack=stack,
+                code_repository=code_repository,
+                source_checksums=source_checksums,
             ) != build.get_settings_checksum(
                 component_key=build_config.key, step=build_config.step_name
             ):
-                logger.warning(
-                    "The Docker settings used to build the image `%s` are "
-                    "not the same as currently specified for your pipeline. "
-                    "This means that the build you specified to run this "
-                    "pipeline might be outdated and most likely contains "
-                    "outdated code or requirements.",
-                    image,
+                _warn_about_outdated_build(
+                    build=build,
+                    build_configs=[build_config],
+                    stack=stack,
+                    code_repository=code_repository,
+                    name=f"image `{image}`",
                 )
 
     if build.is_local:
@@ -492,3 +651,81 @@ def verify_custom_build(
             "your local machine or the image tags have been "
             "overwritten since the original build happened."
         )
+
+
+def _warn_about_outdated_build(
+    build: "PipelineBuildResponseModel",
+    build_configs: List["BuildConfiguration"],
+    stack: "Stack",
+    code_repository: Optional["BaseCodeRepository"],
+    name: str,
+) -> None:
+    """Warns that a build doesn't match the current pipeline.
+
+    The images of a build store the checksum of the source files they
+    include. Recomputing the settings checksums with these source checksums
+    tells whether only the code changed since the build was created.
+
+    Args:
+        build: The outdated build.
+        build_configs: The build configurations of the images to check.
+        stack: The stack on which the pipeline will run.
+        code_repository: Code repository that will be used to download files
+            for the deployment.
+        name: Name of the build or image to use in the warning.
+    """
+    code_changed_only = True
+    for build_config in build_configs:
+        key = PipelineBuildBaseModel.get_image_key(
+            component_key=build_config.key, step=build_config.step_name
+        )
+        item = build.images.get(key)
+        if not item:
+            code_changed_only = False
+            break
+
+        source_checksums: Dict[Optional[str], str] = {}
+        if build_config.should_include_files(code_repository=code_repository):
+            if item.source_checksum is None:
+                # The build was created before the source checksum was
+                # stored, so the code and settings can't be told apart
+                logger.warning(
+                    "The Docker settings or the code used for the %s are not "
+                    "the same as currently specified for your pipeline. This "
+                    "means that the build you specified to run this pipeline "
+                    "might be outdated and most likely contains outdated "
+                    "code or requirements.",
+                    name,
+                )
+                return
+            source_checksums[
+                build_config.settings.dockerignore
+            ] = item.source_checksum
+
+        if (
+            build_config.compute_settings_checksum(
+                stack=stack,
+                code_repository=code_repository,
+                source_checksums=source_checksums,
+            )
+            != item.settings_checksum
+        ):
+            code_changed_only = False
+            break
+
+    if code_changed_only:
+        logger.warning(
+            "The code included in the %s is not the same as the code in "
+            "your source root. The Docker settings are unchanged, but the "
+            "pipeline will run with the code that was included when the "
+            "build was created.",
+            name,
+        )
+    else:
+        logger.warning(
+            "The Docker settings used for the %s are not the same as "
+            "currently specified for your pipeline. This means that the "
+            "build you specified to run this pipeline might be outdated and "
+            "most likely contains outdated requirements.",
+            name,
+        )
@@ -0,0 +1,147 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""In-process cache of compiled and registered pipelines."""
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Hashable, Optional, Tuple
+from uuid import UUID
+
+from zenml.utils.singleton import SingletonMetaClass
+
+if TYPE_CHECKING:
+    from zenml.config.pipeline_spec import PipelineSpec
+    from zenml.models import PipelineResponseModel
+    from zenml.models.pipeline_deployment_models import (
+        PipelineDeploymentBaseModel,
+    )
+
+CompiledPipeline = Tuple["PipelineDeploymentBaseModel", "PipelineSpec"]
+
+MAX_COMPILED_PIPELINES = 32
+MAX_REGISTERED_PIPELINES = 128
+
+
+class PipelineCompileCache(metaclass=SingletonMetaClass):
+    """In-process cache of compiled and registered pipelines.
+
+    Compiling a pipeline resolves sources, settings and stack defaults and
+    registering it requires multiple requests to the ZenML store. When the
+    same pipeline is run many times from one process, e.g. for a parameter
+    sweep, the compiled deployments and registered pipelines are stored
+    here so they can be reused by the following runs.
+
+    Both caches keep the most recently used entries up to a fixed size.
+    Registered pipelines might get deleted in the meantime, so users of the
+    cache need to verify that a cached pipeline still exists.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the cache."""
+        self._lock = threading.Lock()
+        self._deployments: "OrderedDict[Hashable, CompiledPipeline]" = (
+            OrderedDict()
+        )
+        self._pipelines: "OrderedDict[Hashable, PipelineResponseModel]" = (
+            OrderedDict()
+        )
+
+    def get_deployment(self, key: Hashable) -> Optional[CompiledPipeline]:
+        """Gets a compiled pipeline.
+
+        Args:
+            key: The compile cache key of the pipeline.
+
+        Returns:
+            A copy of the compiled deployment and the pipeline spec, or None
+            if the pipeline wasn't compiled with this key yet.
+        """
+        with self._lock:
+            entry = self._deployments.get(key)
+            if entry is None:
+                return None
+            self._deployments.move_to_end(key)
+
+        deployment, pipeline_spec = entry
+        # The deployment gets modified by some of its users, so every run
+        # gets its own copy
+        return deployment.copy(deep=True), pipeline_spec
+
+    def add_deployment(
+        self,
+        key: Hashable,
+        deployment: "PipelineDeploymentBaseModel",
+        pipeline_spec: "PipelineSpec",
+    ) -> None:
+        """Adds a compiled pipeline.
+
+        Args:
+            key: The compile cache key of the pipeline.
+            deployment: The compiled deployment.
+            pipeline_spec: The compiled pipeline spec.
+        """
+        entry = (deployment.copy(deep=True), pipeline_spec)
+        with self._lock:
+            self._deployments[key] = entry
+            self._deployments.move_to_end(key)
+            while len(self._deployments) > MAX_COMPILED_PIPELINES:
+                self._deployments.popitem(last=False)
+
+    def get_pipeline(self, key: Hashable) -> Optional["PipelineResponseModel"]:
+        """Gets a registered pipeline.
+
+        Args:
+            key: The registration key of the pipeline.
+
+        Returns:
+            The registered pipeline or None if the pipeline wasn't registered
+            with this key yet.
+        """
+        with self._lock:
+            pipeline = self._pipelines.get(key)
+            if pipeline is not None:
+                self._pipelines.move_to_end(key)
+            return pipeline
+
+    def add_pipeline(
+        self, key: Hashable, pipeline: "PipelineResponseModel"
+    ) -> None:
+        """Adds a registered pipeline.
+
+        Args:
+            key: The registration key of the pipeline.
+            pipeline: The registered pipeline.
+        """
+        with self._lock:
+            self._pipelines[key] = pipeline
+            self._pipelines.move_to_end(key)
+            while len(self._pipelines) > MAX_REGISTERED_PIPELINES:
+                self._pipelines.popitem(last=False)
+
+    def remove_pipeline(self, pipeline_id: UUID) -> None:
+        """Removes a registered pipeline.
+
+        Args:
+            pipeline_id: The ID of the pipeline to remove.
+        """
+        with self._lock:
+            for key, pipeline in list(self._pipelines.items()):
+                if pipeline.id == pipeline_id:
+                    del self._pipelines[key]
+
+    def clear(self) -> None:
+        """Removes all compiled and registered pipelines from the cache."""
+        with self._lock:
+            self._deployments.clear()
+            self._pipelines.clear()
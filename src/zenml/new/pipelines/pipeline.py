@@ -15,6 +15,7 @@
 import copy
 import hashlib
 import inspect
+import json
 from datetime import datetime
 from pathlib import Path
 from types import FunctionType
@@ -24,9 +25,11 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    Hashable,
     List,
     Mapping,
     Optional,
+    Sequence,
     Set,
     Tuple,
     TypeVar,
@@ -36,6 +39,7 @@ from uuid import UUID
 
 import yaml
 from pydantic import ValidationError
+from pydantic.json import pydantic_encoder
 
 from zenml import constants
 from zenml.client import Client
@@ -66,6 +70,7 @@ from zenml.models.pipeline_build_models import (
 )
 from zenml.models.pipeline_deployment_models import PipelineDeploymentBaseModel
 from zenml.new.pipelines import build_utils
+from zenml.new.pipelines.compile_cache import PipelineCompileCache
 from zenml.stack import Stack
 from zenml.steps import BaseStep
 from zenml.steps.entrypoint_function_utils import (
@@ -85,6 +90,7 @@ from zenml.utils import (
 from zenml.utils.analytics_utils import AnalyticsEvent, event_handler
 
 if TYPE_CHECKING:
+    from zenml.code_repositories import LocalRepositoryContext
     from zenml.config.base_settings import SettingsOrDict
     from zenml.config.source import Source
 
@@ -389,11 +395,7 @@ class Pipeline:
         Returns:
             The registered pipeline model.
         """
-        # Activating the built-in integrations to load all materializers
-        from zenml.integrations.registry import integration_registry
-
         self._prepare_if_possible()
-        integration_registry.activate_integrations()
 
         custom_configurations = self.configuration.dict(
             exclude_defaults=True, exclude={"name"}
@@ -597,20 +599,7 @@ class Pipeline:
             )
             build_id = build_model.id if build_model else None
 
-            code_reference = None
-            if local_repo_context and not local_repo_context.is_dirty:
-                source_root = source_utils.get_source_root()
-                subdirectory = (
-                    Path(source_root)
-                    .resolve()
-                    .relative_to(local_repo_context.root)
-                )
-
-                code_reference = CodeReferenceRequestModel(
-                    commit=local_repo_context.current_commit,
-                    subdirectory=subdirectory.as_posix(),
-                    code_repository=local_repo_context.code_repository_id,
-                )
+            code_reference = self._get_code_reference(local_repo_context)
 
             deployment_request = PipelineDeploymentRequestModel(
                 user=Client().active_user.id,
@@ -666,6 +655,280 @@ class Pipeline:
                     f"infrastructure.",
                 )
 
+    def run_many(
+        self,
+        parameters: Sequence[Dict[str, Any]],
+        *,
+        enable_cache: Optional[bool] = None,
+        enable_artifact_metadata: Optional[bool] = None,
+        enable_artifact_visualization: Optional[bool] = None,
+        enable_step_logs: Optional[bool] = None,
+        build: Union[str, "UUID", "PipelineBuildBaseModel", None] = None,
+        settings: Optional[Mapping[str, "SettingsOrDict"]] = None,
+        step_configurations: Optional[
+            Mapping[str, "StepConfigurationUpdateOrDict"]
+        ] = None,
+        extra: Optional[Dict[str, Any]] = None,
+        config_path: Optional[str] = None,
+        unlisted: Optional[bool] = None,
+        prevent_build_reuse: Optional[bool] = None,
+    ) -> List[PipelineDeploymentResponseModel]:
+        """Runs the pipeline once for each set of parameters.
+
+        All runs share the same configuration and only differ in the
+        arguments passed to the pipeline entrypoint function. The pipeline is
+        registered once for each distinct pipeline spec, the stack is
+        validated and the Docker builds are resolved once for all runs, the
+        deployments are created with a single request and then passed to the
+        orchestrator as a batch.
+
+        Options configured using `pipeline.with_options(...)` are used unless
+        they are overwritten by the arguments of this method.
+
+        Args:
+            parameters: The entrypoint function arguments, one dictionary for
+                each run.
+            enable_cache: If caching should be enabled for the pipeline runs.
+            enable_artifact_metadata: If artifact metadata should be enabled
+                for the pipeline runs.
+            enable_artifact_visualization: If artifact visualization should be
+                enabled for the pipeline runs.
+            enable_step_logs: If step logs should be enabled for the pipeline
+                runs.
+            build: Optional build to use for the runs.
+            settings: Settings for the pipeline runs.
+            step_configurations: Configurations for steps of the pipeline.
+            extra: Extra configurations for the pipeline runs.
+            config_path: Path to a yaml configuration file. This file will
+                be parsed as a
+                `zenml.config.pipeline_configurations.PipelineRunConfiguration`
+                object. Options provided in this file will be overwritten by
+                options provided in code using the other arguments of this
+                method.
+            unlisted: Whether the pipeline runs should be unlisted (not
+                assigned to any pipeline).
+            prevent_build_reuse: Whether to prevent the reuse of a build.
+
+        Returns:
+            The deployments of the pipeline runs, in the same order as the
+            parameters.
+
+        Raises:
+            ValueError: If a fixed run name or schedule was configured for
+                the pipeline.
+        """
+        run_args = dict(self._run_args)
+        run_args.update(
+            {
+                key: value
+                for key, value in {
+                    "enable_cache": enable_cache,
+                    "enable_artifact_metadata": enable_artifact_metadata,
+                    "enable_artifact_visualization": enable_artifact_visualization,
+                    "enable_step_logs": enable_step_logs,
+                    "build": build,
+                    "settings": settings,
+                    "step_configurations": step_configurations,
+                    "extra": extra,
+                    "config_path": config_path,
+                    "unlisted": unlisted,
+                    "prevent_build_reuse": prevent_build_reuse,
+                }.items()
+                if value is not None
+            }
+        )
+        if run_args.pop("run_name", None):
+            raise ValueError(
+                "Running a pipeline multiple times with the same run name is "
+                "not possible. Please remove the run name from the pipeline "
+                "options and use a run name template in the configuration "
+                "file instead."
+            )
+        if run_args.pop("schedule", None):
+            raise ValueError(
+                "Scheduling multiple runs of a pipeline at once is not "
+                "supported."
+            )
+
+        if constants.SHOULD_PREVENT_PIPELINE_EXECUTION:
+            logger.info(
+                "Preventing execution of pipeline '%s'. If this is not "
+                "intended behavior, make sure to unset the environment "
+                "variable '%s'.",
+                self.name,
+                constants.ENV_ZENML_PREVENT_PIPELINE_EXECUTION,
+            )
+            return []
+
+        if not parameters:
+            return []
+
+        logger.info(
+            "Initiating %d new runs for the pipeline: `%s`.",
+            len(parameters),
+            self.name,
+        )
+
+        with event_handler(
+            event=AnalyticsEvent.RUN_PIPELINE, v2=True
+        ) as analytics_handler:
+            skip_pipeline_registration = constants.handle_bool_env_var(
+                constants.ENV_ZENML_SKIP_PIPELINE_REGISTRATION,
+                default=False,
+            )
+            register_pipeline = not (
+                skip_pipeline_registration or run_args.get("unlisted", False)
+            )
+
+            compiled_pipelines: List[
+                Tuple[PipelineDeploymentBaseModel, Optional[UUID]]
+            ] = []
+            pipeline_ids: Dict[str, Optional[UUID]] = {}
+            build_arg = run_args.get("build")
+            for entrypoint_kwargs in parameters:
+                self.prepare(**entrypoint_kwargs)
+                deployment, pipeline_spec, schedule, build_arg = self._compile(
+                    config_path=run_args.get("config_path"),
+                    enable_cache=run_args.get("enable_cache"),
+                    enable_artifact_metadata=run_args.get(
+                        "enable_artifact_metadata"
+                    ),
+                    enable_artifact_visualization=run_args.get(
+                        "enable_artifact_visualization"
+                    ),
+                    enable_step_logs=run_args.get("enable_step_logs"),
+                    steps=run_args.get("step_configurations"),
+                    settings=run_args.get("settings"),
+                    build=run_args.get("build"),
+                    extra=run_args.get("extra"),
+                )
+                # The configuration file can specify a schedule or run name
+                # as well
+                if schedule:
+                    raise ValueError(
+                        "Scheduling multiple runs of a pipeline at once is "
+                        "not supported. Please remove the schedule from the "
+                        "configuration file."
+                    )
+                if self._is_fixed_run_name_template(
+                    deployment.run_name_template
+                ):
+                    raise ValueError(
+                        "Running a pipeline multiple times with the same run "
+                        f"name `{deployment.run_name_template}` is not "
+                        "possible. Please use a run name template that "
+                        "includes the `{time}` placeholder instead."
+                    )
+
+                # The registration depends on the invocations of the
+                # prepared pipeline, so it needs to happen before the
+                # pipeline gets prepared with the next parameters.
+                spec_key = pipeline_spec.json(sort_keys=True)
+                if spec_key not in pipeline_ids:
+                    pipeline_ids[spec_key] = (
+                        self._register(pipeline_spec=pipeline_spec).id
+                        if register_pipeline
+                        else None
+                    )
+                compiled_pipelines.append((deployment, pipeline_ids[spec_key]))
+
+            client = Client()
+            stack = client.active_stack
+            local_repo_context = (
+                code_repository_utils.find_active_code_repository()
+            )
+            code_reference = self._get_code_reference(local_repo_context)
+
+            build_ids: Dict[str, Optional[UUID]] = {}
+            source_checksums: Dict[Optional[str], str] = {}
+            deployment_requests = []
+            for deployment, pipeline_id in compiled_pipelines:
+                code_repository = build_utils.verify_local_repository_context(
+                    deployment=deployment,
+                    local_repo_context=local_repo_context,
+                )
+                build_key = build_utils.compute_build_checksum(
+                    items=stack.get_docker_builds(deployment=deployment),
+                    stack=stack,
+                    code_repository=code_repository,
+                    source_checksums=source_checksums,
+                )
+                if build_key not in build_ids:
+                    build_model = build_utils.reuse_or_create_pipeline_build(
+                        deployment=deployment,
+                        pipeline_id=pipeline_id,
+                        allow_build_reuse=not run_args.get(
+                            "prevent_build_reuse", False
+                        ),
+                        build=build_arg,
+                        code_repository=code_repository,
+                        source_checksums=source_checksums,
+                    )
+                    build_ids[build_key] = (
+                        build_model.id if build_model else None
+                    )
+
+                deployment_requests.append(
+                    PipelineDeploymentRequestModel(
+                        user=client.active_user.id,
+                        workspace=client.active_workspace.id,
+                        stack=stack.id,
+                        pipeline=pipeline_id,
+                        build=build_ids[build_key],
+                        code_reference=code_reference,
+                        **deployment.dict(),
+                    )
+                )
+
+            deployment_models = client.zen_store.create_deployments(
+                deployments=deployment_requests
+            )
+
+            analytics_handler.metadata = self._get_pipeline_analytics_metadata(
+                deployment=deployment_models[0], stack=stack
+            )
+            analytics_handler.metadata["run_count"] = len(deployment_models)
+            stack.prepare_pipeline_deployment(deployment=deployment_models[0])
+
+            for deployment_model in deployment_models:
+                self.log_pipeline_deployment_metadata(deployment_model)
+
+            # Prevent execution of nested pipelines which might lead to
+            # unexpected behavior
+            constants.SHOULD_PREVENT_PIPELINE_EXECUTION = True
+            try:
+                stack.deploy_pipelines(deployments=deployment_models)
+            finally:
+                constants.SHOULD_PREVENT_PIPELINE_EXECUTION = False
+
+            logger.info(
+                "Submitted %d runs of pipeline `%s`.",
+                len(deployment_models),
+                self.name,
+            )
+            return deployment_models
+
+    @staticmethod
+    def _is_fixed_run_name_template(run_name_template: str) -> bool:
+        """Checks whether a run name template doesn't depend on the time.
+
+        Such a template resolves to the same name for runs that are started
+        on the same day, so they would clash.
+
+        Args:
+            run_name_template: The run name template.
+
+        Returns:
+            Whether the template doesn't contain the `{time}` placeholder.
+        """
+        try:
+            return run_name_template.format(
+                date="", time="0"
+            ) == run_name_template.format(date="", time="1")
+        except (KeyError, IndexError, ValueError):
+            # Invalid templates fail once the runs are created
+            return False
+
     @staticmethod
     def log_pipeline_deployment_metadata(
         deployment_model: PipelineDeploymentResponseModel,
@@ -878,6 +1141,33 @@ class Pipeline:
             "own_stack": own_stack,
         }
 
+    @staticmethod
+    def _get_code_reference(
+        local_repo_context: Optional["LocalRepositoryContext"],
+    ) -> Optional[CodeReferenceRequestModel]:
+        """Gets the code reference for a pipeline deployment.
+
+        Args:
+            local_repo_context: The active local repository context.
+
+        Returns:
+            The code reference, or None if there is no active code repository
+            or the local repository has uncommitted changes.
+        """
+        if not local_repo_context or local_repo_context.is_dirty:
+            return None
+
+        source_root = source_utils.get_source_root()
+        subdirectory = (
+            Path(source_root).resolve().relative_to(local_repo_context.root)
+        )
+
+        return CodeReferenceRequestModel(
+            commit=local_repo_context.current_commit,
+            subdirectory=subdirectory.as_posix(),
+            code_repository=local_repo_context.code_repository_id,
+        )
+
     def _compile(
         self, config_path: Optional[str] = None, **run_configuration_args: Any
     ) -> Tuple[
@@ -896,11 +1186,6 @@ class Pipeline:
             A tuple containing the deployment, spec, schedule and build of
             the compiled pipeline.
         """
-        # Activating the built-in integrations to load all materializers
-        from zenml.integrations.registry import integration_registry
-
-        integration_registry.activate_integrations()
-
         if config_path:
             run_config = PipelineRunConfiguration.from_yaml(config_path)
         else:
@@ -912,14 +1197,100 @@ class Pipeline:
         # Update with the values in code so they take precedence
         run_config = pydantic_utils.update_model(run_config, update=update)
 
-        deployment, pipeline_spec = Compiler().compile(
-            pipeline=self,
-            stack=Client().active_stack,
-            run_configuration=run_config,
+        stack = Client().active_stack
+        cache_key = self._compute_compile_cache_key(
+            run_config=run_config, stack=stack
+        )
+        cached_deployment = (
+            PipelineCompileCache().get_deployment(cache_key)
+            if cache_key
+            else None
         )
+        if cached_deployment:
+            logger.debug("Reusing compiled pipeline `%s`.", self.name)
+            deployment, pipeline_spec = cached_deployment
+        else:
+            deployment, pipeline_spec = Compiler().compile(
+                pipeline=self,
+                stack=stack,
+                run_configuration=run_config,
+            )
+            if cache_key:
+                PipelineCompileCache().add_deployment(
+                    cache_key,
+                    deployment=deployment,
+                    pipeline_spec=pipeline_spec,
+                )
 
         return deployment, pipeline_spec, run_config.schedule, run_config.build
 
+    def _compute_compile_cache_key(
+        self, run_config: PipelineRunConfiguration, stack: "Stack"
+    ) -> Optional[Hashable]:
+        """Computes the key under which the compiled pipeline gets cached.
+
+        The key covers everything the compilation depends on: the pipeline
+        and step configurations, the step invocations including their
+        parameters, the run configuration and the stack components including
+        the time they were last updated. The pipeline entrypoint and step
+        classes are part of the key, so redefining them never reuses a
+        deployment compiled for the previous definitions.
+
+        Args:
+            run_config: The run configuration.
+            stack: The stack on which the pipeline will run.
+
+        Returns:
+            The cache key or None if the compiled pipeline should not be
+            cached. This is the case if caching is disabled, the pipeline
+            uses external artifacts which are uploaded during compilation, or
+            its configuration can't be serialized.
+        """
+        if constants.handle_bool_env_var(
+            constants.ENV_ZENML_DISABLE_PIPELINE_COMPILE_CACHE, default=False
+        ):
+            return None
+
+        invocations = sorted(self.invocations.items())
+        if any(invocation.external_artifacts for _, invocation in invocations):
+            return None
+
+        hash_ = hashlib.md5()
+        try:
+            hash_.update(self.configuration.json(sort_keys=True).encode())
+            hash_.update(run_config.json(sort_keys=True).encode())
+            for invocation_id, invocation in invocations:
+                invocation_dict = {
+                    "id": invocation_id,
+                    "configuration": invocation.step.configuration,
+                    "parameters": invocation.parameters,
+                    "inputs": {
+                        key: [artifact.invocation_id, artifact.output_name]
+                        for key, artifact in invocation.input_artifacts.items()
+                    },
+                    "upstream_steps": sorted(invocation.upstream_steps),
+                }
+                hash_.update(
+                    json.dumps(
+                        invocation_dict,
+                        sort_keys=True,
+                        default=pydantic_encoder,
+                    ).encode()
+                )
+        except (TypeError, ValueError):
+            return None
+
+        for component in stack.components.values():
+            hash_.update(f"{component.id}:{component.updated}".encode())
+
+        source_object = getattr(
+            self.source_object, "__func__", self.source_object
+        )
+        step_classes = tuple(
+            type(invocation.step) for _, invocation in invocations
+        )
+        return hash_.hexdigest(), stack.id, source_object, step_classes
+
     def _register(
         self, pipeline_spec: "PipelineSpec"
     ) -> "PipelineResponseModel":
@@ -936,6 +1307,29 @@ class Pipeline:
         )
 
         client = Client()
+        cache_key = (
+            client.zen_store.url,
+            client.active_workspace.id,
+            self.name,
+            version_hash,
+        )
+        cached_pipeline = PipelineCompileCache().get_pipeline(cache_key)
+        if cached_pipeline:
+            try:
+                # The pipeline might have been deleted since it was cached,
+                # e.g. by another process
+                registered_pipeline = client.zen_store.get_pipeline(
+                    cached_pipeline.id
+                )
+            except KeyError:
+                PipelineCompileCache().remove_pipeline(cached_pipeline.id)
+            else:
+                logger.debug(
+                    "Reusing registered version: `(version: %s)`.",
+                    registered_pipeline.version,
+                )
+                return registered_pipeline
+
         matching_pipelines = client.list_pipelines(
             name=self.name,
             version_hash=version_hash,
@@ -948,6 +1342,7 @@ class Pipeline:
                 "Reusing registered version: `(version: %s)`.",
                 registered_pipeline.version,
             )
+            PipelineCompileCache().add_pipeline(cache_key, registered_pipeline)
             return registered_pipeline
 
         latest_version = self._get_latest_version() or 0
@@ -970,6 +1365,7 @@ class Pipeline:
             "Registered new version: `(version %s)`.",
             registered_pipeline.version,
         )
+        PipelineCompileCache().add_pipeline(cache_key, registered_pipeline)
         return registered_pipeline
 
     def _compute_unique_identifier(self, pipeline_spec: PipelineSpec) -> str:
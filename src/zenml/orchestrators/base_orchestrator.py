@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """Base orchestrator class."""
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, cast
 
 from pydantic import root_validator
 
@@ -171,6 +171,31 @@ class BaseOrchestrator(StackComponent, ABC):
 
         return result
 
+    def run_many(
+        self,
+        deployments: List["PipelineDeploymentResponseModel"],
+        stack: "Stack",
+    ) -> List[Any]:
+        """Runs multiple pipeline deployments on a stack.
+
+        This is called when running a batch of pipeline runs, e.g. a parameter
+        sweep. The default implementation runs the deployments one after the
+        other. Orchestrators that only submit the pipeline to remote
+        infrastructure can override this method to submit all deployments
+        concurrently or in a single request.
+
+        Args:
+            deployments: The pipeline deployments.
+            stack: The stack on which to run the pipelines.
+
+        Returns:
+            Orchestrator-specific return values, one for each deployment.
+        """
+        return [
+            self.run(deployment=deployment, stack=stack)
+            for deployment in deployments
+        ]
+
     def run_step(self, step: "Step") -> None:
         """Runs the given step.
 
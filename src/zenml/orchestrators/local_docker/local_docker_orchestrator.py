@@ -15,12 +15,16 @@
 
 import json
 import os
+import secrets
 import sys
+import threading
 import time
+from multiprocessing.connection import Client as ConnectionClient
+from multiprocessing.connection import Connection
 from typing import TYPE_CHECKING, Any, Dict, Optional, Type, Union, cast
-from uuid import uuid4
+from uuid import UUID, uuid4
 
-from docker.errors import ContainerError
+from docker.errors import ContainerError, DockerException
 from pydantic import validator
 
 from zenml.client import Client
@@ -28,8 +32,12 @@ from zenml.config.base_settings import BaseSettings
 from zenml.config.global_config import GlobalConfiguration
 from zenml.constants import (
     ENV_ZENML_LOCAL_STORES_PATH,
+    ENV_ZENML_STEP_WORKER_AUTH_KEY,
+)
+from zenml.entrypoints import (
+    StepEntrypointConfiguration,
+    StepWorkerEntrypointConfiguration,
 )
-from zenml.entrypoints import StepEntrypointConfiguration
 from zenml.enums import StackComponentType
 from zenml.logger import get_logger
 from zenml.orchestrators import (
@@ -38,10 +46,19 @@ from zenml.orchestrators import (
     ContainerizedOrchestrator,
 )
 from zenml.orchestrators import utils as orchestrator_utils
+from zenml.orchestrators.step_worker import (
+    StepWorkerDiedError,
+    StepWorkerTask,
+    run_step_in_worker,
+    stop_worker,
+)
 from zenml.stack import Stack, StackValidator
 from zenml.utils import string_utils
 
 if TYPE_CHECKING:
+    from docker.client import DockerClient
+    from docker.models.containers import Container
+
     from zenml.models.pipeline_deployment_models import (
         PipelineDeploymentResponseModel,
     )
@@ -49,6 +66,169 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 ENV_ZENML_DOCKER_ORCHESTRATOR_RUN_ID = "ZENML_DOCKER_ORCHESTRATOR_RUN_ID"
+STEP_WORKER_PORT = 8237
+STEP_WORKER_STARTUP_TIMEOUT = 300
+STEP_WORKER_EXIT_TIMEOUT = 10
+
+
+class _StepWorkerContainer:
+    """A long-running Docker container that executes steps."""
+
+    def __init__(self, container: "Container", auth_key: str) -> None:
+        """Initializes the step worker container.
+
+        Args:
+            container: The running container.
+            auth_key: Key to authenticate the connection to the worker.
+        """
+        self._container = container
+        self._auth_key = auth_key.encode()
+        self._connection: Optional[Connection] = None
+        self._log_thread = threading.Thread(
+            target=self._stream_logs, daemon=True
+        )
+        self._log_thread.start()
+
+    @classmethod
+    def start(
+        cls,
+        docker_client: "DockerClient",
+        deployment_id: UUID,
+        environment: Dict[str, str],
+        **run_kwargs: Any,
+    ) -> "_StepWorkerContainer":
+        """Starts a step worker container.
+
+        Args:
+            docker_client: The Docker client.
+            deployment_id: ID of the deployment whose steps the worker runs.
+            environment: Environment variables to set in the container.
+            **run_kwargs: Additional arguments for the `docker run` call.
+
+        Returns:
+            The step worker container.
+        """
+        auth_key = secrets.token_hex(32)
+        run_kwargs.update(
+            entrypoint=StepWorkerEntrypointConfiguration.get_entrypoint_command(),
+            command=StepWorkerEntrypointConfiguration.get_entrypoint_arguments(
+                deployment_id=deployment_id, port=STEP_WORKER_PORT
+            ),
+            environment={
+                **environment,
+                ENV_ZENML_STEP_WORKER_AUTH_KEY: auth_key,
+            },
+            ports={f"{STEP_WORKER_PORT}/tcp": ("127.0.0.1", None)},
+            detach=True,
+        )
+        container = docker_client.containers.run(**run_kwargs)
+        return cls(container=container, auth_key=auth_key)
+
+    def _stream_logs(self) -> None:
+        """Forwards the container logs."""
+        try:
+            for line in self._container.logs(stream=True, follow=True):
+                logger.info(line.strip().decode(errors="replace"))
+        except (DockerException, OSError) as e:
+            # The log stream gets interrupted when the container is stopped
+            logger.debug(
+                "Stopped streaming logs of step worker container `%s`: %s",
+                self._container.name,
+                e,
+            )
+
+    def _connect(self) -> Connection:
+        """Connects to the worker inside the container.
+
+        Raises:
+            RuntimeError: If the worker did not start listening in time.
+
+        Returns:
+            The connection to the worker.
+        """
+        deadline = time.time() + STEP_WORKER_STARTUP_TIMEOUT
+        while True:
+            self._container.reload()
+            if self._container.status not in {"created", "running"}:
+                raise RuntimeError(
+                    f"Step worker container {self._container.short_id} "
+                    "stopped unexpectedly."
+                )
+
+            bindings = self._container.ports.get(f"{STEP_WORKER_PORT}/tcp")
+            if bindings:
+                address = ("127.0.0.1", int(bindings[0]["HostPort"]))
+                try:
+                    return ConnectionClient(address, authkey=self._auth_key)
+                except (OSError, EOFError):
+                    # The port is published before the worker listens on it
+                    pass
+
+            if time.time() > deadline:
+                raise RuntimeError(
+                    "Timed out waiting for step worker container "
+                    f"{self._container.short_id} to start."
+                )
+            time.sleep(0.5)
+
+    def run_step(self, task: StepWorkerTask) -> None:
+        """Runs a step in the worker container.
+
+        Args:
+            task: The task specifying the step to run.
+
+        Raises:
+            RuntimeError: If the worker died while running the step. The
+                container of the worker is removed in that case.
+        """
+        if not self._connection:
+            self._connection = self._connect()
+
+        try:
+            run_step_in_worker(self._connection, task)
+        except StepWorkerDiedError as e:
+            self._connection.close()
+            self._connection = None
+            exit_code = self._get_exit_code()
+            self.stop()
+            raise RuntimeError(
+                f"Step worker container {self._container.short_id} exited "
+                f"with code {exit_code} while running step "
+                f"`{task.step_name}`."
+            ) from e
+
+    def _get_exit_code(self) -> Optional[int]:
+        """Waits for the worker container to exit and gets its exit code.
+
+        Returns:
+            The exit code or None if the container didn't exit in time.
+        """
+        try:
+            status = self._container.wait(timeout=STEP_WORKER_EXIT_TIMEOUT)
+        except Exception as e:
+            logger.debug(
+                "Failed to get the exit code of step worker container %s: %s",
+                self._container.short_id,
+                e,
+            )
+            return None
+
+        return cast(Optional[int], status.get("StatusCode"))
+
+    def stop(self) -> None:
+        """Stops the worker and removes the container."""
+        if self._connection:
+            stop_worker(self._connection)
+            self._connection = None
+
+        try:
+            self._container.remove(force=True)
+        except Exception as e:
+            logger.debug(
+                "Failed to remove step worker container %s: %s",
+                self._container.short_id,
+                e,
+            )
 
 
 class LocalDockerOrchestrator(ContainerizedOrchestrator):
@@ -139,49 +319,102 @@ class LocalDockerOrchestrator(ContainerizedOrchestrator):
         environment[ENV_ZENML_LOCAL_STORES_PATH] = local_stores_path
         start_time = time.time()
 
-        # Run each step
-        for step_name, step in deployment.step_configurations.items():
-            if self.requires_resources_in_orchestration_environment(step):
-                logger.warning(
-                    "Specifying step resources is not supported for the local "
-                    "Docker orchestrator, ignoring resource configuration for "
-                    "step %s.",
-                    step_name,
-                )
-
-            arguments = StepEntrypointConfiguration.get_entrypoint_arguments(
-                step_name=step_name, deployment_id=deployment.id
-            )
+        user = None
+        if sys.platform != "win32":
+            user = os.getuid()
 
-            settings = cast(
-                LocalDockerOrchestratorSettings,
-                self.get_settings(step),
-            )
-            image = self.get_image(deployment=deployment, step_name=step_name)
+        # Start all step workers before running the first step so that they
+        # warm up while the previous steps are running
+        step_workers: Dict[str, _StepWorkerContainer] = {}
+        step_worker_keys: Dict[str, str] = {}
+        try:
+            for step_name, step in deployment.step_configurations.items():
+                settings = cast(
+                    LocalDockerOrchestratorSettings,
+                    self.get_settings(step),
+                )
+                if not settings.use_step_workers:
+                    continue
 
-            user = None
-            if sys.platform != "win32":
-                user = os.getuid()
-            logger.info("Running step `%s` in Docker:", step_name)
+                image = self.get_image(
+                    deployment=deployment, step_name=step_name
+                )
+                key = image + json.dumps(
+                    settings.run_args, sort_keys=True, default=str
+                )
+                if key not in step_workers:
+                    step_workers[key] = _StepWorkerContainer.start(
+                        docker_client=docker_client,
+                        deployment_id=deployment.id,
+                        environment=environment,
+                        image=image,
+                        user=user,
+                        volumes=volumes,
+                        extra_hosts={"host.docker.internal": "host-gateway"},
+                        **settings.run_args,
+                    )
+                step_worker_keys[step_name] = key
+
+            # Run each step
+            for step_name, step in deployment.step_configurations.items():
+                if self.requires_resources_in_orchestration_environment(step):
+                    logger.warning(
+                        "Specifying step resources is not supported for the "
+                        "local Docker orchestrator, ignoring resource "
+                        "configuration for step %s.",
+                        step_name,
+                    )
+
+                if step_name in step_worker_keys:
+                    logger.info(
+                        "Running step `%s` in Docker worker:", step_name
+                    )
+                    step_workers[step_worker_keys[step_name]].run_step(
+                        StepWorkerTask(
+                            deployment_id=deployment.id,
+                            step_name=step_name,
+                            orchestrator_run_id=orchestrator_run_id,
+                        )
+                    )
+                    continue
+
+                arguments = (
+                    StepEntrypointConfiguration.get_entrypoint_arguments(
+                        step_name=step_name, deployment_id=deployment.id
+                    )
+                )
 
-            try:
-                logs = docker_client.containers.run(
-                    image=image,
-                    entrypoint=entrypoint,
-                    command=arguments,
-                    user=user,
-                    volumes=volumes,
-                    environment=environment,
-                    stream=True,
-                    extra_hosts={"host.docker.internal": "host-gateway"},
-                    **settings.run_args,
+                settings = cast(
+                    LocalDockerOrchestratorSettings,
+                    self.get_settings(step),
+                )
+                image = self.get_image(
+                    deployment=deployment, step_name=step_name
                 )
 
-                for line in logs:
-                    logger.info(line.strip().decode())
-            except ContainerError as e:
-                error_message = e.stderr.decode()
-                raise RuntimeError(error_message)
+                logger.info("Running step `%s` in Docker:", step_name)
+
+                try:
+                    logs = docker_client.containers.run(
+                        image=image,
+                        entrypoint=entrypoint,
+                        command=arguments,
+                        user=user,
+                        volumes=volumes,
+                        environment=environment,
+                        stream=True,
+                        extra_hosts={"host.docker.internal": "host-gateway"},
+                        **settings.run_args,
+                    )
+
+                    for line in logs:
+                        logger.info(line.strip().decode())
+                except ContainerError as e:
+                    error_message = e.stderr.decode()
+                    raise RuntimeError(error_message)
+        finally:
+            for step_worker in step_workers.values():
+                step_worker.stop()
 
         run_duration = time.time() - start_time
         run_id = orchestrator_utils.get_run_id_for_orchestrator_run_id(
@@ -202,9 +435,15 @@ class LocalDockerOrchestratorSettings(BaseSettings):
         run_args: Arguments to pass to the `docker run` call. (See
             https://docker-py.readthedocs.io/en/stable/containers.html for a list
             of what can be passed.)
+        use_step_workers: If True, steps are executed by long-running worker
+            containers instead of starting a new container for each step.
+            Each worker imports ZenML and the step code, loads the step sources
+            and constructs the stack only once and then runs all steps of the
+            pipeline run that share its image and run arguments.
     """
 
     run_args: Dict[str, Any] = {}
+    use_step_workers: bool = False
 
     @validator("run_args", pre=True)
     def _convert_json_string(
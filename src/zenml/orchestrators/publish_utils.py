@@ -28,6 +28,7 @@ from zenml.models.step_run_models import (
     StepRunUpdateModel,
 )
 from zenml.utils.pagination_utils import depaginate
+from zenml.utils.timing_utils import STEP_TIMINGS_METADATA_KEY
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -203,6 +204,21 @@ def publish_pipeline_run_metadata(
         )
 
 
+def publish_step_run_timings(
+    step_run_id: "UUID", durations: Dict[str, float]
+) -> None:
+    """Publishes the durations of the phases of a step run.
+
+    Args:
+        step_run_id: The ID of the step run.
+        durations: The durations of the phases in seconds by phase name.
+    """
+    Client().create_run_metadata(
+        metadata={STEP_TIMINGS_METADATA_KEY: durations},
+        step_run_id=step_run_id,
+    )
+
+
 def publish_step_run_metadata(
     step_run_id: "UUID",
     step_run_metadata: Dict["UUID", Dict[str, "MetadataType"]],
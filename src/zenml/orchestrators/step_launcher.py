@@ -22,6 +22,10 @@ from typing import TYPE_CHECKING, Dict, Optional, Tuple
 from zenml.client import Client
 from zenml.config.step_configurations import Step
 from zenml.config.step_run_info import StepRunInfo
+from zenml.constants import (
+    ENV_ZENML_DISABLE_STEP_TIMING_METADATA,
+    handle_bool_env_var,
+)
 from zenml.enums import ExecutionStatus
 from zenml.environment import get_run_environment_dict
 from zenml.logger import get_logger
@@ -45,9 +49,11 @@ from zenml.orchestrators import utils as orchestrator_utils
 from zenml.orchestrators.step_runner import StepRunner
 from zenml.orchestrators.utils import is_setting_enabled
 from zenml.stack import Stack
-from zenml.utils import string_utils
+from zenml.utils import string_utils, timing_utils
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from zenml.models.artifact_models import ArtifactResponseModel
     from zenml.models.pipeline_deployment_models import (
         PipelineDeploymentResponseModel,
@@ -112,6 +118,7 @@ class StepLauncher:
         deployment: "PipelineDeploymentResponseModel",
         step: Step,
         orchestrator_run_id: str,
+        stack: Optional[Stack] = None,
     ):
         """Initializes the launcher.
 
@@ -119,6 +126,8 @@ class StepLauncher:
             deployment: The pipeline deployment.
             step: The step to launch.
             orchestrator_run_id: The orchestrator pipeline run id.
+            stack: The stack of the deployment. If not given, the stack will
+                be created from the stack model of the deployment.
 
         Raises:
             RuntimeError: If the deployment has no associated stack.
@@ -133,16 +142,41 @@ class StepLauncher:
                 "probably because the stack was manually deleted."
             )
 
-        self._stack = Stack.from_model(deployment.stack)
+        self._stack = stack or Stack.from_model(deployment.stack)
         self._step_name = step.spec.pipeline_parameter_name
+        self._step_run_id: Optional["UUID"] = None
 
     def launch(self) -> None:
         """Launches the step.
 
+        The durations of the phases of the step run are measured and stored
+        as metadata of the step run, unless the
+        `ZENML_DISABLE_STEP_TIMING_METADATA` environment variable is set.
+        """
+        timer = timing_utils.StepTimer()
+        try:
+            with timer.activate():
+                self._launch()
+        finally:
+            if self._step_run_id and not handle_bool_env_var(
+                ENV_ZENML_DISABLE_STEP_TIMING_METADATA, default=False
+            ):
+                try:
+                    publish_utils.publish_step_run_timings(
+                        step_run_id=self._step_run_id,
+                        durations=timer.durations,
+                    )
+                except Exception as e:
+                    logger.debug("Failed to publish step timings: %s", e)
+
+    def _launch(self) -> None:
+        """Launches the step.
+
         Raises:
             Exception: If the step failed to launch, run, or publish.
         """
-        pipeline_run, run_was_created = self._create_or_reuse_run()
+        with timing_utils.span("create_or_reuse_run"):
+            pipeline_run, run_was_created = self._create_or_reuse_run()
 
         # Set up logging
         step_logging_enabled = is_setting_enabled(
@@ -179,15 +213,18 @@ class StepLauncher:
                     step_logging.StepStdErr()
                 ) if step_logging_enabled else nullcontext():
                     if run_was_created:
-                        pipeline_run_metadata = (
-                            self._stack.get_pipeline_run_metadata(
-                                run_id=pipeline_run.id
+                        with timing_utils.span(
+                            "publish_pipeline_run_metadata"
+                        ):
+                            pipeline_run_metadata = (
+                                self._stack.get_pipeline_run_metadata(
+                                    run_id=pipeline_run.id
+                                )
+                            )
+                            publish_utils.publish_pipeline_run_metadata(
+                                pipeline_run_id=pipeline_run.id,
+                                pipeline_run_metadata=pipeline_run_metadata,
                             )
-                        )
-                        publish_utils.publish_pipeline_run_metadata(
-                            pipeline_run_id=pipeline_run.id,
-                            pipeline_run_metadata=pipeline_run_metadata,
-                        )
                     client = Client()
                     (
                         docstring,
@@ -218,9 +255,11 @@ class StepLauncher:
                         step_run.end_time = datetime.utcnow()
                         raise
                     finally:
-                        step_run_response = Client().zen_store.create_run_step(
-                            step_run
-                        )
+                        with timing_utils.span("create_step_run"):
+                            step_run_response = (
+                                Client().zen_store.create_run_step(step_run)
+                            )
+                        self._step_run_id = step_run_response.id
 
                     logger.info(f"Step `{self._step_name}` has started.")
                     if execution_needed:
@@ -239,9 +278,10 @@ class StepLauncher:
                             )
                             raise
 
-                    publish_utils.update_pipeline_run_status(
-                        pipeline_run=pipeline_run
-                    )
+                    with timing_utils.span("update_pipeline_run_status"):
+                        publish_utils.update_pipeline_run_status(
+                            pipeline_run=pipeline_run
+                        )
         except:  # noqa: E722
             logger.error(f"Pipeline run `{pipeline_run.name}` failed.")
             publish_utils.publish_failed_pipeline_run(pipeline_run.id)
@@ -341,20 +381,25 @@ class StepLauncher:
             Tuple that specifies whether the step needs to be executed as
             well as the response model of the registered step run.
         """
-        input_artifacts, parent_step_ids = input_utils.resolve_step_inputs(
-            step=self._step, run_id=step_run.pipeline_run_id
-        )
+        with timing_utils.span("resolve_inputs"):
+            (
+                input_artifacts,
+                parent_step_ids,
+            ) = input_utils.resolve_step_inputs(
+                step=self._step, run_id=step_run.pipeline_run_id
+            )
         input_artifact_ids = {
             input_name: artifact.id
             for input_name, artifact in input_artifacts.items()
         }
 
-        cache_key = cache_utils.generate_cache_key(
-            step=self._step,
-            input_artifact_ids=input_artifact_ids,
-            artifact_store=self._stack.artifact_store,
-            workspace_id=Client().active_workspace.id,
-        )
+        with timing_utils.span("compute_cache_key"):
+            cache_key = cache_utils.generate_cache_key(
+                step=self._step,
+                input_artifact_ids=input_artifact_ids,
+                artifact_store=self._stack.artifact_store,
+                workspace_id=Client().active_workspace.id,
+            )
 
         step_run.inputs = input_artifact_ids
         step_run.parent_step_ids = parent_step_ids
@@ -367,9 +412,10 @@ class StepLauncher:
 
         execution_needed = True
         if cache_enabled:
-            cached_step_run = cache_utils.get_cached_step_run(
-                cache_key=cache_key
-            )
+            with timing_utils.span("cache_lookup"):
+                cached_step_run = cache_utils.get_cached_step_run(
+                    cache_key=cache_key
+                )
             if cached_step_run:
                 logger.info(f"Using cached version of `{self._step_name}`.")
                 execution_needed = False
@@ -405,9 +451,10 @@ class StepLauncher:
             step_run_id=step_run.id,
         )
 
-        output_artifact_uris = output_utils.prepare_output_artifact_uris(
-            step_run=step_run, stack=self._stack, step=self._step
-        )
+        with timing_utils.span("prepare_output_artifact_uris"):
+            output_artifact_uris = output_utils.prepare_output_artifact_uris(
+                step_run=step_run, stack=self._stack, step=self._step
+            )
 
         # Run the step.
         start_time = time.time()
@@ -470,11 +517,12 @@ class StepLauncher:
             step_operator.name,
             self._step_name,
         )
-        step_operator.launch(
-            info=step_run_info,
-            entrypoint_command=entrypoint_command,
-            environment=environment,
-        )
+        with timing_utils.span("step_operator"):
+            step_operator.launch(
+                info=step_run_info,
+                entrypoint_command=entrypoint_command,
+                environment=environment,
+            )
 
     def _run_step_without_step_operator(
         self,
@@ -14,7 +14,10 @@
 
 """Class to run steps."""
 
+import copy
 import inspect
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -30,10 +33,18 @@ from pydantic.typing import get_origin, is_union
 from zenml.client import Client
 from zenml.config.step_configurations import StepConfiguration
 from zenml.config.step_run_info import StepRunInfo
+from zenml.constants import (
+    ENV_ZENML_ASYNC_ARTIFACT_UPLOAD,
+    ENV_ZENML_INPUT_ARTIFACT_LOAD_MAX_WORKERS,
+    handle_bool_env_var,
+    handle_int_env_var,
+)
 from zenml.enums import StackComponentType
 from zenml.exceptions import StepInterfaceError
 from zenml.logger import get_logger
+from zenml.materializers import lazy_artifact
 from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.materializers.lazy_artifact import LazyArtifact
 from zenml.materializers.unmaterialized_artifact import UnmaterializedArtifact
 from zenml.new.steps.step_context import StepContext, get_step_context
 from zenml.orchestrators.publish_utils import (
@@ -46,13 +57,19 @@ from zenml.steps.utils import (
     parse_return_type_annotations,
     resolve_type_annotation,
 )
-from zenml.utils import artifact_utils, materializer_utils, source_utils
+from zenml.utils import (
+    artifact_utils,
+    materializer_utils,
+    source_utils,
+    timing_utils,
+)
 
 if TYPE_CHECKING:
     from uuid import UUID
 
     from zenml.config.source import Source
     from zenml.config.step_configurations import Step
+    from zenml.metadata.metadata_types import MetadataType
     from zenml.models.artifact_models import ArtifactResponseModel
     from zenml.models.pipeline_run_models import PipelineRunResponseModel
     from zenml.models.step_run_models import StepRunResponseModel
@@ -62,6 +79,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+DEFAULT_INPUT_ARTIFACT_LOAD_MAX_WORKERS = 4
+LAZY_INPUTS_LOADED_METADATA_KEY = "lazy_inputs_loaded"
+
 
 class StepRunner:
     """Class to run steps."""
@@ -105,8 +125,9 @@ class StepRunner:
         Raises:
             BaseException: A general exception if the step fails.
         """
-        step_instance = self._load_step()
-        output_materializers = self._load_output_materializers()
+        with timing_utils.span("load_step"):
+            step_instance = self._load_step()
+            output_materializers = self._load_output_materializers()
         spec = inspect.getfullargspec(inspect.unwrap(step_instance.entrypoint))
 
         # (Deprecated) Wrap the execution of the step function in a step environment
@@ -121,7 +142,8 @@ class StepRunner:
             step_run_info=step_run_info,
             cache_enabled=cache_enabled,
         ):
-            self._stack.prepare_step_run(info=step_run_info)
+            with timing_utils.span("prepare_step_run"):
+                self._stack.prepare_step_run(info=step_run_info)
 
             # Initialize the step context singleton
             StepContext._clear()
@@ -135,50 +157,61 @@ class StepRunner:
             )
 
             # Parse the inputs for the entrypoint function.
-            function_params = self._parse_inputs(
-                args=spec.args,
-                annotations=spec.annotations,
-                input_artifacts=input_artifacts,
-            )
+            with timing_utils.span("load_inputs"):
+                function_params = self._parse_inputs(
+                    args=spec.args,
+                    annotations=spec.annotations,
+                    input_artifacts=input_artifacts,
+                )
 
             step_failed = False
             try:
-                return_values = step_instance.call_entrypoint(
-                    **function_params
-                )
+                with timing_utils.span("step_function"):
+                    return_values = step_instance.call_entrypoint(
+                        **function_params
+                    )
             except BaseException as step_exception:  # noqa: E722
                 step_failed = True
                 failure_hook_source = self.configuration.failure_hook_source
                 if failure_hook_source:
                     logger.info("Detected failure hook. Running...")
-                    self.load_and_run_hook(
-                        failure_hook_source,
-                        step_exception=step_exception,
-                    )
+                    with timing_utils.span("failure_hook"):
+                        self.load_and_run_hook(
+                            failure_hook_source,
+                            step_exception=step_exception,
+                        )
                 raise
             finally:
-                step_run_metadata = self._stack.get_step_run_metadata(
-                    info=step_run_info,
-                )
-                publish_step_run_metadata(
-                    step_run_id=step_run_info.step_run_id,
-                    step_run_metadata=step_run_metadata,
-                )
-                self._stack.cleanup_step_run(
-                    info=step_run_info, step_failed=step_failed
-                )
+                with timing_utils.span("publish_step_run_metadata"):
+                    step_run_metadata = self._stack.get_step_run_metadata(
+                        info=step_run_info,
+                    )
+                    publish_step_run_metadata(
+                        step_run_id=step_run_info.step_run_id,
+                        step_run_metadata=step_run_metadata,
+                    )
+                with timing_utils.span("cleanup_step_run"):
+                    self._stack.cleanup_step_run(
+                        info=step_run_info, step_failed=step_failed
+                    )
                 if not step_failed:
                     success_hook_source = (
                         self.configuration.success_hook_source
                     )
                     if success_hook_source:
                         logger.info("Detected success hook. Running...")
-                        self.load_and_run_hook(
-                            success_hook_source,
-                            step_exception=None,
-                        )
+                        with timing_utils.span("success_hook"):
+                            self.load_and_run_hook(
+                                success_hook_source,
+                                step_exception=None,
+                            )
                 StepContext._clear()  # Remove the step context singleton
 
+            self._publish_lazy_input_metadata(
+                step_run_id=step_run_info.step_run_id,
+                function_params=function_params,
+            )
+
             # Store and publish the output artifacts of the step function.
             output_annotations = parse_return_type_annotations(
                 func=step_instance.entrypoint
@@ -194,19 +227,21 @@ class StepRunner:
                 is_enabled_on_step=step_run_info.config.enable_artifact_visualization,
                 is_enabled_on_pipeline=step_run_info.pipeline.enable_artifact_visualization,
             )
-            output_artifact_ids = self._store_output_artifacts(
-                output_data=output_data,
-                output_artifact_uris=output_artifact_uris,
-                output_materializers=output_materializers,
-                artifact_metadata_enabled=artifact_metadata_enabled,
-                artifact_visualization_enabled=artifact_visualization_enabled,
-            )
+            with timing_utils.span("store_outputs"):
+                output_artifact_ids = self._store_output_artifacts(
+                    output_data=output_data,
+                    output_artifact_uris=output_artifact_uris,
+                    output_materializers=output_materializers,
+                    artifact_metadata_enabled=artifact_metadata_enabled,
+                    artifact_visualization_enabled=artifact_visualization_enabled,
+                )
 
         # Update the status and output artifacts of the step run.
-        publish_successful_step_run(
-            step_run_id=step_run_info.step_run_id,
-            output_artifact_ids=output_artifact_ids,
-        )
+        with timing_utils.span("publish_step_run"):
+            publish_successful_step_run(
+                step_run_id=step_run_info.step_run_id,
+                output_artifact_ids=output_artifact_ids,
+            )
 
     def _load_step(self) -> "BaseStep":
         """Load the step instance.
@@ -216,7 +251,11 @@ class StepRunner:
         """
         from zenml.steps import BaseStep
 
-        step_instance = BaseStep.load_from_source(self._step.spec.source)
+        # Copy the loaded step so the configuration of this run doesn't leak
+        # into the module-level step object when running in-process.
+        step_instance = copy.copy(
+            BaseStep.load_from_source(self._step.spec.source)
+        )
         step_instance._configuration = self._step.config
         return step_instance
 
@@ -252,6 +291,10 @@ class StepRunner:
     ) -> Dict[str, Any]:
         """Parses the inputs for a step entrypoint function.
 
+        Inputs that are configured to be loaded lazily in the
+        `InputArtifactSettings` of the step are passed as `LazyArtifact`
+        proxies, all other inputs are loaded before the step runs.
+
         Args:
             args: The arguments of the step entrypoint function.
             annotations: The annotations of the step entrypoint function.
@@ -264,6 +307,10 @@ class StepRunner:
             RuntimeError: If a function argument value is missing.
         """
         function_params: Dict[str, Any] = {}
+        artifacts_to_load: Dict[
+            str, Tuple["ArtifactResponseModel", Type[Any]]
+        ] = {}
+        input_artifact_settings = self.configuration.input_artifact_settings
 
         if args and args[0] == "self":
             args.pop(0)
@@ -283,9 +330,21 @@ class StepRunner:
                 )
                 function_params[arg] = get_step_context()
             elif arg in input_artifacts:
-                function_params[arg] = self._load_input_artifact(
-                    input_artifacts[arg], arg_type
-                )
+                artifact = input_artifacts[arg]
+                if (
+                    input_artifact_settings.is_lazy(arg)
+                    and arg_type != UnmaterializedArtifact
+                ):
+                    function_params[arg] = LazyArtifact(
+                        artifact=artifact,
+                        load_function=partial(
+                            self._load_input_artifact, artifact, arg_type
+                        ),
+                    )
+                else:
+                    # Loaded below, so the arguments keep their order
+                    function_params[arg] = None
+                    artifacts_to_load[arg] = (artifact, arg_type)
             elif arg in self.configuration.parameters:
                 function_params[arg] = self.configuration.parameters[arg]
             else:
@@ -293,6 +352,7 @@ class StepRunner:
                     f"Unable to find value for step function argument `{arg}`."
                 )
 
+        function_params.update(self._load_input_artifacts(artifacts_to_load))
         return function_params
 
     def _parse_hook_inputs(
@@ -356,6 +416,94 @@ class StepRunner:
 
         return function_params
 
+    def _publish_lazy_input_metadata(
+        self, step_run_id: "UUID", function_params: Dict[str, Any]
+    ) -> None:
+        """Records which lazily loaded inputs were accessed by the step.
+
+        Args:
+            step_run_id: The ID of the step run.
+            function_params: The parameters passed to the step function.
+        """
+        lazy_inputs_loaded: Dict[str, "MetadataType"] = {
+            arg: lazy_artifact.is_loaded(value)
+            for arg, value in function_params.items()
+            if type(value) is LazyArtifact
+        }
+        if not lazy_inputs_loaded:
+            return
+
+        for arg, loaded in lazy_inputs_loaded.items():
+            if not loaded:
+                logger.debug(
+                    "Skipped loading input `%s` as the step never accessed it.",
+                    arg,
+                )
+        Client().create_run_metadata(
+            metadata={LAZY_INPUTS_LOADED_METADATA_KEY: lazy_inputs_loaded},
+            step_run_id=step_run_id,
+        )
+
+    def _load_input_artifacts(
+        self,
+        artifacts: Dict[str, Tuple["ArtifactResponseModel", Type[Any]]],
+    ) -> Dict[str, Any]:
+        """Loads input artifacts concurrently.
+
+        Loading an artifact mostly consists of downloading its files, so
+        loading the artifacts in a thread pool overlaps the downloads with
+        each other and with the deserialization of already downloaded
+        artifacts. The maximum number of artifacts loaded at the same time
+        can be configured using the `ZENML_INPUT_ARTIFACT_LOAD_MAX_WORKERS`
+        environment variable.
+
+        Args:
+            artifacts: Mapping of argument names to the artifacts to load and
+                the data types of their values.
+
+        Returns:
+            Mapping of argument names to the artifact values.
+
+        Raises:
+            RuntimeError: If an artifact could not be loaded.
+        """
+        max_workers = handle_int_env_var(
+            ENV_ZENML_INPUT_ARTIFACT_LOAD_MAX_WORKERS,
+            default=DEFAULT_INPUT_ARTIFACT_LOAD_MAX_WORKERS,
+        )
+        max_workers = min(max_workers, len(artifacts))
+        if max_workers <= 1:
+            return {
+                arg: self._load_input_artifact(artifact, data_type)
+                for arg, (artifact, data_type) in artifacts.items()
+            }
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                arg: executor.submit(
+                    timing_utils.in_current_context(self._load_input_artifact),
+                    artifact,
+                    data_type,
+                )
+                for arg, (artifact, data_type) in artifacts.items()
+            }
+            values: Dict[str, Any] = {}
+            try:
+                for arg, future in futures.items():
+                    try:
+                        values[arg] = future.result()
+                    except Exception as e:
+                        raise RuntimeError(
+                            f"Failed to load the artifact "
+                            f"`{artifacts[arg][0].id}` for input `{arg}` of "
+                            f"step `{self.configuration.name}`: {e}"
+                        ) from e
+            finally:
+                for future in futures.values():
+                    future.cancel()
+
+        return values
+
     def _load_input_artifact(
         self, artifact: "ArtifactResponseModel", data_type: Type[Any]
     ) -> Any:
@@ -384,7 +532,8 @@ class StepRunner:
         )
         materializer: BaseMaterializer = materializer_class(artifact.uri)
         materializer.validate_type_compatibility(data_type)
-        return materializer.load(data_type=data_type)
+        with timing_utils.span("materializer_load"):
+            return materializer.load(data_type=data_type)
 
     def _validate_outputs(
         self,
@@ -450,6 +599,9 @@ class StepRunner:
         for return_value, (output_name, output_annotation) in zip(
             return_values, output_annotations.items()
         ):
+            # Inputs that are returned unchanged get stored like all other
+            # outputs, which requires their data
+            return_value = lazy_artifact.unwrap(return_value)
             if output_annotation is Any:
                 pass
             else:
@@ -475,6 +627,10 @@ class StepRunner:
     ) -> Dict[str, "UUID"]:
         """Stores the output artifacts of the step.
 
+        If the `ZENML_ASYNC_ARTIFACT_UPLOAD` environment variable is set,
+        outputs are staged locally and uploaded in the background while the
+        next output gets materialized.
+
         Args:
             output_data: The output data of the step function, mapping output
                 names to return values.
@@ -494,7 +650,7 @@ class StepRunner:
         )
         assert artifact_stores  # Every stack has an artifact store.
         artifact_store_id = artifact_stores[0].id
-        output_artifacts: Dict[str, "UUID"] = {}
+        artifacts: Dict[str, Tuple[Any, BaseMaterializer]] = {}
 
         for output_name, return_value in output_data.items():
             data_type = type(return_value)
@@ -530,8 +686,18 @@ class StepRunner:
                 materializer_class = materializer_registry[data_type]
 
             uri = output_artifact_uris[output_name]
-            materializer = materializer_class(uri)
+            artifacts[output_name] = (return_value, materializer_class(uri))
 
+        if handle_bool_env_var(ENV_ZENML_ASYNC_ARTIFACT_UPLOAD, default=False):
+            return artifact_utils.upload_artifacts_in_background(
+                artifacts=artifacts,
+                artifact_store_id=artifact_store_id,
+                extract_metadata=artifact_metadata_enabled,
+                include_visualizations=artifact_visualization_enabled,
+            )
+
+        output_artifacts: Dict[str, "UUID"] = {}
+        for output_name, (return_value, materializer) in artifacts.items():
             artifact_id = artifact_utils.upload_artifact(
                 name=output_name,
                 data=return_value,
@@ -0,0 +1,226 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Long-running worker that executes steps it receives over IPC."""
+
+import os
+import traceback
+from multiprocessing.connection import Connection
+from typing import TYPE_CHECKING, Dict, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from zenml.logger import get_logger
+from zenml.orchestrators.step_launcher import StepLauncher
+from zenml.stack import Stack
+from zenml.utils import deployment_cache_utils, source_utils
+
+if TYPE_CHECKING:
+    from zenml.models.pipeline_deployment_models import (
+        PipelineDeploymentResponseModel,
+    )
+
+logger = get_logger(__name__)
+
+
+class StepWorkerTask(BaseModel):
+    """A step that should be executed by a step worker.
+
+    Attributes:
+        deployment_id: ID of the deployment that contains the step.
+        step_name: Name of the step to execute.
+        orchestrator_run_id: The orchestrator run ID of the pipeline run.
+        environment: Environment variables to set before running the step.
+    """
+
+    deployment_id: UUID
+    step_name: str
+    orchestrator_run_id: str
+    environment: Dict[str, str] = {}
+
+
+class StepWorkerResult(BaseModel):
+    """The result of a step executed by a step worker.
+
+    Attributes:
+        error: The formatted traceback if the step failed.
+    """
+
+    error: Optional[str] = None
+
+
+class StepWorkerDiedError(RuntimeError):
+    """Raised if the connection to a step worker breaks while it runs a step."""
+
+
+class StepWorker:
+    """Worker that executes steps while keeping its state in memory.
+
+    Running a step in a fresh process requires importing ZenML and the user
+    code, loading the step sources and constructing the stack. A step worker
+    does all of this once and then executes any number of steps it receives
+    over a connection.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the worker."""
+        self._deployments: Dict[UUID, "PipelineDeploymentResponseModel"] = {}
+        self._stacks: Dict[UUID, Stack] = {}
+
+    def warm_up(self, deployment: "PipelineDeploymentResponseModel") -> None:
+        """Loads everything required to run the steps of a deployment.
+
+        Args:
+            deployment: The deployment to warm up for.
+        """
+        self._deployments[deployment.id] = deployment
+
+        for step in deployment.step_configurations.values():
+            source_utils.load(step.spec.source)
+
+        if deployment.stack:
+            self._get_stack(deployment)
+
+    def _get_deployment(
+        self, deployment_id: UUID
+    ) -> "PipelineDeploymentResponseModel":
+        """Gets a deployment.
+
+        Args:
+            deployment_id: ID of the deployment.
+
+        Returns:
+            The deployment.
+        """
+        if deployment_id not in self._deployments:
+            deployment = deployment_cache_utils.load_deployment(deployment_id)
+            self.warm_up(deployment)
+
+        return self._deployments[deployment_id]
+
+    def _get_stack(
+        self, deployment: "PipelineDeploymentResponseModel"
+    ) -> Optional[Stack]:
+        """Gets the stack of a deployment.
+
+        Args:
+            deployment: The deployment.
+
+        Returns:
+            The stack of the deployment.
+        """
+        if not deployment.stack:
+            return None
+
+        if deployment.stack.id not in self._stacks:
+            self._stacks[deployment.stack.id] = Stack.from_model(
+                deployment.stack
+            )
+
+        return self._stacks[deployment.stack.id]
+
+    def run(self, task: StepWorkerTask) -> None:
+        """Runs a step.
+
+        The environment variables of the task are only set while the step
+        runs, so they don't leak into later tasks served by the same worker.
+
+        Args:
+            task: The task specifying the step to run.
+        """
+        original_environment = os.environ.copy()
+        os.environ.update(task.environment)
+        try:
+            deployment = self._get_deployment(task.deployment_id)
+            step = deployment.step_configurations[task.step_name]
+            launcher = StepLauncher(
+                deployment=deployment,
+                step=step,
+                orchestrator_run_id=task.orchestrator_run_id,
+                stack=self._get_stack(deployment),
+            )
+            launcher.launch()
+        finally:
+            os.environ.clear()
+            os.environ.update(original_environment)
+
+    def serve(self, connection: Connection) -> None:
+        """Runs all tasks received over a connection.
+
+        The worker stops once it receives an empty message or the connection
+        gets closed.
+
+        Args:
+            connection: The connection to receive tasks from.
+        """
+        while True:
+            try:
+                message = connection.recv_bytes()
+            except EOFError:
+                break
+
+            if not message:
+                break
+
+            task = StepWorkerTask.parse_raw(message)
+            result = StepWorkerResult()
+            try:
+                self.run(task)
+            except Exception:
+                result.error = traceback.format_exc()
+
+            connection.send_bytes(result.json().encode())
+
+
+def run_step_in_worker(connection: Connection, task: StepWorkerTask) -> None:
+    """Sends a step to a worker and waits for it to finish.
+
+    Args:
+        connection: Connection to the step worker.
+        task: The task specifying the step to run.
+
+    Raises:
+        StepWorkerDiedError: If the connection to the worker broke, e.g.
+            because the worker process died.
+        RuntimeError: If the step failed.
+    """
+    try:
+        connection.send_bytes(task.json().encode())
+        message = connection.recv_bytes()
+    except (EOFError, OSError) as e:
+        raise StepWorkerDiedError(
+            f"Lost the connection to the step worker while running step "
+            f"`{task.step_name}`."
+        ) from e
+
+    result = StepWorkerResult.parse_raw(message)
+
+    if result.error:
+        raise RuntimeError(
+            f"Failed to run step `{task.step_name}`:\n{result.error}"
+        )
+
+
+def stop_worker(connection: Connection) -> None:
+    """Tells a worker to stop and closes the connection to it.
+
+    Args:
+        connection: Connection to the step worker.
+    """
+    try:
+        connection.send_bytes(b"")
+    except OSError:
+        pass
+    finally:
+        connection.close()
@@ -53,6 +53,7 @@ from zenml.services.service_monitor import (
 )
 from zenml.services.service_registry import ServiceRegistry
 from zenml.services.service_status import ServiceState, ServiceStatus
+from zenml.services.service_status_monitor import ServiceStatusMonitor
 from zenml.services.service_type import ServiceType
 from zenml.services.terraform.terraform_service import (
     TerraformService,
@@ -64,6 +65,7 @@ __all__ = [
     "ServiceState",
     "ServiceConfig",
     "ServiceStatus",
+    "ServiceStatusMonitor",
     "ServiceEndpointProtocol",
     "ServiceEndpointConfig",
     "ServiceEndpointStatus",
@@ -0,0 +1,331 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Index of the local services stored in a directory."""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from zenml.constants import DEFAULT_SERVICE_STATUS_CHECK_TIMEOUT
+from zenml.logger import get_logger
+from zenml.services.local.local_service import SERVICE_DAEMON_CONFIG_FILE_NAME
+
+if TYPE_CHECKING:
+    from zenml.services.service import BaseService
+
+logger = get_logger(__name__)
+
+SERVICE_INDEX_DIR_NAME = ".service_index"
+SERVICE_INDEX_FILE_NAME = "services_index.json"
+SERVICE_STATUS_CHECK_MAX_WORKERS = 8
+
+# Service configuration attributes that are stored in the index. These
+# attributes never change when a service is updated in place by a model
+# deployer, so index entries never become stale.
+INDEXED_CONFIG_ATTRIBUTES = (
+    "pipeline_name",
+    "pipeline_step_name",
+    "model_name",
+)
+
+
+class LocalServiceIndex:
+    """Index of the local services stored in a directory.
+
+    Local model deployers store the configuration of each of their services
+    in a `service.json` file inside a subdirectory of their local path.
+    Finding services by scanning and deserializing all of these files gets
+    slow once many services were deployed, so this index maps the UUID of
+    each service to its configuration file and the attributes that services
+    are usually searched by.
+
+    The index is persisted as a JSON file in a subdirectory and updated when
+    services are deployed or deleted. If the directory was modified by other
+    means since the index was last written, only the configuration files
+    that are not indexed yet are read again. The index lives in its own
+    subdirectory so that writing it doesn't modify the directory itself.
+    """
+
+    def __init__(self, root_path: str) -> None:
+        """Initializes the index.
+
+        Args:
+            root_path: The directory containing the service directories.
+        """
+        self.root_path = root_path
+        self._lock = threading.Lock()
+
+    @property
+    def index_file(self) -> str:
+        """The path of the index file.
+
+        Returns:
+            The path of the index file.
+        """
+        return os.path.join(
+            self.root_path, SERVICE_INDEX_DIR_NAME, SERVICE_INDEX_FILE_NAME
+        )
+
+    def _root_mtime(self) -> int:
+        """Gets the modification time of the root directory.
+
+        Returns:
+            The modification time in nanoseconds or 0 if the directory
+            doesn't exist.
+        """
+        try:
+            return os.stat(self.root_path).st_mtime_ns
+        except OSError:
+            return 0
+
+    def _read(self) -> Dict[str, Any]:
+        """Reads the index file.
+
+        Returns:
+            The index content, or an empty index if the file doesn't exist or
+            is corrupted.
+        """
+        try:
+            with open(self.index_file, "r") as f:
+                index = json.load(f)
+            if isinstance(index, dict) and isinstance(
+                index.get("services"), dict
+            ):
+                return index
+        except (OSError, ValueError):
+            pass
+        return {"root_mtime": None, "services": {}}
+
+    def _write(self, index: Dict[str, Any]) -> None:
+        """Writes the index file atomically.
+
+        Args:
+            index: The index content.
+        """
+        temp_file = f"{self.index_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.index_file), exist_ok=True)
+            with open(temp_file, "w") as f:
+                json.dump(index, f)
+            os.replace(temp_file, self.index_file)
+        except OSError as e:
+            logger.debug("Failed to write service index: %s", e)
+
+    @staticmethod
+    def _entry_from_config_file(
+        config_file: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Creates an index entry from a service configuration file.
+
+        Args:
+            config_file: Path of the service configuration file.
+
+        Returns:
+            The UUID and attributes of the service, or None if the file could
+            not be read.
+        """
+        try:
+            with open(config_file, "r") as f:
+                service_dict = json.load(f)
+            uuid = str(UUID(str(service_dict["uuid"])))
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.debug(
+                "Skipping invalid service configuration file %s", config_file
+            )
+            return None
+
+        config = service_dict.get("config") or {}
+        return {
+            "uuid": uuid,
+            "config_file": config_file,
+            "attributes": {
+                key: config.get(key) for key in INDEXED_CONFIG_ATTRIBUTES
+            },
+        }
+
+    def _reconcile(self, index: Dict[str, Any]) -> Dict[str, Any]:
+        """Updates the index with the services that exist in the directory.
+
+        Args:
+            index: The current index content.
+
+        Returns:
+            The updated index content.
+        """
+        # Create the index directory first, creating it modifies the root
+        # directory.
+        os.makedirs(os.path.dirname(self.index_file), exist_ok=True)
+        root_mtime = self._root_mtime()
+        if index["root_mtime"] == root_mtime:
+            return index
+
+        indexed_services = {
+            entry["config_file"]: uuid
+            for uuid, entry in index["services"].items()
+        }
+        services: Dict[str, Any] = {}
+        for root, _, files in os.walk(self.root_path):
+            if SERVICE_DAEMON_CONFIG_FILE_NAME not in files:
+                continue
+            config_file = os.path.join(root, SERVICE_DAEMON_CONFIG_FILE_NAME)
+            uuid = indexed_services.get(config_file)
+            if uuid:
+                services[uuid] = index["services"][uuid]
+                continue
+            entry = self._entry_from_config_file(config_file)
+            if entry:
+                services[entry.pop("uuid")] = entry
+
+        index = {"root_mtime": root_mtime, "services": services}
+        self._write(index)
+        return index
+
+    def add(self, service: "BaseService") -> None:
+        """Adds a service to the index.
+
+        Args:
+            service: The service to add. Services that don't store their
+                configuration in a file inside the indexed directory are
+                ignored.
+        """
+        config_file = getattr(service.status, "config_file", None)
+        if not config_file or not os.path.exists(config_file):
+            return
+
+        entry = self._entry_from_config_file(config_file)
+        if not entry:
+            return
+
+        with self._lock:
+            index = self._read()
+            index["services"][entry.pop("uuid")] = entry
+            self._write(index)
+
+    def remove(self, uuid: UUID) -> None:
+        """Removes a service from the index.
+
+        Args:
+            uuid: The UUID of the service to remove.
+        """
+        with self._lock:
+            index = self._read()
+            if index["services"].pop(str(uuid), None):
+                self._write(index)
+
+    def find(
+        self, service_uuid: Optional[UUID] = None, **attributes: Optional[str]
+    ) -> List[str]:
+        """Finds the configuration files of services.
+
+        Args:
+            service_uuid: Only find the service with this UUID.
+            **attributes: Only find services whose configuration attribute
+                has the given value. Empty values and attributes that are not
+                indexed are ignored.
+
+        Returns:
+            The configuration files of the matching services, most recently
+            modified first.
+        """
+        with self._lock:
+            index = self._reconcile(self._read())
+
+        entries = index["services"]
+        if service_uuid:
+            entry = entries.get(str(service_uuid))
+            entries = {str(service_uuid): entry} if entry else {}
+
+        criteria = {
+            key: value
+            for key, value in attributes.items()
+            if value and key in INDEXED_CONFIG_ATTRIBUTES
+        }
+        config_files = [
+            entry["config_file"]
+            for entry in entries.values()
+            if all(
+                entry["attributes"].get(key) == value
+                for key, value in criteria.items()
+            )
+        ]
+
+        modification_times = {}
+        for config_file in config_files:
+            try:
+                modification_times[config_file] = os.stat(
+                    config_file
+                ).st_mtime_ns
+            except OSError:
+                # The service was deleted after the index was written.
+                continue
+        return sorted(
+            modification_times,
+            key=lambda config_file: modification_times[config_file],
+            reverse=True,
+        )
+
+
+def update_service_statuses(
+    services: Sequence["BaseService"],
+    timeout: float = DEFAULT_SERVICE_STATUS_CHECK_TIMEOUT,
+) -> List["BaseService"]:
+    """Updates the status of multiple services concurrently.
+
+    Args:
+        services: The services whose status to update.
+        timeout: Maximum time in seconds to wait for all status checks.
+
+    Returns:
+        The services whose status was updated successfully within the
+        timeout.
+    """
+    if not services:
+        return []
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(SERVICE_STATUS_CHECK_MAX_WORKERS, len(services)),
+        thread_name_prefix="zenml-service-status",
+    )
+    try:
+        futures = {
+            executor.submit(service.update_status): service
+            for service in services
+        }
+        done, not_done = wait(futures, timeout=timeout)
+    finally:
+        # Don't block on status checks that didn't finish within the timeout
+        executor.shutdown(wait=False)
+
+    for future in not_done:
+        logger.warning(
+            "Timed out checking the status of service `%s`.", futures[future]
+        )
+
+    updated_services = set()
+    for future in done:
+        service = futures[future]
+        if future.exception():
+            logger.warning(
+                "Failed to check the status of service `%s`: %s",
+                service,
+                future.exception(),
+            )
+        else:
+            updated_services.add(id(service))
+
+    # Keep the order of the input services
+    return [service for service in services if id(service) in updated_services]
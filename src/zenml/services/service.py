@@ -25,6 +25,7 @@ from zenml.logger import get_logger
 from zenml.services.service_endpoint import BaseServiceEndpoint
 from zenml.services.service_registry import ServiceRegistry
 from zenml.services.service_status import ServiceState, ServiceStatus
+from zenml.services.service_status_monitor import ServiceStatusMonitor
 from zenml.services.service_type import ServiceType
 from zenml.utils.typed_model import BaseTypedModel, BaseTypedModelMeta
 
@@ -160,6 +161,9 @@ class BaseService(BaseTypedModel, metaclass=BaseServiceMeta):
     Attributes:
         SERVICE_TYPE: a service type descriptor with information describing
             the service class. Every concrete service class must define this.
+        STATUS_MAX_AGE: the time in seconds for which the last checked status
+            of the service is reused by the `is_running`, `is_stopped` and
+            `is_failed` properties before the service is checked again.
         admin_state: the administrative state of the service.
         uuid: unique UUID identifier for the service instance.
         config: service configuration
@@ -168,6 +172,7 @@ class BaseService(BaseTypedModel, metaclass=BaseServiceMeta):
     """
 
     SERVICE_TYPE: ClassVar[ServiceType]
+    STATUS_MAX_AGE: ClassVar[float] = 1.0
 
     uuid: UUID = Field(default_factory=uuid4, allow_mutation=False)
     admin_state: ServiceState = ServiceState.INACTIVE
@@ -176,6 +181,8 @@ class BaseService(BaseTypedModel, metaclass=BaseServiceMeta):
     # TODO [ENG-703]: allow multiple endpoints per service
     endpoint: Optional[BaseServiceEndpoint]
 
+    _status_checked_at: Optional[float] = None
+
     def __init__(
         self,
         **attrs: Any,
@@ -242,12 +249,39 @@ class BaseService(BaseTypedModel, metaclass=BaseServiceMeta):
         self.status.update_state(state, err)
 
         # don't bother checking the endpoint state if the service is not active
-        if self.status.state == ServiceState.INACTIVE:
-            return
-
-        if self.endpoint:
+        if self.status.state != ServiceState.INACTIVE and self.endpoint:
             self.endpoint.update_status()
 
+        self._status_checked_at = time.monotonic()
+
+    def _refresh_status(self) -> None:
+        """Updates the status of the service if the last check is outdated."""
+        if (
+            self._status_checked_at is None
+            or time.monotonic() - self._status_checked_at > self.STATUS_MAX_AGE
+        ):
+            self.update_status()
+
+    def _invalidate_status(self) -> None:
+        """Forces the next status query to check the service again."""
+        self._status_checked_at = None
+
+    def _matches_admin_state(self) -> bool:
+        """Checks if the last known operational state matches the admin state.
+
+        Returns:
+            True if the operational state of the service (and its endpoint,
+            if the service is active) matches the administrative state.
+        """
+        if self.admin_state == ServiceState.ACTIVE:
+            return self.status.state == ServiceState.ACTIVE and (
+                not self.endpoint
+                or self.endpoint.status.state == ServiceState.ACTIVE
+            )
+        if self.admin_state == ServiceState.INACTIVE:
+            return self.status.state == ServiceState.INACTIVE
+        return False
+
     def get_service_status_message(self) -> str:
         """Get a service status message.
 
@@ -266,7 +300,10 @@ class BaseService(BaseTypedModel, metaclass=BaseServiceMeta):
 
         It does this until the service operational state matches the
         administrative state, the service enters a failed state, or the timeout
-        is reached.
+        is reached. The service is probed by the shared
+        `ServiceStatusMonitor`, which probes it at least every
+        `min_interval` seconds while waiting and once more when the timeout
+        is reached, so the status is up to date when this returns.
 
         Args:
             timeout: maximum time to wait for the service operational state
@@ -276,26 +313,26 @@ class BaseService(BaseTypedModel, metaclass=BaseServiceMeta):
             True if the service operational state matches the administrative
             state, False otherwise.
         """
-        time_remaining = timeout
-        while True:
-            if self.admin_state == ServiceState.ACTIVE and self.is_running:
-                return True
-            if self.admin_state == ServiceState.INACTIVE and self.is_stopped:
-                return True
-            if self.is_failed:
-                return False
-            if time_remaining <= 0:
-                break
-            time.sleep(1)
-            time_remaining -= 1
-
-        if timeout > 0:
-            logger.error(
-                f"Timed out waiting for service {self} to become "
-                f"{self.admin_state.value}:\n"
-                + self.get_service_status_message()
-            )
+        if timeout <= 0:
+            self.update_status()
+            return self._matches_admin_state()
+
+        # The shared status monitor probes this service instance in the
+        # background and wakes this thread up whenever a new status is
+        # available, including after a final probe at the deadline.
+        settled = ServiceStatusMonitor().wait_for(
+            self,
+            lambda service: service._matches_admin_state()
+            or service.status.state == ServiceState.ERROR,
+            timeout=timeout,
+        )
+        if settled:
+            return self._matches_admin_state()
 
+        logger.error(
+            f"Timed out waiting for service {self} to become "
+            f"{self.admin_state.value}:\n" + self.get_service_status_message()
+        )
         return False
 
     @property
@@ -303,15 +340,16 @@ class BaseService(BaseTypedModel, metaclass=BaseServiceMeta):
         """Check if the service is currently running.
 
         This method will actively poll the external service to get its status
-        and will return the result.
+        unless it was checked less than `STATUS_MAX_AGE` seconds ago.
 
         Returns:
             True if the service is running and active (i.e. the endpoints are
             responsive, if any are configured), otherwise False.
         """
-        self.update_status()
+        self._refresh_status()
         return self.status.state == ServiceState.ACTIVE and (
-            not self.endpoint or self.endpoint.is_active()
+            not self.endpoint
+            or self.endpoint.status.state == ServiceState.ACTIVE
         )
 
     @property
@@ -319,12 +357,12 @@ class BaseService(BaseTypedModel, metaclass=BaseServiceMeta):
         """Check if the service is currently stopped.
 
         This method will actively poll the external service to get its status
-        and will return the result.
+        unless it was checked less than `STATUS_MAX_AGE` seconds ago.
 
         Returns:
             True if the service is stopped, otherwise False.
         """
-        self.update_status()
+        self._refresh_status()
         return self.status.state == ServiceState.INACTIVE
 
     @property
@@ -332,12 +370,12 @@ class BaseService(BaseTypedModel, metaclass=BaseServiceMeta):
         """Check if the service is currently failed.
 
         This method will actively poll the external service to get its status
-        and will return the result.
+        unless it was checked less than `STATUS_MAX_AGE` seconds ago.
 
         Returns:
             True if the service is in a failure state, otherwise False.
         """
-        self.update_status()
+        self._refresh_status()
         return self.status.state == ServiceState.ERROR
 
     def provision(self) -> None:
@@ -372,6 +410,7 @@ class BaseService(BaseTypedModel, metaclass=BaseServiceMeta):
             config: the new service configuration.
         """
         self.config = config
+        self._invalidate_status()
 
     def start(self, timeout: int = 0) -> None:
         """Start the service and optionally wait for it to become active.
@@ -387,6 +426,7 @@ class BaseService(BaseTypedModel, metaclass=BaseServiceMeta):
         with console.status(f"Starting service '{self}'.\n"):
             self.admin_state = ServiceState.ACTIVE
             self.provision()
+            self._invalidate_status()
             if timeout > 0:
                 if not self.poll_service_status(timeout):
                     raise RuntimeError(
@@ -410,6 +450,7 @@ class BaseService(BaseTypedModel, metaclass=BaseServiceMeta):
         with console.status(f"Stopping service '{self}'.\n"):
             self.admin_state = ServiceState.INACTIVE
             self.deprovision(force)
+            self._invalidate_status()
             if timeout > 0:
                 self.poll_service_status(timeout)
                 if not self.is_stopped:
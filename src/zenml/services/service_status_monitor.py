@@ -0,0 +1,360 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Shared background monitor for the status of services."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from zenml.logger import get_logger
+from zenml.utils.singleton import SingletonMetaClass
+
+if TYPE_CHECKING:
+    from zenml.services.service import BaseService
+    from zenml.services.service_status import ServiceState
+
+logger = get_logger(__name__)
+
+DEFAULT_MIN_PROBE_INTERVAL = 0.5
+DEFAULT_MAX_PROBE_INTERVAL = 30.0
+MAX_CONCURRENT_PROBES = 8
+
+
+class _MonitoredService:
+    """Probing state of a service registered with the monitor.
+
+    Multiple instances of the same service (e.g. loaded separately from the
+    service registry) share the probing state, but each of them gets its
+    status updated by every probe.
+    """
+
+    def __init__(self, interval: float) -> None:
+        """Initializes the probing state.
+
+        Args:
+            interval: The initial probe interval.
+        """
+        self.instances: Dict[int, "BaseService"] = {}
+        self.registrations: Dict[int, int] = {}
+        self.deadlines: List[float] = []
+        self.interval = interval
+        self.next_probe = time.monotonic()
+        self.probing = False
+        self.probe_requested = False
+        self.probe_count = 0
+        self.last_checked: Optional[float] = None
+
+
+def _get_state(
+    service: "BaseService",
+) -> Tuple["ServiceState", Optional["ServiceState"]]:
+    """Gets the operational state of a service and its endpoint.
+
+    Args:
+        service: The service.
+
+    Returns:
+        The state of the service and the state of its endpoint, if it has
+        one.
+    """
+    endpoint_state = (
+        service.endpoint.status.state if service.endpoint else None
+    )
+    return service.status.state, endpoint_state
+
+
+class ServiceStatusMonitor(metaclass=SingletonMetaClass):
+    """Shared background monitor for the status of services.
+
+    Registered services are probed by a background thread. A service is
+    probed again after `min_interval` seconds if its state or the state of
+    its endpoint changed and the interval doubles (up to `max_interval`
+    seconds) every time they stay the same. While threads are waiting for a
+    service, it is probed at least every `min_interval` seconds and once
+    more when a waiter's timeout is reached. Waiting threads are woken up
+    through a condition variable after every probe instead of probing the
+    service themselves in a sleep loop.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = DEFAULT_MIN_PROBE_INTERVAL,
+        max_interval: float = DEFAULT_MAX_PROBE_INTERVAL,
+    ) -> None:
+        """Initializes the monitor.
+
+        Args:
+            min_interval: The minimum time between two probes of a service.
+            max_interval: The maximum time between two probes of a service.
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._condition = threading.Condition()
+        self._services: Dict[UUID, _MonitoredService] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _ensure_running(self) -> None:
+        """Starts the background thread if it isn't running yet.
+
+        Must be called while holding the condition lock.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_PROBES,
+            thread_name_prefix="zenml-service-probe",
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="zenml-service-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def register(self, service: "BaseService") -> None:
+        """Starts monitoring a service.
+
+        Services can be registered multiple times and are monitored until
+        they were unregistered as many times.
+
+        Args:
+            service: The service to monitor.
+        """
+        with self._condition:
+            entry = self._services.get(service.uuid)
+            if not entry:
+                entry = _MonitoredService(self.min_interval)
+                self._services[service.uuid] = entry
+            entry.instances[id(service)] = service
+            entry.registrations[id(service)] = (
+                entry.registrations.get(id(service), 0) + 1
+            )
+            self._ensure_running()
+            self._condition.notify_all()
+
+    def unregister(self, service: "BaseService") -> None:
+        """Stops monitoring a service.
+
+        Args:
+            service: The service to stop monitoring.
+        """
+        with self._condition:
+            entry = self._services.get(service.uuid)
+            if not entry or id(service) not in entry.registrations:
+                return
+            entry.registrations[id(service)] -= 1
+            if entry.registrations[id(service)] <= 0:
+                del entry.registrations[id(service)]
+                del entry.instances[id(service)]
+            if not entry.instances:
+                del self._services[service.uuid]
+
+    def is_monitored(self, service: "BaseService") -> bool:
+        """Checks whether a service is monitored.
+
+        Args:
+            service: The service to check.
+
+        Returns:
+            Whether the service is monitored.
+        """
+        with self._condition:
+            return service.uuid in self._services
+
+    def last_checked(self, service: "BaseService") -> Optional[float]:
+        """Gets the time when the monitor last probed a service.
+
+        Args:
+            service: The service.
+
+        Returns:
+            The `time.monotonic()` timestamp of the last probe or None if the
+            service wasn't probed by the monitor yet.
+        """
+        with self._condition:
+            entry = self._services.get(service.uuid)
+            return entry.last_checked if entry else None
+
+    def request_probe(self, service: "BaseService") -> int:
+        """Requests an immediate probe of a monitored service.
+
+        Args:
+            service: The service to probe.
+
+        Returns:
+            The number of probes that finished before this request.
+
+        Raises:
+            KeyError: If the service isn't monitored.
+        """
+        with self._condition:
+            return self._request_probe(self._services[service.uuid])
+
+    def _request_probe(self, entry: _MonitoredService) -> int:
+        """Requests an immediate probe of a monitored service.
+
+        Must be called while holding the condition lock.
+
+        Args:
+            entry: The probing state of the service.
+
+        Returns:
+            The number of probes that finished before this request.
+        """
+        entry.interval = self.min_interval
+        entry.next_probe = time.monotonic()
+        self._condition.notify_all()
+        if entry.probing:
+            # The probe in progress might have started before the request,
+            # so the service gets probed again right after it.
+            entry.probe_requested = True
+            return entry.probe_count + 1
+        return entry.probe_count
+
+    def wait_for(
+        self,
+        service: "BaseService",
+        condition: Callable[["BaseService"], bool],
+        timeout: float,
+    ) -> bool:
+        """Waits until the status of a service fulfills a condition.
+
+        The service is probed right away, at least every `min_interval`
+        seconds while waiting and once more when the timeout is reached. The
+        condition is evaluated after each probe and must only look at the
+        status of the service without probing it.
+
+        Args:
+            service: The service to wait for.
+            condition: Function evaluating the status of the service.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            Whether the condition was fulfilled within the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        self.register(service)
+        try:
+            with self._condition:
+                entry = self._services[service.uuid]
+                entry.deadlines.append(deadline)
+                try:
+                    seen_probes = self._request_probe(entry)
+                    final_probe: Optional[int] = None
+                    while True:
+                        if entry.probe_count > seen_probes:
+                            seen_probes = entry.probe_count
+                            if condition(service):
+                                return True
+                            if final_probe is not None and (
+                                seen_probes > final_probe
+                            ):
+                                return False
+
+                        if final_probe is not None:
+                            self._condition.wait()
+                            continue
+
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            # The state might have changed since the last
+                            # probe, so the service is probed once more
+                            # before giving up.
+                            final_probe = self._request_probe(entry)
+                            continue
+                        self._condition.wait(remaining)
+                finally:
+                    entry.deadlines.remove(deadline)
+        finally:
+            self.unregister(service)
+
+    def _run(self) -> None:
+        """Probes the registered services when they are due."""
+        while True:
+            with self._condition:
+                now = time.monotonic()
+                due: List[_MonitoredService] = []
+                next_wakeup: Optional[float] = None
+                for entry in self._services.values():
+                    if entry.probing:
+                        continue
+                    if entry.next_probe <= now:
+                        entry.probing = True
+                        due.append(entry)
+                    elif next_wakeup is None or entry.next_probe < next_wakeup:
+                        next_wakeup = entry.next_probe
+
+                if not due:
+                    self._condition.wait(
+                        None if next_wakeup is None else next_wakeup - now
+                    )
+                    continue
+
+            assert self._executor is not None
+            for entry in due:
+                self._executor.submit(self._probe, entry)
+
+    def _probe(self, entry: _MonitoredService) -> None:
+        """Probes all instances of a service and wakes up all waiting threads.
+
+        Args:
+            entry: The probing state of the service.
+        """
+        with self._condition:
+            instances = list(entry.instances.values())
+
+        state_changed = False
+        for service in instances:
+            previous_state = _get_state(service)
+            try:
+                service.update_status()
+            except Exception as e:
+                logger.debug(
+                    "Failed to check the status of service %s: %s",
+                    service,
+                    e,
+                )
+            if _get_state(service) != previous_state:
+                state_changed = True
+
+        with self._condition:
+            if state_changed:
+                entry.interval = self.min_interval
+            else:
+                entry.interval = min(entry.interval * 2, self.max_interval)
+            entry.last_checked = time.monotonic()
+
+            delay = entry.interval
+            if entry.deadlines:
+                # Waiting threads are not subject to the back-off and the
+                # service is probed again no later than their deadline.
+                delay = min(delay, self.min_interval)
+                upcoming_deadlines = [
+                    deadline
+                    for deadline in entry.deadlines
+                    if deadline > entry.last_checked
+                ]
+                if upcoming_deadlines:
+                    delay = min(
+                        delay, min(upcoming_deadlines) - entry.last_checked
+                    )
+            entry.next_probe = entry.last_checked + delay
+            if entry.probe_requested:
+                entry.probe_requested = False
+                entry.next_probe = entry.last_checked
+            entry.probe_count += 1
+            entry.probing = False
+            self._condition.notify_all()
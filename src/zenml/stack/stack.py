@@ -870,6 +870,20 @@ class Stack:
         """
         return self.orchestrator.run(deployment=deployment, stack=self)
 
+    def deploy_pipelines(
+        self,
+        deployments: List["PipelineDeploymentResponseModel"],
+    ) -> List[Any]:
+        """Deploys multiple pipelines on this stack.
+
+        Args:
+            deployments: The pipeline deployments.
+
+        Returns:
+            The return value of the call to `orchestrator.run_many(...)`.
+        """
+        return self.orchestrator.run_many(deployments=deployments, stack=self)
+
     def _get_active_components_for_step(
         self, step_config: "StepConfiguration"
     ) -> Dict[StackComponentType, "StackComponent"]:
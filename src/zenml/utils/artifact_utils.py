@@ -15,15 +15,38 @@
 
 import base64
 import os
+import posixpath
+import shutil
 import tempfile
-from typing import TYPE_CHECKING, Any, List, Optional, Union, cast
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 from uuid import UUID
 
 from zenml.client import Client
-from zenml.constants import MODEL_METADATA_YAML_FILE_NAME
-from zenml.enums import ExecutionStatus, StackComponentType, VisualizationType
+from zenml.constants import (
+    ARTIFACT_FILE_CHUNK_SIZE,
+    ENV_ZENML_ARTIFACT_UPLOAD_MAX_WORKERS,
+    MODEL_METADATA_YAML_FILE_NAME,
+    handle_int_env_var,
+)
+from zenml.enums import (
+    ExecutionStatus,
+    HydrationLevel,
+    StackComponentType,
+    VisualizationType,
+)
 from zenml.exceptions import DoesNotExistException
-from zenml.io import fileio
+from zenml.io import fileio, storage_tracking
 from zenml.logger import get_logger
 from zenml.models import ArtifactRequestModel, ArtifactResponseModel
 from zenml.models.visualization_models import (
@@ -31,13 +54,14 @@ from zenml.models.visualization_models import (
     VisualizationModel,
 )
 from zenml.stack import StackComponent
-from zenml.utils import source_utils
+from zenml.utils import io_utils, source_utils, timing_utils
 from zenml.utils.yaml_utils import read_yaml, write_yaml
 
 if TYPE_CHECKING:
     from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
     from zenml.config.source import Source
     from zenml.materializers.base_materializer import BaseMaterializer
+    from zenml.metadata.metadata_types import MetadataType
     from zenml.models.pipeline_run_models import PipelineRunResponseModel
     from zenml.models.step_run_models import StepRunResponseModel
     from zenml.zen_stores.base_zen_store import BaseZenStore
@@ -47,6 +71,7 @@ logger = get_logger(__name__)
 
 METADATA_DATATYPE = "datatype"
 METADATA_MATERIALIZER = "materializer"
+DEFAULT_ARTIFACT_UPLOAD_MAX_WORKERS = 4
 
 
 def save_model_metadata(model_artifact: "ArtifactResponseModel") -> str:
@@ -225,17 +250,7 @@ def load_artifact_visualization(
             visualization or if the visualization was not found in the artifact
             store.
     """
-    # Get the visualization to load
-    if not artifact.visualizations:
-        raise DoesNotExistException(
-            f"Artifact '{artifact.id}' has no visualizations."
-        )
-    if index < 0 or index >= len(artifact.visualizations):
-        raise DoesNotExistException(
-            f"Artifact '{artifact.id}' only has {len(artifact.visualizations)} "
-            f"visualizations, but index {index} was requested."
-        )
-    visualization = artifact.visualizations[index]
+    visualization = _get_visualization(artifact=artifact, index=index)
 
     # Load the visualization from the artifact's artifact store
     if not artifact.artifact_store_id:
@@ -260,6 +275,174 @@ def load_artifact_visualization(
     return LoadedVisualizationModel(type=visualization.type, value=value)
 
 
+def _get_visualization(
+    artifact: "ArtifactResponseModel", index: int
+) -> VisualizationModel:
+    """Get a visualization of the given artifact.
+
+    Args:
+        artifact: The artifact of which to get the visualization.
+        index: The index of the visualization.
+
+    Returns:
+        The visualization.
+
+    Raises:
+        DoesNotExistException: If the artifact does not have the requested
+            visualization.
+    """
+    if not artifact.visualizations:
+        raise DoesNotExistException(
+            f"Artifact '{artifact.id}' has no visualizations."
+        )
+    if index < 0 or index >= len(artifact.visualizations):
+        raise DoesNotExistException(
+            f"Artifact '{artifact.id}' only has {len(artifact.visualizations)} "
+            f"visualizations, but index {index} was requested."
+        )
+    return artifact.visualizations[index]
+
+
+def get_artifact_file(
+    artifact: "ArtifactResponseModel",
+    path: Optional[str] = None,
+    visualization_index: Optional[int] = None,
+    zen_store: Optional["BaseZenStore"] = None,
+) -> Tuple["BaseArtifactStore", str]:
+    """Get the artifact store and URI of a file of the given artifact.
+
+    Args:
+        artifact: The artifact of which to get the file.
+        path: Path of the file relative to the artifact URI. Can be omitted
+            if the artifact URI itself is a file.
+        visualization_index: If given, the file of the visualization with
+            this index is returned instead of a file of the artifact data.
+        zen_store: The ZenStore to use for finding the artifact store. If not
+            provided, the client's ZenStore will be used.
+
+    Returns:
+        The artifact store and the URI of the file.
+
+    Raises:
+        ValueError: If both a path and a visualization index are given, or
+            if the path is not a file inside the artifact URI.
+        DoesNotExistException: If the artifact store was deleted or the file
+            does not exist.
+    """
+    if path is not None and visualization_index is not None:
+        raise ValueError(
+            "Only one of `path` and `visualization_index` can be given."
+        )
+
+    if not artifact.artifact_store_id:
+        raise DoesNotExistException(
+            f"Files of artifact '{artifact.id}' cannot be loaded because the "
+            "underlying artifact store was deleted."
+        )
+    artifact_store = _load_artifact_store(
+        artifact_store_id=artifact.artifact_store_id, zen_store=zen_store
+    )
+
+    if visualization_index is not None:
+        uri = _get_visualization(
+            artifact=artifact, index=visualization_index
+        ).uri
+    elif path:
+        normalized_path = posixpath.normpath(path.replace("\\", "/"))
+        if normalized_path.startswith(("/", "../")) or normalized_path in (
+            ".",
+            "..",
+        ):
+            raise ValueError(
+                f"Path '{path}' is not a file inside the URI of artifact "
+                f"'{artifact.id}'."
+            )
+        uri = os.path.join(artifact.uri, normalized_path)
+    else:
+        uri = artifact.uri
+
+    if not artifact_store.exists(uri):
+        raise DoesNotExistException(
+            f"File '{uri}' does not exist in artifact store "
+            f"'{artifact_store.name}'."
+        )
+    if artifact_store.isdir(uri):
+        raise ValueError(
+            f"'{uri}' is a directory. Please specify the path of a file "
+            "inside the artifact directory."
+        )
+
+    return artifact_store, uri
+
+
+def iterate_artifact_file(
+    artifact_store: "BaseArtifactStore",
+    uri: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    chunk_size: int = ARTIFACT_FILE_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Read a file from an artifact store in chunks.
+
+    Args:
+        artifact_store: The artifact store from which to read the file.
+        uri: The URI of the file.
+        start: The offset of the first byte to read.
+        end: The offset of the last byte to read (inclusive). If not given,
+            the file is read until the end.
+        chunk_size: The maximum size of each chunk in bytes.
+
+    Yields:
+        The file content in chunks.
+    """
+    remaining = None if end is None else end - start + 1
+    with artifact_store.open(uri, "rb") as f:
+        if start:
+            f.seek(start)
+        while remaining is None or remaining > 0:
+            read_size = (
+                chunk_size if remaining is None else min(chunk_size, remaining)
+            )
+            chunk = f.read(read_size)
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+
+
+def download_artifact_file(
+    artifact: "ArtifactResponseModel",
+    destination: str,
+    path: Optional[str] = None,
+    visualization_index: Optional[int] = None,
+    zen_store: Optional["BaseZenStore"] = None,
+) -> None:
+    """Download a file of the given artifact to a local path in chunks.
+
+    Args:
+        artifact: The artifact of which to download the file.
+        destination: The local path to which to write the file.
+        path: Path of the file relative to the artifact URI. Can be omitted
+            if the artifact URI itself is a file.
+        visualization_index: If given, the file of the visualization with
+            this index is downloaded instead of a file of the artifact data.
+        zen_store: The ZenStore to use for finding the artifact store. If not
+            provided, the client's ZenStore will be used.
+    """
+    artifact_store, uri = get_artifact_file(
+        artifact=artifact,
+        path=path,
+        visualization_index=visualization_index,
+        zen_store=zen_store,
+    )
+    with open(destination, "wb") as f:
+        for chunk in iterate_artifact_file(
+            artifact_store=artifact_store, uri=uri
+        ):
+            f.write(chunk)
+
+
 def _load_artifact_store(
     artifact_store_id: Union[str, "UUID"],
     zen_store: Optional["BaseZenStore"] = None,
@@ -373,35 +556,240 @@ def upload_artifact(
     Returns:
         The ID of the published artifact.
     """
+    visualizations, artifact_metadata = _save_artifact(
+        name=name,
+        data=data,
+        materializer=materializer,
+        extract_metadata=extract_metadata,
+        include_visualizations=include_visualizations,
+    )
+    return _publish_artifact(
+        name=name,
+        data_type=type(data),
+        materializer=materializer,
+        artifact_store_id=artifact_store_id,
+        visualizations=visualizations,
+        artifact_metadata=artifact_metadata,
+    )
+
+
+def upload_artifacts_in_background(
+    artifacts: Dict[str, Tuple[Any, "BaseMaterializer"]],
+    artifact_store_id: "UUID",
+    extract_metadata: bool,
+    include_visualizations: bool,
+) -> Dict[str, "UUID"]:
+    """Upload and publish multiple artifacts, overlapping their uploads.
+
+    Artifacts with a remote URI are first materialized to a local staging
+    directory. While the next artifact gets materialized, the staged files
+    are uploaded in a background thread pool. Artifacts are only published
+    once all uploads succeeded, so no artifact ever points to incomplete
+    files.
+
+    Args:
+        artifacts: Mapping of artifact names to the artifact data and the
+            materializer to store it.
+        artifact_store_id: ID of the artifact store in which the artifacts
+            should be stored.
+        extract_metadata: If artifact metadata should be extracted and returned.
+        include_visualizations: If artifact visualizations should be generated.
+
+    Returns:
+        The IDs of the published artifacts.
+    """
+    max_workers = handle_int_env_var(
+        ENV_ZENML_ARTIFACT_UPLOAD_MAX_WORKERS,
+        default=DEFAULT_ARTIFACT_UPLOAD_MAX_WORKERS,
+    )
+    saved_artifacts: Dict[
+        str, Tuple[List[VisualizationModel], Dict[str, "MetadataType"]]
+    ] = {}
+    uploads: List["Future[None]"] = []
+    staging_dirs: List[str] = []
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        try:
+            for name, (data, materializer) in artifacts.items():
+                if not io_utils.is_remote(materializer.uri):
+                    saved_artifacts[name] = _save_artifact(
+                        name=name,
+                        data=data,
+                        materializer=materializer,
+                        extract_metadata=extract_metadata,
+                        include_visualizations=include_visualizations,
+                    )
+                    continue
+
+                staging_dir = tempfile.mkdtemp(prefix="zenml-artifact-")
+                staging_dirs.append(staging_dir)
+                visualizations, artifact_metadata = _save_artifact(
+                    name=name,
+                    data=data,
+                    materializer=materializer.__class__(staging_dir),
+                    extract_metadata=extract_metadata,
+                    include_visualizations=include_visualizations,
+                )
+                for visualization in visualizations:
+                    if visualization.uri.startswith(staging_dir):
+                        visualization.uri = (
+                            materializer.uri
+                            + visualization.uri[len(staging_dir) :]
+                        )
+                saved_artifacts[name] = (visualizations, artifact_metadata)
+                uploads.append(
+                    executor.submit(
+                        io_utils.copy_dir,
+                        staging_dir,
+                        materializer.uri,
+                        overwrite=True,
+                    )
+                )
+
+            with timing_utils.span("wait_for_uploads"):
+                for upload in uploads:
+                    # Raises the exception if the upload failed
+                    upload.result()
+        finally:
+            for upload in uploads:
+                upload.cancel()
+            wait(uploads)
+            for staging_dir in staging_dirs:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+
+    return {
+        name: _publish_artifact(
+            name=name,
+            data_type=type(data),
+            materializer=materializer,
+            artifact_store_id=artifact_store_id,
+            visualizations=saved_artifacts[name][0],
+            artifact_metadata=saved_artifacts[name][1],
+        )
+        for name, (data, materializer) in artifacts.items()
+    }
+
+
+def _save_artifact(
+    name: str,
+    data: Any,
+    materializer: "BaseMaterializer",
+    extract_metadata: bool,
+    include_visualizations: bool,
+) -> Tuple[List[VisualizationModel], Dict[str, "MetadataType"]]:
+    """Save an artifact, its visualizations and metadata.
+
+    Args:
+        name: The name of the artifact.
+        data: The artifact data.
+        materializer: The materializer to store the artifact.
+        extract_metadata: If artifact metadata should be extracted and returned.
+        include_visualizations: If artifact visualizations should be generated.
+
+    Returns:
+        The visualizations and metadata of the artifact.
+    """
     data_type = type(data)
     materializer.validate_type_compatibility(data_type)
-    materializer.save(data)
 
+    # Computing statistics of large artifacts can take as long as writing
+    # them, so materializers can opt in to extracting their custom metadata
+    # while the artifact and its visualizations are saved
+    custom_metadata_future: Optional["Future[Dict[str, MetadataType]]"] = None
     visualizations: List[VisualizationModel] = []
-    if include_visualizations:
-        try:
-            vis_data = materializer.save_visualizations(data)
-            for vis_uri, vis_type in vis_data.items():
-                vis_model = VisualizationModel(
-                    type=vis_type,
-                    uri=vis_uri,
-                )
-                visualizations.append(vis_model)
-        except Exception as e:
-            logger.warning(
-                f"Failed to save visualization for output artifact '{name}': "
-                f"{e}"
+    with ThreadPoolExecutor(
+        max_workers=1
+    ) as executor, storage_tracking.track_storage_size(
+        materializer.uri
+    ) as storage_size_tracker:
+        if extract_metadata and materializer.EXTRACT_METADATA_CONCURRENTLY:
+            custom_metadata_future = executor.submit(
+                timing_utils.in_current_context(_extract_custom_metadata),
+                materializer,
+                data,
             )
+        with timing_utils.span("materializer_save"):
+            materializer.save(data)
+
+        if include_visualizations:
+            try:
+                with timing_utils.span("save_visualizations"):
+                    vis_data = materializer.save_visualizations(data)
+                for vis_uri, vis_type in vis_data.items():
+                    vis_model = VisualizationModel(
+                        type=vis_type,
+                        uri=vis_uri,
+                    )
+                    visualizations.append(vis_model)
+            except Exception as e:
+                logger.warning(
+                    "Failed to save visualization for output artifact "
+                    f"'{name}': {e}"
+                )
 
-    artifact_metadata = {}
+    artifact_metadata: Dict[str, "MetadataType"] = {}
     if extract_metadata:
         try:
-            artifact_metadata = materializer.extract_full_metadata(data)
+            custom_metadata = (
+                custom_metadata_future.result()
+                if custom_metadata_future
+                else None
+            )
+            with timing_utils.span("extract_metadata"):
+                # Uses the size of all files written while saving the
+                # artifact and its visualizations if none of them were
+                # written without ZenML's file IO
+                artifact_metadata = materializer.extract_full_metadata(
+                    data,
+                    storage_size=storage_size_tracker.get_storage_size(),
+                    custom_metadata=custom_metadata,
+                )
         except Exception as e:
             logger.warning(
                 f"Failed to extract metadata for output artifact '{name}': {e}"
             )
 
+    return visualizations, artifact_metadata
+
+
+def _extract_custom_metadata(
+    materializer: "BaseMaterializer", data: Any
+) -> Dict[str, "MetadataType"]:
+    """Extracts the custom metadata of an artifact.
+
+    Args:
+        materializer: The materializer of the artifact.
+        data: The artifact data.
+
+    Returns:
+        The extracted metadata.
+    """
+    with timing_utils.span("extract_metadata"):
+        return materializer.extract_metadata(data)
+
+
+def _publish_artifact(
+    name: str,
+    data_type: type,
+    materializer: "BaseMaterializer",
+    artifact_store_id: "UUID",
+    visualizations: List[VisualizationModel],
+    artifact_metadata: Dict[str, "MetadataType"],
+) -> "UUID":
+    """Publish a saved artifact.
+
+    Args:
+        name: The name of the artifact.
+        data_type: The type of the artifact data.
+        materializer: The materializer that stored the artifact.
+        artifact_store_id: ID of the artifact store in which the artifact is
+            stored.
+        visualizations: The visualizations of the artifact.
+        artifact_metadata: The metadata of the artifact.
+
+    Returns:
+        The ID of the published artifact.
+    """
     artifact = ArtifactRequestModel(
         name=name,
         type=materializer.ASSOCIATED_ARTIFACT_TYPE,
@@ -413,11 +801,12 @@ def upload_artifact(
         artifact_store_id=artifact_store_id,
         visualizations=visualizations,
     )
-    response = Client().zen_store.create_artifact(artifact=artifact)
-    if artifact_metadata:
-        Client().create_run_metadata(
-            metadata=artifact_metadata, artifact_id=response.id
-        )
+    with timing_utils.span("publish_artifact"):
+        response = Client().zen_store.create_artifact(artifact=artifact)
+        if artifact_metadata:
+            Client().create_run_metadata(
+                metadata=artifact_metadata, artifact_id=response.id
+            )
 
     return response.id
 
@@ -428,7 +817,8 @@ def get_producer_step_of_artifact(
     """Get the step run that produced a given artifact.
 
     Args:
-        artifact: The artifact.
+        artifact: The artifact. If it was only hydrated on `summary` level, it
+            is fetched again to find its producer step run.
 
     Returns:
         The step run that produced the artifact.
@@ -436,6 +826,10 @@ def get_producer_step_of_artifact(
     Raises:
         RuntimeError: If the run that created the artifact no longer exists.
     """
+    if artifact.hydration == HydrationLevel.SUMMARY:
+        artifact = Client().get_artifact(
+            artifact.id, hydration=HydrationLevel.BODY
+        )
     if not artifact.producer_step_run_id:
         raise RuntimeError(
             f"The run that produced the artifact with id '{artifact.id}' no "
@@ -450,13 +844,16 @@ def get_artifacts_of_pipeline_run(
     """Get all artifacts produced during a pipeline run.
 
     Args:
-        pipeline_run: The pipeline run.
+        pipeline_run: The pipeline run. If it was not fully hydrated, it is
+            fetched again to include its steps.
         only_produced: If only artifacts produced by the pipeline run should be
             returned or also cached artifacts.
 
     Returns:
         A list of all artifacts produced during the pipeline run.
     """
+    if pipeline_run.hydration != HydrationLevel.FULL:
+        pipeline_run = Client().get_pipeline_run(pipeline_run.id)
     artifacts: List["ArtifactResponseModel"] = []
     for step in pipeline_run.steps.values():
         if not only_produced or step.status == ExecutionStatus.COMPLETED:
@@ -0,0 +1,175 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility functions to cache pipeline deployments on the local disk.
+
+The stack of a deployment contains the configurations of all its
+components, which might include credentials. Cached deployments therefore
+only store the ID of their stack, which gets resolved from the zen store
+when loading them. Cache files are only readable by their owner.
+"""
+
+import json
+import os
+import tempfile
+from typing import Optional
+from uuid import UUID
+
+from zenml.client import Client
+from zenml.constants import ENV_ZENML_DEPLOYMENT_CACHE_DIR
+from zenml.logger import get_logger
+from zenml.models.pipeline_deployment_models import (
+    PipelineDeploymentResponseModel,
+)
+from zenml.utils import io_utils
+
+logger = get_logger(__name__)
+
+DEPLOYMENT_CACHE_DIRECTORY_NAME = "deployment_cache"
+DEPLOYMENT_CACHE_MAX_ENTRIES = 32
+
+
+def get_cache_directory() -> Optional[str]:
+    """Gets the directory in which deployments are cached.
+
+    The directory can be configured using the `ZENML_DEPLOYMENT_CACHE_DIR`
+    environment variable, e.g. to share it between multiple containers. If the
+    variable is set to an empty string, deployments will not be cached.
+
+    Returns:
+        The cache directory or None if caching is disabled.
+    """
+    cache_dir = os.getenv(ENV_ZENML_DEPLOYMENT_CACHE_DIR)
+    if cache_dir is not None:
+        return cache_dir or None
+
+    return os.path.join(
+        io_utils.get_global_config_directory(),
+        DEPLOYMENT_CACHE_DIRECTORY_NAME,
+    )
+
+
+def _get_cache_path(cache_dir: str, deployment_id: UUID) -> str:
+    """Gets the path of a cached deployment.
+
+    Args:
+        cache_dir: The cache directory.
+        deployment_id: The deployment ID.
+
+    Returns:
+        The path of the cached deployment.
+    """
+    return os.path.join(cache_dir, f"{deployment_id}.json")
+
+
+def _write_cache(
+    cache_dir: str, deployment: PipelineDeploymentResponseModel
+) -> None:
+    """Writes a deployment to the cache.
+
+    Args:
+        cache_dir: The cache directory.
+        deployment: The deployment to cache.
+    """
+    entry = {
+        "stack_id": str(deployment.stack.id) if deployment.stack else None,
+        "deployment": json.loads(deployment.json(exclude={"stack"})),
+    }
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        # Write to a temporary file first and then replace the cache file so
+        # concurrent processes never read a partially written deployment.
+        # Temporary files are created with permissions `0600`.
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, _get_cache_path(cache_dir, deployment.id))
+        _prune_cache(cache_dir)
+    except OSError as e:
+        logger.debug("Unable to cache deployment %s: %s", deployment.id, e)
+
+
+def _read_cache(
+    cache_dir: str, deployment_id: UUID
+) -> Optional[PipelineDeploymentResponseModel]:
+    """Reads a deployment from the cache.
+
+    Args:
+        cache_dir: The cache directory.
+        deployment_id: ID of the deployment to read.
+
+    Returns:
+        The cached deployment or None if it is not cached.
+    """
+    try:
+        with open(_get_cache_path(cache_dir, deployment_id), "r") as f:
+            entry = json.load(f)
+
+        deployment = PipelineDeploymentResponseModel.parse_obj(
+            entry["deployment"]
+        )
+        if entry["stack_id"]:
+            stack = Client().zen_store.get_stack(UUID(entry["stack_id"]))
+            deployment = deployment.copy(update={"stack": stack})
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+    return deployment
+
+
+def _prune_cache(cache_dir: str) -> None:
+    """Removes the least recently written deployments from the cache.
+
+    Args:
+        cache_dir: The cache directory.
+    """
+    paths = [
+        os.path.join(cache_dir, filename)
+        for filename in os.listdir(cache_dir)
+        if filename.endswith(".json")
+    ]
+    if len(paths) <= DEPLOYMENT_CACHE_MAX_ENTRIES:
+        return
+
+    paths.sort(key=os.path.getmtime)
+    for path in paths[:-DEPLOYMENT_CACHE_MAX_ENTRIES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def load_deployment(deployment_id: UUID) -> PipelineDeploymentResponseModel:
+    """Loads a deployment from the local cache or the zen store.
+
+    Deployments are immutable, which means a deployment that was fetched once
+    can be reused by all subsequent steps that run in the same environment.
+
+    Args:
+        deployment_id: ID of the deployment to load.
+
+    Returns:
+        The deployment.
+    """
+    cache_dir = get_cache_directory()
+    if cache_dir:
+        cached_deployment = _read_cache(cache_dir, deployment_id)
+        if cached_deployment:
+            return cached_deployment
+
+    deployment = Client().zen_store.get_deployment(deployment_id)
+
+    if cache_dir:
+        _write_cache(cache_dir, deployment)
+
+    return deployment
@@ -288,6 +288,18 @@ def tag_image(image_name: str, target: str) -> None:
     image.tag(target)
 
 
+def remove_image(image_name: str) -> None:
+    """Removes an image.
+
+    If the image has other tags, only the given tag is removed.
+
+    Args:
+        image_name: The name of the image to remove.
+    """
+    docker_client = DockerClient.from_env()
+    docker_client.images.remove(image_name)
+
+
 def get_image_digest(image_name: str) -> Optional[str]:
     """Gets the digest of an image.
 
@@ -15,8 +15,9 @@
 
 import fnmatch
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, Iterator, Tuple
 
 import click
 
@@ -97,7 +98,10 @@ def read_file_contents_as_string(file_path: str) -> str:
 
 
 def copy_dir(
-    source_dir: str, destination_dir: str, overwrite: bool = False
+    source_dir: str,
+    destination_dir: str,
+    overwrite: bool = False,
+    max_workers: int = 1,
 ) -> None:
     """Copies dir from source to destination.
 
@@ -105,6 +109,45 @@ def copy_dir(
         source_dir: Path to copy from.
         destination_dir: Path to copy to.
         overwrite: Boolean. If false, function throws an error before overwrite.
+        max_workers: Maximum number of files to copy concurrently. Copying
+            files concurrently speeds up transfers from and to remote
+            filesystems.
+    """
+    files = list(_list_files_to_copy(source_dir, destination_dir))
+    for destination_parent in {
+        os.path.dirname(destination_path) for _, destination_path in files
+    }:
+        create_dir_recursive_if_not_exists(destination_parent)
+
+    def _copy(paths: Tuple[str, str]) -> None:
+        """Copies a single file.
+
+        Args:
+            paths: The source and destination path of the file.
+        """
+        copy(paths[0], paths[1], overwrite)
+
+    if max_workers > 1 and len(files) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results to re-raise the first error
+            for _ in executor.map(_copy, files):
+                pass
+    else:
+        for paths in files:
+            _copy(paths)
+
+
+def _list_files_to_copy(
+    source_dir: str, destination_dir: str
+) -> Iterator[Tuple[str, str]]:
+    """Lists all files to copy from a source to a destination directory.
+
+    Args:
+        source_dir: Path to copy from.
+        destination_dir: Path to copy to.
+
+    Yields:
+        The source and destination path of each file to copy.
     """
     for source_file in listdir(source_dir):
         source_path = os.path.join(source_dir, convert_to_str(source_file))
@@ -116,12 +159,9 @@ def copy_dir(
                 # if the destination is a subdirectory of the source, we skip
                 # copying it to avoid an infinite loop.
                 continue
-            copy_dir(source_path, destination_path, overwrite)
+            yield from _list_files_to_copy(source_path, destination_path)
         else:
-            create_dir_recursive_if_not_exists(
-                os.path.dirname(destination_path)
-            )
-            copy(str(source_path), str(destination_path), overwrite)
+            yield str(source_path), str(destination_path)
 
 
 def find_files(dir_path: "PathType", pattern: str) -> Iterable[str]:
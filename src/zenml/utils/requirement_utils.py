@@ -0,0 +1,236 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility functions to check whether Python requirements are installed."""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from importlib import metadata
+from typing import Dict, Optional, Sequence
+
+from packaging.requirements import InvalidRequirement, Requirement
+
+from zenml.logger import get_logger
+from zenml.utils import io_utils
+
+logger = get_logger(__name__)
+
+REQUIREMENTS_CACHE_FILENAME = "requirements_cache.json"
+
+_fingerprint: Optional[str] = None
+_cache: Optional[Dict[str, bool]] = None
+
+
+def get_environment_fingerprint() -> str:
+    """Computes a fingerprint of the installed Python packages.
+
+    Installing or removing a distribution adds or removes a metadata
+    directory inside one of the `sys.path` directories, which changes the
+    modification time of that directory. The fingerprint is therefore a hash
+    of the interpreter and the modification times of all `sys.path` entries.
+
+    Returns:
+        The environment fingerprint.
+    """
+    hash_ = hashlib.md5()  # nosec
+    hash_.update(sys.executable.encode())
+    hash_.update(sys.version.encode())
+
+    for path in sys.path:
+        try:
+            mtime = os.stat(path or os.curdir).st_mtime_ns
+        except OSError:
+            continue
+        hash_.update(f"{path}:{mtime}".encode())
+
+    return hash_.hexdigest()
+
+
+def _get_cache_path() -> str:
+    """Gets the path of the requirements cache file.
+
+    Returns:
+        The path of the requirements cache file.
+    """
+    return os.path.join(
+        io_utils.get_global_config_directory(), REQUIREMENTS_CACHE_FILENAME
+    )
+
+
+def _load_cache() -> Dict[str, bool]:
+    """Loads the requirements cache for the current environment.
+
+    Returns:
+        The cached requirement check results. If the cache file does not
+        exist or was written for a different environment, an empty dictionary
+        is returned.
+    """
+    global _fingerprint, _cache
+
+    if _cache is not None:
+        return _cache
+
+    _fingerprint = get_environment_fingerprint()
+    _cache = {}
+    try:
+        with open(_get_cache_path(), "r") as f:
+            cache_content = json.load(f)
+    except (OSError, ValueError):
+        return _cache
+
+    if (
+        isinstance(cache_content, dict)
+        and cache_content.get("fingerprint") == _fingerprint
+        and isinstance(cache_content.get("requirements"), dict)
+    ):
+        _cache.update(cache_content["requirements"])
+
+    return _cache
+
+
+def _write_cache() -> None:
+    """Writes the requirements cache to disk."""
+    if _cache is None:
+        return
+
+    cache_path = _get_cache_path()
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temporary file first and then replace the cache file so
+        # concurrent processes never read a partially written cache.
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"fingerprint": _fingerprint, "requirements": _cache}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug("Unable to write requirements cache: %s", e)
+
+
+def reset_cache() -> None:
+    """Resets the in-memory requirements cache."""
+    global _fingerprint, _cache
+
+    _fingerprint = None
+    _cache = None
+
+
+def _check_requirement(requirement: str) -> bool:
+    """Checks whether a single requirement is installed.
+
+    Args:
+        requirement: The requirement string to check.
+
+    Returns:
+        True if the requirement is installed, False otherwise.
+    """
+    try:
+        req = Requirement(requirement)
+    except InvalidRequirement:
+        logger.debug("Unable to parse requirement '%s'.", requirement)
+        return False
+
+    return _check_parsed_requirement(req)
+
+
+def _check_parsed_requirement(
+    req: Requirement, extra: Optional[str] = None
+) -> bool:
+    """Checks whether a parsed requirement is installed.
+
+    Args:
+        req: The requirement to check.
+        extra: The extra of another requirement that this requirement is a
+            dependency of. The environment markers of the requirement are
+            evaluated for this extra.
+
+    Returns:
+        True if the requirement is installed, False otherwise.
+    """
+    if req.marker and not req.marker.evaluate({"extra": extra or ""}):
+        # The requirement does not apply to this environment
+        return True
+
+    try:
+        version = metadata.version(req.name)
+    except metadata.PackageNotFoundError:
+        logger.debug("Unable to find required package '%s'.", req.name)
+        return False
+
+    if not req.specifier.contains(version, prereleases=True):
+        logger.debug(
+            "Installed version %s of package '%s' does not match the "
+            "required version '%s'.",
+            version,
+            req.name,
+            req.specifier,
+        )
+        return False
+
+    if not req.extras:
+        return True
+
+    # Make sure the dependencies of all requested extras are installed as well
+    for dependency in metadata.requires(req.name) or []:
+        try:
+            dependency_req = Requirement(dependency)
+        except InvalidRequirement:
+            continue
+
+        if not dependency_req.marker or dependency_req.marker.evaluate(
+            {"extra": ""}
+        ):
+            # Dependencies that don't belong to an extra aren't checked
+            continue
+
+        for requested_extra in req.extras:
+            if not _check_parsed_requirement(
+                dependency_req, extra=requested_extra
+            ):
+                return False
+
+    return True
+
+
+def is_installed(requirements: Sequence[str]) -> bool:
+    """Checks whether a list of requirements is installed.
+
+    Results are cached on disk and reused as long as the installed packages
+    of the current environment don't change.
+
+    Args:
+        requirements: The requirements to check.
+
+    Returns:
+        True if all requirements are installed, False otherwise.
+    """
+    cache = _load_cache()
+    cache_modified = False
+    installed = True
+
+    for requirement in requirements:
+        if requirement not in cache:
+            cache[requirement] = _check_requirement(requirement)
+            cache_modified = True
+
+        if not cache[requirement]:
+            installed = False
+            break
+
+    if cache_modified:
+        _write_cache()
+
+    return installed
@@ -0,0 +1,126 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utility functions to compute statistics of (large) artifacts."""
+
+import warnings
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import numpy as np
+
+from zenml.constants import (
+    ENV_ZENML_ARTIFACT_STATISTICS_MAX_BYTES,
+    ENV_ZENML_ARTIFACT_STATISTICS_MAX_ROWS,
+    handle_int_env_var,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+DEFAULT_MAX_ROWS = 1_000_000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+SAMPLING_SEED = 0
+SAMPLE_SIZE_METADATA_KEY = "statistics_sample_size"
+
+
+def get_max_sample_size(row_size: int) -> Optional[int]:
+    """Gets the maximum number of rows to compute statistics on.
+
+    The budget can be configured using the
+    `ZENML_ARTIFACT_STATISTICS_MAX_ROWS` and
+    `ZENML_ARTIFACT_STATISTICS_MAX_BYTES` environment variables. Setting one
+    of them to zero or a negative value disables the respective limit.
+
+    Args:
+        row_size: The size of a single row in bytes.
+
+    Returns:
+        The maximum number of rows or None if the number of rows is not
+        limited.
+    """
+    max_rows = handle_int_env_var(
+        ENV_ZENML_ARTIFACT_STATISTICS_MAX_ROWS, default=DEFAULT_MAX_ROWS
+    )
+    max_bytes = handle_int_env_var(
+        ENV_ZENML_ARTIFACT_STATISTICS_MAX_BYTES, default=DEFAULT_MAX_BYTES
+    )
+
+    limits = []
+    if max_rows > 0:
+        limits.append(max_rows)
+    if max_bytes > 0 and row_size > 0:
+        limits.append(max(1, max_bytes // row_size))
+
+    return min(limits) if limits else None
+
+
+def sample_indices(num_rows: int, row_size: int) -> Optional["NDArray[Any]"]:
+    """Samples the rows to compute statistics on.
+
+    Rows are sampled uniformly without replacement and with a fixed seed, so
+    statistics of the same data are reproducible.
+
+    Args:
+        num_rows: The total number of rows.
+        row_size: The size of a single row in bytes.
+
+    Returns:
+        The sorted indices of the sampled rows or None if all rows fit into
+        the budget.
+    """
+    max_sample_size = get_max_sample_size(row_size=row_size)
+    if max_sample_size is None or num_rows <= max_sample_size:
+        return None
+
+    rng = np.random.default_rng(SAMPLING_SEED)
+    return np.sort(rng.choice(num_rows, size=max_sample_size, replace=False))
+
+
+def compute_numeric_statistics(
+    values: "NDArray[Any]", ddof: int = 0
+) -> Dict[str, "NDArray[Any]"]:
+    """Computes the statistics of all columns of a 2D array at once.
+
+    NaN values are ignored. The statistics of columns that contain only NaN
+    values are NaN.
+
+    Args:
+        values: The 2D array of shape (rows, columns).
+        ddof: Delta degrees of freedom used to compute the standard deviation.
+
+    Returns:
+        The mean, standard deviation, minimum and maximum of each column.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    num_columns = values.shape[1]
+    if values.shape[0] == 0:
+        nan = np.full(num_columns, np.nan)
+        return {"mean": nan, "std": nan, "min": nan, "max": nan}
+
+    with warnings.catch_warnings():
+        # All-NaN columns and columns with fewer than `ddof` values result
+        # in NaN statistics, just like in pandas.
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        count = np.count_nonzero(~np.isnan(values), axis=0)
+        mean = np.nanmean(values, axis=0)
+        squared_deviations = np.nansum(np.square(values - mean), axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variance = np.where(
+                count > ddof, squared_deviations / (count - ddof), np.nan
+            )
+        return {
+            "mean": mean,
+            "std": np.sqrt(variance),
+            "min": np.nanmin(values, axis=0),
+            "max": np.nanmax(values, axis=0),
+        }
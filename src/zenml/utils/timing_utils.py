@@ -0,0 +1,209 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utilities to measure the duration of the phases of a step run."""
+
+import contextvars
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+STEP_TIMINGS_METADATA_KEY = "step_phase_durations"
+
+_active_timer: contextvars.ContextVar[
+    Optional["StepTimer"]
+] = contextvars.ContextVar("zenml_step_timer", default=None)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tracer() -> Any:
+    """Gets the OpenTelemetry tracer if OpenTelemetry is installed.
+
+    Returns:
+        The tracer or None if OpenTelemetry is not installed.
+    """
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        return None
+
+    return trace.get_tracer("zenml")
+
+
+class StepTimer:
+    """Measures the duration of the phases of a step run.
+
+    Phases are measured using the `span(...)` context manager of this module
+    while the timer is active. The durations of phases that happen multiple
+    times (e.g. loading multiple input artifacts) are summed up. If
+    OpenTelemetry is installed, each phase is additionally recorded as an
+    OpenTelemetry span.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the timer."""
+        self._lock = threading.Lock()
+        self._durations: Dict[str, float] = {}
+
+    @property
+    def durations(self) -> Dict[str, float]:
+        """The durations of the measured phases in seconds.
+
+        Returns:
+            The durations by phase name, in the order in which the phases
+            started.
+        """
+        with self._lock:
+            return {
+                phase: round(duration, 6)
+                for phase, duration in self._durations.items()
+            }
+
+    def record(self, phase: str, duration: float) -> None:
+        """Records the duration of a phase.
+
+        Args:
+            phase: The name of the phase.
+            duration: The duration in seconds.
+        """
+        with self._lock:
+            self._durations[phase] = self._durations.get(phase, 0.0) + duration
+
+    @contextmanager
+    def activate(self) -> Iterator["StepTimer"]:
+        """Activates the timer in the current context.
+
+        Yields:
+            The timer.
+        """
+        token = _active_timer.set(self)
+        try:
+            yield self
+        finally:
+            _active_timer.reset(token)
+
+
+def get_active_timer() -> Optional[StepTimer]:
+    """Gets the active step timer.
+
+    Returns:
+        The active step timer or None if no timer is active.
+    """
+    return _active_timer.get()
+
+
+@contextmanager
+def span(phase: str) -> Iterator[None]:
+    """Measures the duration of a phase of the active step run.
+
+    Does nothing if no step timer is active.
+
+    Args:
+        phase: The name of the phase.
+
+    Yields:
+        Nothing.
+    """
+    timer = get_active_timer()
+    if timer is None:
+        yield
+        return
+
+    tracer = _get_tracer()
+    start = time.perf_counter()
+    try:
+        if tracer:
+            with tracer.start_as_current_span(f"zenml.step.{phase}"):
+                yield
+        else:
+            yield
+    finally:
+        timer.record(phase, time.perf_counter() - start)
+
+
+def in_current_context(func: F) -> F:
+    """Binds a function to the current context.
+
+    Threads of a thread pool don't inherit the context of the thread that
+    submits work to them, so functions submitted to a thread pool need to be
+    bound to the current context for their phases to be recorded by the
+    active step timer.
+
+    Args:
+        func: The function to bind.
+
+    Returns:
+        The function running in a copy of the current context.
+    """
+    context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        """Calls the function in the bound context.
+
+        Args:
+            *args: Positional arguments of the function.
+            **kwargs: Keyword arguments of the function.
+
+        Returns:
+            The return value of the function.
+        """
+        # A context can only be entered by one thread at a time
+        return context.copy().run(func, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def aggregate_durations(
+    step_durations: Iterable[Dict[str, float]]
+) -> List[Dict[str, Any]]:
+    """Aggregates the phase durations of multiple step runs.
+
+    Args:
+        step_durations: The durations of the phases of each step run by phase
+            name.
+
+    Returns:
+        One entry for each phase with the number of step runs in which the
+        phase was measured and the total, mean and maximum duration in
+        seconds, sorted by total duration in descending order.
+    """
+    phases: Dict[str, List[float]] = {}
+    for durations in step_durations:
+        for phase, duration in durations.items():
+            phases.setdefault(phase, []).append(duration)
+
+    aggregated = [
+        {
+            "phase": phase,
+            "steps": len(durations),
+            "total": round(sum(durations), 3),
+            "mean": round(sum(durations) / len(durations), 3),
+            "max": round(max(durations), 3),
+        }
+        for phase, durations in phases.items()
+    ]
+    return sorted(aggregated, key=lambda entry: entry["total"], reverse=True)
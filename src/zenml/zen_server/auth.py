@@ -13,9 +13,13 @@
 #  permissions and limitations under the License.
 """Authentication module for ZenML server."""
 
+import hashlib
 import os
+import threading
+import time
 from contextvars import ContextVar
-from typing import Callable, List, Optional, Set, Union
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
@@ -27,7 +31,14 @@ from fastapi.security import (
 )
 from pydantic import BaseModel
 
-from zenml.constants import API, ENV_ZENML_AUTH_TYPE, LOGIN, VERSION_1
+from zenml.constants import (
+    API,
+    AUTH_CACHE_MAX_SIZE,
+    AUTH_CACHE_TTL,
+    ENV_ZENML_AUTH_TYPE,
+    LOGIN,
+    VERSION_1,
+)
 from zenml.enums import PermissionType
 from zenml.exceptions import AuthorizationException
 from zenml.logger import get_logger
@@ -80,6 +91,7 @@ class AuthContext(BaseModel):
     """The authentication context."""
 
     user: UserResponseModel
+    access_token: Optional[JWTToken] = None
 
     @property
     def permissions(self) -> Set[PermissionType]:
@@ -100,6 +112,109 @@ class AuthContext(BaseModel):
         return set()
 
 
+class AuthContextCache:
+    """In-process cache of authentication contexts.
+
+    Authenticating a request requires decoding the credentials and fetching
+    the user and its roles from the database. Caching the resulting
+    authentication contexts for a short time avoids paying this cost for
+    every request made with the same credentials.
+
+    The cache only lives in the memory of the current process. Changes to
+    users, teams, roles and role assignments invalidate the cache of the
+    worker process that handled the change, but other worker processes and
+    server replicas keep using their cached entries until the TTL expires.
+    The TTL (`ZENML_SERVER_AUTH_CACHE_TTL`, 5 seconds by default) should
+    therefore be kept short when running multiple workers.
+    """
+
+    def __init__(self, ttl: int, max_size: int = AUTH_CACHE_MAX_SIZE) -> None:
+        """Initializes the cache.
+
+        Args:
+            ttl: Number of seconds for which entries are kept in the cache.
+                A value of 0 disables the cache.
+            max_size: Maximum number of entries kept in the cache.
+        """
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries: Dict[str, Tuple[float, AuthContext]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[AuthContext]:
+        """Gets a cached authentication context.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached authentication context or None if no valid entry
+            exists for the key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires, auth_context = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            return auth_context
+
+    def set(
+        self,
+        key: str,
+        auth_context: AuthContext,
+        expires: Optional[datetime] = None,
+    ) -> None:
+        """Adds an authentication context to the cache.
+
+        Args:
+            key: The cache key.
+            auth_context: The authentication context to cache.
+            expires: Optional expiration time of the credentials. If given,
+                the entry is never kept in the cache past this time.
+        """
+        if self._ttl <= 0:
+            return
+
+        ttl = float(self._ttl)
+        if expires is not None:
+            ttl = min(ttl, (expires - datetime.utcnow()).total_seconds())
+            if ttl <= 0:
+                return
+
+        with self._lock:
+            if len(self._entries) >= self._max_size:
+                now = time.monotonic()
+                self._entries = {
+                    k: v for k, v in self._entries.items() if v[0] > now
+                }
+                if len(self._entries) >= self._max_size:
+                    self._entries.clear()
+
+            self._entries[key] = (time.monotonic() + ttl, auth_context)
+
+    def invalidate(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+_auth_context_cache = AuthContextCache(ttl=AUTH_CACHE_TTL)
+
+
+def invalidate_auth_cache() -> None:
+    """Invalidates all cached authentication contexts.
+
+    This needs to be called whenever users, teams, roles or role assignments
+    are modified, as they affect the cached users and their permissions.
+    """
+    _auth_context_cache.invalidate()
+
+
 def authentication_scheme() -> AuthScheme:
     """Returns the authentication type.
 
@@ -155,13 +270,18 @@ def authenticate_credentials(
         if not UserAuthModel.verify_password(password, user):
             return None
     elif access_token is not None:
-        user = UserAuthModel.verify_access_token(access_token)
-        if not user:
+        try:
+            decoded_token = JWTToken.decode(
+                token_type=JWTTokenType.ACCESS_TOKEN, token=access_token
+            )
+            user_model = zen_store().get_user(
+                user_name_or_id=decoded_token.user_id, include_private=True
+            )
+        except (AuthorizationException, KeyError):
             return None
-        user_model = zen_store().get_user(
-            user_name_or_id=user.id, include_private=True
-        )
-        auth_context = AuthContext(user=user_model)
+        if not user_model.active:
+            return None
+        auth_context = AuthContext(user=user_model, access_token=decoded_token)
     elif activation_token is not None:
         if not UserAuthModel.verify_activation_token(activation_token, user):
             return None
@@ -185,6 +305,13 @@ def http_authentication(
     Raises:
         HTTPException: If the user credentials could not be authenticated.
     """
+    cache_key = hashlib.sha256(
+        f"{credentials.username}:{credentials.password}".encode()
+    ).hexdigest()
+    auth_context = _auth_context_cache.get(cache_key)
+    if auth_context is not None:
+        return auth_context
+
     auth_context = authenticate_credentials(
         user_name_or_id=credentials.username, password=credentials.password
     )
@@ -194,6 +321,7 @@ def http_authentication(
             detail="Invalid authentication credentials",
         )
 
+    _auth_context_cache.set(cache_key, auth_context)
     return auth_context
 
 
@@ -226,33 +354,36 @@ def oauth2_password_bearer_authentication(
         authenticate_value = f'Bearer scope="{security_scopes.scope_str}"'
     else:
         authenticate_value = "Bearer"
-    auth_context = authenticate_credentials(access_token=token)
-
-    try:
-        access_token = JWTToken.decode(
-            token_type=JWTTokenType.ACCESS_TOKEN, token=token
-        )
-    except AuthorizationException:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
+    auth_context = _auth_context_cache.get(token)
+    if auth_context is None:
+        auth_context = authenticate_credentials(access_token=token)
+        if auth_context is None:
+            # We have to return an additional WWW-Authenticate header here with
+            # the value Bearer to be compliant with the OAuth2 spec.
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authentication credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        expires = (
+            auth_context.access_token.expires
+            if auth_context.access_token
+            else None
         )
+        _auth_context_cache.set(token, auth_context, expires=expires)
+
+    permissions = (
+        auth_context.access_token.permissions
+        if auth_context.access_token
+        else []
+    )
     for scope in security_scopes.scopes:
-        if scope not in access_token.permissions:
+        if scope not in permissions:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not enough permissions",
                 headers={"WWW-Authenticate": authenticate_value},
             )
-    if auth_context is None:
-        # We have to return an additional WWW-Authenticate header here with the
-        # value Bearer to be compliant with the OAuth2 spec.
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
     return auth_context
 
 
@@ -268,6 +399,10 @@ def no_authentication(security_scopes: SecurityScopes) -> AuthContext:
     Raises:
         HTTPException: If the default user is not available.
     """
+    auth_context = _auth_context_cache.get(DEFAULT_USERNAME)
+    if auth_context is not None:
+        return auth_context
+
     auth_context = authenticate_credentials(user_name_or_id=DEFAULT_USERNAME)
 
     if auth_context is None:
@@ -276,6 +411,7 @@ def no_authentication(security_scopes: SecurityScopes) -> AuthContext:
             detail="Invalid authentication credentials",
         )
 
+    _auth_context_cache.set(DEFAULT_USERNAME, auth_context)
     return auth_context
 
 
@@ -16,6 +16,8 @@
 import os
 from typing import Dict, List, Optional, Tuple, cast
 
+from pydantic import Field
+
 import zenml
 from zenml.config.global_config import GlobalConfiguration
 from zenml.config.store_config import StoreConfiguration
@@ -60,10 +62,12 @@ class DockerServerDeploymentConfig(ServerDeploymentConfig):
     Attributes:
         port: The TCP port number where the server is accepting connections.
         image: The Docker image to use for the server.
+        workers: The number of worker processes serving requests.
     """
 
     port: int = 8238
     image: str = DOCKER_ZENML_SERVER_DEFAULT_IMAGE
+    workers: int = Field(default=1, ge=1)
     store: Optional[StoreConfiguration] = None
 
     class Config:
@@ -227,6 +231,7 @@ class DockerZenServer(ContainerService):
                 ZEN_SERVER_ENTRYPOINT,
                 host="0.0.0.0",
                 port=self.endpoint.config.port,
+                workers=self.config.server.workers,
                 log_level="info",
             )
         except KeyboardInterrupt:
@@ -17,6 +17,8 @@ import ipaddress
 import os
 from typing import Dict, List, Optional, Tuple, Union, cast
 
+from pydantic import Field
+
 from zenml.client import Client
 from zenml.config.global_config import GlobalConfiguration
 from zenml.config.store_config import StoreConfiguration
@@ -54,6 +56,7 @@ class LocalServerDeploymentConfig(ServerDeploymentConfig):
         address: The IP address where the server is reachable.
         blocking: Run the server in blocking mode instead of using a daemon
             process.
+        workers: The number of worker processes serving requests.
     """
 
     port: int = 8237
@@ -61,6 +64,7 @@ class LocalServerDeploymentConfig(ServerDeploymentConfig):
         ipaddress.IPv4Address, ipaddress.IPv6Address
     ] = ipaddress.IPv4Address(DEFAULT_LOCAL_SERVICE_IP_ADDRESS)
     blocking: bool = False
+    workers: int = Field(default=1, ge=1)
     store: Optional[StoreConfiguration] = None
 
     class Config:
@@ -242,6 +246,7 @@ class LocalZenServer(LocalDaemonService):
                 ZEN_SERVER_ENTRYPOINT,
                 host=self.endpoint.config.ip_address,
                 port=self.endpoint.config.port,
+                workers=self.config.server.workers,
                 log_level="info",
             )
         except KeyboardInterrupt:
@@ -0,0 +1,565 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Request metrics and profiling of the ZenML server.
+
+The metrics are kept in the memory of each server worker process and every
+sample is labeled with the process ID of its worker. A scrape of the metrics
+endpoint is answered by a single worker, so the metrics of the other workers
+of the same server are only collected by subsequent scrapes.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import random
+import threading
+import time
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from sqlalchemy import event
+from starlette.middleware.base import (
+    BaseHTTPMiddleware,
+    RequestResponseEndpoint,
+)
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+from zenml.logger import get_logger
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+logger = get_logger(__name__)
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+PROFILE_STATS_LIMIT = 25
+# Label of requests that didn't match any route, so that requests to random
+# paths can't create an unbounded number of metrics.
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestStats:
+    """Statistics collected while a server request is handled."""
+
+    def __init__(self, profile_requested: bool = False) -> None:
+        """Initializes the statistics.
+
+        Args:
+            profile_requested: Whether the endpoint should be profiled.
+        """
+        self.profile_requested = profile_requested
+        self.query_count = 0
+        self.profile: Optional[str] = None
+
+
+# The statistics object is shared with the copies of the context in which
+# the endpoints are executed, so they can update it from worker threads.
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "zenml_request_stats", default=None
+)
+
+
+def get_request_stats() -> Optional[RequestStats]:
+    """Gets the statistics of the request that is currently handled.
+
+    Returns:
+        The statistics or None if request metrics are disabled.
+    """
+    return _request_stats.get()
+
+
+def _count_query(*args: Any, **kwargs: Any) -> None:
+    """Counts a SQL query executed while handling a request.
+
+    Args:
+        *args: Positional arguments of the SQLAlchemy event.
+        **kwargs: Keyword arguments of the SQLAlchemy event.
+    """
+    stats = get_request_stats()
+    if stats:
+        stats.query_count += 1
+
+
+def instrument_engine(engine: "Engine") -> None:
+    """Counts the SQL queries executed by an engine for each request.
+
+    Args:
+        engine: The SQLAlchemy engine.
+    """
+    if not event.contains(engine, "before_cursor_execute", _count_query):
+        event.listen(engine, "before_cursor_execute", _count_query)
+
+
+def call_with_profiling(
+    func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    """Calls an endpoint function and profiles it if requested.
+
+    The function is profiled if the request that is currently handled was
+    sampled for profiling. The profile is stored in the statistics of the
+    request.
+
+    Args:
+        func: The endpoint function.
+        *args: Positional arguments of the function.
+        **kwargs: Keyword arguments of the function.
+
+    Returns:
+        The return value of the function.
+    """
+    stats = get_request_stats()
+    if not stats or not stats.profile_requested:
+        return func(*args, **kwargs)
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Another profiler is already active
+        return func(*args, **kwargs)
+
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profiler.disable()
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats(
+            "cumulative"
+        ).print_stats(PROFILE_STATS_LIMIT)
+        stats.profile = output.getvalue()
+
+
+class _RouteMetrics:
+    """Metrics of the requests to a single route."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        """Initializes the metrics.
+
+        Args:
+            buckets: The upper bounds of the latency histogram buckets.
+        """
+        self.bucket_counts = [0] * len(buckets)
+        self.status_counts: Dict[int, int] = {}
+        self.count = 0
+        self.duration_sum = 0.0
+        self.query_count_sum = 0
+        self.request_size_sum = 0
+        self.response_size_sum = 0
+        self.slow_count = 0
+
+
+class ServerMetrics:
+    """Thread-safe registry of the request metrics of a server worker."""
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        worker: Optional[str] = None,
+    ) -> None:
+        """Initializes the registry.
+
+        Args:
+            buckets: The upper bounds of the latency histogram buckets in
+                seconds.
+            worker: The label of the worker process recording the metrics.
+                Defaults to the ID of the current process.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._worker = worker
+        self._lock = threading.Lock()
+        self._routes: Dict[Tuple[str, str], _RouteMetrics] = {}
+
+    @property
+    def worker(self) -> str:
+        """The label of the worker process recording the metrics.
+
+        The process ID is looked up when the metrics are rendered because the
+        registry may be created before the worker processes are forked.
+
+        Returns:
+            The worker label.
+        """
+        return self._worker or str(os.getpid())
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        duration: float,
+        query_count: int,
+        request_size: int,
+        response_size: int,
+        slow: bool = False,
+    ) -> None:
+        """Records a handled request.
+
+        Args:
+            method: The HTTP method of the request.
+            route: The path template of the route that handled the request.
+            status_code: The status code of the response.
+            duration: The time it took to handle the request in seconds.
+            query_count: The number of SQL queries executed for the request.
+            request_size: The size of the request body in bytes.
+            response_size: The size of the response body in bytes.
+            slow: Whether the request was slow.
+        """
+        with self._lock:
+            metrics = self._routes.get((method, route))
+            if not metrics:
+                metrics = _RouteMetrics(self.buckets)
+                self._routes[(method, route)] = metrics
+
+            for index, upper_bound in enumerate(self.buckets):
+                if duration <= upper_bound:
+                    metrics.bucket_counts[index] += 1
+            metrics.status_counts[status_code] = (
+                metrics.status_counts.get(status_code, 0) + 1
+            )
+            metrics.count += 1
+            metrics.duration_sum += duration
+            metrics.query_count_sum += query_count
+            metrics.request_size_sum += request_size
+            metrics.response_size_sum += response_size
+            if slow:
+                metrics.slow_count += 1
+
+    def render(self) -> str:
+        """Renders the metrics in the Prometheus text exposition format.
+
+        Returns:
+            The metrics.
+        """
+        with self._lock:
+            routes = sorted(self._routes.items())
+            lines: List[str] = []
+
+            def _add_metric(
+                name: str,
+                metric_type: str,
+                help_text: str,
+                samples: List[Tuple[str, Dict[str, str], float]],
+            ) -> None:
+                """Adds a metric with its samples.
+
+                Args:
+                    name: The name of the metric.
+                    metric_type: The Prometheus type of the metric.
+                    help_text: The description of the metric.
+                    samples: The suffix, labels and value of each sample.
+                """
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                for suffix, labels, value in samples:
+                    label_string = ",".join(
+                        f'{key}="{_escape_label(label)}"'
+                        for key, label in labels.items()
+                    )
+                    lines.append(f"{name}{suffix}{{{label_string}}} {value}")
+
+            _add_metric(
+                "zenml_server_requests_total",
+                "counter",
+                "Number of handled requests.",
+                [
+                    (
+                        "",
+                        {
+                            "method": method,
+                            "route": route,
+                            "status": str(status_code),
+                            "worker": self.worker,
+                        },
+                        count,
+                    )
+                    for (method, route), metrics in routes
+                    for status_code, count in sorted(
+                        metrics.status_counts.items()
+                    )
+                ],
+            )
+
+            duration_samples: List[Tuple[str, Dict[str, str], float]] = []
+            for (method, route), metrics in routes:
+                labels = {
+                    "method": method,
+                    "route": route,
+                    "worker": self.worker,
+                }
+                for upper_bound, bucket_count in zip(
+                    self.buckets, metrics.bucket_counts
+                ):
+                    duration_samples.append(
+                        (
+                            "_bucket",
+                            {**labels, "le": str(upper_bound)},
+                            bucket_count,
+                        )
+                    )
+                duration_samples.append(
+                    ("_bucket", {**labels, "le": "+Inf"}, metrics.count)
+                )
+                duration_samples.append(
+                    ("_sum", labels, round(metrics.duration_sum, 6))
+                )
+                duration_samples.append(("_count", labels, metrics.count))
+            _add_metric(
+                "zenml_server_request_duration_seconds",
+                "histogram",
+                "Time it took to handle requests.",
+                duration_samples,
+            )
+
+            for name, help_text, attribute in [
+                (
+                    "zenml_server_sql_queries_total",
+                    "Number of SQL queries executed to handle requests.",
+                    "query_count_sum",
+                ),
+                (
+                    "zenml_server_request_size_bytes_total",
+                    "Size of the bodies of handled requests.",
+                    "request_size_sum",
+                ),
+                (
+                    "zenml_server_response_size_bytes_total",
+                    "Size of the bodies of sent responses.",
+                    "response_size_sum",
+                ),
+                (
+                    "zenml_server_slow_requests_total",
+                    "Number of requests that took longer than the slow "
+                    "request threshold.",
+                    "slow_count",
+                ),
+            ]:
+                _add_metric(
+                    name,
+                    "counter",
+                    help_text,
+                    [
+                        (
+                            "",
+                            {
+                                "method": method,
+                                "route": route,
+                                "worker": self.worker,
+                            },
+                            getattr(metrics, attribute),
+                        )
+                        for (method, route), metrics in routes
+                    ],
+                )
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    """Escapes a Prometheus label value.
+
+    Args:
+        value: The label value.
+
+    Returns:
+        The escaped label value.
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class RequestMetricsMiddleware(BaseHTTPMiddleware):
+    """Middleware recording metrics of all requests handled by the server.
+
+    Requests are recorded by the path template of the route that handled
+    them. Requests taking longer than the slow request threshold are logged
+    together with the number of SQL queries they executed. A sample of the
+    requests is profiled and the profile is logged if they turn out to be
+    slow.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        metrics: ServerMetrics,
+        slow_request_threshold: float,
+        profile_sample_rate: float = 0.0,
+    ) -> None:
+        """Initializes the middleware.
+
+        Args:
+            app: The ASGI app.
+            metrics: The registry in which to record the metrics.
+            slow_request_threshold: Duration in seconds after which requests
+                are considered slow.
+            profile_sample_rate: Fraction of the requests to profile.
+        """
+        super().__init__(app)
+        self.metrics = metrics
+        self.slow_request_threshold = slow_request_threshold
+        self.profile_sample_rate = profile_sample_rate
+        self._route_paths: Dict[int, str] = {}
+
+    def _get_route(self, request: Request) -> str:
+        """Gets the path template of the route that handled a request.
+
+        Args:
+            request: The request.
+
+        Returns:
+            The path template of the route.
+        """
+        endpoint = request.scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+
+        if id(endpoint) not in self._route_paths:
+            for route in request.app.routes:
+                route_endpoint = getattr(route, "endpoint", None) or getattr(
+                    route, "app", None
+                )
+                path = getattr(route, "path", None)
+                if route_endpoint is not None and path is not None:
+                    self._route_paths.setdefault(id(route_endpoint), path)
+
+        return self._route_paths.get(id(endpoint), UNMATCHED_ROUTE)
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        """Handles a request and records its metrics.
+
+        The request is recorded once the response body was sent, so that the
+        size of streamed responses is counted as well.
+
+        Args:
+            request: The request.
+            call_next: Function handling the request.
+
+        Returns:
+            The response.
+        """
+        stats = RequestStats(
+            profile_requested=random.random() < self.profile_sample_rate
+        )
+        token = _request_stats.set(stats)
+        start = time.perf_counter()
+        try:
+            response = await call_next(request)
+        except Exception:
+            self._record(request, stats, start=start, status_code=500)
+            raise
+        finally:
+            _request_stats.reset(token)
+
+        body_iterator = getattr(response, "body_iterator", None)
+        if body_iterator is None:
+            self._record(
+                request,
+                stats,
+                start=start,
+                status_code=response.status_code,
+                response_size=len(getattr(response, "body", b"")),
+            )
+            return response
+
+        async def _count_response_size() -> AsyncIterator[Any]:
+            """Counts the bytes of the response body while it is sent.
+
+            Yields:
+                The chunks of the response body.
+            """
+            response_size = 0
+            try:
+                async for chunk in body_iterator:
+                    if isinstance(chunk, str):
+                        response_size += len(chunk.encode(response.charset))
+                    else:
+                        response_size += len(chunk)
+                    yield chunk
+            finally:
+                self._record(
+                    request,
+                    stats,
+                    start=start,
+                    status_code=response.status_code,
+                    response_size=response_size,
+                )
+
+        response.body_iterator = _count_response_size()  # type: ignore[attr-defined]
+        return response
+
+    def _record(
+        self,
+        request: Request,
+        stats: RequestStats,
+        start: float,
+        status_code: int,
+        response_size: int = 0,
+    ) -> None:
+        """Records the metrics of a handled request.
+
+        Args:
+            request: The request.
+            stats: The statistics collected while handling the request.
+            start: The time at which handling the request started.
+            status_code: The status code of the response.
+            response_size: The size of the response body in bytes.
+        """
+        duration = time.perf_counter() - start
+        route = self._get_route(request)
+        slow = duration >= self.slow_request_threshold
+        self.metrics.observe(
+            method=request.method,
+            route=route,
+            status_code=status_code,
+            duration=duration,
+            query_count=stats.query_count,
+            request_size=int(request.headers.get("content-length", 0)),
+            response_size=response_size,
+            slow=slow,
+        )
+        if slow:
+            logger.warning(
+                "Slow request: %s %s took %.3fs and executed %d SQL "
+                "queries.%s",
+                request.method,
+                route,
+                duration,
+                stats.query_count,
+                f"\n{stats.profile}" if stats.profile else "",
+            )
@@ -13,14 +13,23 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for steps (and artifacts) of pipeline runs."""
 
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Request, Response, Security
 
-from zenml.constants import API, ARTIFACTS, VERSION_1, VISUALIZE
-from zenml.enums import PermissionType
+from zenml.constants import (
+    API,
+    ARTIFACTS,
+    DOWNLOAD,
+    LINEAGE,
+    VERSION_1,
+    VISUALIZE,
+)
+from zenml.enums import HydrationLevel, LineageDirection, PermissionType
 from zenml.models import (
     ArtifactFilterModel,
+    ArtifactLineageModel,
     ArtifactRequestModel,
     ArtifactResponseModel,
 )
@@ -28,12 +37,17 @@ from zenml.models.page_model import Page
 from zenml.models.visualization_models import (
     LoadedVisualizationModel,
 )
-from zenml.utils.artifact_utils import load_artifact_visualization
+from zenml.utils.artifact_utils import (
+    get_artifact_file,
+    load_artifact_visualization,
+)
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
+    artifact_file_response,
     handle_exceptions,
     make_dependable,
+    run_in_read_thread_pool,
     zen_store,
 )
 
@@ -49,11 +63,13 @@ router = APIRouter(
     response_model=Page[ArtifactResponseModel],
     responses={401: error_response, 404: error_response, 422: error_response},
 )
+@run_in_read_thread_pool
 @handle_exceptions
 def list_artifacts(
     artifact_filter_model: ArtifactFilterModel = Depends(
         make_dependable(ArtifactFilterModel)
     ),
+    hydration: HydrationLevel = HydrationLevel.FULL,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
 ) -> Page[ArtifactResponseModel]:
     """Get artifacts according to query filters.
@@ -61,12 +77,13 @@ def list_artifacts(
     Args:
         artifact_filter_model: Filter model used for pagination, sorting,
             filtering
+        hydration: How much of the artifacts to hydrate.
 
     Returns:
         The artifacts according to query filters.
     """
     return zen_store().list_artifacts(
-        artifact_filter_model=artifact_filter_model
+        artifact_filter_model=artifact_filter_model, hydration=hydration
     )
 
 
@@ -99,17 +116,19 @@ def create_artifact(
 @handle_exceptions
 def get_artifact(
     artifact_id: UUID,
+    hydration: HydrationLevel = HydrationLevel.FULL,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
 ) -> ArtifactResponseModel:
     """Get an artifact by ID.
 
     Args:
         artifact_id: The ID of the artifact to get.
+        hydration: How much of the artifact to hydrate.
 
     Returns:
         The artifact with the given ID.
     """
-    return zen_store().get_artifact(artifact_id)
+    return zen_store().get_artifact(artifact_id, hydration=hydration)
 
 
 @router.delete(
@@ -129,6 +148,35 @@ def delete_artifact(
     zen_store().delete_artifact(artifact_id)
 
 
+@router.get(
+    "/{artifact_id}" + LINEAGE,
+    response_model=ArtifactLineageModel,
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@run_in_read_thread_pool
+@handle_exceptions
+def get_artifact_lineage(
+    artifact_id: UUID,
+    direction: LineageDirection = LineageDirection.DOWNSTREAM,
+    max_depth: Optional[int] = None,
+    _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
+) -> ArtifactLineageModel:
+    """Get the lineage of an artifact across pipeline runs.
+
+    Args:
+        artifact_id: ID of the artifact.
+        direction: Whether to follow the steps that consumed the artifact
+            (downstream) or the steps that produced it (upstream).
+        max_depth: The maximum number of steps to follow.
+
+    Returns:
+        The lineage of the artifact.
+    """
+    return zen_store().get_artifact_lineage(
+        artifact_id=artifact_id, direction=direction, max_depth=max_depth
+    )
+
+
 @router.get(
     "/{artifact_id}" + VISUALIZE,
     response_model=LoadedVisualizationModel,
@@ -154,3 +202,53 @@ def get_artifact_visualization(
     return load_artifact_visualization(
         artifact=artifact, index=index, zen_store=store, encode_image=True
     )
+
+
+@router.get(
+    "/{artifact_id}" + DOWNLOAD,
+    responses={
+        400: error_response,
+        401: error_response,
+        404: error_response,
+        422: error_response,
+    },
+)
+@handle_exceptions
+def download_artifact_file(
+    artifact_id: UUID,
+    request: Request,
+    path: Optional[str] = None,
+    visualization_index: Optional[int] = None,
+    _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
+) -> Response:
+    """Stream a file of an artifact or its visualizations.
+
+    The file is streamed in chunks instead of being loaded into memory. The
+    response supports ETags (`If-None-Match`) and single byte ranges
+    (`Range` and `If-Range`) to resume interrupted downloads.
+
+    Args:
+        artifact_id: ID of the artifact of which to download a file.
+        request: The request.
+        path: Path of the file relative to the artifact URI. Can be omitted
+            if the artifact URI itself is a file.
+        visualization_index: If given, the file of the visualization with
+            this index is streamed instead of a file of the artifact data.
+
+    Returns:
+        The streaming response.
+    """
+    store = zen_store()
+    artifact = store.get_artifact(artifact_id)
+    artifact_store, uri = get_artifact_file(
+        artifact=artifact,
+        path=path,
+        visualization_index=visualization_index,
+        zen_store=store,
+    )
+    return artifact_file_response(
+        request=request,
+        artifact_store=artifact_store,
+        uri=uri,
+        etag_seed=f"{artifact.id}:{uri}",
+    )
@@ -25,6 +25,7 @@ from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
+    run_in_read_thread_pool,
     zen_store,
 )
 
@@ -40,6 +41,7 @@ router = APIRouter(
     response_model=Page[PipelineBuildResponseModel],
     responses={401: error_response, 404: error_response, 422: error_response},
 )
+@run_in_read_thread_pool
 @handle_exceptions
 def list_builds(
     build_filter_model: PipelineBuildFilterModel = Depends(
@@ -28,6 +28,7 @@ from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
+    run_in_read_thread_pool,
     zen_store,
 )
 
@@ -43,6 +44,7 @@ router = APIRouter(
     response_model=Page[PipelineDeploymentResponseModel],
     responses={401: error_response, 404: error_response, 422: error_response},
 )
+@run_in_read_thread_pool
 @handle_exceptions
 def list_deployments(
     deployment_filter_model: PipelineDeploymentFilterModel = Depends(
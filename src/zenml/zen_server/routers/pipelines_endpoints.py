@@ -18,7 +18,7 @@ from fastapi import APIRouter, Depends, Security
 
 from zenml.config.pipeline_spec import PipelineSpec
 from zenml.constants import API, PIPELINE_SPEC, PIPELINES, RUNS, VERSION_1
-from zenml.enums import PermissionType
+from zenml.enums import HydrationLevel, PermissionType
 from zenml.models import (
     PipelineFilterModel,
     PipelineResponseModel,
@@ -32,6 +32,7 @@ from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
+    run_in_read_thread_pool,
     zen_store,
 )
 
@@ -47,6 +48,7 @@ router = APIRouter(
     response_model=Page[PipelineResponseModel],
     responses={401: error_response, 404: error_response, 422: error_response},
 )
+@run_in_read_thread_pool
 @handle_exceptions
 def list_pipelines(
     pipeline_filter_model: PipelineFilterModel = Depends(
@@ -136,11 +138,13 @@ def delete_pipeline(
     response_model=Page[PipelineRunResponseModel],
     responses={401: error_response, 404: error_response, 422: error_response},
 )
+@run_in_read_thread_pool
 @handle_exceptions
 def list_pipeline_runs(
     pipeline_run_filter_model: PipelineRunFilterModel = Depends(
         make_dependable(PipelineRunFilterModel)
     ),
+    hydration: HydrationLevel = HydrationLevel.FULL,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
 ) -> Page[PipelineRunResponseModel]:
     """Get pipeline runs according to query filters.
@@ -148,11 +152,14 @@ def list_pipeline_runs(
     Args:
         pipeline_run_filter_model: Filter model used for pagination, sorting,
             filtering
+        hydration: How much of the pipeline runs to hydrate.
 
     Returns:
         The pipeline runs according to query filters.
     """
-    return zen_store().list_runs(pipeline_run_filter_model)
+    return zen_store().list_runs(
+        pipeline_run_filter_model, hydration=hydration
+    )
 
 
 @router.get(
@@ -16,16 +16,21 @@
 
 from fastapi import APIRouter, Depends, Security
 
-from zenml.constants import API, RUN_METADATA, VERSION_1
+from zenml.constants import API, LEADERBOARD, RUN_METADATA, VERSION_1
 from zenml.enums import PermissionType
 from zenml.models import RunMetadataResponseModel
 from zenml.models.page_model import Page
-from zenml.models.run_metadata_models import RunMetadataFilterModel
+from zenml.models.run_metadata_models import (
+    RunMetadataFilterModel,
+    RunMetadataLeaderboardFilterModel,
+    RunMetadataLeaderboardModel,
+)
 from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
+    run_in_read_thread_pool,
     zen_store,
 )
 
@@ -41,6 +46,7 @@ router = APIRouter(
     response_model=Page[RunMetadataResponseModel],
     responses={401: error_response, 404: error_response, 422: error_response},
 )
+@run_in_read_thread_pool
 @handle_exceptions
 def list_run_metadata(
     run_metadata_filter_model: RunMetadataFilterModel = Depends(
@@ -58,3 +64,29 @@ def list_run_metadata(
         The pipeline runs according to query filters.
     """
     return zen_store().list_run_metadata(run_metadata_filter_model)
+
+
+@router.get(
+    LEADERBOARD,
+    response_model=RunMetadataLeaderboardModel,
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@run_in_read_thread_pool
+@handle_exceptions
+def get_run_metadata_leaderboard(
+    leaderboard_filter_model: RunMetadataLeaderboardFilterModel = Depends(
+        make_dependable(RunMetadataLeaderboardFilterModel)
+    ),
+    _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
+) -> RunMetadataLeaderboardModel:
+    """Get the best pipeline runs according to a numeric metadata key.
+
+    Args:
+        leaderboard_filter_model: The metadata key to rank by and filters for
+            the pipeline runs to include.
+
+    Returns:
+        The best runs and aggregated statistics of the values of all
+        matching runs.
+    """
+    return zen_store().get_run_metadata_leaderboard(leaderboard_filter_model)
@@ -12,7 +12,8 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """Endpoint definitions for pipeline runs."""
-from typing import Any, Dict
+from datetime import datetime
+from typing import Any, Dict, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Security
@@ -26,7 +27,7 @@ from zenml.constants import (
     STEPS,
     VERSION_1,
 )
-from zenml.enums import ExecutionStatus, PermissionType
+from zenml.enums import ExecutionStatus, HydrationLevel, PermissionType
 from zenml.lineage_graph.lineage_graph import LineageGraph
 from zenml.models import (
     PipelineRunFilterModel,
@@ -41,6 +42,7 @@ from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
+    run_in_read_thread_pool,
     zen_store,
 )
 
@@ -56,22 +58,27 @@ router = APIRouter(
     response_model=Page[PipelineRunResponseModel],
     responses={401: error_response, 404: error_response, 422: error_response},
 )
+@run_in_read_thread_pool
 @handle_exceptions
 def list_runs(
     runs_filter_model: PipelineRunFilterModel = Depends(
         make_dependable(PipelineRunFilterModel)
     ),
+    hydration: HydrationLevel = HydrationLevel.FULL,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
 ) -> Page[PipelineRunResponseModel]:
     """Get pipeline runs according to query filters.
 
     Args:
         runs_filter_model: Filter model used for pagination, sorting, filtering
+        hydration: How much of the pipeline runs to hydrate.
 
     Returns:
         The pipeline runs according to query filters.
     """
-    return zen_store().list_runs(runs_filter_model=runs_filter_model)
+    return zen_store().list_runs(
+        runs_filter_model=runs_filter_model, hydration=hydration
+    )
 
 
 @router.get(
@@ -82,17 +89,19 @@ def list_runs(
 @handle_exceptions
 def get_run(
     run_id: UUID,
+    hydration: HydrationLevel = HydrationLevel.FULL,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
 ) -> PipelineRunResponseModel:
     """Get a specific pipeline run using its ID.
 
     Args:
         run_id: ID of the pipeline run to get.
+        hydration: How much of the pipeline run to hydrate.
 
     Returns:
         The pipeline run.
     """
-    return zen_store().get_run(run_name_or_id=run_id)
+    return zen_store().get_run(run_name_or_id=run_id, hydration=hydration)
 
 
 @router.put(
@@ -140,23 +149,27 @@ def delete_run(
     response_model=LineageGraph,
     responses={401: error_response, 404: error_response, 422: error_response},
 )
+@run_in_read_thread_pool
 @handle_exceptions
 def get_run_dag(
     run_id: UUID,
+    since: Optional[datetime] = None,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
 ) -> LineageGraph:
     """Get the DAG for a given pipeline run.
 
     Args:
         run_id: ID of the pipeline run to use to get the DAG.
+        since: Only include the steps that changed after this time. The
+            `timestamp` of a previously returned DAG can be used to only get
+            the changes since that DAG was generated.
 
     Returns:
         The DAG for a given pipeline run.
     """
-    run = zen_store().get_run(run_name_or_id=run_id)
-    graph = LineageGraph()
-    graph.generate_run_nodes_and_edges(run)
-    return graph
+    return zen_store().get_run_lineage_graph(
+        run_name_or_id=run_id, since=since
+    )
 
 
 @router.get(
@@ -169,6 +182,7 @@ def get_run_steps(
     step_run_filter_model: StepRunFilterModel = Depends(
         make_dependable(StepRunFilterModel)
     ),
+    hydration: HydrationLevel = HydrationLevel.FULL,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
 ) -> Page[StepRunResponseModel]:
     """Get all steps for a given pipeline run.
@@ -176,11 +190,14 @@ def get_run_steps(
     Args:
         step_run_filter_model: Filter model used for pagination, sorting,
             filtering
+        hydration: How much of the steps to hydrate.
 
     Returns:
         The steps for a given pipeline run.
     """
-    return zen_store().list_run_steps(step_run_filter_model)
+    return zen_store().list_run_steps(
+        step_run_filter_model, hydration=hydration
+    )
 
 
 @router.get(
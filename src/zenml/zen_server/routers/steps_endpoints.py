@@ -26,7 +26,7 @@ from zenml.constants import (
     STEPS,
     VERSION_1,
 )
-from zenml.enums import ExecutionStatus, PermissionType
+from zenml.enums import ExecutionStatus, HydrationLevel, PermissionType
 from zenml.models import (
     StepRunFilterModel,
     StepRunRequestModel,
@@ -43,6 +43,7 @@ from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
+    run_in_read_thread_pool,
     zen_store,
 )
 
@@ -58,11 +59,13 @@ router = APIRouter(
     response_model=Page[StepRunResponseModel],
     responses={401: error_response, 404: error_response, 422: error_response},
 )
+@run_in_read_thread_pool
 @handle_exceptions
 def list_run_steps(
     step_run_filter_model: StepRunFilterModel = Depends(
         make_dependable(StepRunFilterModel)
     ),
+    hydration: HydrationLevel = HydrationLevel.FULL,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
 ) -> Page[StepRunResponseModel]:
     """Get run steps according to query filters.
@@ -70,12 +73,13 @@ def list_run_steps(
     Args:
         step_run_filter_model: Filter model used for pagination, sorting,
                                    filtering
+        hydration: How much of the run steps to hydrate.
 
     Returns:
         The run steps according to query filters.
     """
     return zen_store().list_run_steps(
-        step_run_filter_model=step_run_filter_model
+        step_run_filter_model=step_run_filter_model, hydration=hydration
     )
 
 
@@ -108,17 +112,19 @@ def create_run_step(
 @handle_exceptions
 def get_step(
     step_id: UUID,
+    hydration: HydrationLevel = HydrationLevel.FULL,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
 ) -> StepRunResponseModel:
     """Get one specific step.
 
     Args:
         step_id: ID of the step to get.
+        hydration: How much of the step to hydrate.
 
     Returns:
         The step.
     """
-    return zen_store().get_run_step(step_id)
+    return zen_store().get_run_step(step_id, hydration=hydration)
 
 
 @router.put(
@@ -24,7 +24,11 @@ from zenml.models import (
     TeamRoleAssignmentResponseModel,
 )
 from zenml.models.page_model import Page
-from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.auth import (
+    AuthContext,
+    authorize,
+    invalidate_auth_cache,
+)
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
@@ -85,9 +89,11 @@ def create_team_role_assignment(
     Returns:
         The created role assignment.
     """
-    return zen_store().create_team_role_assignment(
+    created_role_assignment = zen_store().create_team_role_assignment(
         team_role_assignment=role_assignment
     )
+    invalidate_auth_cache()
+    return created_role_assignment
 
 
 @router.get(
@@ -130,3 +136,4 @@ def delete_team_role_assignment(
     zen_store().delete_team_role_assignment(
         team_role_assignment_id=role_assignment_id
     )
+    invalidate_auth_cache()
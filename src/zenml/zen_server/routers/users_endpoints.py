@@ -44,6 +44,7 @@ from zenml.zen_server.auth import (
     AuthContext,
     authenticate_credentials,
     authorize,
+    invalidate_auth_cache,
 )
 from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
@@ -181,10 +182,12 @@ def update_user(
     """
     user = zen_store().get_user(user_name_or_id)
 
-    return zen_store().update_user(
+    updated_user = zen_store().update_user(
         user_id=user.id,
         user_update=user_update,
     )
+    invalidate_auth_cache()
+    return updated_user
 
 
 @activation_router.put(
@@ -222,7 +225,11 @@ def activate_user(
         )
     user_update.active = True
     user_update.activation_token = None
-    return zen_store().update_user(user_id=user.id, user_update=user_update)
+    updated_user = zen_store().update_user(
+        user_id=user.id, user_update=user_update
+    )
+    invalidate_auth_cache()
+    return updated_user
 
 
 @router.put(
@@ -251,6 +258,7 @@ def deactivate_user(
     )
     token = user_update.generate_activation_token()
     user = zen_store().update_user(user_id=user.id, user_update=user_update)
+    invalidate_auth_cache()
     # add back the original unhashed activation token
     user.activation_token = token
     return user
@@ -286,6 +294,7 @@ def delete_user(
             "administrator."
         )
     zen_store().delete_user(user_name_or_id=user_name_or_id)
+    invalidate_auth_cache()
 
 
 @router.put(
@@ -330,9 +339,11 @@ def email_opt_in_response(
             source="zenml server",
         )
 
-        return zen_store().update_user(
+        updated_user = zen_store().update_user(
             user_id=user.id, user_update=user_update
         )
+        invalidate_auth_cache()
+        return updated_user
     else:
         raise AuthorizationException(
             "Users can not opt in on behalf of another " "user."
@@ -407,6 +418,8 @@ def update_myself(
     Returns:
         The updated user.
     """
-    return zen_store().update_user(
+    updated_user = zen_store().update_user(
         user_id=auth_context.user.id, user_update=user
     )
+    invalidate_auth_cache()
+    return updated_user
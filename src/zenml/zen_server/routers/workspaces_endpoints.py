@@ -19,6 +19,7 @@ from fastapi import APIRouter, Depends, Security
 
 from zenml.constants import (
     API,
+    BATCH,
     CODE_REPOSITORIES,
     GET_OR_CREATE,
     PIPELINE_BUILDS,
@@ -38,7 +39,7 @@ from zenml.constants import (
     VERSION_1,
     WORKSPACES,
 )
-from zenml.enums import PermissionType
+from zenml.enums import HydrationLevel, PermissionType
 from zenml.exceptions import IllegalOperationError
 from zenml.models import (
     CodeRepositoryFilterModel,
@@ -87,6 +88,7 @@ from zenml.zen_server.exceptions import error_response
 from zenml.zen_server.utils import (
     handle_exceptions,
     make_dependable,
+    run_in_read_thread_pool,
     zen_store,
 )
 
@@ -440,6 +442,7 @@ def create_stack_component(
     response_model=Page[PipelineResponseModel],
     responses={401: error_response, 404: error_response, 422: error_response},
 )
+@run_in_read_thread_pool
 @handle_exceptions
 def list_workspace_pipelines(
     workspace_name_or_id: Union[str, UUID],
@@ -516,6 +519,7 @@ def create_pipeline(
     response_model=Page[PipelineBuildResponseModel],
     responses={401: error_response, 404: error_response, 422: error_response},
 )
+@run_in_read_thread_pool
 @handle_exceptions
 def list_workspace_builds(
     workspace_name_or_id: Union[str, UUID],
@@ -590,6 +594,7 @@ def create_build(
     response_model=Page[PipelineDeploymentResponseModel],
     responses={401: error_response, 404: error_response, 422: error_response},
 )
+@run_in_read_thread_pool
 @handle_exceptions
 def list_workspace_deployments(
     workspace_name_or_id: Union[str, UUID],
@@ -662,17 +667,65 @@ def create_deployment(
     return zen_store().create_deployment(deployment=deployment)
 
 
+@router.post(
+    WORKSPACES + "/{workspace_name_or_id}" + PIPELINE_DEPLOYMENTS + BATCH,
+    response_model=List[PipelineDeploymentResponseModel],
+    responses={401: error_response, 409: error_response, 422: error_response},
+)
+@handle_exceptions
+def create_deployments(
+    workspace_name_or_id: Union[str, UUID],
+    deployments: List[PipelineDeploymentRequestModel],
+    auth_context: AuthContext = Security(
+        authorize, scopes=[PermissionType.WRITE]
+    ),
+) -> List[PipelineDeploymentResponseModel]:
+    """Creates multiple deployments at once.
+
+    Args:
+        workspace_name_or_id: Name or ID of the workspace.
+        deployments: Deployments to create.
+        auth_context: Authentication context.
+
+    Returns:
+        The created deployments.
+
+    Raises:
+        IllegalOperationError: If the workspace or user specified in any of
+            the deployments does not match the current workspace or
+            authenticated user.
+    """
+    workspace = zen_store().get_workspace(workspace_name_or_id)
+
+    for deployment in deployments:
+        if deployment.workspace != workspace.id:
+            raise IllegalOperationError(
+                "Creating deployments outside of the workspace scope "
+                f"of this endpoint `{workspace_name_or_id}` is "
+                f"not supported."
+            )
+        if deployment.user != auth_context.user.id:
+            raise IllegalOperationError(
+                "Creating deployments for a user other than yourself "
+                "is not supported."
+            )
+
+    return zen_store().create_deployments(deployments=deployments)
+
+
 @router.get(
     WORKSPACES + "/{workspace_name_or_id}" + RUNS,
     response_model=Page[PipelineRunResponseModel],
     responses={401: error_response, 404: error_response, 422: error_response},
 )
+@run_in_read_thread_pool
 @handle_exceptions
 def list_runs(
     workspace_name_or_id: Union[str, UUID],
     runs_filter_model: PipelineRunFilterModel = Depends(
         make_dependable(PipelineRunFilterModel)
     ),
+    hydration: HydrationLevel = HydrationLevel.FULL,
     _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
 ) -> Page[PipelineRunResponseModel]:
     """Get pipeline runs according to query filters.
@@ -681,14 +734,16 @@ def list_runs(
         workspace_name_or_id: Name or ID of the workspace.
         runs_filter_model: Filter model used for pagination, sorting,
             filtering
-
+        hydration: How much of the pipeline runs to hydrate.
 
     Returns:
         The pipeline runs according to query filters.
     """
     workspace = zen_store().get_workspace(workspace_name_or_id)
     runs_filter_model.set_scope_workspace(workspace.id)
-    return zen_store().list_runs(runs_filter_model=runs_filter_model)
+    return zen_store().list_runs(
+        runs_filter_model=runs_filter_model, hydration=hydration
+    )
 
 
 @router.post(
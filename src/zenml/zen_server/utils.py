@@ -13,10 +13,21 @@
 #  permissions and limitations under the License.
 """Util functions for the ZenML Server."""
 
+import hashlib
 import inspect
+import mimetypes
 import os
-from functools import wraps
-from typing import Any, Callable, Optional, Tuple, Type, TypeVar, cast
+from functools import partial, wraps
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 from urllib.parse import urlparse
 
 from pydantic import BaseModel, ValidationError
@@ -25,16 +36,25 @@ from zenml.config.global_config import GlobalConfiguration
 from zenml.constants import (
     ENV_ZENML_SERVER,
     ENV_ZENML_SERVER_ROOT_URL_PATH,
+    READ_THREAD_POOL_SIZE,
 )
 from zenml.enums import ServerProviderType
 from zenml.logger import get_logger
+from zenml.utils.artifact_utils import iterate_artifact_file
 from zenml.zen_server.deploy.deployment import ServerDeployment
 from zenml.zen_server.deploy.local.local_zen_server import (
     LocalServerDeploymentConfig,
 )
 from zenml.zen_server.exceptions import http_exception_from_error
+from zenml.zen_server.metrics import call_with_profiling
 from zenml.zen_stores.sql_zen_store import SqlZenStore
 
+if TYPE_CHECKING:
+    from anyio import CapacityLimiter
+    from fastapi import Request, Response
+
+    from zenml.artifact_stores import BaseArtifactStore
+
 logger = get_logger(__name__)
 
 
@@ -196,7 +216,7 @@ def handle_exceptions(func: F) -> F:
                     break
 
         try:
-            return func(*args, **kwargs)
+            return call_with_profiling(func, *args, **kwargs)
         except Exception as error:
             logger.exception("API error")
             http_exception = http_exception_from_error(error)
@@ -205,6 +225,61 @@ def handle_exceptions(func: F) -> F:
     return cast(F, decorated)
 
 
+_read_thread_pool_limiter: Optional["CapacityLimiter"] = None
+
+
+def _get_read_thread_pool_limiter() -> "CapacityLimiter":
+    """Get the capacity limiter of the thread pool for heavy read requests.
+
+    The limiter can only be created inside the event loop, which is why it is
+    initialized lazily on first use.
+
+    Returns:
+        The capacity limiter.
+    """
+    from anyio import CapacityLimiter
+
+    global _read_thread_pool_limiter
+    if _read_thread_pool_limiter is None:
+        _read_thread_pool_limiter = CapacityLimiter(READ_THREAD_POOL_SIZE)
+    return _read_thread_pool_limiter
+
+
+def run_in_read_thread_pool(func: F) -> F:
+    """Decorator to run a synchronous endpoint in the read thread pool.
+
+    FastAPI runs all synchronous endpoints and dependencies in a single shared
+    thread pool. Endpoints decorated with this function are instead executed
+    in a separate, bounded thread pool, which means slow read queries (e.g.
+    listing large numbers of runs) can't exhaust the shared thread pool and
+    stall all other requests.
+
+    Usage:
+        @router.get(...)
+        @run_in_read_thread_pool
+        @handle_exceptions
+        def list_entities(...):
+            ...
+
+    Args:
+        func: Synchronous endpoint function to decorate.
+
+    Returns:
+        Asynchronous endpoint function.
+    """
+
+    @wraps(func)
+    async def decorated(*args: Any, **kwargs: Any) -> Any:
+        from anyio import to_thread
+
+        return await to_thread.run_sync(
+            partial(func, *args, **kwargs),
+            limiter=_get_read_thread_pool_limiter(),
+        )
+
+    return cast(F, decorated)
+
+
 # Code from https://github.com/tiangolo/fastapi/issues/1474#issuecomment-1160633178
 # to send 422 response when receiving invalid query parameters
 def make_dependable(cls: Type[BaseModel]) -> Callable[..., Any]:
@@ -241,3 +316,146 @@ def make_dependable(cls: Type[BaseModel]) -> Callable[..., Any]:
     init_cls_and_handle_errors.__signature__ = inspect.signature(cls)  # type: ignore[attr-defined]
 
     return init_cls_and_handle_errors
+
+
+def parse_range_header(
+    range_header: str, size: int
+) -> Optional[Tuple[int, int]]:
+    """Parses the byte range of an HTTP `Range` header.
+
+    Only single byte ranges are supported. Headers with other units, multiple
+    ranges or an invalid syntax are ignored, which means the full content
+    should be sent.
+
+    Args:
+        range_header: The value of the `Range` header.
+        size: The size of the requested content in bytes.
+
+    Returns:
+        The first and last byte (inclusive) of the requested range or `None`
+        if the header should be ignored.
+
+    Raises:
+        ValueError: If the requested range is not satisfiable.
+    """
+    unit, _, byte_range = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in byte_range:
+        return None
+
+    first, separator, last = byte_range.strip().partition("-")
+    if not separator or not (first or last):
+        return None
+    if (first and not first.isdigit()) or (last and not last.isdigit()):
+        return None
+
+    if not first:
+        # Suffix range containing the last bytes of the content
+        suffix_length = int(last)
+        if suffix_length == 0 or size == 0:
+            raise ValueError("Range not satisfiable.")
+        return max(0, size - suffix_length), size - 1
+
+    start = int(first)
+    end = int(last) if last else size - 1
+    if last and end < start:
+        return None
+    if start >= size:
+        raise ValueError("Range not satisfiable.")
+    return start, min(end, size - 1)
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    """Checks whether an `If-None-Match` header matches an ETag.
+
+    Args:
+        header: The value of the `If-None-Match` header.
+        etag: The ETag of the content.
+
+    Returns:
+        Whether the header matches the ETag.
+    """
+    if not header:
+        return False
+
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate in ("*", etag):
+            return True
+    return False
+
+
+def artifact_file_response(
+    request: "Request",
+    artifact_store: "BaseArtifactStore",
+    uri: str,
+    etag_seed: str,
+) -> "Response":
+    """Creates a response that streams a file from an artifact store.
+
+    The response supports conditional requests using ETags as well as single
+    byte range requests, so clients can skip downloading unchanged files and
+    resume interrupted downloads.
+
+    Args:
+        request: The request for the file.
+        artifact_store: The artifact store that contains the file.
+        uri: The URI of the file.
+        etag_seed: A string that uniquely identifies the file content. As
+            artifact files are immutable, the artifact ID and file URI are
+            enough.
+
+    Returns:
+        The streaming response.
+    """
+    from fastapi import Response
+    from fastapi.responses import StreamingResponse
+
+    size = artifact_store.size(uri)
+    etag_hash = hashlib.sha256(f"{etag_seed}:{size}".encode()).hexdigest()
+    etag = f'"{etag_hash[:32]}"'
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes" if size is not None else "none",
+        "Content-Disposition": (
+            f'attachment; filename="{os.path.basename(uri)}"'
+        ),
+    }
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and size is not None and if_range in (None, etag):
+        try:
+            byte_range = parse_range_header(range_header, size=size)
+        except ValueError:
+            return Response(
+                status_code=416,
+                headers={**headers, "Content-Range": f"bytes */{size}"},
+            )
+
+    media_type = mimetypes.guess_type(uri)[0] or "application/octet-stream"
+    if byte_range is None:
+        if size is not None:
+            headers["Content-Length"] = str(size)
+        return StreamingResponse(
+            iterate_artifact_file(artifact_store=artifact_store, uri=uri),
+            headers=headers,
+            media_type=media_type,
+        )
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        iterate_artifact_file(
+            artifact_store=artifact_store, uri=uri, start=start, end=end
+        ),
+        status_code=206,
+        headers=headers,
+        media_type=media_type,
+    )
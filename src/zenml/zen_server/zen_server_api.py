@@ -16,20 +16,33 @@ import os
 from asyncio.log import logger
 from typing import Any, List
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Security
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from genericpath import isfile
 from starlette.middleware.cors import CORSMiddleware
-from starlette.responses import FileResponse
+from starlette.responses import FileResponse, PlainTextResponse
 
 import zenml
 from zenml.analytics import source_context
-from zenml.constants import API, HEALTH
-from zenml.enums import SourceContextTypes
+from zenml.constants import (
+    API,
+    HEALTH,
+    METRICS,
+    PROFILE_SAMPLE_RATE,
+    SERVER_METRICS_ENABLED,
+    SLOW_REQUEST_THRESHOLD_MS,
+)
+from zenml.enums import PermissionType, SourceContextTypes
+from zenml.zen_server.auth import AuthContext, authorize
 from zenml.zen_server.exceptions import error_detail
+from zenml.zen_server.metrics import (
+    RequestMetricsMiddleware,
+    ServerMetrics,
+    instrument_engine,
+)
 from zenml.zen_server.routers import (
     artifacts_endpoints,
     auth_endpoints,
@@ -54,7 +67,11 @@ from zenml.zen_server.routers import (
     users_endpoints,
     workspaces_endpoints,
 )
-from zenml.zen_server.utils import ROOT_URL_PATH, initialize_zen_store
+from zenml.zen_server.utils import (
+    ROOT_URL_PATH,
+    initialize_zen_store,
+    zen_store,
+)
 
 DASHBOARD_DIRECTORY = "dashboard"
 
@@ -138,12 +155,25 @@ async def infer_source_context(request: Request, call_next: Any) -> Any:
     return await call_next(request)
 
 
+server_metrics = ServerMetrics()
+if SERVER_METRICS_ENABLED:
+    # Added last so it wraps all other middlewares
+    app.add_middleware(
+        RequestMetricsMiddleware,
+        metrics=server_metrics,
+        slow_request_threshold=SLOW_REQUEST_THRESHOLD_MS / 1000,
+        profile_sample_rate=PROFILE_SAMPLE_RATE,
+    )
+
+
 @app.on_event("startup")
 def initialize() -> None:
     """Initialize the ZenML server."""
     # IMPORTANT: this needs to be done before the fastapi app starts, to avoid
     # race conditions
     initialize_zen_store()
+    if SERVER_METRICS_ENABLED:
+        instrument_engine(zen_store().engine)
 
 
 app.mount(
@@ -167,6 +197,27 @@ def health() -> str:
     return "OK"
 
 
+if SERVER_METRICS_ENABLED:
+
+    @app.get(METRICS, include_in_schema=False)
+    def metrics(
+        _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
+    ) -> PlainTextResponse:
+        """Get the request metrics of the server worker process.
+
+        Every worker process of the server records the metrics of the
+        requests it handled itself, so the samples are labeled with the
+        process ID of the worker that served this request.
+
+        Returns:
+            The metrics in the Prometheus text exposition format.
+        """
+        return PlainTextResponse(
+            server_metrics.render(),
+            media_type="text/plain; version=0.0.4",
+        )
+
+
 templates = Jinja2Templates(directory=relative_path(DASHBOARD_DIRECTORY))
 
 
@@ -0,0 +1,160 @@
+"""Add secondary indexes [3b1d1a5e9f42].
+
+Revision ID: 3b1d1a5e9f42
+Revises: 0.42.1
+Create Date: 2023-07-26 10:12:43.581932
+
+"""
+from typing import List, NamedTuple, Optional
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3b1d1a5e9f42"
+down_revision = "0.42.1"
+branch_labels = None
+depends_on = None
+
+
+class _ForeignKey(NamedTuple):
+    """Foreign key whose column is the leading column of an index."""
+
+    name: str
+    column: str
+    referent_table: str
+    ondelete: str
+
+
+class _Index(NamedTuple):
+    """Secondary index added in this revision."""
+
+    name: str
+    table: str
+    columns: List[str]
+    foreign_key: Optional[_ForeignKey] = None
+
+
+INDEXES = [
+    _Index(
+        name="ix_step_run_cache_key_status",
+        table="step_run",
+        columns=["cache_key", "status", "created"],
+    ),
+    _Index(
+        name="ix_step_run_pipeline_run_id_status",
+        table="step_run",
+        columns=["pipeline_run_id", "status"],
+        foreign_key=_ForeignKey(
+            name="fk_step_run_pipeline_run_id_pipeline_run",
+            column="pipeline_run_id",
+            referent_table="pipeline_run",
+            ondelete="CASCADE",
+        ),
+    ),
+    _Index(
+        name="ix_step_run_parents_child_id",
+        table="step_run_parents",
+        columns=["child_id"],
+        foreign_key=_ForeignKey(
+            name="fk_step_run_parents_child_id_step_run",
+            column="child_id",
+            referent_table="step_run",
+            ondelete="CASCADE",
+        ),
+    ),
+    _Index(
+        name="ix_step_run_input_artifact_artifact_id",
+        table="step_run_input_artifact",
+        columns=["artifact_id"],
+        foreign_key=_ForeignKey(
+            name="fk_step_run_input_artifact_artifact_id_artifact",
+            column="artifact_id",
+            referent_table="artifact",
+            ondelete="CASCADE",
+        ),
+    ),
+    _Index(
+        name="ix_step_run_output_artifact_artifact_id",
+        table="step_run_output_artifact",
+        columns=["artifact_id"],
+        foreign_key=_ForeignKey(
+            name="fk_step_run_output_artifact_artifact_id_artifact",
+            column="artifact_id",
+            referent_table="artifact",
+            ondelete="CASCADE",
+        ),
+    ),
+    _Index(
+        name="ix_run_metadata_pipeline_run_id_key",
+        table="run_metadata",
+        columns=["pipeline_run_id", "key"],
+        foreign_key=_ForeignKey(
+            name="fk_run_metadata_pipeline_run_id_pipeline_run",
+            column="pipeline_run_id",
+            referent_table="pipeline_run",
+            ondelete="CASCADE",
+        ),
+    ),
+    _Index(
+        name="ix_run_metadata_step_run_id_key",
+        table="run_metadata",
+        columns=["step_run_id", "key"],
+        foreign_key=_ForeignKey(
+            name="fk_run_metadata_step_run_id_step_run",
+            column="step_run_id",
+            referent_table="step_run",
+            ondelete="CASCADE",
+        ),
+    ),
+    _Index(
+        name="ix_run_metadata_artifact_id_key",
+        table="run_metadata",
+        columns=["artifact_id", "key"],
+        foreign_key=_ForeignKey(
+            name="fk_run_metadata_artifact_id_artifact",
+            column="artifact_id",
+            referent_table="artifact",
+            ondelete="CASCADE",
+        ),
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    for index in INDEXES:
+        op.create_index(
+            index_name=index.name,
+            table_name=index.table,
+            columns=index.columns,
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    is_mysql = op.get_bind().engine.name == "mysql"
+
+    for index in reversed(INDEXES):
+        if is_mysql and index.foreign_key:
+            # MySQL drops the index it implicitly created for a foreign key
+            # once another index can be used to enforce the constraint. We
+            # therefore need to recreate the foreign key so MySQL adds its
+            # implicit index again before we can remove ours.
+            fk = index.foreign_key
+            op.drop_constraint(
+                constraint_name=fk.name,
+                table_name=index.table,
+                type_="foreignkey",
+            )
+            op.drop_index(index_name=index.name, table_name=index.table)
+            op.create_foreign_key(
+                constraint_name=fk.name,
+                source_table=index.table,
+                referent_table=fk.referent_table,
+                local_cols=[fk.column],
+                remote_cols=["id"],
+                ondelete=fk.ondelete,
+            )
+        else:
+            op.drop_index(index_name=index.name, table_name=index.table)
@@ -0,0 +1,85 @@
+"""Deduplicate step configurations [5d2b8a0e7c14].
+
+Revision ID: 5d2b8a0e7c14
+Revises: 3b1d1a5e9f42
+Create Date: 2023-07-27 14:48:05.310694
+
+"""
+import json
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.mysql import MEDIUMTEXT
+
+# revision identifiers, used by Alembic.
+revision = "5d2b8a0e7c14"
+down_revision = "3b1d1a5e9f42"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("step_run", schema=None) as batch_op:
+        batch_op.alter_column(
+            "step_configuration",
+            existing_type=sa.String(length=16777215).with_variant(
+                MEDIUMTEXT, "mysql"
+            ),
+            nullable=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    # Copy the step configurations from the deployments to all step runs that
+    # don't store their own configuration
+    connection = op.get_bind()
+    step_runs = connection.execute(
+        sa.text(
+            "SELECT step_run.id, step_run.name, pipeline_deployment.id, "
+            "pipeline_deployment.step_configurations "
+            "FROM step_run "
+            "JOIN pipeline_run "
+            "ON step_run.pipeline_run_id = pipeline_run.id "
+            "JOIN pipeline_deployment "
+            "ON pipeline_run.deployment_id = pipeline_deployment.id "
+            "WHERE step_run.step_configuration IS NULL"
+        )
+    ).fetchall()
+
+    decoded_step_configurations = {}
+    for (
+        step_run_id,
+        step_name,
+        deployment_id,
+        step_configurations,
+    ) in step_runs:
+        if deployment_id not in decoded_step_configurations:
+            decoded_step_configurations[deployment_id] = json.loads(
+                step_configurations
+            )
+        step_configuration = decoded_step_configurations[deployment_id][
+            step_name
+        ]
+        connection.execute(
+            sa.text(
+                "UPDATE step_run SET step_configuration = :step_configuration "
+                "WHERE id = :id"
+            ),
+            {
+                "step_configuration": json.dumps(
+                    step_configuration, sort_keys=True
+                ),
+                "id": step_run_id,
+            },
+        )
+
+    with op.batch_alter_table("step_run", schema=None) as batch_op:
+        batch_op.alter_column(
+            "step_configuration",
+            existing_type=sa.String(length=16777215).with_variant(
+                MEDIUMTEXT, "mysql"
+            ),
+            nullable=False,
+        )
@@ -0,0 +1,138 @@
+"""Add typed run metadata values [c1a4f0e92b6d].
+
+Revision ID: c1a4f0e92b6d
+Revises: 5d2b8a0e7c14
+Create Date: 2023-07-28 09:31:17.904216
+
+"""
+import json
+import math
+from typing import Any, Optional, Tuple
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c1a4f0e92b6d"
+down_revision = "5d2b8a0e7c14"
+branch_labels = None
+depends_on = None
+
+NUMERIC_METADATA_TYPES = ("int", "float", "StorageSize")
+STRING_METADATA_TYPES = ("str", "Uri", "Path", "DType")
+STRING_VALUE_MAX_LENGTH = 255
+BATCH_SIZE = 1000
+
+
+def _get_typed_values(
+    value: Any, type_: str
+) -> Tuple[Optional[float], Optional[str]]:
+    """Gets the typed values of a metadata value.
+
+    Args:
+        value: The decoded metadata value.
+        type_: The metadata type.
+
+    Returns:
+        The numeric and string value.
+    """
+    if type_ in NUMERIC_METADATA_TYPES:
+        try:
+            numeric_value = float(value)
+        except (TypeError, ValueError, OverflowError):
+            return None, None
+        if math.isfinite(numeric_value):
+            return numeric_value, None
+    elif type_ in STRING_METADATA_TYPES:
+        if isinstance(value, str) and len(value) <= STRING_VALUE_MAX_LENGTH:
+            return None, value
+
+    return None, None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("run_metadata", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("numeric_value", sa.Float(precision=53), nullable=True)
+        )
+        batch_op.add_column(
+            sa.Column(
+                "string_value",
+                sqlmodel.sql.sqltypes.AutoString(),
+                nullable=True,
+            )
+        )
+
+    # Backfill the typed values of all existing numeric and string metadata.
+    # Rows are read in batches using keyset pagination on the ID so the
+    # metadata table never needs to fit into memory at once.
+    connection = op.get_bind()
+    types = NUMERIC_METADATA_TYPES + STRING_METADATA_TYPES
+    query = sa.text(
+        "SELECT id, value, type FROM run_metadata "
+        "WHERE type IN :types AND id > :last_id "
+        "ORDER BY id LIMIT :batch_size"
+    ).bindparams(sa.bindparam("types", expanding=True))
+    update = sa.text(
+        "UPDATE run_metadata SET numeric_value = :numeric_value, "
+        "string_value = :string_value WHERE id = :id"
+    )
+
+    last_id = ""
+    while True:
+        rows = connection.execute(
+            query,
+            {
+                "types": list(types),
+                "last_id": last_id,
+                "batch_size": BATCH_SIZE,
+            },
+        ).fetchall()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        updates = []
+        for metadata_id, value, type_ in rows:
+            try:
+                decoded_value = json.loads(value)
+            except ValueError:
+                continue
+            numeric_value, string_value = _get_typed_values(
+                decoded_value, type_
+            )
+            if numeric_value is None and string_value is None:
+                continue
+            updates.append(
+                {
+                    "id": metadata_id,
+                    "numeric_value": numeric_value,
+                    "string_value": string_value,
+                }
+            )
+
+        if updates:
+            connection.execute(update, updates)
+
+    with op.batch_alter_table("run_metadata", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_run_metadata_key_numeric_value",
+            ["key", "numeric_value"],
+            unique=False,
+        )
+        batch_op.create_index(
+            "ix_run_metadata_key_string_value",
+            ["key", "string_value"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("run_metadata", schema=None) as batch_op:
+        batch_op.drop_index("ix_run_metadata_key_string_value")
+        batch_op.drop_index("ix_run_metadata_key_numeric_value")
+        batch_op.drop_column("string_value")
+        batch_op.drop_column("numeric_value")
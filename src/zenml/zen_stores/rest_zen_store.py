@@ -12,8 +12,10 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """REST Zen Store implementation."""
+import json
 import os
 import re
+from datetime import datetime
 from pathlib import Path, PurePath
 from typing import (
     Any,
@@ -40,14 +42,20 @@ from zenml.config.secrets_store_config import SecretsStoreConfiguration
 from zenml.config.store_config import StoreConfiguration
 from zenml.constants import (
     API,
+    ARTIFACT_FILE_CHUNK_SIZE,
     ARTIFACTS,
+    BATCH,
     CODE_REPOSITORIES,
     CURRENT_USER,
     DISABLE_CLIENT_SERVER_MISMATCH_WARNING,
+    DOWNLOAD,
     ENV_ZENML_DISABLE_CLIENT_SERVER_MISMATCH_WARNING,
     FLAVORS,
     GET_OR_CREATE,
+    GRAPH,
     INFO,
+    LEADERBOARD,
+    LINEAGE,
     LOGIN,
     PIPELINE_BUILDS,
     PIPELINE_DEPLOYMENTS,
@@ -71,14 +79,21 @@ from zenml.constants import (
     VERSION_1,
     WORKSPACES,
 )
-from zenml.enums import SecretsStoreType, StoreType
+from zenml.enums import (
+    HydrationLevel,
+    LineageDirection,
+    SecretsStoreType,
+    StoreType,
+)
 from zenml.exceptions import (
     AuthorizationException,
 )
 from zenml.io import fileio
+from zenml.lineage_graph.lineage_graph import LineageGraph
 from zenml.logger import get_logger
 from zenml.models import (
     ArtifactFilterModel,
+    ArtifactLineageModel,
     ArtifactRequestModel,
     ArtifactResponseModel,
     BaseFilterModel,
@@ -154,7 +169,11 @@ from zenml.models.base_models import (
     WorkspaceScopedRequestModel,
 )
 from zenml.models.page_model import Page
-from zenml.models.run_metadata_models import RunMetadataFilterModel
+from zenml.models.run_metadata_models import (
+    RunMetadataFilterModel,
+    RunMetadataLeaderboardFilterModel,
+    RunMetadataLeaderboardModel,
+)
 from zenml.models.schedule_model import ScheduleFilterModel
 from zenml.models.server_models import ServerModel
 from zenml.models.team_models import TeamFilterModel, TeamUpdateModel
@@ -1370,6 +1389,57 @@ class RestZenStore(BaseZenStore):
             response_model=PipelineDeploymentResponseModel,
         )
 
+    def create_deployments(
+        self,
+        deployments: List[PipelineDeploymentRequestModel],
+    ) -> List[PipelineDeploymentResponseModel]:
+        """Creates multiple deployments at once.
+
+        Deployments are created with one request per workspace.
+
+        Args:
+            deployments: The deployments to create.
+
+        Returns:
+            The newly created deployments, in the same order as the requests.
+
+        Raises:
+            ValueError: If the server response is not a list of deployments.
+        """
+        requests_by_workspace: Dict[UUID, List[int]] = {}
+        for index, deployment in enumerate(deployments):
+            requests_by_workspace.setdefault(deployment.workspace, []).append(
+                index
+            )
+
+        created: Dict[int, PipelineDeploymentResponseModel] = {}
+        for workspace_id, indices in requests_by_workspace.items():
+            route = (
+                f"{WORKSPACES}/{str(workspace_id)}{PIPELINE_DEPLOYMENTS}"
+                f"{BATCH}"
+            )
+            logger.debug(f"Sending POST request to {route}...")
+            response_body = self._request(
+                "POST",
+                self.url + API + VERSION_1 + route,
+                data=json.dumps(
+                    [json.loads(deployments[i].json()) for i in indices]
+                ),
+            )
+            if not isinstance(response_body, list) or len(
+                response_body
+            ) != len(indices):
+                raise ValueError(
+                    f"Expected a list of {len(indices)} deployments from the "
+                    f"{route} endpoint but got {response_body} instead."
+                )
+            for index, item in zip(indices, response_body):
+                created[index] = PipelineDeploymentResponseModel.parse_obj(
+                    item
+                )
+
+        return [created[index] for index in range(len(deployments))]
+
     def get_deployment(
         self, deployment_id: UUID
     ) -> PipelineDeploymentResponseModel:
@@ -1524,12 +1594,15 @@ class RestZenStore(BaseZenStore):
         )
 
     def get_run(
-        self, run_name_or_id: Union[UUID, str]
+        self,
+        run_name_or_id: Union[UUID, str],
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> PipelineRunResponseModel:
         """Gets a pipeline run.
 
         Args:
             run_name_or_id: The name or ID of the pipeline run to get.
+            hydration: How much of the pipeline run to hydrate.
 
         Returns:
             The pipeline run.
@@ -1538,7 +1611,30 @@ class RestZenStore(BaseZenStore):
             resource_id=run_name_or_id,
             route=RUNS,
             response_model=PipelineRunResponseModel,
+            params={"hydration": hydration.value},
+        )
+
+    def get_run_lineage_graph(
+        self,
+        run_name_or_id: Union[str, UUID],
+        since: Optional[datetime] = None,
+    ) -> LineageGraph:
+        """Gets the lineage graph of a pipeline run.
+
+        Args:
+            run_name_or_id: The name or ID of the pipeline run.
+            since: Only include the steps that were updated after this time
+                or have metadata or output artifacts that were created after
+                this time. The run metadata is always included.
+
+        Returns:
+            The lineage graph of the pipeline run.
+        """
+        body = self.get(
+            f"{RUNS}/{str(run_name_or_id)}{GRAPH}",
+            params={"since": since.isoformat()} if since else None,
         )
+        return LineageGraph.parse_obj(body)
 
     def get_or_create_run(
         self, pipeline_run: PipelineRunRequestModel
@@ -1562,13 +1658,16 @@ class RestZenStore(BaseZenStore):
         )
 
     def list_runs(
-        self, runs_filter_model: PipelineRunFilterModel
+        self,
+        runs_filter_model: PipelineRunFilterModel,
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> Page[PipelineRunResponseModel]:
         """List all pipeline runs matching the given filter criteria.
 
         Args:
             runs_filter_model: All filter parameters including pagination
                 params.
+            hydration: How much of the pipeline runs to hydrate.
 
         Returns:
             A list of all pipeline runs matching the filter criteria.
@@ -1577,6 +1676,7 @@ class RestZenStore(BaseZenStore):
             route=RUNS,
             response_model=PipelineRunResponseModel,
             filter_model=runs_filter_model,
+            params={"hydration": hydration.value},
         )
 
     def update_run(
@@ -1631,11 +1731,16 @@ class RestZenStore(BaseZenStore):
             route=STEPS,
         )
 
-    def get_run_step(self, step_run_id: UUID) -> StepRunResponseModel:
+    def get_run_step(
+        self,
+        step_run_id: UUID,
+        hydration: HydrationLevel = HydrationLevel.FULL,
+    ) -> StepRunResponseModel:
         """Get a step run by ID.
 
         Args:
             step_run_id: The ID of the step run to get.
+            hydration: How much of the step run to hydrate.
 
         Returns:
             The step run.
@@ -1644,16 +1749,20 @@ class RestZenStore(BaseZenStore):
             resource_id=step_run_id,
             route=STEPS,
             response_model=StepRunResponseModel,
+            params={"hydration": hydration.value},
         )
 
     def list_run_steps(
-        self, step_run_filter_model: StepRunFilterModel
+        self,
+        step_run_filter_model: StepRunFilterModel,
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> Page[StepRunResponseModel]:
         """List all step runs matching the given filter criteria.
 
         Args:
             step_run_filter_model: All filter parameters including pagination
                 params.
+            hydration: How much of the step runs to hydrate.
 
         Returns:
             A list of all step runs matching the filter criteria.
@@ -1662,6 +1771,7 @@ class RestZenStore(BaseZenStore):
             route=STEPS,
             response_model=StepRunResponseModel,
             filter_model=step_run_filter_model,
+            params={"hydration": hydration.value},
         )
 
     def update_run_step(
@@ -1706,11 +1816,16 @@ class RestZenStore(BaseZenStore):
             route=ARTIFACTS,
         )
 
-    def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
+    def get_artifact(
+        self,
+        artifact_id: UUID,
+        hydration: HydrationLevel = HydrationLevel.FULL,
+    ) -> ArtifactResponseModel:
         """Gets an artifact.
 
         Args:
             artifact_id: The ID of the artifact to get.
+            hydration: How much of the artifact to hydrate.
 
         Returns:
             The artifact.
@@ -1719,16 +1834,46 @@ class RestZenStore(BaseZenStore):
             resource_id=artifact_id,
             route=ARTIFACTS,
             response_model=ArtifactResponseModel,
+            params={"hydration": hydration.value},
         )
 
+    def get_artifact_lineage(
+        self,
+        artifact_id: UUID,
+        direction: LineageDirection = LineageDirection.DOWNSTREAM,
+        max_depth: Optional[int] = None,
+    ) -> ArtifactLineageModel:
+        """Gets the lineage of an artifact across pipeline runs.
+
+        Args:
+            artifact_id: The ID of the artifact.
+            direction: Whether to follow the steps that consumed the artifact
+                (downstream) or the steps that produced it (upstream).
+            max_depth: The maximum number of steps to follow. If not given,
+                the complete lineage is returned.
+
+        Returns:
+            The lineage of the artifact.
+        """
+        params: Dict[str, Any] = {"direction": direction.value}
+        if max_depth is not None:
+            params["max_depth"] = max_depth
+        body = self.get(
+            f"{ARTIFACTS}/{str(artifact_id)}{LINEAGE}", params=params
+        )
+        return ArtifactLineageModel.parse_obj(body)
+
     def list_artifacts(
-        self, artifact_filter_model: ArtifactFilterModel
+        self,
+        artifact_filter_model: ArtifactFilterModel,
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> Page[ArtifactResponseModel]:
         """List all artifacts matching the given filter criteria.
 
         Args:
             artifact_filter_model: All filter parameters including pagination
                 params.
+            hydration: How much of the artifacts to hydrate.
 
         Returns:
             A list of all artifacts matching the filter criteria.
@@ -1737,6 +1882,7 @@ class RestZenStore(BaseZenStore):
             route=ARTIFACTS,
             response_model=ArtifactResponseModel,
             filter_model=artifact_filter_model,
+            params={"hydration": hydration.value},
         )
 
     def delete_artifact(self, artifact_id: UUID) -> None:
@@ -1747,6 +1893,57 @@ class RestZenStore(BaseZenStore):
         """
         self._delete_resource(resource_id=artifact_id, route=ARTIFACTS)
 
+    def download_artifact_file(
+        self,
+        artifact_id: UUID,
+        destination: str,
+        path: Optional[str] = None,
+        visualization_index: Optional[int] = None,
+    ) -> None:
+        """Downloads a file of an artifact to a local path.
+
+        The file is streamed from the server in chunks, which means neither
+        the server nor the client load it into memory and the client doesn't
+        need access to the artifact store.
+
+        Args:
+            artifact_id: The ID of the artifact of which to download a file.
+            destination: The local path to which to write the file.
+            path: Path of the file relative to the artifact URI. Can be
+                omitted if the artifact URI itself is a file.
+            visualization_index: If given, the file of the visualization with
+                this index is downloaded instead of a file of the artifact
+                data.
+        """
+        params: Dict[str, Any] = {}
+        if path is not None:
+            params["path"] = path
+        if visualization_index is not None:
+            params["visualization_index"] = visualization_index
+
+        url = (
+            self.url
+            + API
+            + VERSION_1
+            + ARTIFACTS
+            + f"/{artifact_id}"
+            + DOWNLOAD
+        )
+        logger.debug(f"Downloading artifact file from {url}...")
+        try:
+            response = self._stream(url, params=params)
+        except AuthorizationException:
+            # The authentication token could have expired; refresh it and try
+            # again
+            self._session = None
+            response = self._stream(url, params=params)
+
+        with response, open(destination, "wb") as f:
+            for chunk in response.iter_content(
+                chunk_size=ARTIFACT_FILE_CHUNK_SIZE
+            ):
+                f.write(chunk)
+
     # ------------
     # Run Metadata
     # ------------
@@ -1787,6 +1984,26 @@ class RestZenStore(BaseZenStore):
             filter_model=run_metadata_filter_model,
         )
 
+    def get_run_metadata_leaderboard(
+        self,
+        leaderboard_filter_model: RunMetadataLeaderboardFilterModel,
+    ) -> RunMetadataLeaderboardModel:
+        """Gets the best pipeline runs according to a numeric metadata key.
+
+        Args:
+            leaderboard_filter_model: The metadata key to rank by and filters
+                for the pipeline runs to include.
+
+        Returns:
+            The best runs and aggregated statistics of the values of all
+            matching runs.
+        """
+        body = self.get(
+            RUN_METADATA + LEADERBOARD,
+            params=leaderboard_filter_model.dict(exclude_none=True),
+        )
+        return RunMetadataLeaderboardModel.parse_obj(body)
+
     # -----------------
     # Code Repositories
     # -----------------
@@ -2463,6 +2680,32 @@ class RestZenStore(BaseZenStore):
                 )
             )
 
+    def _stream(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> requests.Response:
+        """Make a GET request without reading the response body.
+
+        Args:
+            url: The URL to request.
+            params: The query parameters to pass to the endpoint.
+
+        Returns:
+            The response whose body can be read in chunks.
+        """
+        params = {k: str(v) for k, v in params.items()} if params else {}
+        response = self.session.get(
+            url,
+            params=params,
+            stream=True,
+            verify=self.config.verify_ssl,
+            timeout=self.config.http_timeout,
+        )
+        if response.status_code >= 300:
+            with response:
+                # Raises the exception corresponding to the error response
+                self._handle_response(response)
+        return response
+
     def get(
         self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any
     ) -> Json:
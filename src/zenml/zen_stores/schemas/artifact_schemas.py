@@ -14,7 +14,7 @@
 """SQLModel implementation of artifact tables."""
 
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 from uuid import UUID
 
 from pydantic import ValidationError
@@ -22,7 +22,7 @@ from sqlalchemy import TEXT, Column
 from sqlmodel import Field, Relationship
 
 from zenml.config.source import Source
-from zenml.enums import ArtifactType, VisualizationType
+from zenml.enums import ArtifactType, HydrationLevel, VisualizationType
 from zenml.models import ArtifactRequestModel, ArtifactResponseModel
 from zenml.models.visualization_models import VisualizationModel
 from zenml.zen_stores.schemas.base_schemas import BaseSchema, NamedSchema
@@ -32,6 +32,7 @@ from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
 if TYPE_CHECKING:
+    from zenml.models import RunMetadataResponseModel
     from zenml.zen_stores.schemas.run_metadata_schemas import RunMetadataSchema
     from zenml.zen_stores.schemas.step_run_schemas import (
         StepRunInputArtifactSchema,
@@ -118,34 +119,56 @@ class ArtifactSchema(NamedSchema, table=True):
             data_type=artifact_request.data_type.json(),
         )
 
+    @staticmethod
+    def _load_source(source: str) -> Source:
+        """Loads a source stored in an artifact schema.
+
+        Args:
+            source: The stored source.
+
+        Returns:
+            The loaded source.
+        """
+        try:
+            return Source.parse_raw(source)
+        except ValidationError:
+            # This is an old source which was simply an importable source path
+            return Source.from_import_path(source)
+
+    def get_data_type(self) -> Source:
+        """Gets the data type of the artifact.
+
+        Returns:
+            The source of the artifact data type.
+        """
+        return self._load_source(self.data_type)
+
     def to_model(
-        self, producer_step_run_id: Optional[UUID]
+        self,
+        producer_step_run_id: Optional[UUID],
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> ArtifactResponseModel:
         """Convert an `ArtifactSchema` to an `ArtifactModel`.
 
         Args:
             producer_step_run_id: The ID of the step run that produced this
                 artifact.
+            hydration: Which related entities to include. The visualizations
+                are only included on `body` level or above, the metadata only
+                on `full` level.
 
         Returns:
             The created `ArtifactModel`.
         """
-        metadata = {
-            metadata_schema.key: metadata_schema.to_model()
-            for metadata_schema in self.run_metadata
-        }
-
-        try:
-            materializer = Source.parse_raw(self.materializer)
-        except ValidationError:
-            # This is an old source which was simply an importable source path
-            materializer = Source.from_import_path(self.materializer)
-
-        try:
-            data_type = Source.parse_raw(self.data_type)
-        except ValidationError:
-            # This is an old source which was simply an importable source path
-            data_type = Source.from_import_path(self.data_type)
+        metadata: Dict[str, "RunMetadataResponseModel"] = {}
+        if hydration == HydrationLevel.FULL:
+            metadata = {
+                metadata_schema.key: metadata_schema.to_model()
+                for metadata_schema in self.run_metadata
+            }
+        visualizations: List[VisualizationModel] = []
+        if hydration != HydrationLevel.SUMMARY:
+            visualizations = [vis.to_model() for vis in self.visualizations]
 
         return ArtifactResponseModel(
             id=self.id,
@@ -155,13 +178,14 @@ class ArtifactSchema(NamedSchema, table=True):
             workspace=self.workspace.to_model(),
             type=self.type,
             uri=self.uri,
-            materializer=materializer,
-            data_type=data_type,
+            materializer=self._load_source(self.materializer),
+            data_type=self.get_data_type(),
             created=self.created,
             updated=self.updated,
             producer_step_run_id=producer_step_run_id,
             metadata=metadata,
-            visualizations=[vis.to_model() for vis in self.visualizations],
+            visualizations=visualizations,
+            hydration=hydration,
         )
 
 
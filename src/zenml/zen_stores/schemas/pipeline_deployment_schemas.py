@@ -14,7 +14,9 @@
 """SQLModel implementation of pipeline deployment tables."""
 
 import json
-from typing import TYPE_CHECKING, List, Optional
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from uuid import UUID
 
 from pydantic.json import pydantic_encoder
@@ -23,6 +25,7 @@ from sqlalchemy.dialects.mysql import MEDIUMTEXT
 from sqlmodel import Field, Relationship
 
 from zenml.config.pipeline_configurations import PipelineConfiguration
+from zenml.config.step_configurations import Step
 from zenml.models import (
     PipelineDeploymentRequestModel,
     PipelineDeploymentResponseModel,
@@ -43,6 +46,13 @@ from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 if TYPE_CHECKING:
     from zenml.zen_stores.schemas import PipelineRunSchema
 
+STEP_CONFIGURATIONS_CACHE_SIZE = 32
+
+# Deployments are immutable, which means we can cache the decoded step
+# configurations by deployment ID instead of decoding them for every step run
+_step_configurations_cache: "OrderedDict[UUID, Dict[str, Any]]" = OrderedDict()
+_step_configurations_cache_lock = threading.Lock()
+
 
 class PipelineDeploymentSchema(BaseSchema, table=True):
     """SQL Model for pipeline deployments."""
@@ -196,6 +206,47 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
             pipeline_configuration=PipelineConfiguration.parse_raw(
                 self.pipeline_configuration
             ),
-            step_configurations=json.loads(self.step_configurations),
+            step_configurations=self._get_raw_step_configurations(),
             client_environment=json.loads(self.client_environment),
         )
+
+    def _get_raw_step_configurations(self) -> Dict[str, Any]:
+        """Gets the decoded step configurations of this deployment.
+
+        Returns:
+            The decoded step configurations.
+        """
+        with _step_configurations_cache_lock:
+            if self.id in _step_configurations_cache:
+                _step_configurations_cache.move_to_end(self.id)
+                return _step_configurations_cache[self.id]
+
+        step_configurations: Dict[str, Any] = json.loads(
+            self.step_configurations
+        )
+
+        with _step_configurations_cache_lock:
+            _step_configurations_cache[self.id] = step_configurations
+            while (
+                len(_step_configurations_cache)
+                > STEP_CONFIGURATIONS_CACHE_SIZE
+            ):
+                _step_configurations_cache.popitem(last=False)
+
+        return step_configurations
+
+    def get_step_configuration(self, step_name: str) -> Optional[Step]:
+        """Gets the configuration of a step of this deployment.
+
+        Args:
+            step_name: The name of the step.
+
+        Returns:
+            The step configuration or None if the deployment does not contain
+            a step with the given name.
+        """
+        step_configuration = self._get_raw_step_configurations().get(step_name)
+        if step_configuration is None:
+            return None
+
+        return Step.parse_obj(step_configuration)
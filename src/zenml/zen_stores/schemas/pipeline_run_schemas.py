@@ -22,11 +22,16 @@ from sqlalchemy import TEXT, Column
 from sqlmodel import Field, Relationship
 
 from zenml.config.pipeline_configurations import PipelineConfiguration
-from zenml.enums import ExecutionStatus
+from zenml.enums import ExecutionStatus, HydrationLevel
 from zenml.models import (
+    PipelineBuildResponseModel,
+    PipelineDeploymentResponseModel,
+    PipelineResponseModel,
     PipelineRunRequestModel,
     PipelineRunResponseModel,
     PipelineRunUpdateModel,
+    RunMetadataResponseModel,
+    StackResponseModel,
     StepRunResponseModel,
 )
 from zenml.zen_stores.schemas.base_schemas import NamedSchema
@@ -200,11 +205,15 @@ class PipelineRunSchema(NamedSchema, table=True):
     def to_model(
         self,
         steps: Optional[Dict[str, "StepRunResponseModel"]] = None,
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> PipelineRunResponseModel:
         """Convert a `PipelineRunSchema` to a `PipelineRunResponseModel`.
 
         Args:
             steps: The steps to include in the response.
+            hydration: Which related entities to include. The pipeline,
+                stack, build and metadata are only included on `body` level
+                or above, the deployment only on `full` level.
 
         Returns:
             The created `PipelineRunResponseModel`.
@@ -219,21 +228,31 @@ class PipelineRunSchema(NamedSchema, table=True):
             if self.orchestrator_environment
             else {}
         )
-        metadata = {
-            metadata_schema.key: metadata_schema.to_model()
-            for metadata_schema in self.run_metadata
-        }
         config = PipelineConfiguration.parse_raw(self.pipeline_configuration)
 
-        pipeline = self.pipeline.to_model() if self.pipeline else None
-        build = self.build.to_model() if self.build else None
-        deployment = self.deployment.to_model() if self.deployment else None
+        metadata: Dict[str, RunMetadataResponseModel] = {}
+        pipeline: Optional[PipelineResponseModel] = None
+        stack: Optional[StackResponseModel] = None
+        build: Optional[PipelineBuildResponseModel] = None
+        deployment: Optional[PipelineDeploymentResponseModel] = None
+        if hydration != HydrationLevel.SUMMARY:
+            metadata = {
+                metadata_schema.key: metadata_schema.to_model()
+                for metadata_schema in self.run_metadata
+            }
+            pipeline = self.pipeline.to_model() if self.pipeline else None
+            stack = self.stack.to_model() if self.stack else None
+            build = self.build.to_model() if self.build else None
+        if hydration == HydrationLevel.FULL:
+            deployment = (
+                self.deployment.to_model() if self.deployment else None
+            )
         steps = steps or {}
 
         return PipelineRunResponseModel(
             id=self.id,
             name=self.name,
-            stack=self.stack.to_model() if self.stack else None,
+            stack=stack,
             workspace=self.workspace.to_model(),
             user=self.user.to_model(True) if self.user else None,
             orchestrator_run_id=self.orchestrator_run_id,
@@ -254,6 +273,7 @@ class PipelineRunSchema(NamedSchema, table=True):
             updated=self.updated,
             metadata=metadata,
             steps=steps,
+            hydration=hydration,
         )
 
     def update(
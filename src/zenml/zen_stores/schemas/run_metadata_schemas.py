@@ -15,13 +15,15 @@
 
 
 import json
-from typing import Optional
+import math
+from typing import Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import TEXT, Column
+from sqlalchemy import TEXT, Column, Float, Index
 from sqlmodel import Field, Relationship
 
-from zenml.metadata.metadata_types import MetadataTypeEnum
+from zenml.metadata.metadata_types import MetadataType, MetadataTypeEnum
+from zenml.models.constants import STR_FIELD_MAX_LENGTH
 from zenml.models.run_metadata_models import (
     RunMetadataRequestModel,
     RunMetadataResponseModel,
@@ -35,11 +37,57 @@ from zenml.zen_stores.schemas.step_run_schemas import StepRunSchema
 from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
+NUMERIC_METADATA_TYPES = {
+    MetadataTypeEnum.INT,
+    MetadataTypeEnum.FLOAT,
+    MetadataTypeEnum.STORAGE_SIZE,
+}
+STRING_METADATA_TYPES = {
+    MetadataTypeEnum.STRING,
+    MetadataTypeEnum.URI,
+    MetadataTypeEnum.PATH,
+    MetadataTypeEnum.DTYPE,
+}
+
+
+def get_typed_metadata_values(
+    value: MetadataType, type_: MetadataTypeEnum
+) -> Tuple[Optional[float], Optional[str]]:
+    """Gets the values to store in the typed columns of a metadata row.
+
+    Args:
+        value: The metadata value.
+        type_: The metadata type.
+
+    Returns:
+        The numeric and string value. Both are None if the metadata value
+        can't be represented in the respective column.
+    """
+    if type_ in NUMERIC_METADATA_TYPES:
+        try:
+            numeric_value = float(value)  # type: ignore[arg-type]
+        except (TypeError, ValueError, OverflowError):
+            return None, None
+        if math.isfinite(numeric_value):
+            return numeric_value, None
+    elif type_ in STRING_METADATA_TYPES:
+        if isinstance(value, str) and len(value) <= STR_FIELD_MAX_LENGTH:
+            return None, value
+
+    return None, None
+
 
 class RunMetadataSchema(BaseSchema, table=True):
     """SQL Model for run metadata."""
 
     __tablename__ = "run_metadata"
+    __table_args__ = (
+        Index("ix_run_metadata_pipeline_run_id_key", "pipeline_run_id", "key"),
+        Index("ix_run_metadata_step_run_id_key", "step_run_id", "key"),
+        Index("ix_run_metadata_artifact_id_key", "artifact_id", "key"),
+        Index("ix_run_metadata_key_numeric_value", "key", "numeric_value"),
+        Index("ix_run_metadata_key_string_value", "key", "string_value"),
+    )
 
     pipeline_run_id: Optional[UUID] = build_foreign_key_field(
         source=__tablename__,
@@ -112,6 +160,12 @@ class RunMetadataSchema(BaseSchema, table=True):
     key: str
     value: str = Field(sa_column=Column(TEXT, nullable=False))
     type: MetadataTypeEnum
+    # Typed copies of the value that can be used for filtering, sorting and
+    # aggregating metadata in the database
+    numeric_value: Optional[float] = Field(
+        sa_column=Column(Float(precision=53), nullable=True)
+    )
+    string_value: Optional[str] = Field(nullable=True)
 
     def to_model(self) -> "RunMetadataResponseModel":
         """Convert a `RunMetadataSchema` to a `RunMetadataResponseModel`.
@@ -146,6 +200,9 @@ class RunMetadataSchema(BaseSchema, table=True):
         Returns:
             The created `RunMetadataSchema`.
         """
+        numeric_value, string_value = get_typed_metadata_values(
+            value=request.value, type_=request.type
+        )
         return cls(
             workspace_id=request.workspace,
             user_id=request.user,
@@ -156,4 +213,6 @@ class RunMetadataSchema(BaseSchema, table=True):
             key=request.key,
             value=json.dumps(request.value),
             type=request.type,
+            numeric_value=numeric_value,
+            string_value=string_value,
         )
@@ -18,13 +18,13 @@ from typing import TYPE_CHECKING, Dict, List, Optional
 from uuid import UUID
 
 from pydantic.json import pydantic_encoder
-from sqlalchemy import TEXT, Column, String
+from sqlalchemy import TEXT, Column, Index, String
 from sqlalchemy.dialects.mysql import MEDIUMTEXT
 from sqlmodel import Field, Relationship, SQLModel
 
 from zenml.config.step_configurations import Step
 from zenml.constants import STEP_SOURCE_PARAMETER_NAME
-from zenml.enums import ExecutionStatus
+from zenml.enums import ExecutionStatus, HydrationLevel
 from zenml.models.constants import MEDIUMTEXT_MAX_LENGTH
 from zenml.models.step_run_models import (
     StepRunRequestModel,
@@ -39,7 +39,11 @@ from zenml.zen_stores.schemas.user_schemas import UserSchema
 from zenml.zen_stores.schemas.workspace_schemas import WorkspaceSchema
 
 if TYPE_CHECKING:
-    from zenml.models import ArtifactResponseModel
+    from zenml.models import (
+        ArtifactResponseModel,
+        LogsResponseModel,
+        RunMetadataResponseModel,
+    )
     from zenml.zen_stores.schemas.logs_schemas import LogsSchema
     from zenml.zen_stores.schemas.run_metadata_schemas import RunMetadataSchema
 
@@ -48,6 +52,14 @@ class StepRunSchema(NamedSchema, table=True):
     """SQL Model for steps of pipeline runs."""
 
     __tablename__ = "step_run"
+    __table_args__ = (
+        Index(
+            "ix_step_run_cache_key_status", "cache_key", "status", "created"
+        ),
+        Index(
+            "ix_step_run_pipeline_run_id_status", "pipeline_run_id", "status"
+        ),
+    )
 
     pipeline_run_id: UUID = build_foreign_key_field(
         source=__tablename__,
@@ -105,12 +117,14 @@ class StepRunSchema(NamedSchema, table=True):
             nullable=False,
         )
     )
-    step_configuration: str = Field(
+    # Only set if the configuration differs from the one stored in the
+    # deployment of the pipeline run
+    step_configuration: Optional[str] = Field(
         sa_column=Column(
             String(length=MEDIUMTEXT_MAX_LENGTH).with_variant(
                 MEDIUMTEXT, "mysql"
             ),
-            nullable=False,
+            nullable=True,
         )
     )
     caching_parameters: Optional[str] = Field(
@@ -197,6 +211,7 @@ class StepRunSchema(NamedSchema, table=True):
         parent_step_ids: List[UUID],
         input_artifacts: Dict[str, "ArtifactResponseModel"],
         output_artifacts: Dict[str, "ArtifactResponseModel"],
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> StepRunResponseModel:
         """Convert a `StepRunSchema` to a `StepRunModel`.
 
@@ -204,15 +219,21 @@ class StepRunSchema(NamedSchema, table=True):
             parent_step_ids: The parent step ids to link to the step.
             input_artifacts: The input artifacts to link to the step.
             output_artifacts: The output artifacts to link to the step.
+            hydration: Which related entities to include. The metadata and
+                logs are only included on `body` level or above.
 
         Returns:
             The created StepRunModel.
         """
-        metadata = {
-            metadata_schema.key: metadata_schema.to_model()
-            for metadata_schema in self.run_metadata
-        }
-        full_step_config = Step.parse_raw(self.step_configuration)
+        metadata: Dict[str, "RunMetadataResponseModel"] = {}
+        logs: Optional["LogsResponseModel"] = None
+        if hydration != HydrationLevel.SUMMARY:
+            metadata = {
+                metadata_schema.key: metadata_schema.to_model()
+                for metadata_schema in self.run_metadata
+            }
+            logs = self.logs.to_model() if self.logs else None
+        full_step_config = self.get_step_configuration()
         return StepRunResponseModel(
             id=self.id,
             name=self.name,
@@ -234,8 +255,35 @@ class StepRunSchema(NamedSchema, table=True):
             inputs=input_artifacts,
             outputs=output_artifacts,
             metadata=metadata,
-            logs=self.logs.to_model() if self.logs else None,
+            logs=logs,
+            hydration=hydration,
+        )
+
+    def get_step_configuration(self) -> Step:
+        """Gets the full configuration of the step.
+
+        Returns:
+            The step configuration.
+
+        Raises:
+            RuntimeError: If the step configuration is neither stored for the
+                step run nor in the deployment of the pipeline run.
+        """
+        if self.step_configuration:
+            return Step.parse_raw(self.step_configuration)
+
+        deployment = self.pipeline_run.deployment
+        step_configuration = (
+            deployment.get_step_configuration(self.name)
+            if deployment
+            else None
         )
+        if not step_configuration:
+            raise RuntimeError(
+                f"Missing configuration for step run {self.id}."
+            )
+
+        return step_configuration
 
     def update(self, step_update: StepRunUpdateModel) -> "StepRunSchema":
         """Update a step run schema with a step run update model.
@@ -263,6 +311,7 @@ class StepRunParentsSchema(SQLModel, table=True):
     """SQL Model that defines the order of steps."""
 
     __tablename__ = "step_run_parents"
+    __table_args__ = (Index("ix_step_run_parents_child_id", "child_id"),)
 
     parent_id: UUID = build_foreign_key_field(
         source=__tablename__,
@@ -300,6 +349,9 @@ class StepRunInputArtifactSchema(SQLModel, table=True):
     """SQL Model that defines which artifacts are inputs to which step."""
 
     __tablename__ = "step_run_input_artifact"
+    __table_args__ = (
+        Index("ix_step_run_input_artifact_artifact_id", "artifact_id"),
+    )
 
     step_id: UUID = build_foreign_key_field(
         source=__tablename__,
@@ -330,6 +382,9 @@ class StepRunOutputArtifactSchema(SQLModel, table=True):
     """SQL Model that defines which artifacts are outputs of which step."""
 
     __tablename__ = "step_run_output_artifact"
+    __table_args__ = (
+        Index("ix_step_run_output_artifact_artifact_id", "artifact_id"),
+    )
 
     step_id: UUID = build_foreign_key_field(
         source=__tablename__,
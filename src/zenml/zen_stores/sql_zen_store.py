@@ -19,7 +19,10 @@ import logging
 import math
 import os
 import re
+from collections import defaultdict
 from contextvars import ContextVar
+from datetime import datetime
+from functools import partial
 from pathlib import Path, PurePath
 from typing import (
     Any,
@@ -28,6 +31,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
@@ -38,7 +42,7 @@ from uuid import UUID
 
 import pymysql
 from pydantic import SecretStr, root_validator, validator
-from sqlalchemy import asc, desc, func, text
+from sqlalchemy import and_, asc, desc, exists, func, literal, text
 from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.exc import (
     ArgumentError,
@@ -46,7 +50,7 @@ from sqlalchemy.exc import (
     NoResultFound,
     OperationalError,
 )
-from sqlalchemy.orm import noload
+from sqlalchemy.orm import noload, selectinload
 from sqlmodel import Session, create_engine, or_, select
 from sqlmodel.sql.expression import Select, SelectOfScalar
 
@@ -54,11 +58,14 @@ from zenml.config.global_config import GlobalConfiguration
 from zenml.config.secrets_store_config import SecretsStoreConfiguration
 from zenml.config.store_config import StoreConfiguration
 from zenml.constants import (
+    ARTIFACT_LINEAGE_MAX_DEPTH,
     ENV_ZENML_DISABLE_DATABASE_MIGRATION,
     ENV_ZENML_SERVER_DEPLOYMENT_TYPE,
 )
 from zenml.enums import (
     ExecutionStatus,
+    HydrationLevel,
+    LineageDirection,
     LoggingLevels,
     SecretScope,
     SorterOps,
@@ -73,9 +80,12 @@ from zenml.exceptions import (
     StackExistsError,
 )
 from zenml.io import fileio
+from zenml.lineage_graph.lineage_graph import LineageGraph
 from zenml.logger import get_console_handler, get_logger, get_logging_level
 from zenml.models import (
     ArtifactFilterModel,
+    ArtifactLineageModel,
+    ArtifactLineageStepModel,
     ArtifactRequestModel,
     ArtifactResponseModel,
     BaseFilterModel,
@@ -154,7 +164,12 @@ from zenml.models import (
 from zenml.models.base_models import BaseResponseModel
 from zenml.models.constants import TEXT_FIELD_MAX_LENGTH
 from zenml.models.page_model import Page
-from zenml.models.run_metadata_models import RunMetadataFilterModel
+from zenml.models.run_metadata_models import (
+    RunMetadataFilterModel,
+    RunMetadataLeaderboardEntryModel,
+    RunMetadataLeaderboardFilterModel,
+    RunMetadataLeaderboardModel,
+)
 from zenml.models.schedule_model import ScheduleFilterModel
 from zenml.models.secret_models import SecretUpdateModel
 from zenml.models.server_models import ServerDatabaseType, ServerModel
@@ -290,6 +305,11 @@ class SqlZenStoreConfiguration(StoreConfiguration):
         pool_pre_ping: Enable emitting a test statement on the SQL connection
             at the start of each connection pool checkout, to test that the
             database connection is still viable.
+        pool_recycle: The number of seconds after which connections in the
+            SQLAlchemy pool are recycled. If not set, connections are never
+            recycled.
+        pool_timeout: The number of seconds to wait for a connection to become
+            available in the SQLAlchemy pool before giving up.
     """
 
     type: StoreType = StoreType.SQL
@@ -307,6 +327,8 @@ class SqlZenStoreConfiguration(StoreConfiguration):
     pool_size: int = 20
     max_overflow: int = 20
     pool_pre_ping: bool = True
+    pool_recycle: Optional[int] = None
+    pool_timeout: int = 30
 
     @validator("secrets_store")
     def validate_secrets_store(
@@ -596,7 +618,10 @@ class SqlZenStoreConfiguration(StoreConfiguration):
                 "pool_size": self.pool_size,
                 "max_overflow": self.max_overflow,
                 "pool_pre_ping": self.pool_pre_ping,
+                "pool_timeout": self.pool_timeout,
             }
+            if self.pool_recycle is not None:
+                engine_args["pool_recycle"] = self.pool_recycle
 
             sql_url = sql_url._replace(
                 drivername="mysql+pymysql",
@@ -718,6 +743,9 @@ class SqlZenStore(BaseZenStore):
                 List[AnySchema],
             ]
         ] = None,
+        custom_page_conversion: Optional[
+            Callable[[List[AnySchema]], List[B]]
+        ] = None,
     ) -> Page[B]:
         """Given a query, return a Page instance with a list of filtered Models.
 
@@ -736,6 +764,11 @@ class SqlZenStore(BaseZenStore):
                 perform additional filtering). The callable should take a
                 `Session`, a `Select` query and a `BaseFilterModel` filter as
                 arguments and return a `List` of items.
+            custom_page_conversion: Callable to convert all schemas of the
+                page into models at once. This is used instead of
+                `custom_schema_to_model_conversion` if the models contain
+                additional data that can be loaded for all items of the page
+                with a single query.
 
         Returns:
             The Domain Model representation of the DB resource
@@ -796,21 +829,24 @@ class SqlZenStore(BaseZenStore):
 
         # Convert this page of items from schemas to models.
         items: List[B] = []
-        for schema in item_schemas:
-            # If a custom conversion function is provided, use it.
-            if custom_schema_to_model_conversion:
-                items.append(custom_schema_to_model_conversion(schema))
-                continue
-            # Otherwise, try to use the `to_model` method of the schema.
-            to_model = getattr(schema, "to_model", None)
-            if callable(to_model):
-                items.append(to_model())
-                continue
-            # If neither of the above work, raise an error.
-            raise RuntimeError(
-                f"Cannot convert schema `{schema.__class__.__name__}` to model "
-                "since it does not have a `to_model` method."
-            )
+        if custom_page_conversion:
+            items = custom_page_conversion(item_schemas)
+        else:
+            for schema in item_schemas:
+                # If a custom conversion function is provided, use it.
+                if custom_schema_to_model_conversion:
+                    items.append(custom_schema_to_model_conversion(schema))
+                    continue
+                # Otherwise, try to use the `to_model` method of the schema.
+                to_model = getattr(schema, "to_model", None)
+                if callable(to_model):
+                    items.append(to_model())
+                    continue
+                # If neither of the above work, raise an error.
+                raise RuntimeError(
+                    f"Cannot convert schema `{schema.__class__.__name__}` to "
+                    "model since it does not have a `to_model` method."
+                )
 
         return Page(
             total=total,
@@ -2845,7 +2881,11 @@ class SqlZenStore(BaseZenStore):
             A list of all pipelines matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(PipelineSchema)
+            # The status of each pipeline is computed from its runs, which are
+            # loaded for all pipelines of the page at once.
+            query = select(PipelineSchema).options(
+                selectinload(PipelineSchema.runs)  # type: ignore[arg-type]
+            )
             return self.filter_and_paginate(
                 session=session,
                 query=query,
@@ -3057,6 +3097,64 @@ class SqlZenStore(BaseZenStore):
 
             return new_deployment.to_model()
 
+    def create_deployments(
+        self,
+        deployments: List[PipelineDeploymentRequestModel],
+    ) -> List[PipelineDeploymentResponseModel]:
+        """Creates multiple deployments at once.
+
+        All deployments are created in a single transaction and deployments
+        with the same code reference share it.
+
+        Args:
+            deployments: The deployments to create.
+
+        Returns:
+            The newly created deployments, in the same order as the requests.
+        """
+        if not deployments:
+            return []
+
+        with Session(self.engine) as session:
+            code_reference_ids: Dict[Tuple[UUID, str], Optional[UUID]] = {}
+            new_deployments = []
+            for deployment in deployments:
+                code_reference_id = None
+                if deployment.code_reference:
+                    key = (
+                        deployment.workspace,
+                        deployment.code_reference.json(sort_keys=True),
+                    )
+                    if key not in code_reference_ids:
+                        code_reference_ids[
+                            key
+                        ] = self._create_or_reuse_code_reference(
+                            session=session,
+                            workspace_id=deployment.workspace,
+                            code_reference=deployment.code_reference,
+                        )
+                    code_reference_id = code_reference_ids[key]
+
+                new_deployments.append(
+                    PipelineDeploymentSchema.from_request(
+                        deployment, code_reference_id=code_reference_id
+                    )
+                )
+
+            session.add_all(new_deployments)
+            session.commit()
+
+            # Reload all expired deployments with a single query instead of
+            # refreshing them one by one.
+            deployment_ids = [deployment.id for deployment in new_deployments]
+            session.exec(
+                select(PipelineDeploymentSchema).where(
+                    PipelineDeploymentSchema.id.in_(deployment_ids)  # type: ignore[attr-defined]
+                )
+            ).all()
+
+            return [deployment.to_model() for deployment in new_deployments]
+
     def get_deployment(
         self, deployment_id: UUID
     ) -> PipelineDeploymentResponseModel:
@@ -3099,7 +3197,13 @@ class SqlZenStore(BaseZenStore):
             A page of all deployments matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(PipelineDeploymentSchema)
+            query = select(PipelineDeploymentSchema).options(
+                selectinload(
+                    PipelineDeploymentSchema.pipeline  # type: ignore[arg-type]
+                ).selectinload(
+                    PipelineSchema.runs  # type: ignore[arg-type]
+                )
+            )
             return self.filter_and_paginate(
                 session=session,
                 query=query,
@@ -3129,6 +3233,18 @@ class SqlZenStore(BaseZenStore):
                     f"No deployment with this ID found."
                 )
 
+            # Step runs that reference their configuration in this deployment
+            # need to store it themselves once the deployment is gone
+            for run in deployment.runs:
+                for step_run in run.step_runs:
+                    if step_run.step_configuration is None:
+                        step_run.step_configuration = (
+                            step_run.get_step_configuration().json(
+                                sort_keys=True
+                            )
+                        )
+                        session.add(step_run)
+
             session.delete(deployment)
             session.commit()
 
@@ -3338,36 +3454,330 @@ class SqlZenStore(BaseZenStore):
             return self._run_schema_to_model(new_run)
 
     def _run_schema_to_model(
-        self, run: PipelineRunSchema
+        self,
+        run: PipelineRunSchema,
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> PipelineRunResponseModel:
         """Converts a pipeline run schema to a pipeline run model incl. steps.
 
         Args:
             run: The pipeline run schema to convert.
+            hydration: How much of the pipeline run to hydrate. The steps are
+                only hydrated on `full` level.
 
         Returns:
             The converted pipeline run model with steps hydrated into it.
         """
-        steps = {
-            step.name: self._run_step_schema_to_model(step)
-            for step in run.step_runs
-        }
-        return run.to_model(steps=steps)
+        return self._run_schemas_to_models([run], hydration=hydration)[0]
+
+    def _run_schemas_to_models(
+        self,
+        runs: List[PipelineRunSchema],
+        hydration: HydrationLevel = HydrationLevel.FULL,
+    ) -> List[PipelineRunResponseModel]:
+        """Converts pipeline run schemas to pipeline run models incl. steps.
+
+        The steps of all pipeline runs are hydrated together.
+
+        Args:
+            runs: The pipeline run schemas to convert.
+            hydration: How much of the pipeline runs to hydrate. The steps
+                are only hydrated on `full` level.
+
+        Returns:
+            The converted pipeline run models with steps hydrated into them.
+        """
+        steps: Dict[UUID, Dict[str, StepRunResponseModel]] = defaultdict(dict)
+        if hydration == HydrationLevel.FULL:
+            step_runs = [step for run in runs for step in run.step_runs]
+            for step_run in self._run_step_schemas_to_models(step_runs):
+                steps[step_run.pipeline_run_id][step_run.name] = step_run
+        return [
+            run.to_model(steps=steps[run.id], hydration=hydration)
+            for run in runs
+        ]
+
+    @classmethod
+    def _get_run_loader_options(cls, hydration: HydrationLevel) -> List[Any]:
+        """Gets the loader options for everything a run is hydrated with.
+
+        Adding these options to a query that loads multiple pipeline runs
+        loads the related entities of all runs with one query per
+        relationship instead of lazily for each run.
+
+        Args:
+            hydration: How much of the pipeline runs will be hydrated.
+
+        Returns:
+            The loader options.
+        """
+        if hydration == HydrationLevel.SUMMARY:
+            return []
+
+        options: List[Any] = [
+            selectinload(
+                PipelineRunSchema.run_metadata  # type: ignore[arg-type]
+            ),
+            selectinload(
+                PipelineRunSchema.pipeline  # type: ignore[arg-type]
+            ).selectinload(
+                PipelineSchema.runs  # type: ignore[arg-type]
+            ),
+            selectinload(PipelineRunSchema.stack),  # type: ignore[arg-type]
+            selectinload(PipelineRunSchema.build),  # type: ignore[arg-type]
+        ]
+        if hydration == HydrationLevel.FULL:
+            options.append(
+                selectinload(
+                    PipelineRunSchema.deployment  # type: ignore[arg-type]
+                )
+            )
+            options.append(
+                selectinload(
+                    PipelineRunSchema.step_runs  # type: ignore[arg-type]
+                ).options(*cls._get_step_run_loader_options(hydration))
+            )
+        return options
 
     def get_run(
-        self, run_name_or_id: Union[str, UUID]
+        self,
+        run_name_or_id: Union[str, UUID],
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> PipelineRunResponseModel:
         """Gets a pipeline run.
 
         Args:
             run_name_or_id: The name or ID of the pipeline run to get.
+            hydration: How much of the pipeline run to hydrate.
 
         Returns:
             The pipeline run.
         """
+        with Session(self.engine) as session:
+            run = self._get_run_schema(
+                run_name_or_id, session=session, hydration=hydration
+            )
+            return self._run_schema_to_model(run, hydration=hydration)
+
+    def get_run_lineage_graph(
+        self,
+        run_name_or_id: Union[str, UUID],
+        since: Optional[datetime] = None,
+    ) -> LineageGraph:
+        """Gets the lineage graph of a pipeline run.
+
+        The graph is built from a fixed number of queries that load all steps,
+        artifacts and metadata of the run at once instead of hydrating each
+        step and artifact of the run separately.
+
+        Args:
+            run_name_or_id: The name or ID of the pipeline run.
+            since: Only include the steps that were updated after this time
+                or have metadata or output artifacts that were created after
+                this time. The run metadata is always included.
+
+        Returns:
+            The lineage graph of the pipeline run.
+        """
+        timestamp = datetime.utcnow()
         with Session(self.engine) as session:
             run = self._get_run_schema(run_name_or_id, session=session)
-            return self._run_schema_to_model(run)
+            run_metadata = self._get_lineage_metadata(
+                session, RunMetadataSchema.pipeline_run_id, [run.id]
+            )
+
+            steps_query = select(StepRunSchema).where(
+                StepRunSchema.pipeline_run_id == run.id
+            )
+            if since:
+                new_metadata = RunMetadataSchema.created >= since
+                new_outputs = (
+                    select(StepRunOutputArtifactSchema.step_id)
+                    .where(
+                        StepRunOutputArtifactSchema.artifact_id
+                        == ArtifactSchema.id
+                    )
+                    .where(
+                        or_(
+                            ArtifactSchema.created >= since,
+                            ArtifactSchema.id.in_(  # type: ignore[attr-defined]
+                                select(RunMetadataSchema.artifact_id).where(
+                                    new_metadata
+                                )
+                            ),
+                        )
+                    )
+                )
+                steps_query = steps_query.where(
+                    or_(
+                        StepRunSchema.updated >= since,
+                        StepRunSchema.id.in_(  # type: ignore[attr-defined]
+                            select(RunMetadataSchema.step_run_id).where(
+                                new_metadata
+                            )
+                        ),
+                        StepRunSchema.id.in_(  # type: ignore[attr-defined]
+                            new_outputs
+                        ),
+                    )
+                )
+            steps = session.exec(
+                steps_query.order_by(StepRunSchema.created)
+            ).all()
+            step_ids = [step.id for step in steps]
+
+            step_metadata = self._get_lineage_metadata(
+                session, RunMetadataSchema.step_run_id, step_ids
+            )
+
+            inputs: Dict[UUID, List[Tuple[str, UUID, str]]] = defaultdict(list)
+            for step_id, name, artifact_id, uri in session.exec(
+                select(
+                    StepRunInputArtifactSchema.step_id,
+                    StepRunInputArtifactSchema.name,
+                    ArtifactSchema.id,
+                    ArtifactSchema.uri,
+                )
+                .where(
+                    StepRunInputArtifactSchema.artifact_id == ArtifactSchema.id
+                )
+                .where(
+                    StepRunInputArtifactSchema.step_id.in_(  # type: ignore[attr-defined]
+                        step_ids
+                    )
+                )
+            ):
+                inputs[step_id].append((name, artifact_id, uri))
+
+            outputs: Dict[
+                UUID, List[Tuple[str, ArtifactSchema]]
+            ] = defaultdict(list)
+            for step_id, name, artifact in session.exec(
+                select(
+                    StepRunOutputArtifactSchema.step_id,
+                    StepRunOutputArtifactSchema.name,
+                    ArtifactSchema,
+                )
+                .where(
+                    StepRunOutputArtifactSchema.artifact_id
+                    == ArtifactSchema.id
+                )
+                .where(
+                    StepRunOutputArtifactSchema.step_id.in_(  # type: ignore[attr-defined]
+                        step_ids
+                    )
+                )
+            ):
+                outputs[step_id].append((name, artifact))
+            artifact_ids = [
+                artifact.id
+                for step_outputs in outputs.values()
+                for _, artifact in step_outputs
+            ]
+
+            artifact_metadata = self._get_lineage_metadata(
+                session, RunMetadataSchema.artifact_id, artifact_ids
+            )
+
+            producer_step_ids: Dict[UUID, UUID] = {}
+            for artifact_id, step_id in session.exec(
+                select(
+                    StepRunOutputArtifactSchema.artifact_id,
+                    StepRunOutputArtifactSchema.step_id,
+                )
+                .where(StepRunOutputArtifactSchema.step_id == StepRunSchema.id)
+                .where(StepRunSchema.status != ExecutionStatus.CACHED)
+                .where(
+                    StepRunOutputArtifactSchema.artifact_id.in_(  # type: ignore[attr-defined]
+                        artifact_ids
+                    )
+                )
+            ):
+                producer_step_ids.setdefault(artifact_id, step_id)
+
+            graph = LineageGraph(
+                run_metadata=run_metadata.get(run.id, []), timestamp=timestamp
+            )
+            for step in steps:
+                graph.add_step_node(
+                    step_id=step.id,
+                    name=step.name,
+                    status=step.status,
+                    config=step.get_step_configuration().config,
+                    inputs={name: uri for name, _, uri in inputs[step.id]},
+                    outputs={
+                        name: artifact.uri
+                        for name, artifact in outputs[step.id]
+                    },
+                    metadata=step_metadata.get(step.id, []),
+                )
+                for name, artifact in outputs[step.id]:
+                    graph.add_artifact_node(
+                        artifact_id=artifact.id,
+                        name=name,
+                        status=step.status,
+                        artifact_type=artifact.type,
+                        artifact_data_type=artifact.get_data_type().import_path,
+                        parent_step_id=step.id,
+                        producer_step_id=producer_step_ids.get(artifact.id),
+                        uri=artifact.uri,
+                        metadata=artifact_metadata.get(artifact.id, []),
+                    )
+                    graph.add_artifact_edge(
+                        step.id, artifact.id, is_output=True
+                    )
+                for _, artifact_id, _ in inputs[step.id]:
+                    graph.add_artifact_edge(
+                        step.id, artifact_id, is_output=False
+                    )
+
+        if since:
+            # The first changed step is not necessarily the root step
+            graph.root_step_id = None
+        return graph
+
+    @staticmethod
+    def _get_lineage_metadata(
+        session: Session, owner_column: Any, owner_ids: List[UUID]
+    ) -> Dict[UUID, List[Tuple[str, str, str]]]:
+        """Loads the metadata of multiple entities for a lineage graph.
+
+        Args:
+            session: The DB session.
+            owner_column: The column of the run metadata schema referencing
+                the entities.
+            owner_ids: The IDs of the entities.
+
+        Returns:
+            The (key, value, type) tuples of the metadata by entity ID. If an
+            entity has multiple values for a key, only the latest one is
+            included.
+        """
+        metadata: Dict[UUID, Dict[str, Tuple[str, str, str]]] = defaultdict(
+            dict
+        )
+        if not owner_ids:
+            return {}
+
+        for owner_id, key, value, type_ in session.exec(
+            select(
+                owner_column,
+                RunMetadataSchema.key,
+                RunMetadataSchema.value,
+                RunMetadataSchema.type,
+            )
+            .where(owner_column.in_(owner_ids))
+            .order_by(RunMetadataSchema.created)
+        ):
+            metadata[owner_id][key] = (
+                key,
+                str(json.loads(value)),
+                str(type_),
+            )
+        return {
+            owner_id: list(entries.values())
+            for owner_id, entries in metadata.items()
+        }
 
     def get_or_create_run(
         self, pipeline_run: PipelineRunRequestModel
@@ -3398,25 +3808,32 @@ class SqlZenStore(BaseZenStore):
                 return self.get_run(pipeline_run.name), False
 
     def list_runs(
-        self, runs_filter_model: PipelineRunFilterModel
+        self,
+        runs_filter_model: PipelineRunFilterModel,
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> Page[PipelineRunResponseModel]:
         """List all pipeline runs matching the given filter criteria.
 
         Args:
             runs_filter_model: All filter parameters including pagination
                 params.
+            hydration: How much of the pipeline runs to hydrate.
 
         Returns:
             A list of all pipeline runs matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(PipelineRunSchema)
+            query = select(PipelineRunSchema).options(
+                *self._get_run_loader_options(hydration)
+            )
             return self.filter_and_paginate(
                 session=session,
                 query=query,
                 table=PipelineRunSchema,
                 filter_model=runs_filter_model,
-                custom_schema_to_model_conversion=self._run_schema_to_model,
+                custom_page_conversion=partial(
+                    self._run_schemas_to_models, hydration=hydration
+                ),
             )
 
     def count_runs(self, workspace_id: Optional[UUID]) -> int:
@@ -3539,6 +3956,20 @@ class SqlZenStore(BaseZenStore):
 
             # Create the step
             step_schema = StepRunSchema.from_request(step_run)
+
+            # Don't store the step configuration again if it is the same as
+            # the one stored in the deployment of the pipeline run
+            if run.deployment:
+                deployment_step_configuration = (
+                    run.deployment.get_step_configuration(step_run.name)
+                )
+                if (
+                    deployment_step_configuration
+                    and deployment_step_configuration.json(sort_keys=True)
+                    == step_schema.step_configuration
+                ):
+                    step_schema.step_configuration = None
+
             session.add(step_schema)
 
             # Add logs entry for the step if exists
@@ -3734,11 +4165,16 @@ class SqlZenStore(BaseZenStore):
         )
         session.add(assignment)
 
-    def get_run_step(self, step_run_id: UUID) -> StepRunResponseModel:
+    def get_run_step(
+        self,
+        step_run_id: UUID,
+        hydration: HydrationLevel = HydrationLevel.FULL,
+    ) -> StepRunResponseModel:
         """Get a step run by ID.
 
         Args:
             step_run_id: The ID of the step run to get.
+            hydration: How much of the step run to hydrate.
 
         Returns:
             The step run.
@@ -3748,95 +4184,187 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
             step_run = session.exec(
-                select(StepRunSchema).where(StepRunSchema.id == step_run_id)
+                select(StepRunSchema)
+                .where(StepRunSchema.id == step_run_id)
+                .options(*self._get_step_run_loader_options(hydration))
             ).first()
             if step_run is None:
                 raise KeyError(
                     f"Unable to get step run with ID {step_run_id}: No step "
                     "run with this ID found."
                 )
-            return self._run_step_schema_to_model(step_run)
+            return self._run_step_schema_to_model(
+                step_run, hydration=hydration
+            )
 
     def _run_step_schema_to_model(
-        self, step_run: StepRunSchema
+        self,
+        step_run: StepRunSchema,
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> StepRunResponseModel:
         """Converts a run step schema to a step model.
 
         Args:
             step_run: The run step schema to convert.
+            hydration: How much of the step run to hydrate. The parent steps
+                and artifacts are only hydrated on `body` level or above, the
+                artifacts themselves are hydrated one level lower than the
+                step run.
 
         Returns:
             The run step model.
         """
-        with Session(self.engine) as session:
-            # Get parent steps.
-            parent_steps = session.exec(
-                select(StepRunSchema)
-                .where(StepRunParentsSchema.child_id == step_run.id)
-                .where(StepRunParentsSchema.parent_id == StepRunSchema.id)
-            ).all()
-            parent_step_ids = [parent_step.id for parent_step in parent_steps]
+        return self._run_step_schemas_to_models(
+            [step_run], hydration=hydration
+        )[0]
 
-            # Get input artifacts.
-            input_artifact_list = session.exec(
-                select(
-                    ArtifactSchema,
-                    StepRunInputArtifactSchema.name,
-                )
-                .where(
-                    ArtifactSchema.id == StepRunInputArtifactSchema.artifact_id
-                )
-                .where(StepRunInputArtifactSchema.step_id == step_run.id)
-            ).all()
-            input_artifacts = {
-                input_name: self._artifact_schema_to_model(artifact)
-                for (artifact, input_name) in input_artifact_list
-            }
+    def _run_step_schemas_to_models(
+        self,
+        step_runs: List[StepRunSchema],
+        hydration: HydrationLevel = HydrationLevel.FULL,
+    ) -> List[StepRunResponseModel]:
+        """Converts run step schemas to step models.
 
-            # Get output artifacts.
-            output_artifact_list = session.exec(
-                select(
-                    ArtifactSchema,
-                    StepRunOutputArtifactSchema.name,
-                )
-                .where(
-                    ArtifactSchema.id
-                    == StepRunOutputArtifactSchema.artifact_id
-                )
-                .where(StepRunOutputArtifactSchema.step_id == step_run.id)
-            ).all()
-            output_artifacts = {
-                output_name: self._artifact_schema_to_model(artifact)
-                for (artifact, output_name) in output_artifact_list
-            }
+        The parent steps and artifacts of all step runs are loaded with a
+        fixed number of queries instead of separately for each step run.
 
-            # Convert to model.
-            return step_run.to_model(
-                parent_step_ids=parent_step_ids,
-                input_artifacts=input_artifacts,
-                output_artifacts=output_artifacts,
+        Args:
+            step_runs: The run step schemas to convert.
+            hydration: How much of the step runs to hydrate. The parent steps
+                and artifacts are only hydrated on `body` level or above, the
+                artifacts themselves are hydrated one level lower than the
+                step runs.
+
+        Returns:
+            The run step models.
+        """
+        parent_step_ids: Dict[UUID, List[UUID]] = defaultdict(list)
+        input_artifacts: Dict[
+            UUID, Dict[str, ArtifactResponseModel]
+        ] = defaultdict(dict)
+        output_artifacts: Dict[
+            UUID, Dict[str, ArtifactResponseModel]
+        ] = defaultdict(dict)
+
+        if hydration != HydrationLevel.SUMMARY and step_runs:
+            artifact_hydration = (
+                HydrationLevel.FULL
+                if hydration == HydrationLevel.FULL
+                else HydrationLevel.SUMMARY
             )
+            step_run_ids = [step_run.id for step_run in step_runs]
+            with Session(self.engine) as session:
+                # Get parent steps.
+                for parent in session.exec(
+                    select(StepRunParentsSchema).where(
+                        StepRunParentsSchema.child_id.in_(  # type: ignore[attr-defined]
+                            step_run_ids
+                        )
+                    )
+                ):
+                    parent_step_ids[parent.child_id].append(parent.parent_id)
+
+                # Get input and output artifacts.
+                for link_schema, artifacts in [
+                    (StepRunInputArtifactSchema, input_artifacts),
+                    (StepRunOutputArtifactSchema, output_artifacts),
+                ]:
+                    artifact_list = session.exec(
+                        select(
+                            ArtifactSchema,
+                            link_schema.step_id,
+                            link_schema.name,
+                        )
+                        .where(ArtifactSchema.id == link_schema.artifact_id)
+                        .where(
+                            link_schema.step_id.in_(  # type: ignore[attr-defined]
+                                step_run_ids
+                            )
+                        )
+                        .options(
+                            *self._get_artifact_loader_options(
+                                artifact_hydration
+                            )
+                        )
+                    ).all()
+                    for artifact, step_id, name in artifact_list:
+                        artifact_model = self._artifact_schema_to_model(
+                            artifact, hydration=artifact_hydration
+                        )
+                        artifacts[step_id][name] = artifact_model
+
+        # Convert to models.
+        return [
+            step_run.to_model(
+                parent_step_ids=parent_step_ids[step_run.id],
+                input_artifacts=input_artifacts[step_run.id],
+                output_artifacts=output_artifacts[step_run.id],
+                hydration=hydration,
+            )
+            for step_run in step_runs
+        ]
+
+    @staticmethod
+    def _get_step_run_loader_options(hydration: HydrationLevel) -> List[Any]:
+        """Gets the loader options for everything a step run is hydrated with.
+
+        Adding these options to a query that loads multiple step runs loads
+        the related entities of all step runs with one query per
+        relationship instead of lazily for each step run.
+
+        Args:
+            hydration: How much of the step runs will be hydrated.
+
+        Returns:
+            The loader options.
+        """
+        # The deployment is required for the configuration of step runs that
+        # don't store their configuration themselves.
+        options: List[Any] = [
+            selectinload(
+                StepRunSchema.pipeline_run  # type: ignore[arg-type]
+            ).selectinload(
+                PipelineRunSchema.deployment  # type: ignore[arg-type]
+            )
+        ]
+        if hydration != HydrationLevel.SUMMARY:
+            options.append(
+                selectinload(
+                    StepRunSchema.run_metadata  # type: ignore[arg-type]
+                )
+            )
+            options.append(
+                selectinload(StepRunSchema.logs)  # type: ignore[arg-type]
+            )
+        return options
 
     def list_run_steps(
-        self, step_run_filter_model: StepRunFilterModel
+        self,
+        step_run_filter_model: StepRunFilterModel,
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> Page[StepRunResponseModel]:
         """List all step runs matching the given filter criteria.
 
         Args:
             step_run_filter_model: All filter parameters including pagination
                 params.
+            hydration: How much of the step runs to hydrate.
 
         Returns:
             A list of all step runs matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(StepRunSchema)
+            query = select(StepRunSchema).options(
+                *self._get_step_run_loader_options(hydration)
+            )
             return self.filter_and_paginate(
                 session=session,
                 query=query,
                 table=StepRunSchema,
                 filter_model=step_run_filter_model,
-                custom_schema_to_model_conversion=self._run_step_schema_to_model,
+                custom_page_conversion=partial(
+                    self._run_step_schemas_to_models, hydration=hydration
+                ),
             )
 
     def update_run_step(
@@ -3920,38 +4448,84 @@ class SqlZenStore(BaseZenStore):
             return self._artifact_schema_to_model(artifact_schema)
 
     def _artifact_schema_to_model(
-        self, artifact_schema: ArtifactSchema
+        self,
+        artifact_schema: ArtifactSchema,
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> ArtifactResponseModel:
         """Converts an artifact schema to a model.
 
         Args:
             artifact_schema: The artifact schema to convert.
+            hydration: How much of the artifact to hydrate. The producer step
+                run is only looked up on `body` level or above.
 
         Returns:
             The converted artifact model.
         """
+        if hydration == HydrationLevel.SUMMARY:
+            return artifact_schema.to_model(
+                producer_step_run_id=None, hydration=hydration
+            )
+
         # Find the producer step run ID.
-        with Session(self.engine) as session:
-            producer_step_run_id = session.exec(
-                select(StepRunOutputArtifactSchema.step_id)
-                .where(
-                    StepRunOutputArtifactSchema.artifact_id
-                    == artifact_schema.id
-                )
-                .where(StepRunOutputArtifactSchema.step_id == StepRunSchema.id)
-                .where(StepRunSchema.status != ExecutionStatus.CACHED)
-            ).first()
+        producer_step_run_id = next(
+            (
+                output.step_id
+                for output in artifact_schema.output_of_step_runs
+                if output.step_run.status != ExecutionStatus.CACHED
+            ),
+            None,
+        )
+        return artifact_schema.to_model(
+            producer_step_run_id=producer_step_run_id,
+            hydration=hydration,
+        )
 
-            # Convert the artifact schema to a model.
-            return artifact_schema.to_model(
-                producer_step_run_id=producer_step_run_id
+    @staticmethod
+    def _get_artifact_loader_options(hydration: HydrationLevel) -> List[Any]:
+        """Gets the loader options for everything an artifact is hydrated with.
+
+        Adding these options to a query that loads multiple artifacts loads
+        the related entities of all artifacts with one query per relationship
+        instead of lazily for each artifact.
+
+        Args:
+            hydration: How much of the artifacts will be hydrated.
+
+        Returns:
+            The loader options.
+        """
+        if hydration == HydrationLevel.SUMMARY:
+            return []
+
+        options: List[Any] = [
+            selectinload(
+                ArtifactSchema.output_of_step_runs  # type: ignore[arg-type]
+            ).selectinload(
+                StepRunOutputArtifactSchema.step_run  # type: ignore[arg-type]
+            ),
+            selectinload(
+                ArtifactSchema.visualizations  # type: ignore[arg-type]
+            ),
+        ]
+        if hydration == HydrationLevel.FULL:
+            options.append(
+                selectinload(
+                    ArtifactSchema.run_metadata  # type: ignore[arg-type]
+                )
             )
+        return options
 
-    def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
+    def get_artifact(
+        self,
+        artifact_id: UUID,
+        hydration: HydrationLevel = HydrationLevel.FULL,
+    ) -> ArtifactResponseModel:
         """Gets an artifact.
 
         Args:
             artifact_id: The ID of the artifact to get.
+            hydration: How much of the artifact to hydrate.
 
         Returns:
             The artifact.
@@ -3968,22 +4542,285 @@ class SqlZenStore(BaseZenStore):
                     f"Unable to get artifact with ID {artifact_id}: "
                     f"No artifact with this ID found."
                 )
-            return self._artifact_schema_to_model(artifact)
+            return self._artifact_schema_to_model(
+                artifact, hydration=hydration
+            )
+
+    def get_artifact_lineage(
+        self,
+        artifact_id: UUID,
+        direction: LineageDirection = LineageDirection.DOWNSTREAM,
+        max_depth: Optional[int] = None,
+    ) -> ArtifactLineageModel:
+        """Gets the lineage of an artifact across pipeline runs.
+
+        The lineage is computed by a single recursive query over the input
+        and output artifacts of all step runs. On databases that don't
+        support recursive queries (MySQL < 8.0), each level of the lineage is
+        queried separately instead.
+
+        Args:
+            artifact_id: The ID of the artifact.
+            direction: Whether to follow the steps that consumed the artifact
+                (downstream) or the steps that produced it (upstream).
+            max_depth: The maximum number of steps to follow. If not given,
+                the lineage is followed up to `ARTIFACT_LINEAGE_MAX_DEPTH`
+                steps.
+
+        Returns:
+            The lineage of the artifact.
+
+        Raises:
+            KeyError: if the artifact doesn't exist.
+            ValueError: if the maximum depth is smaller than 1.
+        """
+        if max_depth is not None and max_depth < 1:
+            raise ValueError("The maximum lineage depth must be at least 1.")
+        # Artifacts can be linked in a cycle, so the lineage is never
+        # followed indefinitely
+        depth_limit = max_depth or ARTIFACT_LINEAGE_MAX_DEPTH
+
+        if direction == LineageDirection.DOWNSTREAM:
+            # Steps consume lineage artifacts as inputs and continue the
+            # lineage with their outputs.
+            source_link: Any = StepRunInputArtifactSchema
+            target_link: Any = StepRunOutputArtifactSchema
+        else:
+            source_link = StepRunOutputArtifactSchema
+            target_link = StepRunInputArtifactSchema
+
+        with Session(self.engine) as session:
+            if not session.exec(
+                select(ArtifactSchema.id).where(
+                    ArtifactSchema.id == artifact_id
+                )
+            ).first():
+                raise KeyError(
+                    f"Unable to get lineage of artifact with ID {artifact_id}: "
+                    f"No artifact with this ID found."
+                )
+
+            if self._supports_recursive_queries(session):
+                rows = self._query_artifact_lineage(
+                    session, artifact_id, source_link, target_link, depth_limit
+                )
+            else:
+                rows = self._query_artifact_lineage_by_level(
+                    session, artifact_id, source_link, target_link, depth_limit
+                )
+
+        steps: Dict[UUID, ArtifactLineageStepModel] = {}
+        for step_id, pipeline_run_id, lineage_artifact_id, depth in sorted(
+            rows, key=lambda row: row[3]
+        ):
+            step = steps.get(step_id)
+            if not step:
+                step = ArtifactLineageStepModel(
+                    step_run_id=step_id,
+                    pipeline_run_id=pipeline_run_id,
+                    depth=depth,
+                )
+                steps[step_id] = step
+            if lineage_artifact_id and (
+                lineage_artifact_id not in step.artifact_ids
+            ):
+                step.artifact_ids.append(lineage_artifact_id)
+
+        return ArtifactLineageModel(
+            artifact_id=artifact_id,
+            direction=direction,
+            max_depth=max_depth,
+            steps=list(steps.values()),
+        )
+
+    @staticmethod
+    def _supports_recursive_queries(session: Session) -> bool:
+        """Checks whether the database supports recursive queries.
+
+        Args:
+            session: The DB session.
+
+        Returns:
+            Whether the database supports recursive common table expressions.
+        """
+        dialect = session.get_bind().dialect
+        if dialect.name != SQLDatabaseDriver.MYSQL:
+            return True
+        version = dialect.server_version_info or ()
+        if getattr(dialect, "is_mariadb", False):
+            return version >= (10, 2)
+        return version >= (8, 0)
+
+    @staticmethod
+    def _supports_window_functions(session: Session) -> bool:
+        """Checks whether the database supports window functions.
+
+        Window functions were introduced in the same MySQL and MariaDB
+        versions as recursive common table expressions.
+
+        Args:
+            session: The DB session.
+
+        Returns:
+            Whether the database supports window functions.
+        """
+        return SqlZenStore._supports_recursive_queries(session)
+
+    @staticmethod
+    def _query_artifact_lineage(
+        session: Session,
+        artifact_id: UUID,
+        source_link: Any,
+        target_link: Any,
+        max_depth: int,
+    ) -> List[Tuple[UUID, UUID, Optional[UUID], int]]:
+        """Queries the lineage of an artifact using a recursive query.
+
+        The recursion stops at the maximum depth, which guarantees that the
+        query terminates even if artifacts are linked in a cycle. Steps that
+        are reached again at a higher depth are only returned with their
+        minimum depth.
+
+        Args:
+            session: The DB session.
+            artifact_id: The ID of the artifact.
+            source_link: The link schema through which steps are reached
+                from lineage artifacts.
+            target_link: The link schema through which steps continue the
+                lineage.
+            max_depth: The maximum number of steps to follow.
+
+        Returns:
+            Tuples of step run ID, pipeline run ID, the ID of an artifact
+            through which the step continues the lineage and the depth of the
+            step.
+        """
+        lineage = (
+            select(
+                source_link.step_id.label("step_id"),
+                target_link.artifact_id.label("artifact_id"),
+                literal(1).label("depth"),
+            )
+            .select_from(source_link)
+            .outerjoin(target_link, target_link.step_id == source_link.step_id)
+            .where(source_link.artifact_id == artifact_id)
+            .cte("lineage", recursive=True)
+        )
+        next_level = (
+            select(
+                source_link.step_id,
+                target_link.artifact_id,
+                lineage.c.depth + 1,
+            )
+            .select_from(lineage)
+            .join(
+                source_link, source_link.artifact_id == lineage.c.artifact_id
+            )
+            .outerjoin(target_link, target_link.step_id == source_link.step_id)
+            .where(lineage.c.depth < max_depth)
+        )
+        lineage = lineage.union(next_level)
+
+        depth = func.min(lineage.c.depth)
+        return [
+            tuple(row)  # type: ignore[misc]
+            for row in session.execute(
+                select(
+                    lineage.c.step_id,
+                    StepRunSchema.pipeline_run_id,
+                    lineage.c.artifact_id,
+                    depth,
+                )
+                .where(StepRunSchema.id == lineage.c.step_id)
+                .group_by(
+                    lineage.c.step_id,
+                    StepRunSchema.pipeline_run_id,
+                    lineage.c.artifact_id,
+                )
+            )
+        ]
+
+    @staticmethod
+    def _query_artifact_lineage_by_level(
+        session: Session,
+        artifact_id: UUID,
+        source_link: Any,
+        target_link: Any,
+        max_depth: int,
+    ) -> List[Tuple[UUID, UUID, Optional[UUID], int]]:
+        """Queries the lineage of an artifact with one query per level.
+
+        Artifacts are only followed the first time they are reached, so the
+        lineage is traversed at most once even if artifacts are linked in a
+        cycle.
+
+        Args:
+            session: The DB session.
+            artifact_id: The ID of the artifact.
+            source_link: The link schema through which steps are reached
+                from lineage artifacts.
+            target_link: The link schema through which steps continue the
+                lineage.
+            max_depth: The maximum number of steps to follow.
+
+        Returns:
+            Tuples of step run ID, pipeline run ID, the ID of an artifact
+            through which the step continues the lineage and the depth of the
+            step.
+        """
+        rows: List[Tuple[UUID, UUID, Optional[UUID], int]] = []
+        visited_artifact_ids = {artifact_id}
+        artifact_ids = [artifact_id]
+        depth = 1
+        while artifact_ids and depth <= max_depth:
+            level = session.exec(
+                select(
+                    source_link.step_id,
+                    StepRunSchema.pipeline_run_id,
+                    target_link.artifact_id,
+                )
+                .select_from(source_link)
+                .join(StepRunSchema, StepRunSchema.id == source_link.step_id)
+                .outerjoin(
+                    target_link, target_link.step_id == source_link.step_id
+                )
+                .where(source_link.artifact_id.in_(artifact_ids))
+            ).all()
+            rows.extend(
+                (step_id, pipeline_run_id, lineage_artifact_id, depth)
+                for step_id, pipeline_run_id, lineage_artifact_id in level
+            )
+            artifact_ids = list(
+                {
+                    lineage_artifact_id: None
+                    for _, _, lineage_artifact_id in level
+                    if lineage_artifact_id
+                    and lineage_artifact_id not in visited_artifact_ids
+                }
+            )
+            visited_artifact_ids.update(artifact_ids)
+            depth += 1
+        return rows
 
     def list_artifacts(
-        self, artifact_filter_model: ArtifactFilterModel
+        self,
+        artifact_filter_model: ArtifactFilterModel,
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> Page[ArtifactResponseModel]:
         """List all artifacts matching the given filter criteria.
 
         Args:
             artifact_filter_model: All filter parameters including pagination
                 params.
+            hydration: How much of the artifacts to hydrate.
 
         Returns:
             A list of all artifacts matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(ArtifactSchema)
+            query = select(ArtifactSchema).options(
+                *self._get_artifact_loader_options(hydration)
+            )
             if artifact_filter_model.only_unused:
                 query = query.where(
                     ArtifactSchema.id.notin_(  # type: ignore[attr-defined]
@@ -4000,7 +4837,9 @@ class SqlZenStore(BaseZenStore):
                 query=query,
                 table=ArtifactSchema,
                 filter_model=artifact_filter_model,
-                custom_schema_to_model_conversion=self._artifact_schema_to_model,
+                custom_schema_to_model_conversion=partial(
+                    self._artifact_schema_to_model, hydration=hydration
+                ),
             )
 
     def delete_artifact(self, artifact_id: UUID) -> None:
@@ -4067,6 +4906,168 @@ class SqlZenStore(BaseZenStore):
                 filter_model=run_metadata_filter_model,
             )
 
+    def get_run_metadata_leaderboard(
+        self,
+        leaderboard_filter_model: RunMetadataLeaderboardFilterModel,
+    ) -> RunMetadataLeaderboardModel:
+        """Gets the best pipeline runs according to a numeric metadata key.
+
+        Only metadata of pipeline runs and step runs is taken into account.
+        If multiple matching values exist for a pipeline run, only the most
+        recently created one is ranked.
+
+        Args:
+            leaderboard_filter_model: The metadata key to rank by and filters
+                for the pipeline runs to include.
+
+        Returns:
+            The best runs and aggregated statistics of the values of all
+            matching runs.
+        """
+        filter_ = leaderboard_filter_model
+        run_id = func.coalesce(
+            RunMetadataSchema.pipeline_run_id, StepRunSchema.pipeline_run_id
+        )
+        columns = [
+            RunMetadataSchema.id.label("metadata_id"),
+            PipelineRunSchema.id.label("pipeline_run_id"),
+            PipelineRunSchema.name.label("pipeline_run_name"),
+            RunMetadataSchema.step_run_id.label("step_run_id"),
+            RunMetadataSchema.numeric_value.label("value"),
+            RunMetadataSchema.created.label("created"),
+        ]
+
+        with Session(self.engine) as session:
+            if self._supports_window_functions(session):
+                values = self._filter_leaderboard_values(
+                    select(
+                        *columns,
+                        func.row_number()
+                        .over(
+                            partition_by=PipelineRunSchema.id,
+                            order_by=(
+                                desc(RunMetadataSchema.created),
+                                desc(RunMetadataSchema.id),
+                            ),
+                        )
+                        .label("recency"),
+                    ),
+                    run_id=run_id,
+                    filter_=filter_,
+                ).subquery()
+                latest_value = values.c.recency == 1
+            else:
+                # Without window functions, a value is the latest one of its
+                # run if no other value of the same run was created after it
+                values = self._filter_leaderboard_values(
+                    select(*columns), run_id=run_id, filter_=filter_
+                ).subquery()
+                later = self._filter_leaderboard_values(
+                    select(*columns), run_id=run_id, filter_=filter_
+                ).subquery()
+                latest_value = ~exists().where(
+                    later.c.pipeline_run_id == values.c.pipeline_run_id,
+                    or_(
+                        later.c.created > values.c.created,
+                        and_(
+                            later.c.created == values.c.created,
+                            later.c.metadata_id > values.c.metadata_id,
+                        ),
+                    ),
+                )
+            order = asc if filter_.ascending else desc
+
+            count, min_, max_, mean = session.execute(
+                select(
+                    func.count(values.c.metadata_id),
+                    func.min(values.c.value),
+                    func.max(values.c.value),
+                    func.avg(values.c.value),
+                ).where(latest_value)
+            ).one()
+
+            rows = session.execute(
+                select(
+                    values.c.metadata_id,
+                    values.c.pipeline_run_id,
+                    values.c.pipeline_run_name,
+                    values.c.step_run_id,
+                    values.c.value,
+                    values.c.created,
+                )
+                .where(latest_value)
+                .order_by(order(values.c.value), desc(values.c.created))
+                .limit(filter_.size)
+            ).all()
+
+        return RunMetadataLeaderboardModel(
+            key=filter_.key,
+            count=count,
+            min=min_,
+            max=max_,
+            mean=mean,
+            entries=[
+                RunMetadataLeaderboardEntryModel(
+                    metadata_id=metadata_id,
+                    pipeline_run_id=pipeline_run_id,
+                    pipeline_run_name=pipeline_run_name,
+                    step_run_id=step_run_id,
+                    value=value,
+                    created=created,
+                )
+                for (
+                    metadata_id,
+                    pipeline_run_id,
+                    pipeline_run_name,
+                    step_run_id,
+                    value,
+                    created,
+                ) in rows
+            ],
+        )
+
+    @staticmethod
+    def _filter_leaderboard_values(
+        query: Select[Any],
+        run_id: Any,
+        filter_: RunMetadataLeaderboardFilterModel,
+    ) -> Select[Any]:
+        """Selects the metadata values that are ranked in a leaderboard.
+
+        Args:
+            query: The query selecting the columns of the values.
+            run_id: Expression for the pipeline run ID of a metadata value.
+            filter_: The leaderboard filter.
+
+        Returns:
+            The query selecting the matching values.
+        """
+        query = (
+            query.select_from(RunMetadataSchema)
+            .outerjoin(
+                StepRunSchema,
+                StepRunSchema.id == RunMetadataSchema.step_run_id,
+            )
+            .join(PipelineRunSchema, PipelineRunSchema.id == run_id)
+            .where(RunMetadataSchema.key == filter_.key)
+            .where(RunMetadataSchema.numeric_value != None)  # noqa: E711
+        )
+        if filter_.workspace_id:
+            query = query.where(
+                RunMetadataSchema.workspace_id == filter_.workspace_id
+            )
+        if filter_.pipeline_id:
+            query = query.where(
+                PipelineRunSchema.pipeline_id == filter_.pipeline_id
+            )
+        if filter_.start_time:
+            query = query.where(
+                RunMetadataSchema.created >= filter_.start_time
+            )
+        if filter_.end_time:
+            query = query.where(RunMetadataSchema.created <= filter_.end_time)
+        return query
+
     # -----------------
     # Code Repositories
     # -----------------
@@ -5163,6 +6164,7 @@ class SqlZenStore(BaseZenStore):
         schema_class: Type[AnyNamedSchema],
         schema_name: str,
         session: Session,
+        options: Sequence[Any] = (),
     ) -> AnyNamedSchema:
         """Query a schema by its 'name' or 'id' field.
 
@@ -5172,6 +6174,7 @@ class SqlZenStore(BaseZenStore):
             schema_name: The name of the schema used for error messages.
                 E.g., "workspace".
             session: The database session to use.
+            options: Loader options to add to the query.
 
         Returns:
             The schema object.
@@ -5200,7 +6203,7 @@ class SqlZenStore(BaseZenStore):
             )
 
         schema = session.exec(
-            select(schema_class).where(filter_params)
+            select(schema_class).where(filter_params).options(*options)
         ).first()
 
         if schema is None:
@@ -5307,6 +6310,7 @@ class SqlZenStore(BaseZenStore):
         self,
         run_name_or_id: Union[str, UUID],
         session: Session,
+        hydration: Optional[HydrationLevel] = None,
     ) -> PipelineRunSchema:
         """Gets a run schema by name or ID.
 
@@ -5316,6 +6320,8 @@ class SqlZenStore(BaseZenStore):
         Args:
             run_name_or_id: The name or ID of the run to get.
             session: The database session to use.
+            hydration: If set, everything the run is hydrated with on this
+                level is loaded together with the run.
 
         Returns:
             The run schema.
@@ -5325,6 +6331,9 @@ class SqlZenStore(BaseZenStore):
             schema_class=PipelineRunSchema,
             schema_name="run",
             session=session,
+            options=self._get_run_loader_options(hydration)
+            if hydration
+            else (),
         )
 
     def _create_or_reuse_code_reference(
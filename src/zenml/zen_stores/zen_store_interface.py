@@ -13,11 +13,15 @@
 #  permissions and limitations under the License.
 """ZenML Store interface."""
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import List, Optional, Tuple, Union
 from uuid import UUID
 
+from zenml.enums import HydrationLevel, LineageDirection
+from zenml.lineage_graph.lineage_graph import LineageGraph
 from zenml.models import (
     ArtifactFilterModel,
+    ArtifactLineageModel,
     ArtifactRequestModel,
     ArtifactResponseModel,
     CodeRepositoryFilterModel,
@@ -88,7 +92,11 @@ from zenml.models import (
     WorkspaceUpdateModel,
 )
 from zenml.models.page_model import Page
-from zenml.models.run_metadata_models import RunMetadataFilterModel
+from zenml.models.run_metadata_models import (
+    RunMetadataFilterModel,
+    RunMetadataLeaderboardFilterModel,
+    RunMetadataLeaderboardModel,
+)
 from zenml.models.schedule_model import (
     ScheduleFilterModel,
     ScheduleUpdateModel,
@@ -990,6 +998,23 @@ class ZenStoreInterface(ABC):
             EntityExistsError: If an identical deployment already exists.
         """
 
+    @abstractmethod
+    def create_deployments(
+        self,
+        deployments: List[PipelineDeploymentRequestModel],
+    ) -> List[PipelineDeploymentResponseModel]:
+        """Creates multiple deployments at once.
+
+        Args:
+            deployments: The deployments to create.
+
+        Returns:
+            The newly created deployments, in the same order as the requests.
+
+        Raises:
+            KeyError: If a workspace does not exist.
+        """
+
     @abstractmethod
     def get_deployment(
         self, deployment_id: UUID
@@ -1129,12 +1154,15 @@ class ZenStoreInterface(ABC):
 
     @abstractmethod
     def get_run(
-        self, run_name_or_id: Union[str, UUID]
+        self,
+        run_name_or_id: Union[str, UUID],
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> PipelineRunResponseModel:
         """Gets a pipeline run.
 
         Args:
             run_name_or_id: The name or ID of the pipeline run to get.
+            hydration: How much of the pipeline run to hydrate.
 
         Returns:
             The pipeline run.
@@ -1143,6 +1171,27 @@ class ZenStoreInterface(ABC):
             KeyError: if the pipeline run doesn't exist.
         """
 
+    @abstractmethod
+    def get_run_lineage_graph(
+        self,
+        run_name_or_id: Union[str, UUID],
+        since: Optional[datetime] = None,
+    ) -> LineageGraph:
+        """Gets the lineage graph of a pipeline run.
+
+        Args:
+            run_name_or_id: The name or ID of the pipeline run.
+            since: Only include the steps that were updated after this time
+                or have metadata or output artifacts that were created after
+                this time. The run metadata is always included.
+
+        Returns:
+            The lineage graph of the pipeline run.
+
+        Raises:
+            KeyError: if the pipeline run doesn't exist.
+        """
+
     @abstractmethod
     def get_or_create_run(
         self, pipeline_run: PipelineRunRequestModel
@@ -1162,13 +1211,16 @@ class ZenStoreInterface(ABC):
 
     @abstractmethod
     def list_runs(
-        self, runs_filter_model: PipelineRunFilterModel
+        self,
+        runs_filter_model: PipelineRunFilterModel,
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> Page[PipelineRunResponseModel]:
         """List all pipeline runs matching the given filter criteria.
 
         Args:
             runs_filter_model: All filter parameters including pagination
                 params.
+            hydration: How much of the pipeline runs to hydrate.
 
         Returns:
             A list of all pipeline runs matching the filter criteria.
@@ -1224,11 +1276,16 @@ class ZenStoreInterface(ABC):
         """
 
     @abstractmethod
-    def get_run_step(self, step_run_id: UUID) -> StepRunResponseModel:
+    def get_run_step(
+        self,
+        step_run_id: UUID,
+        hydration: HydrationLevel = HydrationLevel.FULL,
+    ) -> StepRunResponseModel:
         """Get a step run by ID.
 
         Args:
             step_run_id: The ID of the step run to get.
+            hydration: How much of the step run to hydrate.
 
         Returns:
             The step run.
@@ -1239,13 +1296,16 @@ class ZenStoreInterface(ABC):
 
     @abstractmethod
     def list_run_steps(
-        self, step_run_filter_model: StepRunFilterModel
+        self,
+        step_run_filter_model: StepRunFilterModel,
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> Page[StepRunResponseModel]:
         """List all step runs matching the given filter criteria.
 
         Args:
             step_run_filter_model: All filter parameters including pagination
                 params.
+            hydration: How much of the step runs to hydrate.
 
         Returns:
             A list of all step runs matching the filter criteria.
@@ -1288,11 +1348,16 @@ class ZenStoreInterface(ABC):
         """
 
     @abstractmethod
-    def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
+    def get_artifact(
+        self,
+        artifact_id: UUID,
+        hydration: HydrationLevel = HydrationLevel.FULL,
+    ) -> ArtifactResponseModel:
         """Gets an artifact.
 
         Args:
             artifact_id: The ID of the artifact to get.
+            hydration: How much of the artifact to hydrate.
 
         Returns:
             The artifact.
@@ -1301,15 +1366,42 @@ class ZenStoreInterface(ABC):
             KeyError: if the artifact doesn't exist.
         """
 
+    @abstractmethod
+    def get_artifact_lineage(
+        self,
+        artifact_id: UUID,
+        direction: LineageDirection = LineageDirection.DOWNSTREAM,
+        max_depth: Optional[int] = None,
+    ) -> ArtifactLineageModel:
+        """Gets the lineage of an artifact across pipeline runs.
+
+        Args:
+            artifact_id: The ID of the artifact.
+            direction: Whether to follow the steps that consumed the artifact
+                (downstream) or the steps that produced it (upstream).
+            max_depth: The maximum number of steps to follow. If not given,
+                the lineage is followed up to `ARTIFACT_LINEAGE_MAX_DEPTH`
+                steps.
+
+        Returns:
+            The lineage of the artifact.
+
+        Raises:
+            KeyError: if the artifact doesn't exist.
+        """
+
     @abstractmethod
     def list_artifacts(
-        self, artifact_filter_model: ArtifactFilterModel
+        self,
+        artifact_filter_model: ArtifactFilterModel,
+        hydration: HydrationLevel = HydrationLevel.FULL,
     ) -> Page[ArtifactResponseModel]:
         """List all artifacts matching the given filter criteria.
 
         Args:
             artifact_filter_model: All filter parameters including pagination
                 params.
+            hydration: How much of the artifacts to hydrate.
 
         Returns:
             A list of all artifacts matching the filter criteria.
@@ -1358,6 +1450,25 @@ class ZenStoreInterface(ABC):
             The run metadata.
         """
 
+    @abstractmethod
+    def get_run_metadata_leaderboard(
+        self,
+        leaderboard_filter_model: RunMetadataLeaderboardFilterModel,
+    ) -> RunMetadataLeaderboardModel:
+        """Gets the best pipeline runs according to a numeric metadata key.
+
+        Each pipeline run is ranked by its most recently created value for the
+        metadata key.
+
+        Args:
+            leaderboard_filter_model: The metadata key to rank by and filters
+                for the pipeline runs to include.
+
+        Returns:
+            The best runs and aggregated statistics of the values of all
+            matching runs.
+        """
+
     # -----------------
     # Code Repositories
     # -----------------
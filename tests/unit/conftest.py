@@ -48,6 +48,7 @@ from zenml.models.artifact_models import ArtifactRequestModel
 from zenml.models.hub_plugin_models import HubPluginResponseModel, PluginStatus
 from zenml.models.pipeline_run_models import PipelineRunRequestModel
 from zenml.models.step_run_models import StepRunRequestModel
+from zenml.new.pipelines.compile_cache import PipelineCompileCache
 from zenml.new.pipelines.pipeline import Pipeline
 from zenml.orchestrators.base_orchestrator import BaseOrchestratorConfig
 from zenml.orchestrators.local.local_orchestrator import LocalOrchestrator
@@ -79,6 +80,19 @@ def module_auto_clean_workspace(
         yield client
 
 
+@pytest.fixture(autouse=True)
+def empty_compile_cache() -> Generator[None, None, None]:
+    """Fixture to empty the pipeline compile cache before and after each
+    test, so that compiled or registered pipelines don't leak between tests.
+
+    Yields:
+        Nothing.
+    """
+    PipelineCompileCache().clear()
+    yield
+    PipelineCompileCache().clear()
+
+
 @pytest.fixture
 def local_stack():
     """Returns a local stack with local orchestrator and artifact store."""
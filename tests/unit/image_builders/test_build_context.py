@@ -79,3 +79,39 @@ def test_build_context_includes_and_excludes(tmp_path):
         ".zen",
         os.path.join(".zen", "config.yaml"),
     }
+
+
+def test_build_context_checksum(tmp_path, mocker):
+    """Tests that the build context checksum covers file contents and only
+    rehashes files that changed."""
+    mocker.patch(
+        "zenml.utils.io_utils.get_global_config_directory",
+        return_value=str(tmp_path / "config"),
+    )
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "1").write_text("file 1")
+    (root / "ignored").write_text("ignored file")
+    (root / ".dockerignore").write_text("/ignored")
+
+    build_context = BuildContext(root=str(root))
+    checksum = build_context.compute_checksum()
+    assert build_context.compute_checksum() == checksum
+
+    # Ignored files don't influence the checksum
+    (root / "ignored").write_text("changed ignored file")
+    assert build_context.compute_checksum() == checksum
+
+    # Unchanged files are not read again
+    mock_hash = mocker.spy(BuildContext, "_compute_file_hash")
+    assert build_context.compute_checksum() == checksum
+    mock_hash.assert_not_called()
+
+    (root / "1").write_text("changed file 1")
+    assert build_context.compute_checksum() != checksum
+    mock_hash.assert_called_once_with(str(root / "1"))
+
+    (root / "2").write_text("file 2")
+    new_checksum = build_context.compute_checksum()
+    build_context.add_file("extra file", destination="extra")
+    assert build_context.compute_checksum() != new_checksum
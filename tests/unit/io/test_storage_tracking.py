@@ -0,0 +1,103 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+
+from zenml.io import fileio, storage_tracking
+
+
+def test_tracking_writes_through_fileio(tmp_path):
+    """Tests that bytes written through fileio inside the root are tracked."""
+    root = tmp_path / "artifact"
+    fileio.makedirs(str(root))
+
+    with storage_tracking.track_storage_size(str(root)) as tracker:
+        with fileio.open(str(root / "data.txt"), "w") as f:
+            f.write("aria")
+        with fileio.open(str(root / "data.bin"), "wb") as f:
+            f.write(b"\x00" * 10)
+            f.seek(0)
+            f.write(b"\x01" * 5)
+        with fileio.open(str(root / "data.txt"), "r") as f:
+            assert f.read() == "aria"
+        with fileio.open(str(tmp_path / "outside.txt"), "w") as f:
+            f.write("not tracked")
+
+    assert tracker.storage_size == 14
+    assert tracker.storage_size == fileio.size(str(root))
+    assert not storage_tracking.is_tracked(str(root / "data.txt"))
+
+
+def test_tracking_copies(tmp_path):
+    """Tests that copied files are tracked."""
+    source = tmp_path / "source.txt"
+    source.write_text("axl")
+    root = tmp_path / "artifact"
+    fileio.makedirs(str(root))
+
+    with storage_tracking.track_storage_size(str(root)) as tracker:
+        fileio.copy(str(source), str(root / "copy.txt"))
+
+    assert tracker.storage_size == 3
+
+
+def test_storage_size_is_unknown_without_complete_tracking(tmp_path):
+    """Tests that the storage size is unknown if writes were untracked."""
+    root = str(tmp_path)
+    with storage_tracking.track_storage_size(root) as tracker:
+        pass
+    assert tracker.storage_size is None
+
+    with storage_tracking.track_storage_size(root) as tracker:
+        storage_tracking.record_bytes_written(os.path.join(root, "a"), 3)
+        storage_tracking.record_unknown_write(os.path.join(root, "b"))
+    assert tracker.bytes_written == 3
+    assert tracker.storage_size is None
+
+
+def test_recording_local_directories(tmp_path):
+    """Tests recording files that were written to a local directory."""
+    root = tmp_path / "artifact"
+    (root / "nested").mkdir(parents=True)
+    (root / "a.txt").write_text("aria")
+    (root / "nested" / "b.txt").write_text("axl")
+
+    storage_tracking.record_local_directory(str(root))
+
+    with storage_tracking.track_storage_size(str(root)) as tracker:
+        storage_tracking.record_local_directory(str(root))
+
+    assert tracker.storage_size == 7
+
+
+def test_storage_size_requires_all_files_to_be_tracked(tmp_path):
+    """Tests that the tracked size is only used if no files of the directory
+    were written without fileio."""
+    root = tmp_path / "artifact"
+    fileio.makedirs(str(root))
+
+    with storage_tracking.track_storage_size(str(root)) as tracker:
+        with fileio.open(str(root / "metadata.json"), "w") as f:
+            f.write("{}")
+        with fileio.open(str(root / "metadata.json"), "w") as f:
+            f.write("{}")
+    assert tracker.storage_size == 2
+    assert tracker.get_storage_size() == 2
+
+    with storage_tracking.track_storage_size(str(root)) as tracker:
+        with fileio.open(str(root / "metadata.json"), "w") as f:
+            f.write("{}")
+        # Written by a native library
+        (root / "data.parquet").write_bytes(b"\x00" * 100)
+    assert tracker.storage_size == 2
+    assert tracker.get_storage_size() is None
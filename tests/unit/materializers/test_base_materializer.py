@@ -12,12 +12,16 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import gc
+import os
 from contextlib import ExitStack as does_not_raise
 
 import pytest
 
 from zenml.enums import ArtifactType
 from zenml.exceptions import MaterializerInterfaceError
+from zenml.io import fileio, storage_tracking
+from zenml.materializers import base_materializer
 from zenml.materializers.base_materializer import BaseMaterializer
 
 
@@ -60,3 +64,109 @@ def test_validate_type_compatibility():
 
     with pytest.raises(TypeError):
         materializer.validate_type_compatibility(data_type=str)
+
+
+def _write_file(directory: str) -> None:
+    """Writes a test file into a directory."""
+    with open(os.path.join(directory, "data.txt"), "w") as f:
+        f.write("aria")
+
+
+def _read_file(directory: str) -> str:
+    """Reads the test file from a directory."""
+    with open(os.path.join(directory, "data.txt")) as f:
+        return f.read()
+
+
+class _LazyData:
+    """Data that keeps reading from the directory it was loaded from."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+
+def test_local_directories_are_used_directly(tmp_path):
+    """Tests that local artifact directories are used without copies."""
+    materializer = TestMaterializer(uri=str(tmp_path))
+    directories = []
+
+    def _save(directory: str) -> None:
+        directories.append(directory)
+        _write_file(directory)
+
+    materializer.save_to_local_directory(str(tmp_path), _save)
+    assert directories == [str(tmp_path)]
+
+    data = materializer.load_from_local_directory(str(tmp_path), _LazyData)
+    assert data.directory == str(tmp_path)
+
+
+def test_remote_directories_use_temporary_directories(tmp_path, mocker):
+    """Tests that remote artifact directories get transferred and cleaned."""
+    mocker.patch.object(
+        base_materializer, "_is_local_path", return_value=False
+    )
+    uri = os.path.join(str(tmp_path), "artifact")
+    materializer = TestMaterializer(uri=uri)
+    directories = []
+
+    def _save(directory: str) -> None:
+        directories.append(directory)
+        _write_file(directory)
+
+    materializer.save_to_local_directory(uri, _save)
+    assert directories[0] != uri
+    assert not os.path.exists(directories[0])
+    assert _read_file(uri) == "aria"
+
+    # Eagerly loaded data doesn't need the temporary directory
+    data = materializer.load_from_local_directory(uri, _LazyData)
+    assert data.directory != uri
+    assert not os.path.exists(data.directory)
+
+    # Lazily loaded data keeps the directory until it is garbage collected
+    data = materializer.load_from_local_directory(uri, _LazyData, lazy=True)
+    directory = data.directory
+    assert _read_file(directory) == "aria"
+    del data
+    gc.collect()
+    assert not os.path.exists(directory)
+
+    # Temporary directories are removed if loading fails
+    def _fail(directory: str) -> None:
+        directories.append(directory)
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        materializer.load_from_local_directory(uri, _fail)
+    assert not os.path.exists(directories[-1])
+
+
+def test_directory_saves_are_tracked(tmp_path, mocker):
+    """Tests that the size of saved directories is tracked."""
+    for is_local in [True, False]:
+        mocker.patch.object(
+            base_materializer, "_is_local_path", return_value=is_local
+        )
+        uri = os.path.join(str(tmp_path), f"artifact_{is_local}")
+        os.makedirs(uri)
+        materializer = TestMaterializer(uri=uri)
+
+        with storage_tracking.track_storage_size(uri) as tracker:
+            materializer.save_to_local_directory(uri, _write_file)
+
+        assert tracker.storage_size == len("aria")
+
+
+def test_base_metadata_uses_tracked_storage_size(mocker):
+    """Tests that a tracked storage size avoids walking the directory."""
+    mock_size = mocker.patch.object(fileio, "size", return_value=3)
+    materializer = TestMaterializer(uri="/tmp/artifact")
+
+    metadata = materializer._extract_base_metadata(None, storage_size=7)
+    assert metadata["storage_size"] == 7
+    mock_size.assert_not_called()
+
+    metadata = materializer._extract_base_metadata(None)
+    assert metadata["storage_size"] == 3
+    mock_size.assert_called_once_with("/tmp/artifact")
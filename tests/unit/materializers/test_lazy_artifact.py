@@ -0,0 +1,74 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import pickle
+
+import numpy as np
+
+from zenml.materializers.lazy_artifact import LazyArtifact, is_loaded, unwrap
+
+
+def _create_lazy_artifact(sample_artifact_model, value):
+    """Creates a lazy artifact and a list that records all loads."""
+    loads = []
+
+    def _load():
+        loads.append(value)
+        return value
+
+    return LazyArtifact(sample_artifact_model, _load), loads
+
+
+def test_lazy_artifacts_load_on_first_access(sample_artifact_model):
+    """Tests that lazy artifacts only load their data once it is used."""
+    artifact, loads = _create_lazy_artifact(sample_artifact_model, [1, 2])
+
+    assert not is_loaded(artifact)
+    assert "not loaded" in repr(artifact)
+    assert not loads
+
+    assert len(artifact) == 2
+    assert artifact[0] == 1
+    assert artifact + [3] == [1, 2, 3]
+    assert [0] + artifact == [0, 1, 2]
+    artifact.append(3)
+    assert list(artifact) == [1, 2, 3]
+    assert isinstance(artifact, list)
+    assert is_loaded(artifact)
+    assert len(loads) == 1
+
+
+def test_lazy_artifact_operators(sample_artifact_model):
+    """Tests that operators are applied to the artifact data."""
+    artifact, _ = _create_lazy_artifact(sample_artifact_model, 2)
+    assert artifact + 1.5 == 3.5
+    assert 1.5 + artifact == 3.5
+    assert artifact * 3 == 6
+    assert -artifact == -2
+    assert artifact > 1
+    assert float(artifact) == 2.0
+    assert f"{artifact:03d}" == "002"
+    assert hash(artifact) == hash(2)
+
+    array, _ = _create_lazy_artifact(sample_artifact_model, np.arange(3))
+    assert array.shape == (3,)
+    assert np.array_equal(array * 2, np.array([0, 2, 4]))
+
+
+def test_unwrapping_and_pickling_lazy_artifacts(sample_artifact_model):
+    """Tests that lazy artifacts can be unwrapped and pickled."""
+    artifact, _ = _create_lazy_artifact(sample_artifact_model, {"a": 1})
+    assert type(unwrap(artifact)) is dict
+    assert unwrap("not_lazy") == "not_lazy"
+    assert is_loaded("not_lazy")
+    assert pickle.loads(pickle.dumps(artifact)) == {"a": 1}
@@ -13,6 +13,8 @@
 #  permissions and limitations under the License.
 from contextlib import ExitStack as does_not_raise
 
+import pytest
+
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.steps import step
 
@@ -105,3 +107,40 @@ def test_materializer_with_conflicting_parameter_and_explicit_materializer():
 
     with does_not_raise():
         some_step().configure(output_materializers=MyFirstMaterializer)()
+
+
+def test_materializer_registry_activates_integrations_on_first_use(mocker):
+    """Tests that integrations are only activated once a materializer is
+    looked up in the registry."""
+    from zenml.materializers.materializer_registry import MaterializerRegistry
+
+    mock_activate = mocker.patch(
+        "zenml.integrations.registry.integration_registry.activate_integrations"
+    )
+    registry = MaterializerRegistry()
+    registry.register_materializer_type(MyFirstType, MyFirstMaterializer)
+    mock_activate.assert_not_called()
+
+    assert registry[MyFirstType] is MyFirstMaterializer
+    assert registry.is_registered(MyFirstType)
+    mock_activate.assert_called_once()
+
+
+def test_materializer_registry_retries_failed_integration_activation(mocker):
+    """Tests that a failed integration activation is retried on the next
+    lookup."""
+    from zenml.materializers.materializer_registry import MaterializerRegistry
+
+    mock_activate = mocker.patch(
+        "zenml.integrations.registry.integration_registry.activate_integrations",
+        side_effect=[RuntimeError, None],
+    )
+    registry = MaterializerRegistry()
+    registry.register_materializer_type(MyFirstType, MyFirstMaterializer)
+
+    with pytest.raises(RuntimeError):
+        registry[MyFirstType]
+
+    assert registry[MyFirstType] is MyFirstMaterializer
+    assert registry[MyFirstType] is MyFirstMaterializer
+    assert mock_activate.call_count == 2
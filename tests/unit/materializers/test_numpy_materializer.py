@@ -15,10 +15,12 @@
 import numpy as np
 
 from tests.unit.test_general import _test_materializer
+from zenml.constants import ENV_ZENML_ARTIFACT_STATISTICS_MAX_ROWS
 from zenml.materializers.numpy_materializer import NumpyMaterializer
 from zenml.metadata.metadata_types import (
     DType,
 )
+from zenml.utils import statistics_utils
 
 
 def test_numpy_materializer():
@@ -84,3 +86,22 @@ def test_numpy_materializer():
     assert text_metadata["total_words"] == 7
     assert text_metadata["most_common_word"] == "world"
     assert text_metadata["most_common_count"] == 2
+
+
+def test_numpy_materializer_samples_large_arrays(tmp_path, monkeypatch):
+    """Test that statistics of large arrays are computed on a sample."""
+    monkeypatch.setenv(ENV_ZENML_ARTIFACT_STATISTICS_MAX_ROWS, "10")
+    materializer = NumpyMaterializer(str(tmp_path))
+
+    numeric_metadata = materializer.extract_metadata(np.ones((100, 3)))
+    assert numeric_metadata["shape"] == (100, 3)
+    assert numeric_metadata["mean"] == 1.0
+    assert numeric_metadata[statistics_utils.SAMPLE_SIZE_METADATA_KEY] == 10
+
+    text_metadata = materializer.extract_metadata(
+        np.array([["hello world", "zenml"]] * 100)
+    )
+    assert text_metadata["shape"] == (100, 2)
+    assert text_metadata["total_words"] == 30
+    assert text_metadata["unique_words"] == 3
+    assert text_metadata[statistics_utils.SAMPLE_SIZE_METADATA_KEY] == 10
@@ -17,7 +17,9 @@ import datetime
 import pandas
 
 from tests.unit.test_general import _test_materializer
+from zenml.constants import ENV_ZENML_ARTIFACT_STATISTICS_MAX_ROWS
 from zenml.materializers.pandas_materializer import PandasMaterializer
+from zenml.utils import statistics_utils
 
 
 def test_pandas_materializer():
@@ -100,3 +102,16 @@ def test_pandas_materializer_with_index():
         assert_visualization_exists=True,
     )
     assert df_datetime_indexed.equals(result)
+
+
+def test_pandas_materializer_samples_large_dataframes(tmp_path, monkeypatch):
+    """Test that statistics of large dataframes are computed on a sample."""
+    monkeypatch.setenv(ENV_ZENML_ARTIFACT_STATISTICS_MAX_ROWS, "100")
+    df = pandas.DataFrame({"A": range(1000), "B": ["b"] * 1000})
+
+    metadata = PandasMaterializer(str(tmp_path)).extract_metadata(df)
+
+    assert metadata["shape"] == (1000, 2)
+    assert metadata[statistics_utils.SAMPLE_SIZE_METADATA_KEY] == 100
+    assert set(metadata["mean"]) == {"A"}
+    assert 0 <= metadata["min"]["A"] <= metadata["max"]["A"] <= 999
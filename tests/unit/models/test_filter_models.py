@@ -37,6 +37,7 @@ class SomeFilterModel(BaseFilterModel):
     uuid_field: Optional[Union[UUID, str]]
     datetime_field: Optional[Union[datetime, str]]
     int_field: Optional[Union[int, str]]
+    float_field: Optional[Union[float, str]]
     str_field: Optional[str]
 
 
@@ -203,6 +204,15 @@ def test_int_filter_model():
     )
 
 
+def test_float_filter_model():
+    """Test Filter model creation for float fields."""
+    _test_filter_model(
+        filter_field="float_field",
+        filter_class=NumericFilter,
+        filter_value=0.25,
+    )
+
+
 def test_uuid_filter_model():
     """Test Filter model creation for UUID fields."""
     filter_value = uuid.uuid4()
@@ -11,9 +11,16 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+from uuid import uuid4
+
+import pytest
 
 from zenml.enums import StackComponentType
 from zenml.orchestrators import LocalDockerOrchestratorFlavor
+from zenml.orchestrators.local_docker.local_docker_orchestrator import (
+    _StepWorkerContainer,
+)
+from zenml.orchestrators.step_worker import StepWorkerDiedError, StepWorkerTask
 
 
 def test_local_docker_orchestrator_flavor_attributes():
@@ -23,3 +30,28 @@ def test_local_docker_orchestrator_flavor_attributes():
     flavor = LocalDockerOrchestratorFlavor()
     assert flavor.type == StackComponentType.ORCHESTRATOR
     assert flavor.name == "local_docker"
+
+
+def test_step_worker_container_reports_exit_code_of_dead_worker(mocker):
+    """Tests that a worker container that died while running a step is
+    removed and reported with its exit code."""
+    container = mocker.MagicMock(short_id="abc")
+    container.logs.return_value = []
+    container.wait.return_value = {"StatusCode": 137}
+    mocker.patch(
+        "zenml.orchestrators.local_docker.local_docker_orchestrator."
+        "run_step_in_worker",
+        side_effect=StepWorkerDiedError,
+    )
+    connection = mocker.MagicMock()
+    worker = _StepWorkerContainer(container=container, auth_key="key")
+    mocker.patch.object(worker, "_connect", return_value=connection)
+
+    task = StepWorkerTask(
+        deployment_id=uuid4(), step_name="step", orchestrator_run_id="run"
+    )
+    with pytest.raises(RuntimeError, match="code 137 .*`step`"):
+        worker.run_step(task)
+
+    connection.close.assert_called_once()
+    container.remove.assert_called_once_with(force=True)
@@ -22,6 +22,7 @@ from zenml.orchestrators.step_launcher import (
     _get_step_operator,
 )
 from zenml.stack import Stack
+from zenml.utils.timing_utils import STEP_TIMINGS_METADATA_KEY
 
 
 def test_step_operator_validation(local_stack, sample_step_operator):
@@ -49,3 +50,24 @@ def test_step_operator_validation(local_stack, sample_step_operator):
             stack=stack_with_step_operator,
             step_operator_name=sample_step_operator.name,
         )
+
+
+def test_step_phase_durations_are_stored_as_metadata(
+    clean_client, one_step_pipeline, empty_step
+):
+    """Tests that the durations of the phases of a step run are stored as
+    step run metadata."""
+    one_step_pipeline(empty_step()).run(unlisted=True)
+
+    step_run = clean_client.list_pipeline_runs().items[0].steps["step_"]
+    durations = step_run.metadata[STEP_TIMINGS_METADATA_KEY].value
+    for phase in [
+        "create_or_reuse_run",
+        "resolve_inputs",
+        "compute_cache_key",
+        "create_step_run",
+        "prepare_output_artifact_uris",
+        "step_function",
+        "publish_step_run",
+    ]:
+        assert phase in durations
@@ -12,14 +12,17 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import threading
 from uuid import uuid4
 
 import pytest
 
+from zenml.client import Client
 from zenml.config.pipeline_configurations import PipelineConfiguration
 from zenml.config.step_configurations import Step
 from zenml.config.step_run_info import StepRunInfo
 from zenml.materializers import UnmaterializedArtifact
+from zenml.materializers.lazy_artifact import LazyArtifact, is_loaded
 from zenml.models.pipeline_run_models import PipelineRunResponseModel
 from zenml.models.step_run_models import StepRunResponseModel
 from zenml.orchestrators.step_launcher import StepRunner
@@ -171,3 +174,127 @@ def test_loading_unmaterialized_input_artifact(
         artifact=artifact_response, data_type=UnmaterializedArtifact
     )
     assert artifact == artifact_response
+
+
+def _create_step_runner(local_stack, **config) -> StepRunner:
+    """Creates a step runner for a step without any source."""
+    step = Step.parse_obj(
+        {
+            "spec": {
+                "source": "module.step_class",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+                **config,
+            },
+        }
+    )
+    return StepRunner(step=step, stack=local_stack)
+
+
+def test_loading_input_artifacts_concurrently(
+    mocker, local_stack, sample_artifact_model
+):
+    """Tests that input artifacts are loaded concurrently."""
+    runner = _create_step_runner(local_stack)
+    barrier = threading.Barrier(3, timeout=10)
+
+    def _load(artifact, data_type):
+        # Fails with a `BrokenBarrierError` if the artifacts are loaded
+        # one after another
+        barrier.wait()
+        return artifact.name
+
+    mocker.patch.object(runner, "_load_input_artifact", side_effect=_load)
+    artifacts = {
+        arg: (sample_artifact_model.copy(update={"name": arg}), int)
+        for arg in ["a", "b", "c"]
+    }
+
+    function_params = runner._parse_inputs(
+        args=["c", "a", "b"],
+        annotations={},
+        input_artifacts={arg: value[0] for arg, value in artifacts.items()},
+    )
+    assert function_params == {"c": "c", "a": "a", "b": "b"}
+    assert list(function_params) == ["c", "a", "b"]
+
+
+def test_loading_input_artifacts_sequentially(
+    mocker, monkeypatch, local_stack, sample_artifact_model
+):
+    """Tests that the number of concurrent input loads can be limited."""
+    monkeypatch.setenv("ZENML_INPUT_ARTIFACT_LOAD_MAX_WORKERS", "1")
+    runner = _create_step_runner(local_stack)
+    threads = set()
+
+    def _load(artifact, data_type):
+        threads.add(threading.current_thread())
+
+    mocker.patch.object(runner, "_load_input_artifact", side_effect=_load)
+    runner._load_input_artifacts(
+        {arg: (sample_artifact_model, int) for arg in ["a", "b"]}
+    )
+    assert threads == {threading.current_thread()}
+
+
+def test_failing_input_artifact_load(
+    mocker, local_stack, sample_artifact_model
+):
+    """Tests that failing input loads name the input."""
+    runner = _create_step_runner(local_stack)
+
+    def _load(artifact, data_type):
+        if artifact.name == "b":
+            raise OSError("download failed")
+
+    mocker.patch.object(runner, "_load_input_artifact", side_effect=_load)
+    with pytest.raises(RuntimeError, match="input `b`.*download failed"):
+        runner._load_input_artifacts(
+            {
+                arg: (sample_artifact_model.copy(update={"name": arg}), int)
+                for arg in ["a", "b"]
+            }
+        )
+
+
+def test_loading_lazy_input_artifacts(
+    mocker, local_stack, sample_artifact_model
+):
+    """Tests that lazy inputs are only loaded when accessed."""
+    runner = _create_step_runner(
+        local_stack, settings={"input_artifacts": {"lazy_inputs": ["lazy"]}}
+    )
+    mocker.patch.object(runner, "_load_input_artifact", return_value=[1, 2, 3])
+    mock_create_run_metadata = mocker.patch.object(
+        Client, "create_run_metadata"
+    )
+
+    function_params = runner._parse_inputs(
+        args=["lazy", "eager"],
+        annotations={"lazy": list, "eager": list},
+        input_artifacts={
+            "lazy": sample_artifact_model,
+            "eager": sample_artifact_model,
+        },
+    )
+    assert type(function_params["lazy"]) is LazyArtifact
+    assert not is_loaded(function_params["lazy"])
+    assert function_params["eager"] == [1, 2, 3]
+    runner._load_input_artifact.assert_called_once()
+
+    step_run_id = uuid4()
+    runner._publish_lazy_input_metadata(
+        step_run_id=step_run_id, function_params=function_params
+    )
+    mock_create_run_metadata.assert_called_once_with(
+        metadata={"lazy_inputs_loaded": {"lazy": False}},
+        step_run_id=step_run_id,
+    )
+
+    # Lazy inputs that are returned as outputs get loaded
+    outputs = runner._validate_outputs(
+        function_params["lazy"], output_annotations={"output": list}
+    )
+    assert type(outputs["output"]) is list
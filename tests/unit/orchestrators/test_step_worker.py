@@ -0,0 +1,122 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+import threading
+from multiprocessing import Pipe
+from uuid import uuid4
+
+import pytest
+
+from zenml.orchestrators.step_worker import (
+    StepWorker,
+    StepWorkerDiedError,
+    StepWorkerTask,
+    run_step_in_worker,
+    stop_worker,
+)
+
+
+def test_step_worker_runs_received_steps(mocker):
+    """Tests that the step worker runs all steps it receives until it gets
+    stopped."""
+    worker = StepWorker()
+
+    def _run(task: StepWorkerTask) -> None:
+        if task.step_name == "failing_step":
+            raise ValueError("step failed")
+
+    mock_run = mocker.patch.object(worker, "run", side_effect=_run)
+
+    client_connection, worker_connection = Pipe()
+    thread = threading.Thread(target=worker.serve, args=(worker_connection,))
+    thread.start()
+
+    task = StepWorkerTask(
+        deployment_id=uuid4(), step_name="step", orchestrator_run_id="run"
+    )
+    run_step_in_worker(client_connection, task)
+    mock_run.assert_called_once_with(task)
+
+    with pytest.raises(RuntimeError, match="step failed"):
+        run_step_in_worker(
+            client_connection, task.copy(update={"step_name": "failing_step"})
+        )
+
+    stop_worker(client_connection)
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert mock_run.call_count == 2
+
+
+def test_step_worker_reuses_deployment_and_stack(
+    mocker, monkeypatch, local_stack, sample_deployment_response_model
+):
+    """Tests that the step worker only loads deployments and stacks once."""
+    monkeypatch.setenv("ZENML_TEST_STEP_WORKER_ENV", "")
+    monkeypatch.setenv("ZENML_DEPLOYMENT_CACHE_DIR", "")
+    deployment = sample_deployment_response_model.copy(
+        update={
+            "stack": mocker.MagicMock(id=uuid4()),
+            "step_configurations": {"step": mocker.MagicMock()},
+        }
+    )
+    mocker.patch("zenml.orchestrators.step_worker.source_utils.load")
+    mock_get_deployment = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_deployment",
+        return_value=deployment,
+    )
+    mock_from_model = mocker.patch(
+        "zenml.orchestrators.step_worker.Stack.from_model",
+        return_value=local_stack,
+    )
+    mock_launcher = mocker.patch(
+        "zenml.orchestrators.step_worker.StepLauncher"
+    )
+    step_environments = []
+    mock_launcher.return_value.launch.side_effect = (
+        lambda: step_environments.append(
+            os.environ["ZENML_TEST_STEP_WORKER_ENV"]
+        )
+    )
+
+    worker = StepWorker()
+    task = StepWorkerTask(
+        deployment_id=deployment.id,
+        step_name="step",
+        orchestrator_run_id="run",
+        environment={"ZENML_TEST_STEP_WORKER_ENV": "value"},
+    )
+    worker.run(task)
+    worker.run(task)
+
+    mock_get_deployment.assert_called_once_with(deployment.id)
+    mock_from_model.assert_called_once()
+    assert mock_launcher.call_count == 2
+    assert mock_launcher.call_args.kwargs["stack"] is local_stack
+    assert step_environments == ["value", "value"]
+    # The environment of the task doesn't leak into later tasks
+    assert os.environ["ZENML_TEST_STEP_WORKER_ENV"] == ""
+
+
+def test_run_step_in_dead_worker():
+    """Tests that a broken connection to a worker is reported with the name
+    of the step."""
+    client_connection, worker_connection = Pipe()
+    worker_connection.close()
+
+    task = StepWorkerTask(
+        deployment_id=uuid4(), step_name="step", orchestrator_run_id="run"
+    )
+    with pytest.raises(StepWorkerDiedError, match="`step`"):
+        run_step_in_worker(client_connection, task)
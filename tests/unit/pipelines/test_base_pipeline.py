@@ -29,6 +29,7 @@ from zenml.exceptions import (
 from zenml.models.page_model import Page
 from zenml.models.pipeline_build_models import PipelineBuildBaseModel
 from zenml.models.pipeline_deployment_models import PipelineDeploymentBaseModel
+from zenml.new.pipelines.compile_cache import PipelineCompileCache
 from zenml.pipelines import BasePipeline, Schedule, pipeline
 from zenml.steps import BaseParameters, step
 
@@ -588,6 +589,8 @@ def test_registering_new_pipeline_version(mocker, empty_pipeline):
     _, call_kwargs = mock_create_pipeline.call_args
     assert call_kwargs["pipeline"].version == "1"
     mock_create_pipeline.reset_mock()
+    # The mocked store didn't persist the pipeline, so it must not be reused
+    PipelineCompileCache().clear()
 
     mocker.patch.object(BasePipeline, "_get_latest_version", return_value=3)
     pipeline_instance.register()
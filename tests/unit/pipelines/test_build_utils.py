@@ -173,9 +173,12 @@ def test_build_uses_correct_settings(clean_client, mocker, empty_pipeline):
         deployment=deployment, pipeline_id=pipeline_id
     )
 
+    checksum = build_config.compute_settings_checksum(
+        stack=clean_client.active_stack
+    )
     mock_build_docker_image.assert_called_with(
         docker_settings=build_config.settings,
-        tag="pipeline-step_name-key",
+        tag=f"pipeline-step_name-key-{checksum[:12]}",
         stack=ANY,
         entrypoint=build_config.entrypoint,
         extra_files=build_config.extra_files,
@@ -188,9 +191,129 @@ def test_build_uses_correct_settings(clean_client, mocker, empty_pipeline):
     assert len(build.images) == 1
     image = build.images["step_name.key"]
     assert image.image == "image_name"
-    assert image.settings_checksum == build_config.compute_settings_checksum(
-        stack=clean_client.active_stack
+    assert image.settings_checksum == checksum
+
+
+def test_build_reads_source_root_once(clean_client, mocker):
+    """Tests that the source root checksum is only computed once for all
+    images of a build that include the source files."""
+    build_configs = [
+        BuildConfiguration(key="key", settings=DockerSettings()),
+        BuildConfiguration(
+            key="key",
+            step_name="step_name",
+            settings=DockerSettings(requirements=["numpy"]),
+        ),
+    ]
+    mocker.patch.object(Stack, "get_docker_builds", return_value=build_configs)
+    mocker.patch.object(
+        PipelineDockerImageBuilder,
+        "build_docker_image",
+        return_value=("image_name", "", ""),
+    )
+    mock_compute_checksum = mocker.patch(
+        "zenml.image_builders.BuildContext.compute_checksum",
+        return_value="source_checksum",
+    )
+
+    deployment = PipelineDeploymentBaseModel(
+        run_name_template="",
+        pipeline_configuration={"name": "pipeline"},
+        step_configurations={},
     )
+    build = build_utils.create_pipeline_build(deployment=deployment)
+
+    assert len(build.images) == 2
+    mock_compute_checksum.assert_called_once()
+
+
+def test_local_build_removes_replaced_images(clean_client, mocker):
+    """Tests that a new local build removes the images of the previous local
+    build that it replaced."""
+    mocker.patch.object(
+        Stack,
+        "get_docker_builds",
+        return_value=[
+            BuildConfiguration(key="key", settings=DockerSettings())
+        ],
+    )
+    mock_build_docker_image = mocker.patch.object(
+        PipelineDockerImageBuilder,
+        "build_docker_image",
+        return_value=("zenml:pipeline-key-aaa", "", ""),
+    )
+    mock_remove_image = mocker.patch("zenml.utils.docker_utils.remove_image")
+
+    deployment = PipelineDeploymentBaseModel(
+        run_name_template="",
+        pipeline_configuration={"name": "pipeline"},
+        step_configurations={},
+    )
+    build_utils.create_pipeline_build(deployment=deployment)
+    mock_remove_image.assert_not_called()
+
+    mock_build_docker_image.return_value = ("zenml:pipeline-key-bbb", "", "")
+    build_utils.create_pipeline_build(deployment=deployment)
+    mock_remove_image.assert_called_once_with("zenml:pipeline-key-aaa")
+
+    # Images that weren't tagged for the same key are kept
+    mock_remove_image.reset_mock()
+    mock_build_docker_image.return_value = ("custom_image", "", "")
+    build_utils.create_pipeline_build(deployment=deployment)
+    mock_remove_image.assert_not_called()
+
+
+def test_outdated_build_warning_names_the_difference(
+    clean_client, mocker, sample_deployment_response_model
+):
+    """Tests that the warning for an outdated build says whether the code or
+    the Docker settings changed."""
+    settings = DockerSettings()
+    mock_get_docker_builds = mocker.patch.object(
+        Stack,
+        "get_docker_builds",
+        return_value=[BuildConfiguration(key="key", settings=settings)],
+    )
+    mocker.patch.object(
+        PipelineDockerImageBuilder,
+        "build_docker_image",
+        return_value=("image_name", "", ""),
+    )
+    mock_compute_checksum = mocker.patch(
+        "zenml.image_builders.BuildContext.compute_checksum",
+        return_value="source_checksum",
+    )
+    mock_logger = mocker.patch("zenml.new.pipelines.build_utils.logger")
+
+    build = build_utils.create_pipeline_build(
+        deployment=sample_deployment_response_model
+    )
+    assert build.images["key"].source_checksum == "source_checksum"
+
+    def _outdated_build_warnings():
+        mock_logger.reset_mock()
+        build_utils.verify_custom_build(
+            build=build, deployment=sample_deployment_response_model
+        )
+        return [
+            call.args[0]
+            for call in mock_logger.warning.call_args_list
+            if "not the same as" in call.args[0]
+        ]
+
+    assert _outdated_build_warnings() == []
+
+    mock_compute_checksum.return_value = "changed_source_checksum"
+    (warning,) = _outdated_build_warnings()
+    assert warning.startswith("The code included in the")
+
+    mock_get_docker_builds.return_value = [
+        BuildConfiguration(
+            key="key", settings=DockerSettings(requirements=["numpy"])
+        )
+    ]
+    (warning,) = _outdated_build_warnings()
+    assert warning.startswith("The Docker settings used for the")
 
 
 def test_building_with_identical_keys_and_settings(clean_client, mocker):
@@ -519,11 +642,73 @@ def test_finding_existing_build(
         sort_by="desc:created",
         size=1,
         stack_id=clean_client.active_stack.id,
-        is_local=False,
-        contains_code=False,
+        is_local=True,
         zenml_version=zenml.__version__,
         python_version=f"startswith:{sys.version_info.major}.{sys.version_info.minor}",
         checksum="checksum",
     )
 
     assert not build
+
+
+def test_finding_existing_local_build(
+    clean_client, mocker, sample_deployment_response_model
+):
+    """Tests that local builds are only reused if their images still exist
+    and weren't overwritten by a subsequent build."""
+    existing_build = PipelineBuildResponseModel(
+        id=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+        user=sample_deployment_response_model.user,
+        workspace=sample_deployment_response_model.workspace,
+        images={"key": {"image": "image_name"}},
+        is_local=True,
+        contains_code=True,
+    )
+    other_build = existing_build.copy(update={"id": uuid4()})
+
+    def _page(build: PipelineBuildResponseModel) -> Page:
+        return Page(index=1, max_size=1, total_pages=1, total=1, items=[build])
+
+    mocker.patch(
+        "zenml.new.pipelines.build_utils.compute_build_checksum",
+        return_value="checksum",
+    )
+    mocker.patch.object(
+        Stack,
+        "get_docker_builds",
+        return_value=[
+            BuildConfiguration(key="key", settings=DockerSettings())
+        ],
+    )
+    mock_is_local_image = mocker.patch(
+        "zenml.utils.docker_utils.is_local_image", return_value=True
+    )
+
+    # The existing build is the latest local build and its image exists
+    mocker.patch(
+        "zenml.client.Client.list_builds",
+        return_value=_page(existing_build),
+    )
+    build = build_utils.find_existing_build(
+        deployment=sample_deployment_response_model
+    )
+    assert build == existing_build
+    mock_is_local_image.assert_called_once_with("image_name")
+
+    # The image doesn't exist anymore
+    mock_is_local_image.return_value = False
+    assert not build_utils.find_existing_build(
+        deployment=sample_deployment_response_model
+    )
+
+    # A subsequent local build might have overwritten the image tag
+    mock_is_local_image.return_value = True
+    mocker.patch(
+        "zenml.client.Client.list_builds",
+        side_effect=[_page(existing_build), _page(other_build)],
+    )
+    assert not build_utils.find_existing_build(
+        deployment=sample_deployment_response_model
+    )
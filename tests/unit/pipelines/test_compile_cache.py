@@ -0,0 +1,130 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import pytest
+
+from zenml import pipeline, step
+from zenml.client import Client
+from zenml.config.compiler import Compiler
+from zenml.constants import ENV_ZENML_DISABLE_PIPELINE_COMPILE_CACHE
+from zenml.enums import StackComponentType
+
+
+@step
+def step_with_parameter(value: int) -> None:
+    pass
+
+
+@pipeline
+def pipeline_with_parameter(value: int):
+    step_with_parameter(value=value)
+
+
+@pytest.fixture
+def compile_spy(mocker):
+    """Fixture that spies on the compilation of pipelines."""
+    return mocker.patch.object(Compiler, "compile", wraps=Compiler().compile)
+
+
+def test_repeated_runs_reuse_compiled_pipeline(
+    clean_client, compile_spy, mocker
+):
+    """Tests that running the same pipeline again reuses the compiled
+    deployment and the registered pipeline."""
+    list_pipelines_spy = mocker.spy(Client, "list_pipelines")
+
+    pipeline_with_parameter(value=1)
+    pipeline_with_parameter(value=1)
+    registration_calls = list_pipelines_spy.call_count
+    pipeline_with_parameter(value=1)
+
+    assert compile_spy.call_count == 1
+    assert list_pipelines_spy.call_count == registration_calls
+    runs = clean_client.list_pipeline_runs()
+    assert runs.total == 3
+    assert runs.items[0].pipeline.id == runs.items[1].pipeline.id
+    assert runs.items[0].deployment.id != runs.items[1].deployment.id
+
+
+def test_deleted_pipeline_gets_registered_again(clean_client):
+    """Tests that a cached pipeline is not reused after it was deleted."""
+
+    def _get_latest_pipeline_id():
+        runs = clean_client.list_pipeline_runs(sort_by="desc:created")
+        return runs.items[0].pipeline.id
+
+    pipeline_with_parameter(value=1)
+    pipeline_id = _get_latest_pipeline_id()
+    clean_client.delete_pipeline(pipeline_id)
+
+    pipeline_with_parameter(value=1)
+    new_pipeline_id = _get_latest_pipeline_id()
+    assert new_pipeline_id != pipeline_id
+
+    # Pipelines deleted by another process are not removed from the cache
+    clean_client.zen_store.delete_pipeline(new_pipeline_id)
+
+    pipeline_with_parameter(value=1)
+    assert _get_latest_pipeline_id() not in {pipeline_id, new_pipeline_id}
+
+
+def test_changed_parameters_recompile_pipeline(clean_client, compile_spy):
+    """Tests that a pipeline is compiled again if a parameter changed."""
+    pipeline_with_parameter(value=1)
+    pipeline_with_parameter(value=2)
+
+    assert compile_spy.call_count == 2
+    parameters = {
+        run.steps["step_with_parameter"].config.parameters["value"]
+        for run in clean_client.list_pipeline_runs().items
+    }
+    assert parameters == {1, 2}
+
+
+def test_changed_stack_recompiles_pipeline(clean_client, compile_spy):
+    """Tests that a pipeline is compiled again if the stack was updated."""
+    orchestrator = clean_client.create_stack_component(
+        name="local",
+        flavor="local",
+        component_type=StackComponentType.ORCHESTRATOR,
+        configuration={},
+    )
+    clean_client.create_stack(
+        name="local",
+        components={
+            StackComponentType.ORCHESTRATOR: orchestrator.id,
+            StackComponentType.ARTIFACT_STORE: "default",
+        },
+    )
+    clean_client.activate_stack("local")
+
+    pipeline_with_parameter(value=1)
+    clean_client.update_stack_component(
+        name_id_or_prefix=orchestrator.id,
+        component_type=StackComponentType.ORCHESTRATOR,
+        labels={"updated": "true"},
+    )
+    pipeline_with_parameter(value=1)
+
+    assert compile_spy.call_count == 2
+
+
+def test_compile_cache_can_be_disabled(clean_client, compile_spy, mocker):
+    """Tests that the compile cache can be disabled."""
+    mocker.patch.dict(
+        "os.environ", {ENV_ZENML_DISABLE_PIPELINE_COMPILE_CACHE: "true"}
+    )
+    pipeline_with_parameter(value=1)
+    pipeline_with_parameter(value=1)
+
+    assert compile_spy.call_count == 2
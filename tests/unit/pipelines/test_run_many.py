@@ -0,0 +1,112 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import pytest
+
+from zenml import pipeline, step
+from zenml.config.schedule import Schedule
+from zenml.orchestrators import BaseOrchestrator
+
+
+@step
+def sweep_step(learning_rate: float) -> float:
+    return learning_rate
+
+
+@pipeline
+def sweep_pipeline(learning_rate: float):
+    sweep_step(learning_rate=learning_rate)
+
+
+def test_run_many_creates_one_run_per_parameter_set(clean_client, mocker):
+    """Tests that running a pipeline for multiple parameter sets creates
+    all deployments at once and passes them to the orchestrator as batch."""
+    create_deployment_spy = mocker.spy(
+        type(clean_client.zen_store), "create_deployment"
+    )
+    create_deployments_spy = mocker.spy(
+        type(clean_client.zen_store), "create_deployments"
+    )
+    run_many_spy = mocker.spy(BaseOrchestrator, "run_many")
+
+    deployments = sweep_pipeline.run_many(
+        [{"learning_rate": 0.1}, {"learning_rate": 0.01}]
+    )
+
+    assert len(deployments) == 2
+    assert create_deployment_spy.call_count == 0
+    assert create_deployments_spy.call_count == 1
+    assert run_many_spy.call_count == 1
+    assert deployments[0].pipeline.name == deployments[1].pipeline.name
+
+    for deployment, learning_rate in zip(deployments, [0.1, 0.01]):
+        runs = clean_client.list_pipeline_runs(deployment_id=deployment.id)
+        assert runs.total == 1
+        step_run = runs.items[0].steps["sweep_step"]
+        assert step_run.config.parameters["learning_rate"] == learning_rate
+        assert step_run.outputs["output"].load() == learning_rate
+
+
+def test_run_many_without_parameters_does_nothing(clean_client):
+    """Tests that running a pipeline for no parameter sets doesn't create any
+    runs."""
+    assert sweep_pipeline.run_many([]) == []
+    assert clean_client.list_pipeline_runs().total == 0
+
+
+def test_run_many_fails_for_fixed_run_name_or_schedule():
+    """Tests that a pipeline with a fixed run name or schedule can't be run
+    multiple times at once."""
+    with pytest.raises(ValueError):
+        sweep_pipeline.with_options(run_name="sweep").run_many(
+            [{"learning_rate": 0.1}]
+        )
+
+    with pytest.raises(ValueError):
+        sweep_pipeline.with_options(
+            schedule=Schedule(cron_expression="* * * * *")
+        ).run_many([{"learning_rate": 0.1}])
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        "run_name: sweep",
+        "run_name: sweep_{date}",
+        "schedule:\n  cron_expression: '* * * * *'",
+    ],
+)
+def test_run_many_fails_for_fixed_run_name_or_schedule_in_config_file(
+    clean_client, tmp_path, config
+):
+    """Tests that a fixed run name or schedule in the configuration file
+    prevents running a pipeline multiple times at once."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(config)
+
+    with pytest.raises(ValueError):
+        sweep_pipeline.run_many(
+            [{"learning_rate": 0.1}], config_path=str(config_path)
+        )
+    assert clean_client.list_pipeline_runs().total == 0
+
+
+def test_run_many_logs_deployment_metadata(clean_client, mocker):
+    """Tests that the metadata of every deployment gets logged."""
+    log_spy = mocker.spy(sweep_pipeline, "log_pipeline_deployment_metadata")
+
+    deployments = sweep_pipeline.run_many(
+        [{"learning_rate": 0.1}, {"learning_rate": 0.01}]
+    )
+
+    assert [call.args[0] for call in log_spy.call_args_list] == deployments
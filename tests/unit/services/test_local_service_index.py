@@ -0,0 +1,110 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import json
+import os
+import shutil
+import threading
+from types import SimpleNamespace
+from uuid import uuid4
+
+from zenml.services.local.local_service_index import (
+    LocalServiceIndex,
+    update_service_statuses,
+)
+
+
+def _write_service(root, **config):
+    """Writes a service configuration file like a local daemon service."""
+    uuid = uuid4()
+    runtime_path = os.path.join(root, str(uuid))
+    os.makedirs(runtime_path)
+    config_file = os.path.join(runtime_path, "service.json")
+    with open(config_file, "w") as f:
+        json.dump({"uuid": str(uuid), "config": config}, f)
+    return uuid, config_file
+
+
+def test_service_index_finds_services_by_attributes(tmp_path):
+    """Tests finding services by UUID and indexed config attributes."""
+    root = str(tmp_path)
+    uuid, config_file = _write_service(
+        root, pipeline_name="p", pipeline_step_name="s", model_name="m"
+    )
+    _, other_config_file = _write_service(
+        root, pipeline_name="p", pipeline_step_name="s", model_name="other"
+    )
+
+    index = LocalServiceIndex(root)
+    assert set(index.find()) == {config_file, other_config_file}
+    assert index.find(model_name="m") == [config_file]
+    assert index.find(pipeline_name="p", model_name="") == index.find()
+    assert index.find(service_uuid=uuid) == [config_file]
+    assert index.find(service_uuid=uuid4()) == []
+    assert index.find(pipeline_name="unknown") == []
+
+
+def test_service_index_only_reads_new_configuration_files(tmp_path, mocker):
+    """Tests that indexed configuration files are not read again."""
+    root = str(tmp_path)
+    _, config_file = _write_service(root, model_name="m")
+    index = LocalServiceIndex(root)
+    assert index.find() == [config_file]
+
+    read_entry = mocker.spy(LocalServiceIndex, "_entry_from_config_file")
+    assert LocalServiceIndex(root).find() == [config_file]
+    read_entry.assert_not_called()
+
+    _, new_config_file = _write_service(root, model_name="new")
+    assert LocalServiceIndex(root).find(model_name="new") == [new_config_file]
+    read_entry.assert_called_once_with(new_config_file)
+
+
+def test_service_index_updates_on_add_and_remove(tmp_path):
+    """Tests adding and removing services from the index."""
+    root = str(tmp_path)
+    index = LocalServiceIndex(root)
+    assert index.find() == []
+
+    uuid, config_file = _write_service(root, model_name="m")
+    service = SimpleNamespace(status=SimpleNamespace(config_file=config_file))
+    index.add(service)
+    assert index.find(model_name="m") == [config_file]
+
+    index.remove(uuid)
+    shutil.rmtree(os.path.dirname(config_file))
+    assert index.find() == []
+
+
+def test_update_service_statuses_skips_slow_and_failing_services():
+    """Tests that status checks run concurrently and respect the timeout."""
+    release = threading.Event()
+
+    def _slow_check():
+        release.wait(5)
+
+    def _failing_check():
+        raise RuntimeError("unreachable")
+
+    healthy = SimpleNamespace(update_status=lambda: None)
+    slow = SimpleNamespace(update_status=_slow_check)
+    failing = SimpleNamespace(update_status=_failing_check)
+
+    try:
+        updated = update_service_statuses(
+            [slow, healthy, failing], timeout=0.5
+        )
+    finally:
+        release.set()
+    assert updated == [healthy]
+    assert update_service_statuses([]) == []
@@ -0,0 +1,218 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import threading
+from typing import Generator, List, Optional, Tuple
+
+import pytest
+
+from zenml.services import (
+    BaseService,
+    ServiceConfig,
+    ServiceState,
+    ServiceStatus,
+    ServiceStatusMonitor,
+    ServiceType,
+)
+
+
+class _DummyService(BaseService):
+    """Service whose state is controlled by the test."""
+
+    SERVICE_TYPE = ServiceType(type="test", flavor="dummy")
+
+    config: ServiceConfig = ServiceConfig()
+    status: ServiceStatus = ServiceStatus()
+
+    _states: List[ServiceState] = []
+    _checks: int = 0
+
+    def check_status(self) -> Tuple[ServiceState, str]:
+        """Returns the next state of the service.
+
+        Returns:
+            The next state and an empty message.
+        """
+        self._checks += 1
+        if len(self._states) > 1:
+            return self._states.pop(0), ""
+        return self._states[0], ""
+
+    def get_logs(
+        self, follow: bool = False, tail: Optional[int] = None
+    ) -> Generator[str, bool, None]:
+        """Returns no logs.
+
+        Args:
+            follow: Unused.
+            tail: Unused.
+
+        Yields:
+            Nothing.
+        """
+        yield from ()
+
+    def provision(self) -> None:
+        """Provisions nothing."""
+
+    def deprovision(self, force: bool = False) -> None:
+        """Deprovisions nothing.
+
+        Args:
+            force: Unused.
+        """
+
+
+@pytest.fixture
+def monitor():
+    """Fixture that returns a fast status monitor."""
+    ServiceStatusMonitor._clear()
+    yield ServiceStatusMonitor(min_interval=0.01, max_interval=0.05)
+    ServiceStatusMonitor._clear()
+
+
+def _create_service(*states: ServiceState) -> _DummyService:
+    """Creates a dummy service that goes through the given states."""
+    service = _DummyService()
+    service._states = list(states)
+    return service
+
+
+def test_waiting_for_a_state_wakes_up_after_probes(monitor):
+    """Tests that waiters are woken up once the monitor sees the state."""
+    service = _create_service(
+        ServiceState.PENDING_STARTUP,
+        ServiceState.PENDING_STARTUP,
+        ServiceState.ACTIVE,
+    )
+
+    assert monitor.wait_for(
+        service,
+        lambda s: s.status.state == ServiceState.ACTIVE,
+        timeout=5,
+    )
+    assert service._checks == 3
+    assert not monitor.is_monitored(service)
+
+
+def test_waiting_for_a_state_times_out(monitor):
+    """Tests that waiting returns once the timeout is reached."""
+    service = _create_service(ServiceState.PENDING_STARTUP)
+
+    assert not monitor.wait_for(
+        service,
+        lambda s: s.status.state == ServiceState.ACTIVE,
+        timeout=0.2,
+    )
+    assert service._checks > 1
+    assert not monitor.is_monitored(service)
+
+
+def test_waiting_probes_the_service_at_the_deadline():
+    """Tests that the service is probed at the deadline even if the back-off
+    interval is longer than the timeout."""
+    ServiceStatusMonitor._clear()
+    monitor = ServiceStatusMonitor(min_interval=10, max_interval=10)
+    try:
+        service = _create_service(
+            ServiceState.PENDING_STARTUP, ServiceState.ACTIVE
+        )
+        assert monitor.wait_for(
+            service,
+            lambda s: s.status.state == ServiceState.ACTIVE,
+            timeout=0.2,
+        )
+        assert service._checks == 2
+    finally:
+        ServiceStatusMonitor._clear()
+
+
+def test_waiting_updates_the_status_of_the_waiting_instance(monitor):
+    """Tests that waiters on another instance of an already monitored service
+    see the status of their own instance."""
+    service = _create_service(ServiceState.PENDING_STARTUP)
+    other_instance = _DummyService(uuid=service.uuid)
+    other_instance._states = [
+        ServiceState.PENDING_STARTUP,
+        ServiceState.ACTIVE,
+    ]
+
+    monitor.register(service)
+    try:
+        assert monitor.wait_for(
+            other_instance,
+            lambda s: s.status.state == ServiceState.ACTIVE,
+            timeout=5,
+        )
+        assert other_instance.status.state == ServiceState.ACTIVE
+        assert monitor.is_monitored(service)
+    finally:
+        monitor.unregister(service)
+    assert not monitor.is_monitored(service)
+
+
+def test_multiple_waiters_share_the_probes(monitor):
+    """Tests that concurrent waiters don't probe the service themselves."""
+    service = _create_service(
+        ServiceState.PENDING_STARTUP,
+        ServiceState.PENDING_STARTUP,
+        ServiceState.ACTIVE,
+    )
+    results = []
+
+    def _wait():
+        results.append(
+            monitor.wait_for(
+                service,
+                lambda s: s.status.state == ServiceState.ACTIVE,
+                timeout=5,
+            )
+        )
+
+    threads = [threading.Thread(target=_wait) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [True] * 5
+    assert service._checks < 10
+
+
+def test_service_state_properties_reuse_recent_status(monitor):
+    """Tests that the state properties don't probe the service every time."""
+    service = _create_service(ServiceState.ACTIVE)
+
+    assert service.is_running
+    assert not service.is_stopped
+    assert not service.is_failed
+    assert service._checks == 1
+
+    service._invalidate_status()
+    assert service.is_running
+    assert service._checks == 2
+
+
+def test_starting_a_service_waits_for_the_monitor(monitor):
+    """Tests starting a service using the shared monitor."""
+    service = _create_service(
+        ServiceState.INACTIVE,
+        ServiceState.PENDING_STARTUP,
+        ServiceState.ACTIVE,
+    )
+    service.start(timeout=5)
+    assert service.is_running
+
+    service = _create_service(ServiceState.PENDING_STARTUP, ServiceState.ERROR)
+    with pytest.raises(RuntimeError):
+        service.start(timeout=5)
@@ -14,21 +14,33 @@
 import os
 import shutil
 import tempfile
+import threading
 from uuid import uuid4
 
 import numpy as np
 import pytest
 
 from zenml.constants import MODEL_METADATA_YAML_FILE_NAME
+from zenml.enums import VisualizationType
+from zenml.exceptions import DoesNotExistException
+from zenml.io import fileio
+from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.materializers.numpy_materializer import NUMPY_FILENAME
 from zenml.models import ArtifactResponseModel
+from zenml.models.visualization_models import VisualizationModel
+from zenml.utils import artifact_utils, io_utils
 from zenml.utils.artifact_utils import (
     METADATA_DATATYPE,
     METADATA_MATERIALIZER,
     _load_artifact,
+    _save_artifact,
+    download_artifact_file,
+    get_artifact_file,
+    iterate_artifact_file,
     load_artifact,
     load_model_from_metadata,
     save_model_metadata,
+    upload_artifacts_in_background,
 )
 
 
@@ -170,3 +182,190 @@ def test__load_artifact(numpy_file_uri):
     artifact = _load_artifact(materializer, data_type, numpy_file_uri)
     assert artifact is not None
     assert isinstance(artifact, np.ndarray)
+
+
+@pytest.fixture
+def local_artifact(clean_client, sample_artifact_model, tmp_path):
+    """Fixture for an artifact with files in the local artifact store."""
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "data.txt").write_text("aria")
+    (tmp_path / "visualization.html").write_text("<p>axl</p>")
+
+    return sample_artifact_model.copy(
+        update={
+            "uri": str(tmp_path),
+            "artifact_store_id": clean_client.active_stack.artifact_store.id,
+            "visualizations": [
+                VisualizationModel(
+                    type=VisualizationType.HTML,
+                    uri=str(tmp_path / "visualization.html"),
+                )
+            ],
+        }
+    )
+
+
+def test_get_artifact_file(local_artifact):
+    """Tests resolving the files of an artifact."""
+    _, uri = get_artifact_file(local_artifact, path="nested/data.txt")
+    assert uri == os.path.join(local_artifact.uri, "nested", "data.txt")
+
+    _, uri = get_artifact_file(local_artifact, visualization_index=0)
+    assert uri == local_artifact.visualizations[0].uri
+
+    with pytest.raises(ValueError):
+        get_artifact_file(local_artifact, path="../outside.txt")
+    with pytest.raises(ValueError):
+        get_artifact_file(local_artifact, path="/etc/passwd")
+    with pytest.raises(ValueError):
+        get_artifact_file(local_artifact, path="nested")
+    with pytest.raises(ValueError):
+        get_artifact_file(
+            local_artifact, path="nested/data.txt", visualization_index=0
+        )
+    with pytest.raises(DoesNotExistException):
+        get_artifact_file(local_artifact, path="missing.txt")
+    with pytest.raises(DoesNotExistException):
+        get_artifact_file(local_artifact, visualization_index=1)
+
+
+def test_iterate_artifact_file(local_artifact_store, tmp_path):
+    """Tests reading artifact files in chunks."""
+    uri = str(tmp_path / "data.bin")
+    with open(uri, "wb") as f:
+        f.write(b"0123456789")
+
+    chunks = list(
+        iterate_artifact_file(local_artifact_store, uri=uri, chunk_size=4)
+    )
+    assert chunks == [b"0123", b"4567", b"89"]
+
+    chunks = list(
+        iterate_artifact_file(
+            local_artifact_store, uri=uri, start=3, end=8, chunk_size=4
+        )
+    )
+    assert chunks == [b"3456", b"78"]
+
+
+def test_download_artifact_file(local_artifact, tmp_path):
+    """Tests downloading artifact files to a local path."""
+    destination = str(tmp_path / "download.txt")
+    download_artifact_file(
+        local_artifact, destination=destination, path="nested/data.txt"
+    )
+    with open(destination) as f:
+        assert f.read() == "aria"
+
+    download_artifact_file(
+        local_artifact, destination=destination, visualization_index=0
+    )
+    with open(destination) as f:
+        assert f.read() == "<p>axl</p>"
+
+
+class StringMaterializer(BaseMaterializer):
+    """Materializer that stores strings and visualizes them as HTML."""
+
+    ASSOCIATED_TYPES = (str,)
+
+    def save(self, data: str) -> None:
+        with fileio.open(os.path.join(self.uri, "data.txt"), "w") as f:
+            f.write(data)
+
+    def save_visualizations(self, data: str):
+        uri = os.path.join(self.uri, "visualization.html")
+        with fileio.open(uri, "w") as f:
+            f.write(f"<p>{data}</p>")
+        return {uri: VisualizationType.HTML}
+
+
+def test_upload_artifacts_in_background(clean_client, mocker, tmp_path):
+    """Tests that remote artifacts are staged and uploaded concurrently."""
+    remote_uri = str(tmp_path / "remote")
+    local_uri = str(tmp_path / "local")
+    os.makedirs(local_uri)
+    mocker.patch.object(
+        io_utils, "is_remote", side_effect=lambda uri: uri == remote_uri
+    )
+    copy_dir = mocker.spy(io_utils, "copy_dir")
+
+    artifact_ids = upload_artifacts_in_background(
+        artifacts={
+            "remote": ("aria", StringMaterializer(remote_uri)),
+            "local": ("axl", StringMaterializer(local_uri)),
+        },
+        artifact_store_id=clean_client.active_stack.artifact_store.id,
+        extract_metadata=True,
+        include_visualizations=True,
+    )
+
+    # Only the remote artifact was uploaded from a removed staging directory
+    assert copy_dir.call_count == 1
+    staging_dir = copy_dir.call_args.args[0]
+    assert not os.path.exists(staging_dir)
+
+    remote_artifact = clean_client.get_artifact(artifact_ids["remote"])
+    assert remote_artifact.uri == remote_uri
+    assert remote_artifact.visualizations[0].uri == os.path.join(
+        remote_uri, "visualization.html"
+    )
+    assert int(remote_artifact.metadata["storage_size"].value) == len(
+        "aria<p>aria</p>"
+    )
+    with open(os.path.join(remote_uri, "data.txt")) as f:
+        assert f.read() == "aria"
+
+    local_artifact = clean_client.get_artifact(artifact_ids["local"])
+    assert local_artifact.visualizations[0].uri == os.path.join(
+        local_uri, "visualization.html"
+    )
+
+
+def test_failed_background_uploads_publish_no_artifacts(
+    clean_client, mocker, tmp_path
+):
+    """Tests that no artifacts are published if an upload fails."""
+    mocker.patch.object(io_utils, "is_remote", return_value=True)
+    mocker.patch.object(io_utils, "copy_dir", side_effect=OSError)
+    mock_publish = mocker.patch.object(artifact_utils, "_publish_artifact")
+
+    with pytest.raises(OSError):
+        upload_artifacts_in_background(
+            artifacts={
+                "output": ("aria", StringMaterializer(str(tmp_path))),
+            },
+            artifact_store_id=clean_client.active_stack.artifact_store.id,
+            extract_metadata=False,
+            include_visualizations=False,
+        )
+    mock_publish.assert_not_called()
+
+
+@pytest.mark.parametrize("concurrently", [False, True])
+def test_concurrent_metadata_extraction_is_opt_in(tmp_path, concurrently):
+    """Tests that metadata is only extracted in a separate thread if the
+    materializer opts in to it."""
+    extraction_threads = []
+
+    class MetadataMaterializer(StringMaterializer):
+        EXTRACT_METADATA_CONCURRENTLY = concurrently
+
+        def extract_metadata(self, data: str):
+            extraction_threads.append(threading.current_thread())
+            return {"length": len(data)}
+
+    _, metadata = _save_artifact(
+        name="output",
+        data="aria",
+        materializer=MetadataMaterializer(str(tmp_path)),
+        extract_metadata=True,
+        include_visualizations=True,
+    )
+
+    assert metadata["length"] == 4
+    assert int(metadata["storage_size"]) == len("aria<p>aria</p>")
+    assert len(extraction_threads) == 1
+    assert (
+        extraction_threads[0] is not threading.current_thread()
+    ) == concurrently
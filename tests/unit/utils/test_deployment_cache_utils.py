@@ -0,0 +1,120 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import json
+import os
+
+from zenml.constants import ENV_ZENML_DEPLOYMENT_CACHE_DIR
+from zenml.utils import deployment_cache_utils
+
+
+def test_loading_deployments_uses_cache(
+    clean_client,
+    mocker,
+    monkeypatch,
+    tmp_path,
+    sample_deployment_response_model,
+):
+    """Tests that deployments are only fetched from the zen store once."""
+    monkeypatch.setenv(ENV_ZENML_DEPLOYMENT_CACHE_DIR, str(tmp_path))
+    mock_get_deployment = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_deployment",
+        return_value=sample_deployment_response_model,
+    )
+
+    for _ in range(2):
+        deployment = deployment_cache_utils.load_deployment(
+            sample_deployment_response_model.id
+        )
+        assert deployment == sample_deployment_response_model
+
+    mock_get_deployment.assert_called_once_with(
+        sample_deployment_response_model.id
+    )
+    assert os.listdir(tmp_path) == [
+        f"{sample_deployment_response_model.id}.json"
+    ]
+
+
+def test_deployment_cache_can_be_disabled(
+    clean_client, mocker, monkeypatch, sample_deployment_response_model
+):
+    """Tests that deployments are not cached if the cache is disabled."""
+    monkeypatch.setenv(ENV_ZENML_DEPLOYMENT_CACHE_DIR, "")
+    mock_get_deployment = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_deployment",
+        return_value=sample_deployment_response_model,
+    )
+
+    for _ in range(2):
+        deployment_cache_utils.load_deployment(
+            sample_deployment_response_model.id
+        )
+
+    assert mock_get_deployment.call_count == 2
+
+
+def test_deployment_cache_is_pruned(
+    clean_client,
+    mocker,
+    monkeypatch,
+    tmp_path,
+    sample_deployment_response_model,
+):
+    """Tests that the deployment cache does not grow indefinitely."""
+    monkeypatch.setenv(ENV_ZENML_DEPLOYMENT_CACHE_DIR, str(tmp_path))
+    monkeypatch.setattr(
+        deployment_cache_utils, "DEPLOYMENT_CACHE_MAX_ENTRIES", 2
+    )
+    for i in range(3):
+        (tmp_path / f"{i}.json").write_text("{}")
+        os.utime(tmp_path / f"{i}.json", (i, i))
+
+    mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_deployment",
+        return_value=sample_deployment_response_model,
+    )
+    deployment_cache_utils.load_deployment(sample_deployment_response_model.id)
+
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        ["2.json", f"{sample_deployment_response_model.id}.json"]
+    )
+
+
+def test_deployment_cache_does_not_store_stack_configuration(
+    clean_client,
+    mocker,
+    monkeypatch,
+    tmp_path,
+    sample_deployment_response_model,
+):
+    """Tests that cached deployments only store the ID of their stack and are
+    only readable by their owner."""
+    monkeypatch.setenv(ENV_ZENML_DEPLOYMENT_CACHE_DIR, str(tmp_path))
+    stack = clean_client.active_stack_model
+    deployment = sample_deployment_response_model.copy(update={"stack": stack})
+    mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_deployment",
+        return_value=deployment,
+    )
+
+    deployment_cache_utils.load_deployment(deployment.id)
+
+    cache_file = tmp_path / f"{deployment.id}.json"
+    assert cache_file.stat().st_mode & 0o777 == 0o600
+    entry = json.loads(cache_file.read_text())
+    assert entry["stack_id"] == str(stack.id)
+    assert "stack" not in entry["deployment"]
+
+    cached_deployment = deployment_cache_utils.load_deployment(deployment.id)
+    assert cached_deployment.stack == stack
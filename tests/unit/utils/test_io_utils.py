@@ -104,6 +104,23 @@ def test_copy_dir_works(tmp_path):
         assert f.read() == "some_content_about_aria"
 
 
+def test_copy_dir_copies_files_concurrently(tmp_path):
+    """Tests copying nested directories with multiple workers."""
+    dir_path = os.path.join(tmp_path, "test")
+    for i in range(5):
+        io_utils.create_file_if_not_exists(
+            os.path.join(dir_path, "nested", str(i), "test.txt"), str(i)
+        )
+
+    new_dir_path = os.path.join(tmp_path, "test2")
+    io_utils.copy_dir(dir_path, new_dir_path, max_workers=4)
+    for i in range(5):
+        with open(
+            os.path.join(new_dir_path, "nested", str(i), "test.txt"), "r"
+        ) as f:
+            assert f.read() == str(i)
+
+
 def test_copy_dir_overwriting_works(tmp_path):
     """Tests copying directory overwriting."""
     dir_path = os.path.join(tmp_path, "test")
@@ -0,0 +1,109 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import json
+import os
+
+import pytest
+
+from zenml.utils import requirement_utils
+
+
+@pytest.fixture
+def clean_requirements_cache(tmp_path, monkeypatch):
+    """Fixture that uses a fresh requirements cache in a temp directory."""
+    monkeypatch.setattr(
+        requirement_utils.io_utils,
+        "get_global_config_directory",
+        lambda: str(tmp_path),
+    )
+    requirement_utils.reset_cache()
+    yield tmp_path
+    requirement_utils.reset_cache()
+
+
+def test_is_installed_checks_requirements(clean_requirements_cache):
+    """Tests checking whether requirements are installed."""
+    assert requirement_utils.is_installed([])
+    assert requirement_utils.is_installed(["pytest"])
+    assert requirement_utils.is_installed(["pytest>=1.0"])
+    assert not requirement_utils.is_installed(["pytest<1.0"])
+    assert not requirement_utils.is_installed(
+        ["pytest", "zenml-package-that-does-not-exist"]
+    )
+    assert requirement_utils.is_installed(
+        ["zenml-package-that-does-not-exist; python_version < '3'"]
+    )
+    assert not requirement_utils.is_installed(["invalid requirement $"])
+
+
+def test_is_installed_uses_cache(clean_requirements_cache, mocker):
+    """Tests that requirement checks are cached on disk."""
+    assert requirement_utils.is_installed(["pytest"])
+
+    cache_path = os.path.join(
+        clean_requirements_cache, requirement_utils.REQUIREMENTS_CACHE_FILENAME
+    )
+    with open(cache_path) as f:
+        cache_content = json.load(f)
+
+    assert (
+        cache_content["fingerprint"]
+        == requirement_utils.get_environment_fingerprint()
+    )
+    assert cache_content["requirements"] == {"pytest": True}
+
+    # A new process with the same environment reads the cache from disk
+    requirement_utils.reset_cache()
+    mock_check = mocker.patch.object(requirement_utils, "_check_requirement")
+    assert requirement_utils.is_installed(["pytest"])
+    mock_check.assert_not_called()
+
+
+def test_cache_is_invalidated_when_environment_changes(
+    clean_requirements_cache, mocker
+):
+    """Tests that cached results are ignored for a different environment."""
+    assert requirement_utils.is_installed(["pytest"])
+
+    requirement_utils.reset_cache()
+    mocker.patch.object(
+        requirement_utils,
+        "get_environment_fingerprint",
+        return_value="other_environment",
+    )
+    mock_check = mocker.patch.object(
+        requirement_utils, "_check_requirement", return_value=False
+    )
+    assert not requirement_utils.is_installed(["pytest"])
+    mock_check.assert_called_once_with("pytest")
+
+
+def test_extra_dependencies_keep_environment_markers(
+    clean_requirements_cache, mocker
+):
+    """Tests that the dependencies of an extra are only checked if their
+    environment markers apply apart from the extra itself."""
+    mocker.patch.object(
+        requirement_utils.metadata,
+        "requires",
+        return_value=[
+            "zenml-package-that-does-not-exist; extra == 'old' and "
+            "python_version < '3'",
+            "zenml-package-that-does-not-exist; extra == 'new' and "
+            "python_version >= '3'",
+        ],
+    )
+
+    assert requirement_utils.is_installed(["pytest[old]"])
+    assert not requirement_utils.is_installed(["pytest[new]"])
@@ -0,0 +1,82 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import numpy as np
+import pandas as pd
+
+from zenml.constants import (
+    ENV_ZENML_ARTIFACT_STATISTICS_MAX_BYTES,
+    ENV_ZENML_ARTIFACT_STATISTICS_MAX_ROWS,
+)
+from zenml.utils import statistics_utils
+
+
+def test_max_sample_size_respects_row_and_byte_budget(monkeypatch):
+    """Tests that the sample size is limited by rows and bytes."""
+    monkeypatch.setenv(ENV_ZENML_ARTIFACT_STATISTICS_MAX_ROWS, "100")
+    monkeypatch.setenv(ENV_ZENML_ARTIFACT_STATISTICS_MAX_BYTES, "800")
+    assert statistics_utils.get_max_sample_size(row_size=1) == 100
+    assert statistics_utils.get_max_sample_size(row_size=16) == 50
+    assert statistics_utils.get_max_sample_size(row_size=10_000) == 1
+
+    monkeypatch.setenv(ENV_ZENML_ARTIFACT_STATISTICS_MAX_BYTES, "0")
+    assert statistics_utils.get_max_sample_size(row_size=16) == 100
+
+    monkeypatch.setenv(ENV_ZENML_ARTIFACT_STATISTICS_MAX_ROWS, "0")
+    assert statistics_utils.get_max_sample_size(row_size=16) is None
+
+
+def test_sample_indices(monkeypatch):
+    """Tests that rows are only sampled if they exceed the budget."""
+    monkeypatch.setenv(ENV_ZENML_ARTIFACT_STATISTICS_MAX_ROWS, "10")
+    assert statistics_utils.sample_indices(num_rows=10, row_size=8) is None
+
+    indices = statistics_utils.sample_indices(num_rows=1000, row_size=8)
+    assert len(indices) == 10
+    assert len(set(indices)) == 10
+    assert list(indices) == sorted(indices)
+    assert indices.max() < 1000
+
+    # Sampling is reproducible
+    assert np.array_equal(
+        indices, statistics_utils.sample_indices(num_rows=1000, row_size=8)
+    )
+
+
+def test_compute_numeric_statistics_matches_pandas():
+    """Tests that the computed statistics match the pandas ones."""
+    df = pd.DataFrame(
+        {
+            "a": [1.0, 2.0, np.nan, 4.0],
+            "b": [3, 1, 4, 1],
+            "c": [np.nan] * 4,
+        }
+    )
+
+    statistics = statistics_utils.compute_numeric_statistics(
+        df.to_numpy(dtype=np.float64), ddof=1
+    )
+
+    for stat_name, values in statistics.items():
+        expected = getattr(df, stat_name)().to_numpy(dtype=np.float64)
+        np.testing.assert_allclose(values, expected)
+
+
+def test_compute_numeric_statistics_for_empty_arrays():
+    """Tests computing statistics of arrays without rows."""
+    statistics = statistics_utils.compute_numeric_statistics(
+        np.empty((0, 2)), ddof=1
+    )
+    for values in statistics.values():
+        assert values.shape == (2,)
+        assert np.isnan(values).all()
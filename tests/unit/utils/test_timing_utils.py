@@ -0,0 +1,82 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from concurrent.futures import ThreadPoolExecutor
+
+from zenml.utils import timing_utils
+
+
+def test_spans_are_only_recorded_by_active_timer():
+    """Tests that spans are recorded by the active timer and ignored if no
+    timer is active."""
+    with timing_utils.span("ignored"):
+        pass
+
+    timer = timing_utils.StepTimer()
+    with timer.activate():
+        assert timing_utils.get_active_timer() is timer
+        for _ in range(2):
+            with timing_utils.span("phase"):
+                pass
+
+    assert timing_utils.get_active_timer() is None
+    assert list(timer.durations) == ["phase"]
+    assert timer.durations["phase"] >= 0
+
+
+def test_spans_in_thread_pools_are_recorded():
+    """Tests that spans of functions bound to the current context are
+    recorded when running in a thread pool."""
+
+    def _work() -> None:
+        with timing_utils.span("work"):
+            pass
+
+    timer = timing_utils.StepTimer()
+    with timer.activate(), ThreadPoolExecutor(max_workers=2) as executor:
+        executor.submit(_work).result()
+        assert timer.durations == {}
+
+        bound_work = timing_utils.in_current_context(_work)
+        futures = [executor.submit(bound_work) for _ in range(4)]
+        for future in futures:
+            future.result()
+
+    assert list(timer.durations) == ["work"]
+
+
+def test_aggregating_durations():
+    """Tests aggregating the phase durations of multiple step runs."""
+    aggregated = timing_utils.aggregate_durations(
+        [
+            {"step_function": 1.0, "materializer_save": 3.0},
+            {"step_function": 2.0},
+        ]
+    )
+
+    assert aggregated == [
+        {
+            "phase": "step_function",
+            "steps": 2,
+            "total": 3.0,
+            "mean": 1.5,
+            "max": 2.0,
+        },
+        {
+            "phase": "materializer_save",
+            "steps": 1,
+            "total": 3.0,
+            "mean": 3.0,
+            "max": 3.0,
+        },
+    ]
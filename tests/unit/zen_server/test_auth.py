@@ -0,0 +1,95 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from zenml.models.user_models import JWTToken, JWTTokenType
+from zenml.zen_server.auth import AuthContext, AuthContextCache
+
+
+def test_auth_context_cache_returns_cached_entries(sample_user_model):
+    """Tests that the auth context cache returns cached entries."""
+    cache = AuthContextCache(ttl=60)
+    auth_context = AuthContext(user=sample_user_model)
+
+    assert cache.get("token") is None
+    cache.set("token", auth_context)
+    assert cache.get("token") is auth_context
+
+    cache.invalidate()
+    assert cache.get("token") is None
+
+
+def test_auth_context_cache_respects_expiration(sample_user_model, mocker):
+    """Tests that the auth context cache drops expired entries."""
+    cache = AuthContextCache(ttl=60)
+    auth_context = AuthContext(user=sample_user_model)
+
+    mock_time = mocker.patch("zenml.zen_server.auth.time.monotonic")
+    mock_time.return_value = 0
+    cache.set("token", auth_context)
+
+    mock_time.return_value = 59
+    assert cache.get("token") is auth_context
+    mock_time.return_value = 60
+    assert cache.get("token") is None
+
+    # Already expired credentials are never cached
+    cache.set(
+        "token",
+        auth_context,
+        expires=datetime.utcnow() - timedelta(seconds=1),
+    )
+    assert cache.get("token") is None
+
+
+def test_auth_context_cache_can_be_disabled(sample_user_model):
+    """Tests that a TTL of zero disables the auth context cache."""
+    cache = AuthContextCache(ttl=0)
+    cache.set("token", AuthContext(user=sample_user_model))
+    assert cache.get("token") is None
+
+
+def test_auth_context_cache_max_size(sample_user_model):
+    """Tests that the auth context cache does not grow indefinitely."""
+    cache = AuthContextCache(ttl=60, max_size=2)
+    auth_context = AuthContext(user=sample_user_model)
+
+    cache.set("first", auth_context)
+    cache.set("second", auth_context)
+    cache.set("third", auth_context)
+
+    assert cache.get("third") is auth_context
+    assert cache.get("first") is None
+
+
+def test_jwt_token_decoding_includes_expiration():
+    """Tests that decoding a JWT token includes its expiration time."""
+    token = JWTToken(
+        token_type=JWTTokenType.ACCESS_TOKEN,
+        user_id=uuid4(),
+        permissions=["read"],
+    )
+
+    decoded_token = JWTToken.decode(
+        token_type=JWTTokenType.ACCESS_TOKEN, token=token.encode()
+    )
+    assert decoded_token.expires is None
+
+    decoded_token = JWTToken.decode(
+        token_type=JWTTokenType.ACCESS_TOKEN,
+        token=token.encode(expire_minutes=10),
+    )
+    assert decoded_token.expires is not None
+    assert decoded_token.expires > datetime.utcnow()
@@ -0,0 +1,180 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from zenml.zen_server.metrics import (
+    UNMATCHED_ROUTE,
+    RequestMetricsMiddleware,
+    ServerMetrics,
+    get_request_stats,
+    instrument_engine,
+)
+from zenml.zen_server.utils import handle_exceptions, run_in_read_thread_pool
+
+
+def _create_app(
+    metrics: ServerMetrics,
+    slow_request_threshold: float = 10.0,
+    profile_sample_rate: float = 0.0,
+) -> FastAPI:
+    """Creates an app recording metrics and executing SQL queries."""
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    instrument_engine(engine)
+
+    app = FastAPI()
+    app.add_middleware(
+        RequestMetricsMiddleware,
+        metrics=metrics,
+        slow_request_threshold=slow_request_threshold,
+        profile_sample_rate=profile_sample_rate,
+    )
+
+    @app.post("/queries/{count}")
+    @run_in_read_thread_pool
+    @handle_exceptions
+    def run_queries(count: int) -> bool:
+        with engine.connect() as connection:
+            for _ in range(count):
+                connection.execute(text("SELECT 1"))
+        stats = get_request_stats()
+        assert stats is not None
+        return stats.profile is None
+
+    @app.get("/stream/{chunk_count}")
+    def stream(chunk_count: int) -> StreamingResponse:
+        return StreamingResponse(
+            iter([b"1234567890"] * chunk_count),
+            media_type="application/octet-stream",
+        )
+
+    return app
+
+
+def test_middleware_records_metrics_per_route():
+    """Tests that requests are recorded by route with their query count."""
+    metrics = ServerMetrics(worker="0")
+    app = _create_app(metrics)
+
+    with TestClient(app) as client:
+        assert client.post("/queries/2", content=b"12345").status_code == 200
+        assert client.post("/queries/3").status_code == 200
+        assert client.get("/unknown").status_code == 404
+
+    rendered = metrics.render()
+    labels = 'method="POST",route="/queries/{count}",worker="0"'
+    assert (
+        'zenml_server_requests_total{method="POST",route="/queries/{count}",'
+        'status="200",worker="0"} 2' in rendered
+    )
+    assert f"zenml_server_sql_queries_total{{{labels}}} 5" in rendered
+    assert f"zenml_server_request_size_bytes_total{{{labels}}} 5" in rendered
+    assert (
+        f'zenml_server_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2'
+        in rendered
+    )
+    assert f"zenml_server_slow_requests_total{{{labels}}} 0" in rendered
+    assert f'route="{UNMATCHED_ROUTE}",status="404",worker="0"' in rendered
+    assert "/unknown" not in rendered
+    assert get_request_stats() is None
+
+
+def test_middleware_counts_bytes_of_streamed_responses():
+    """Tests that streamed responses without content length are measured."""
+    metrics = ServerMetrics(worker="0")
+    app = _create_app(metrics)
+
+    with TestClient(app) as client:
+        response = client.get("/stream/3")
+        assert response.status_code == 200
+        assert "content-length" not in response.headers
+        assert client.post("/queries/1").status_code == 200
+
+    rendered = metrics.render()
+    stream_labels = 'method="GET",route="/stream/{chunk_count}",worker="0"'
+    assert (
+        f"zenml_server_response_size_bytes_total{{{stream_labels}}} 30"
+        in rendered
+    )
+    # Responses with a content length are measured by their actual body
+    query_labels = 'method="POST",route="/queries/{count}",worker="0"'
+    assert (
+        f"zenml_server_response_size_bytes_total{{{query_labels}}} "
+        f"{len(b'true')}" in rendered
+    )
+
+
+def test_middleware_profiles_sampled_slow_requests(mocker):
+    """Tests that sampled requests are profiled and reported if slow."""
+    mock_logger = mocker.patch("zenml.zen_server.metrics.logger")
+    metrics = ServerMetrics(worker="0")
+    app = _create_app(
+        metrics, slow_request_threshold=0.0, profile_sample_rate=1.0
+    )
+
+    with TestClient(app) as client:
+        response = client.post("/queries/1")
+        assert response.status_code == 200
+        # The profile is only stored once the endpoint returned
+        assert response.json() is True
+
+    labels = 'method="POST",route="/queries/{count}",worker="0"'
+    assert f"zenml_server_slow_requests_total{{{labels}}} 1" in (
+        metrics.render()
+    )
+    assert mock_logger.warning.call_count == 1
+    assert "function calls" in mock_logger.warning.call_args.args[-1]
+
+
+def test_server_metrics_histogram_is_cumulative():
+    """Tests that the latency histogram buckets are cumulative."""
+    metrics = ServerMetrics(buckets=[1.0, 0.1], worker="0")
+    metrics.observe(
+        method="GET",
+        route="/",
+        status_code=200,
+        duration=0.5,
+        query_count=0,
+        request_size=0,
+        response_size=10,
+    )
+
+    rendered = metrics.render()
+    labels = 'method="GET",route="/",worker="0"'
+    assert f'_bucket{{{labels},le="0.1"}} 0' in rendered
+    assert f'_bucket{{{labels},le="1.0"}} 1' in rendered
+    assert f"zenml_server_response_size_bytes_total{{{labels}}} 10" in rendered
+
+
+def test_server_metrics_are_labeled_by_worker_process(mocker):
+    """Tests that the metrics are labeled with the current process ID."""
+    mocker.patch("zenml.zen_server.metrics.os.getpid", return_value=1234)
+    metrics = ServerMetrics()
+    metrics.observe(
+        method="GET",
+        route="/",
+        status_code=200,
+        duration=0.5,
+        query_count=0,
+        request_size=0,
+        response_size=0,
+    )
+
+    assert (
+        'zenml_server_requests_total{method="GET",route="/",status="200",'
+        'worker="1234"} 1' in metrics.render()
+    )
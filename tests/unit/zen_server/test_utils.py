@@ -0,0 +1,142 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import threading
+
+import pytest
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.testclient import TestClient
+
+from zenml.zen_server.utils import (
+    artifact_file_response,
+    handle_exceptions,
+    parse_range_header,
+    run_in_read_thread_pool,
+)
+
+
+def test_run_in_read_thread_pool_runs_endpoint_in_worker_thread():
+    """Tests that decorated endpoints run outside the event loop thread."""
+    app = FastAPI()
+
+    @app.get("/threads/{name}")
+    @run_in_read_thread_pool
+    @handle_exceptions
+    def get_thread(name: str, suffix: str = "") -> str:
+        return name + suffix + threading.current_thread().name
+
+    @app.get("/errors")
+    @run_in_read_thread_pool
+    @handle_exceptions
+    def raise_error() -> None:
+        raise KeyError("not found")
+
+    with TestClient(app) as client:
+        response = client.get("/threads/test", params={"suffix": "-"})
+        assert response.status_code == 200
+        assert response.json().startswith("test-")
+        assert response.json() != "test-" + threading.current_thread().name
+
+        response = client.get("/errors")
+        assert response.status_code == 404
+
+
+def test_run_in_read_thread_pool_preserves_http_exceptions():
+    """Tests that HTTP exceptions raised by endpoints are passed through."""
+    app = FastAPI()
+
+    @app.get("/")
+    @run_in_read_thread_pool
+    def forbidden() -> None:
+        raise HTTPException(status_code=403)
+
+    with TestClient(app) as client:
+        assert client.get("/").status_code == 403
+
+
+def test_parsing_range_headers():
+    """Tests parsing the byte range of HTTP range headers."""
+    assert parse_range_header("bytes=0-9", size=100) == (0, 9)
+    assert parse_range_header("bytes=90-", size=100) == (90, 99)
+    assert parse_range_header("bytes=90-200", size=100) == (90, 99)
+    assert parse_range_header("bytes=-10", size=100) == (90, 99)
+    assert parse_range_header("bytes=-200", size=100) == (0, 99)
+
+    # Unsupported or invalid ranges are ignored
+    assert parse_range_header("bytes=0-1,5-6", size=100) is None
+    assert parse_range_header("items=0-9", size=100) is None
+    assert parse_range_header("bytes=9-0", size=100) is None
+    assert parse_range_header("bytes=a-b", size=100) is None
+    assert parse_range_header("bytes=-", size=100) is None
+
+    with pytest.raises(ValueError):
+        parse_range_header("bytes=100-", size=100)
+    with pytest.raises(ValueError):
+        parse_range_header("bytes=-0", size=100)
+
+
+def test_artifact_file_response(tmp_path, local_artifact_store):
+    """Tests streaming artifact files with range requests and ETags."""
+    content = bytes(range(256)) * 10
+    uri = str(tmp_path / "data.bin")
+    with open(uri, "wb") as f:
+        f.write(content)
+
+    app = FastAPI()
+
+    @app.get("/file")
+    def get_file(request: Request) -> Response:
+        return artifact_file_response(
+            request=request,
+            artifact_store=local_artifact_store,
+            uri=uri,
+            etag_seed="artifact",
+        )
+
+    with TestClient(app) as client:
+        response = client.get("/file")
+        assert response.status_code == 200
+        assert response.content == content
+        assert response.headers["content-length"] == str(len(content))
+        assert response.headers["accept-ranges"] == "bytes"
+        etag = response.headers["etag"]
+
+        response = client.get("/file", headers={"Range": "bytes=10-19"})
+        assert response.status_code == 206
+        assert response.content == content[10:20]
+        assert response.headers["content-range"] == (
+            f"bytes 10-19/{len(content)}"
+        )
+
+        response = client.get(
+            "/file", headers={"Range": "bytes=-5", "If-Range": etag}
+        )
+        assert response.status_code == 206
+        assert response.content == content[-5:]
+
+        # Ranges of outdated files are ignored
+        response = client.get(
+            "/file", headers={"Range": "bytes=-5", "If-Range": '"outdated"'}
+        )
+        assert response.status_code == 200
+        assert response.content == content
+
+        response = client.get(
+            "/file", headers={"Range": f"bytes={len(content)}-"}
+        )
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{len(content)}"
+
+        response = client.get("/file", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
@@ -0,0 +1,78 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from contextlib import contextmanager
+from typing import Any, Callable, ContextManager, Iterator, List, Tuple
+
+import pytest
+from sqlalchemy import event
+
+
+class QueryCounter:
+    """Records the SQL statements executed by an engine."""
+
+    def __init__(self) -> None:
+        """Initializes the counter."""
+        self.queries: List[Tuple[str, Any]] = []
+
+    def _before_cursor_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        """Records a statement before it is executed."""
+        self.queries.append((statement, parameters))
+
+    @property
+    def selects(self) -> List[Tuple[str, Any]]:
+        """The recorded SELECT statements and their parameters."""
+        return [
+            (statement, parameters)
+            for statement, parameters in self.queries
+            if statement.lstrip().upper().startswith("SELECT")
+        ]
+
+    @property
+    def count(self) -> int:
+        """The number of recorded statements."""
+        return len(self.queries)
+
+
+@pytest.fixture
+def query_counter(
+    clean_client,
+) -> Callable[[], ContextManager[QueryCounter]]:
+    """Fixture that returns a context manager recording the SQL statements
+    executed by the store of the clean client while it is active."""
+    engine = clean_client.zen_store.engine
+
+    @contextmanager
+    def _count_queries() -> Iterator[QueryCounter]:
+        counter = QueryCounter()
+        event.listen(
+            engine, "before_cursor_execute", counter._before_cursor_execute
+        )
+        try:
+            yield counter
+        finally:
+            event.remove(
+                engine,
+                "before_cursor_execute",
+                counter._before_cursor_execute,
+            )
+
+    return _count_queries
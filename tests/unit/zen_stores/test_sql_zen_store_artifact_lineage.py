@@ -0,0 +1,197 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from uuid import uuid4
+
+import pytest
+
+from zenml.enums import ExecutionStatus, LineageDirection
+from zenml.models import StepRunRequestModel
+from zenml.zen_stores.sql_zen_store import SqlZenStore
+
+
+@pytest.fixture
+def artifact_chain(
+    clean_client,
+    sample_pipeline_run_request_model,
+    sample_step_request_model,
+    sample_artifact_request_model,
+):
+    """Fixture that creates artifacts consumed by steps of other runs.
+
+    Run 1 produces `a1`, run 2 consumes `a1` in two steps, one of which
+    produces `a2`, and run 3 consumes `a2` to produce `a3`.
+    """
+    store = clean_client.zen_store
+    user_id = clean_client.active_user.id
+    workspace_id = clean_client.active_workspace.id
+
+    artifacts = {}
+    for name in ["a1", "a2", "a3"]:
+        sample_artifact_request_model.name = name
+        sample_artifact_request_model.user = user_id
+        sample_artifact_request_model.workspace = workspace_id
+        artifacts[name] = store.create_artifact(sample_artifact_request_model)
+
+    runs = {}
+    for run_name in ["run_1", "run_2", "run_3"]:
+        sample_pipeline_run_request_model.id = uuid4()
+        sample_pipeline_run_request_model.name = run_name
+        sample_pipeline_run_request_model.user = user_id
+        sample_pipeline_run_request_model.workspace = workspace_id
+        runs[run_name] = store.create_run(sample_pipeline_run_request_model)
+
+    steps = {}
+    for step_name, run_name, inputs, outputs in [
+        ("producer", "run_1", [], ["a1"]),
+        ("transformer", "run_2", ["a1"], ["a2"]),
+        ("evaluator", "run_2", ["a1"], []),
+        ("consumer", "run_3", ["a2"], ["a3"]),
+    ]:
+        sample_step_request_model.name = step_name
+        sample_step_request_model.user = user_id
+        sample_step_request_model.workspace = workspace_id
+        sample_step_request_model.pipeline_run_id = runs[run_name].id
+        sample_step_request_model.inputs = {
+            name: artifacts[name].id for name in inputs
+        }
+        sample_step_request_model.outputs = {
+            name: artifacts[name].id for name in outputs
+        }
+        steps[step_name] = store.create_run_step(sample_step_request_model)
+
+    return artifacts, runs, steps
+
+
+@pytest.mark.parametrize("recursive", [True, False])
+def test_downstream_artifact_lineage(
+    clean_client, artifact_chain, monkeypatch, recursive
+):
+    """Tests following the consumers of an artifact across runs."""
+    artifacts, runs, steps = artifact_chain
+    monkeypatch.setattr(
+        SqlZenStore,
+        "_supports_recursive_queries",
+        staticmethod(lambda session: recursive),
+    )
+
+    lineage = clean_client.get_artifact_lineage(artifacts["a1"].id)
+
+    assert lineage.direction == LineageDirection.DOWNSTREAM
+    depths = {step.step_run_id: step.depth for step in lineage.steps}
+    assert depths == {
+        steps["transformer"].id: 1,
+        steps["evaluator"].id: 1,
+        steps["consumer"].id: 2,
+    }
+    assert [step.depth for step in lineage.steps] == [1, 1, 2]
+    assert set(lineage.artifact_ids) == {
+        artifacts["a2"].id,
+        artifacts["a3"].id,
+    }
+    assert lineage.pipeline_run_ids == [runs["run_2"].id, runs["run_3"].id]
+
+    lineage = clean_client.get_artifact_lineage(
+        artifacts["a1"].id, max_depth=1
+    )
+    assert {step.step_run_id for step in lineage.steps} == {
+        steps["transformer"].id,
+        steps["evaluator"].id,
+    }
+    assert lineage.artifact_ids == [artifacts["a2"].id]
+
+
+@pytest.mark.parametrize("recursive", [True, False])
+def test_upstream_artifact_lineage(
+    clean_client, artifact_chain, monkeypatch, recursive
+):
+    """Tests following the producers of an artifact across runs."""
+    artifacts, runs, steps = artifact_chain
+    monkeypatch.setattr(
+        SqlZenStore,
+        "_supports_recursive_queries",
+        staticmethod(lambda session: recursive),
+    )
+
+    lineage = clean_client.get_artifact_lineage(
+        artifacts["a3"].id, direction=LineageDirection.UPSTREAM
+    )
+
+    assert [(step.step_run_id, step.depth) for step in lineage.steps] == [
+        (steps["consumer"].id, 1),
+        (steps["transformer"].id, 2),
+        (steps["producer"].id, 3),
+    ]
+    assert lineage.steps[0].artifact_ids == [artifacts["a2"].id]
+    assert lineage.steps[2].artifact_ids == []
+    assert lineage.artifact_ids == [artifacts["a2"].id, artifacts["a1"].id]
+    assert lineage.pipeline_run_ids == [
+        runs["run_3"].id,
+        runs["run_2"].id,
+        runs["run_1"].id,
+    ]
+
+
+def test_artifact_lineage_errors(clean_client, artifact_chain):
+    """Tests the errors raised for invalid lineage queries."""
+    artifacts, _, _ = artifact_chain
+    with pytest.raises(KeyError):
+        clean_client.get_artifact_lineage(uuid4())
+
+    with pytest.raises(ValueError):
+        clean_client.get_artifact_lineage(artifacts["a1"].id, max_depth=0)
+
+
+@pytest.mark.parametrize("recursive", [True, False])
+def test_cyclic_artifact_lineage(
+    clean_client, artifact_chain, monkeypatch, recursive
+):
+    """Tests that the lineage query terminates if artifacts are linked in a
+    cycle."""
+    artifacts, runs, steps = artifact_chain
+    monkeypatch.setattr(
+        SqlZenStore,
+        "_supports_recursive_queries",
+        staticmethod(lambda session: recursive),
+    )
+    store = clean_client.zen_store
+    cycle_run = runs["run_3"]
+
+    # `a3` is consumed by a step that produces `a1` again
+    cycle_step = store.create_run_step(
+        StepRunRequestModel(
+            name="cycle",
+            user=clean_client.active_user.id,
+            workspace=clean_client.active_workspace.id,
+            pipeline_run_id=cycle_run.id,
+            status=ExecutionStatus.COMPLETED,
+            spec=steps["consumer"].spec,
+            config=steps["consumer"].config,
+            inputs={"a3": artifacts["a3"].id},
+            outputs={"a1": artifacts["a1"].id},
+        )
+    )
+
+    lineage = clean_client.get_artifact_lineage(artifacts["a1"].id)
+    depths = {step.step_run_id: step.depth for step in lineage.steps}
+    assert depths == {
+        steps["transformer"].id: 1,
+        steps["evaluator"].id: 1,
+        steps["consumer"].id: 2,
+        cycle_step.id: 3,
+    }
+
+    lineage = clean_client.get_artifact_lineage(
+        artifacts["a1"].id, max_depth=2
+    )
+    assert cycle_step.id not in {step.step_run_id for step in lineage.steps}
@@ -0,0 +1,207 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import pytest
+
+from zenml.config.pipeline_configurations import PipelineConfiguration
+from zenml.config.step_configurations import Step
+from zenml.enums import HydrationLevel, VisualizationType
+from zenml.metadata.metadata_types import MetadataTypeEnum
+from zenml.models import (
+    PipelineDeploymentRequestModel,
+    PipelineRunFilterModel,
+    RunMetadataRequestModel,
+)
+from zenml.models.visualization_models import VisualizationModel
+
+
+@pytest.fixture
+def step_run_with_output(
+    clean_client,
+    sample_pipeline_run_request_model,
+    sample_step_request_model,
+    sample_artifact_request_model,
+):
+    """Fixture that creates a run with a deployment and a step producing an
+    artifact with metadata and visualizations."""
+    user_id = clean_client.active_user.id
+    workspace_id = clean_client.active_workspace.id
+    deployment = clean_client.zen_store.create_deployment(
+        PipelineDeploymentRequestModel(
+            user=user_id,
+            workspace=workspace_id,
+            stack=clean_client.active_stack_model.id,
+            run_name_template="",
+            pipeline_configuration=PipelineConfiguration(name="pipeline"),
+            step_configurations={
+                sample_step_request_model.name: Step(
+                    spec=sample_step_request_model.spec,
+                    config=sample_step_request_model.config,
+                )
+            },
+        )
+    )
+    sample_pipeline_run_request_model.deployment = deployment.id
+    sample_pipeline_run_request_model.stack = (
+        clean_client.active_stack_model.id
+    )
+    sample_pipeline_run_request_model.user = user_id
+    sample_pipeline_run_request_model.workspace = workspace_id
+    run = clean_client.zen_store.create_run(sample_pipeline_run_request_model)
+
+    sample_artifact_request_model.user = user_id
+    sample_artifact_request_model.workspace = workspace_id
+    sample_artifact_request_model.visualizations = [
+        VisualizationModel(type=VisualizationType.HTML, uri="vis.html")
+    ]
+    artifact = clean_client.zen_store.create_artifact(
+        sample_artifact_request_model
+    )
+
+    sample_step_request_model.user = user_id
+    sample_step_request_model.workspace = workspace_id
+    sample_step_request_model.pipeline_run_id = run.id
+    sample_step_request_model.outputs = {"output": artifact.id}
+    step_run = clean_client.zen_store.create_run_step(
+        sample_step_request_model
+    )
+
+    for metadata_target in [
+        {"pipeline_run_id": run.id},
+        {"step_run_id": step_run.id},
+        {"artifact_id": artifact.id},
+    ]:
+        clean_client.zen_store.create_run_metadata(
+            RunMetadataRequestModel(
+                user=user_id,
+                workspace=workspace_id,
+                key="accuracy",
+                value=0.9,
+                type=MetadataTypeEnum.FLOAT,
+                **metadata_target,
+            )
+        )
+
+    return step_run
+
+
+def test_run_hydration_levels(clean_client, step_run_with_output):
+    """Tests which parts of a pipeline run get hydrated on each level."""
+    store = clean_client.zen_store
+    run_id = step_run_with_output.pipeline_run_id
+
+    run = store.get_run(run_id, hydration=HydrationLevel.SUMMARY)
+    assert run.hydration == HydrationLevel.SUMMARY
+    assert run.id == run_id
+    assert run.status == step_run_with_output.status
+    assert run.steps == {}
+    assert run.metadata == {}
+    assert run.stack is None
+    assert run.deployment is None
+
+    run = store.get_run(run_id, hydration=HydrationLevel.BODY)
+    assert run.hydration == HydrationLevel.BODY
+    assert run.steps == {}
+    assert set(run.metadata) == {"accuracy"}
+    assert run.stack is not None
+    assert run.deployment is None
+
+    run = store.get_run(run_id)
+    assert run.hydration == HydrationLevel.FULL
+    assert set(run.steps) == {step_run_with_output.name}
+    assert run.stack is not None
+    assert run.deployment is not None
+    output = run.steps[step_run_with_output.name].outputs["output"]
+    assert set(output.metadata) == {"accuracy"}
+
+
+def test_list_runs_hydration_levels(clean_client, step_run_with_output):
+    """Tests that listing runs respects the hydration level."""
+    runs = clean_client.zen_store.list_runs(
+        PipelineRunFilterModel(), hydration=HydrationLevel.SUMMARY
+    )
+    assert runs.total == 1
+    assert runs.items[0].steps == {}
+    assert runs.items[0].deployment is None
+
+    runs = clean_client.list_pipeline_runs()
+    assert set(runs.items[0].steps) == {step_run_with_output.name}
+
+
+def test_step_run_hydration_levels(clean_client, step_run_with_output):
+    """Tests which parts of a step run get hydrated on each level."""
+    store = clean_client.zen_store
+    step_run_id = step_run_with_output.id
+
+    step_run = store.get_run_step(
+        step_run_id, hydration=HydrationLevel.SUMMARY
+    )
+    assert step_run.hydration == HydrationLevel.SUMMARY
+    assert step_run.outputs == {}
+    assert step_run.metadata == {}
+
+    step_run = store.get_run_step(step_run_id, hydration=HydrationLevel.BODY)
+    assert set(step_run.metadata) == {"accuracy"}
+    output = step_run.outputs["output"]
+    assert output.hydration == HydrationLevel.SUMMARY
+    assert output.metadata == {}
+    assert output.visualizations == []
+    assert output.producer_step_run_id is None
+
+    step_run = store.get_run_step(step_run_id)
+    output = step_run.outputs["output"]
+    assert set(output.metadata) == {"accuracy"}
+    assert len(output.visualizations) == 1
+    assert output.producer_step_run_id == step_run_id
+
+
+def test_artifact_hydration_levels(clean_client, step_run_with_output):
+    """Tests which parts of an artifact get hydrated on each level."""
+    artifact_id = step_run_with_output.outputs["output"].id
+
+    artifact = clean_client.get_artifact(
+        artifact_id, hydration=HydrationLevel.SUMMARY
+    )
+    assert artifact.hydration == HydrationLevel.SUMMARY
+    assert artifact.producer_step_run_id is None
+    assert artifact.visualizations == []
+
+    artifact = clean_client.get_artifact(
+        artifact_id, hydration=HydrationLevel.BODY
+    )
+    assert artifact.producer_step_run_id == step_run_with_output.id
+    assert len(artifact.visualizations) == 1
+    assert artifact.metadata == {}
+
+    artifacts = clean_client.list_artifacts(hydration=HydrationLevel.FULL)
+    assert set(artifacts.items[0].metadata) == {"accuracy"}
+
+
+def test_partially_hydrated_models_fetch_what_they_miss(
+    clean_client, step_run_with_output
+):
+    """Tests that properties of partially hydrated models don't silently
+    return empty results."""
+    store = clean_client.zen_store
+    output = step_run_with_output.outputs["output"]
+
+    run = store.get_run(
+        step_run_with_output.pipeline_run_id, hydration=HydrationLevel.BODY
+    )
+    assert run.steps == {}
+    assert [artifact.id for artifact in run.artifacts] == [output.id]
+
+    artifact = clean_client.get_artifact(
+        output.id, hydration=HydrationLevel.SUMMARY
+    )
+    assert artifact.step.id == step_run_with_output.id
@@ -0,0 +1,98 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from typing import Any, List, Tuple
+from uuid import uuid4
+
+from sqlalchemy import inspect
+from sqlmodel import SQLModel
+
+from zenml.enums import ExecutionStatus
+from zenml.models import RunMetadataFilterModel, StepRunFilterModel
+
+
+def _get_query_plans(engine: Any, queries: List[Tuple[str, Any]]) -> str:
+    """Gets the SQLite query plans of the given queries."""
+    plans = []
+    with engine.connect() as connection:
+        for statement, parameters in queries:
+            rows = connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).fetchall()
+            plans.extend(str(row[-1]) for row in rows)
+    return "\n".join(plans)
+
+
+def test_migrations_create_all_schema_indexes(clean_client):
+    """Tests that the database migrations create all indexes defined in the
+    SQL schemas."""
+    inspector = inspect(clean_client.zen_store.engine)
+
+    for table in SQLModel.metadata.tables.values():
+        existing_indexes = {
+            index["name"] for index in inspector.get_indexes(table.name)
+        }
+        for index in table.indexes:
+            assert index.name in existing_indexes
+
+
+def test_cache_lookup_uses_index(clean_client, query_counter):
+    """Tests that looking up cached step runs uses an index."""
+    engine = clean_client.zen_store.engine
+
+    with query_counter() as counter:
+        clean_client.zen_store.list_run_steps(
+            StepRunFilterModel(
+                workspace_id=clean_client.active_workspace.id,
+                cache_key="cache_key",
+                status=ExecutionStatus.COMPLETED,
+                sort_by="desc:created",
+                size=1,
+            )
+        )
+
+    assert "ix_step_run_cache_key_status" in _get_query_plans(
+        engine, counter.selects
+    )
+
+
+def test_run_step_listing_uses_index(clean_client, query_counter):
+    """Tests that listing the steps of a run uses an index."""
+    engine = clean_client.zen_store.engine
+
+    with query_counter() as counter:
+        clean_client.zen_store.list_run_steps(
+            StepRunFilterModel(pipeline_run_id=uuid4())
+        )
+
+    assert "ix_step_run_pipeline_run_id_status" in _get_query_plans(
+        engine, counter.selects
+    )
+
+
+def test_run_metadata_listing_uses_indexes(clean_client, query_counter):
+    """Tests that listing the metadata of runs, steps and artifacts uses
+    indexes."""
+    engine = clean_client.zen_store.engine
+
+    for filter_field, index_name in [
+        ("pipeline_run_id", "ix_run_metadata_pipeline_run_id_key"),
+        ("step_run_id", "ix_run_metadata_step_run_id_key"),
+        ("artifact_id", "ix_run_metadata_artifact_id_key"),
+    ]:
+        with query_counter() as counter:
+            clean_client.zen_store.list_run_metadata(
+                RunMetadataFilterModel(**{filter_field: uuid4()})
+            )
+
+        assert index_name in _get_query_plans(engine, counter.selects)
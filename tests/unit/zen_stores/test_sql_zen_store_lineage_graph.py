@@ -0,0 +1,140 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import pytest
+
+from zenml.enums import ExecutionStatus
+from zenml.lineage_graph.lineage_graph import LineageGraph
+from zenml.metadata.metadata_types import MetadataTypeEnum
+from zenml.models import RunMetadataRequestModel, StepRunUpdateModel
+
+
+def _add_metadata(client, key, value, **target):
+    """Adds a float metadata value to a run, step or artifact."""
+    client.zen_store.create_run_metadata(
+        RunMetadataRequestModel(
+            user=client.active_user.id,
+            workspace=client.active_workspace.id,
+            key=key,
+            value=value,
+            type=MetadataTypeEnum.FLOAT,
+            **target,
+        )
+    )
+
+
+@pytest.fixture
+def two_step_run(
+    clean_client,
+    sample_pipeline_run_request_model,
+    sample_step_request_model,
+    sample_artifact_request_model,
+):
+    """Fixture that creates a run with a step consuming the output of
+    another step."""
+    store = clean_client.zen_store
+    user_id = clean_client.active_user.id
+    workspace_id = clean_client.active_workspace.id
+    sample_pipeline_run_request_model.user = user_id
+    sample_pipeline_run_request_model.workspace = workspace_id
+    run = store.create_run(sample_pipeline_run_request_model)
+
+    sample_artifact_request_model.user = user_id
+    sample_artifact_request_model.workspace = workspace_id
+    artifacts = []
+    for name in ["first", "second"]:
+        sample_artifact_request_model.name = name
+        sample_artifact_request_model.uri = f"uri_{name}"
+        artifacts.append(store.create_artifact(sample_artifact_request_model))
+
+    sample_step_request_model.user = user_id
+    sample_step_request_model.workspace = workspace_id
+    sample_step_request_model.pipeline_run_id = run.id
+    sample_step_request_model.outputs = {"output": artifacts[0].id}
+    first_step = store.create_run_step(sample_step_request_model)
+
+    sample_step_request_model.name = "second_step"
+    sample_step_request_model.inputs = {"input": artifacts[0].id}
+    sample_step_request_model.outputs = {"output": artifacts[1].id}
+    sample_step_request_model.parent_step_ids = [first_step.id]
+    sample_step_request_model.status = ExecutionStatus.RUNNING
+    second_step = store.create_run_step(sample_step_request_model)
+
+    _add_metadata(clean_client, "duration", 1.5, pipeline_run_id=run.id)
+    _add_metadata(clean_client, "loss", 0.1, step_run_id=first_step.id)
+    _add_metadata(clean_client, "accuracy", 0.8, artifact_id=artifacts[0].id)
+    _add_metadata(clean_client, "accuracy", 0.9, artifact_id=artifacts[0].id)
+    return run, first_step, second_step
+
+
+def test_lineage_graph_matches_hydrated_run(clean_client, two_step_run):
+    """Tests that the bulk loaded graph equals the graph built from the
+    hydrated run."""
+    run, first_step, _ = two_step_run
+    expected = LineageGraph()
+    expected.generate_run_nodes_and_edges(
+        clean_client.zen_store.get_run(run.id)
+    )
+
+    graph = clean_client.zen_store.get_run_lineage_graph(run.id)
+
+    assert graph.timestamp is not None
+    assert graph.dict(exclude={"timestamp"}) == expected.dict(
+        exclude={"timestamp"}
+    )
+    assert graph.root_step_id == f"step_{first_step.id}"
+    assert len(graph.nodes) == 4
+    assert len(graph.edges) == 3
+    artifact_node = next(
+        node for node in graph.nodes if node.data.name == "output"
+    )
+    assert artifact_node.data.metadata == [
+        ("accuracy", "0.9", str(MetadataTypeEnum.FLOAT))
+    ]
+
+
+def test_incremental_lineage_graph(clean_client, two_step_run):
+    """Tests that incremental graphs only contain the changed steps."""
+    store = clean_client.zen_store
+    run, first_step, second_step = two_step_run
+    graph = store.get_run_lineage_graph(run.id)
+
+    unchanged = store.get_run_lineage_graph(run.id, since=graph.timestamp)
+    assert unchanged.nodes == []
+    assert unchanged.edges == []
+    assert unchanged.root_step_id is None
+    assert unchanged.run_metadata == graph.run_metadata
+    assert unchanged.timestamp > graph.timestamp
+
+    store.update_run_step(
+        second_step.id, StepRunUpdateModel(status=ExecutionStatus.COMPLETED)
+    )
+    changed = store.get_run_lineage_graph(run.id, since=graph.timestamp)
+    assert {node.id for node in changed.nodes} == {
+        f"step_{second_step.id}",
+        f"artifact_{second_step.outputs['output'].id}",
+    }
+    assert len(changed.edges) == 2
+    assert changed.nodes[0].data.status == ExecutionStatus.COMPLETED
+
+    _add_metadata(
+        clean_client,
+        "accuracy",
+        0.95,
+        artifact_id=first_step.outputs["output"].id,
+    )
+    changed = store.get_run_lineage_graph(run.id, since=changed.timestamp)
+    assert {node.id for node in changed.nodes} == {
+        f"step_{first_step.id}",
+        f"artifact_{first_step.outputs['output'].id}",
+    }
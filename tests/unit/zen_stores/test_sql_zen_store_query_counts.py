@@ -0,0 +1,264 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from typing import Callable, List
+from uuid import UUID, uuid4
+
+import pytest
+
+from zenml.config.pipeline_configurations import PipelineConfiguration
+from zenml.config.pipeline_spec import PipelineSpec
+from zenml.config.step_configurations import Step
+from zenml.enums import (
+    ArtifactType,
+    ExecutionStatus,
+    HydrationLevel,
+    StackComponentType,
+)
+from zenml.metadata.metadata_types import MetadataTypeEnum
+from zenml.models import (
+    ArtifactFilterModel,
+    ArtifactRequestModel,
+    LogsRequestModel,
+    PipelineDeploymentFilterModel,
+    PipelineDeploymentRequestModel,
+    PipelineFilterModel,
+    PipelineRequestModel,
+    PipelineRunFilterModel,
+    PipelineRunRequestModel,
+    RunMetadataRequestModel,
+    StepRunFilterModel,
+    StepRunRequestModel,
+)
+
+# Number of runs or steps of the data sets whose query counts are compared
+SMALL_SIZE = 2
+SIZES = [SMALL_SIZE, 8, 32]
+
+
+@pytest.fixture
+def create_run(
+    clean_client, sample_step_request_model
+) -> Callable[[int, int], UUID]:
+    """Fixture that returns a function which creates a run with the given
+    index and number of steps. Each run belongs to its own pipeline and
+    deployment and each step produces an artifact and stores logs, all with
+    metadata."""
+    store = clean_client.zen_store
+    user_id = clean_client.active_user.id
+    workspace_id = clean_client.active_workspace.id
+    stack = clean_client.active_stack_model
+    artifact_store_id = stack.components[StackComponentType.ARTIFACT_STORE][
+        0
+    ].id
+
+    def _create_run(index: int, step_count: int = 1) -> UUID:
+        name = f"pipeline_{index}"
+        step_names = [f"step_{i}" for i in range(step_count)]
+        pipeline = store.create_pipeline(
+            PipelineRequestModel(
+                user=user_id,
+                workspace=workspace_id,
+                name=name,
+                version="1",
+                version_hash=name,
+                spec=PipelineSpec(steps=[]),
+            )
+        )
+        deployment = store.create_deployment(
+            PipelineDeploymentRequestModel(
+                user=user_id,
+                workspace=workspace_id,
+                stack=stack.id,
+                pipeline=pipeline.id,
+                run_name_template="",
+                pipeline_configuration=PipelineConfiguration(name=name),
+                step_configurations={
+                    step_name: Step(
+                        spec=sample_step_request_model.spec,
+                        config=sample_step_request_model.config,
+                    )
+                    for step_name in step_names
+                },
+            )
+        )
+        run = store.create_run(
+            PipelineRunRequestModel(
+                id=uuid4(),
+                user=user_id,
+                workspace=workspace_id,
+                stack=stack.id,
+                pipeline=pipeline.id,
+                deployment=deployment.id,
+                name=f"run_{index}",
+                config=PipelineConfiguration(name=name),
+                num_steps=step_count,
+                status=ExecutionStatus.COMPLETED,
+            )
+        )
+        metadata_targets = [{"pipeline_run_id": run.id}]
+        for step_name in step_names:
+            artifact = store.create_artifact(
+                ArtifactRequestModel(
+                    user=user_id,
+                    workspace=workspace_id,
+                    name="output",
+                    uri=f"uri_{index}_{step_name}",
+                    type=ArtifactType.DATA,
+                    materializer="materializer",
+                    data_type="data_type",
+                )
+            )
+            step_run = store.create_run_step(
+                StepRunRequestModel(
+                    user=user_id,
+                    workspace=workspace_id,
+                    name=step_name,
+                    pipeline_run_id=run.id,
+                    status=ExecutionStatus.COMPLETED,
+                    spec=sample_step_request_model.spec,
+                    config=sample_step_request_model.config,
+                    outputs={"output": artifact.id},
+                    logs=LogsRequestModel(
+                        uri=f"logs_{index}_{step_name}",
+                        artifact_store_id=artifact_store_id,
+                    ),
+                )
+            )
+            metadata_targets.append({"step_run_id": step_run.id})
+            metadata_targets.append({"artifact_id": artifact.id})
+
+        for target in metadata_targets:
+            store.create_run_metadata(
+                RunMetadataRequestModel(
+                    user=user_id,
+                    workspace=workspace_id,
+                    key="accuracy",
+                    value=0.9,
+                    type=MetadataTypeEnum.FLOAT,
+                    **target,
+                )
+            )
+        return run.id
+
+    return _create_run
+
+
+@pytest.fixture
+def create_runs(clean_client, create_run) -> Callable[[int], List[UUID]]:
+    """Fixture that returns a function which tops up the store to the given
+    number of runs with one step each."""
+    store = clean_client.zen_store
+
+    def _create_runs(count: int) -> List[UUID]:
+        first_index = store.list_runs(PipelineRunFilterModel()).total
+        return [create_run(index) for index in range(first_index, count)]
+
+    return _create_runs
+
+
+def _get_run(store, run_ids):
+    return store.get_run(run_ids[0])
+
+
+def _list_runs(store, run_ids):
+    return store.list_runs(PipelineRunFilterModel())
+
+
+def _list_run_summaries(store, run_ids):
+    return store.list_runs(
+        PipelineRunFilterModel(), hydration=HydrationLevel.SUMMARY
+    )
+
+
+def _list_run_steps(store, run_ids):
+    return store.list_run_steps(StepRunFilterModel())
+
+
+def _list_artifacts(store, run_ids):
+    return store.list_artifacts(ArtifactFilterModel())
+
+
+def _list_pipelines(store, run_ids):
+    return store.list_pipelines(PipelineFilterModel())
+
+
+def _list_deployments(store, run_ids):
+    return store.list_deployments(PipelineDeploymentFilterModel())
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        _get_run,
+        _list_runs,
+        _list_run_summaries,
+        _list_run_steps,
+        _list_artifacts,
+        _list_pipelines,
+        _list_deployments,
+    ],
+)
+def test_query_count_does_not_grow_with_page_size(
+    clean_client, create_runs, query_counter, call
+):
+    """Tests that the number of queries to list or get entities doesn't grow
+    with the number of entities, which would indicate lazy loads per item."""
+    store = clean_client.zen_store
+
+    query_counts = {}
+    for size in SIZES:
+        run_ids = create_runs(size)
+        with query_counter() as counter:
+            call(store, run_ids)
+        query_counts[size] = counter.count
+
+    assert len(set(query_counts.values())) == 1, (
+        f"{call.__name__} executed a different number of queries depending "
+        f"on the number of runs: {query_counts}"
+    )
+
+
+def test_get_run_query_count_does_not_grow_with_step_count(
+    clean_client, create_run, query_counter
+):
+    """Tests that the number of queries to get a run doesn't grow with the
+    number of its steps."""
+    store = clean_client.zen_store
+
+    query_counts = {}
+    for index, step_count in enumerate(SIZES):
+        run_id = create_run(index, step_count=step_count)
+        with query_counter() as counter:
+            run = store.get_run(run_id)
+        assert len(run.steps) == step_count
+        query_counts[step_count] = counter.count
+
+    assert len(set(query_counts.values())) == 1, (
+        "Getting a run executed a different number of queries depending on "
+        f"the number of steps: {query_counts}"
+    )
+
+
+def test_listed_runs_match_fetched_runs(clean_client, create_runs):
+    """Tests that listing runs hydrates them the same way as fetching each
+    run separately."""
+    store = clean_client.zen_store
+    create_runs(SMALL_SIZE)
+
+    for run in store.list_runs(PipelineRunFilterModel()).items:
+        assert run == store.get_run(run.id)
+        step = run.steps["step_0"]
+        assert set(step.metadata) == {"accuracy"}
+        assert step.outputs["output"].producer_step_run_id == step.id
+        assert set(step.outputs["output"].metadata) == {"accuracy"}
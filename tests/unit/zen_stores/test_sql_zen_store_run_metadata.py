@@ -0,0 +1,253 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from zenml.metadata.metadata_types import MetadataTypeEnum
+from zenml.models import (
+    RunMetadataLeaderboardFilterModel,
+    RunMetadataRequestModel,
+)
+from zenml.zen_stores.schemas.run_metadata_schemas import (
+    get_typed_metadata_values,
+)
+from zenml.zen_stores.sql_zen_store import SqlZenStore
+
+
+@pytest.fixture
+def create_pipeline_run(clean_client, sample_pipeline_run_request_model):
+    """Fixture that creates pipeline runs in the clean client store."""
+
+    def _create_pipeline_run(name: str):
+        request = sample_pipeline_run_request_model.copy(
+            update={
+                "id": uuid4(),
+                "name": name,
+                "user": clean_client.active_user.id,
+                "workspace": clean_client.active_workspace.id,
+            }
+        )
+        return clean_client.zen_store.create_run(request)
+
+    return _create_pipeline_run
+
+
+def _create_metadata(clean_client, key, value, type_, **kwargs):
+    """Creates run metadata in the clean client store."""
+    return clean_client.zen_store.create_run_metadata(
+        RunMetadataRequestModel(
+            user=clean_client.active_user.id,
+            workspace=clean_client.active_workspace.id,
+            key=key,
+            value=value,
+            type=type_,
+            **kwargs,
+        )
+    )
+
+
+def test_typed_metadata_values():
+    """Tests extracting the typed values of metadata."""
+    assert get_typed_metadata_values(3, MetadataTypeEnum.INT) == (3.0, None)
+    assert get_typed_metadata_values(0.5, MetadataTypeEnum.FLOAT) == (
+        0.5,
+        None,
+    )
+    assert get_typed_metadata_values(float("nan"), MetadataTypeEnum.FLOAT) == (
+        None,
+        None,
+    )
+    assert get_typed_metadata_values("aria", MetadataTypeEnum.STRING) == (
+        None,
+        "aria",
+    )
+    assert get_typed_metadata_values("a" * 1000, MetadataTypeEnum.STRING) == (
+        None,
+        None,
+    )
+    assert get_typed_metadata_values([1, 2], MetadataTypeEnum.LIST) == (
+        None,
+        None,
+    )
+
+
+def test_filtering_by_typed_metadata_values(clean_client, create_pipeline_run):
+    """Tests filtering and sorting run metadata by their typed values."""
+    run = create_pipeline_run("run")
+    for value in [0.1, 0.9, 0.5]:
+        _create_metadata(
+            clean_client,
+            key="accuracy",
+            value=value,
+            type_=MetadataTypeEnum.FLOAT,
+            pipeline_run_id=run.id,
+        )
+    _create_metadata(
+        clean_client,
+        key="dataset",
+        value="aria",
+        type_=MetadataTypeEnum.STRING,
+        pipeline_run_id=run.id,
+    )
+
+    metadata = clean_client.list_run_metadata(numeric_value="gte:0.5")
+    assert {float(m.value) for m in metadata.items} == {0.5, 0.9}
+
+    metadata = clean_client.list_run_metadata(
+        key="accuracy", sort_by="desc:numeric_value"
+    )
+    assert [float(m.value) for m in metadata.items] == [0.9, 0.5, 0.1]
+
+    metadata = clean_client.list_run_metadata(string_value="aria")
+    assert [m.key for m in metadata.items] == ["dataset"]
+
+
+def test_run_metadata_leaderboard(clean_client, create_pipeline_run):
+    """Tests getting the best runs according to a metadata key."""
+    runs = [create_pipeline_run(f"run_{i}") for i in range(3)]
+    for run, value in zip(runs, [0.7, 0.9, 0.8]):
+        _create_metadata(
+            clean_client,
+            key="accuracy",
+            value=value,
+            type_=MetadataTypeEnum.FLOAT,
+            pipeline_run_id=run.id,
+        )
+    _create_metadata(
+        clean_client,
+        key="accuracy",
+        value="not_numeric",
+        type_=MetadataTypeEnum.STRING,
+        pipeline_run_id=runs[0].id,
+    )
+    _create_metadata(
+        clean_client,
+        key="loss",
+        value=0.1,
+        type_=MetadataTypeEnum.FLOAT,
+        pipeline_run_id=runs[0].id,
+    )
+
+    leaderboard = clean_client.get_run_metadata_leaderboard(
+        key="accuracy", size=2
+    )
+    assert leaderboard.count == 3
+    assert leaderboard.min == pytest.approx(0.7)
+    assert leaderboard.max == pytest.approx(0.9)
+    assert leaderboard.mean == pytest.approx(0.8)
+    assert [entry.pipeline_run_id for entry in leaderboard.entries] == [
+        runs[1].id,
+        runs[2].id,
+    ]
+    assert [entry.pipeline_run_name for entry in leaderboard.entries] == [
+        "run_1",
+        "run_2",
+    ]
+
+    leaderboard = clean_client.get_run_metadata_leaderboard(
+        key="accuracy", size=1, ascending=True
+    )
+    assert [entry.value for entry in leaderboard.entries] == [0.7]
+
+    leaderboard = clean_client.zen_store.get_run_metadata_leaderboard(
+        RunMetadataLeaderboardFilterModel(
+            key="accuracy",
+            start_time=datetime.utcnow() + timedelta(days=1),
+        )
+    )
+    assert leaderboard.count == 0
+    assert leaderboard.mean is None
+    assert leaderboard.entries == []
+
+
+def test_run_metadata_leaderboard_includes_step_metadata(
+    clean_client, create_pipeline_run, sample_step_request_model
+):
+    """Tests that step run metadata is ranked by its pipeline run."""
+    run = create_pipeline_run("run")
+    sample_step_request_model.user = clean_client.active_user.id
+    sample_step_request_model.workspace = clean_client.active_workspace.id
+    sample_step_request_model.pipeline_run_id = run.id
+    step_run = clean_client.zen_store.create_run_step(
+        sample_step_request_model
+    )
+    _create_metadata(
+        clean_client,
+        key="accuracy",
+        value=0.9,
+        type_=MetadataTypeEnum.FLOAT,
+        step_run_id=step_run.id,
+    )
+
+    leaderboard = clean_client.get_run_metadata_leaderboard(key="accuracy")
+    assert len(leaderboard.entries) == 1
+    assert leaderboard.entries[0].pipeline_run_id == run.id
+    assert leaderboard.entries[0].step_run_id == step_run.id
+
+
+def test_run_metadata_leaderboard_ranks_latest_value_per_run(
+    clean_client, create_pipeline_run
+):
+    """Tests that each run is ranked only once by its latest value."""
+    runs = [create_pipeline_run(f"run_{i}") for i in range(2)]
+    for run, values in zip(runs, [[0.9, 0.5], [0.7]]):
+        for value in values:
+            _create_metadata(
+                clean_client,
+                key="accuracy",
+                value=value,
+                type_=MetadataTypeEnum.FLOAT,
+                pipeline_run_id=run.id,
+            )
+
+    leaderboard = clean_client.get_run_metadata_leaderboard(key="accuracy")
+    assert leaderboard.count == 2
+    assert leaderboard.max == pytest.approx(0.7)
+    assert [
+        (entry.pipeline_run_id, entry.value) for entry in leaderboard.entries
+    ] == [(runs[1].id, 0.7), (runs[0].id, 0.5)]
+
+
+def test_run_metadata_leaderboard_without_window_functions(
+    clean_client, create_pipeline_run, monkeypatch
+):
+    """Tests ranking the latest value per run on databases without window
+    functions."""
+    monkeypatch.setattr(
+        SqlZenStore,
+        "_supports_window_functions",
+        staticmethod(lambda session: False),
+    )
+    runs = [create_pipeline_run(f"run_{i}") for i in range(3)]
+    for run, values in zip(runs, [[0.9, 0.5], [0.7], [0.3, 0.8]]):
+        for value in values:
+            _create_metadata(
+                clean_client,
+                key="accuracy",
+                value=value,
+                type_=MetadataTypeEnum.FLOAT,
+                pipeline_run_id=run.id,
+            )
+
+    leaderboard = clean_client.get_run_metadata_leaderboard(
+        key="accuracy", size=2
+    )
+    assert leaderboard.count == 3
+    assert leaderboard.min == pytest.approx(0.5)
+    assert leaderboard.max == pytest.approx(0.8)
+    assert [
+        (entry.pipeline_run_id, entry.value) for entry in leaderboard.entries
+    ] == [(runs[2].id, 0.8), (runs[1].id, 0.7)]
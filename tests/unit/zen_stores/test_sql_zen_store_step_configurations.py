@@ -0,0 +1,102 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from sqlmodel import Session
+
+from zenml.config.pipeline_configurations import PipelineConfiguration
+from zenml.config.step_configurations import Step
+from zenml.models import PipelineDeploymentRequestModel
+from zenml.zen_stores.schemas import StepRunSchema
+
+
+def _get_stored_step_configuration(clean_client, step_run_id):
+    """Gets the step configuration stored in the step run table."""
+    with Session(clean_client.zen_store.engine) as session:
+        return session.get(StepRunSchema, step_run_id).step_configuration
+
+
+def test_step_configurations_are_stored_once_per_deployment(
+    clean_client, sample_pipeline_run_request_model, sample_step_request_model
+):
+    """Tests that step runs reference the step configurations of their
+    deployment instead of storing a copy."""
+    deployment = clean_client.zen_store.create_deployment(
+        PipelineDeploymentRequestModel(
+            user=clean_client.active_user.id,
+            workspace=clean_client.active_workspace.id,
+            stack=clean_client.active_stack_model.id,
+            run_name_template="",
+            pipeline_configuration=PipelineConfiguration(name="pipeline"),
+            step_configurations={
+                sample_step_request_model.name: Step(
+                    spec=sample_step_request_model.spec,
+                    config=sample_step_request_model.config,
+                )
+            },
+        )
+    )
+    sample_pipeline_run_request_model.deployment = deployment.id
+    sample_pipeline_run_request_model.user = clean_client.active_user.id
+    sample_pipeline_run_request_model.workspace = (
+        clean_client.active_workspace.id
+    )
+    clean_client.zen_store.create_run(sample_pipeline_run_request_model)
+
+    sample_step_request_model.user = clean_client.active_user.id
+    sample_step_request_model.workspace = clean_client.active_workspace.id
+    sample_step_request_model.pipeline_run_id = (
+        sample_pipeline_run_request_model.id
+    )
+    step_run = clean_client.zen_store.create_run_step(
+        sample_step_request_model
+    )
+
+    assert _get_stored_step_configuration(clean_client, step_run.id) is None
+    step_run = clean_client.zen_store.get_run_step(step_run.id)
+    assert step_run.config == sample_step_request_model.config
+    assert step_run.spec == sample_step_request_model.spec
+
+    # Deleting the deployment copies the configuration to the step run
+    clean_client.zen_store.delete_deployment(deployment.id)
+    assert _get_stored_step_configuration(clean_client, step_run.id)
+    assert (
+        clean_client.zen_store.get_run_step(step_run.id).config
+        == sample_step_request_model.config
+    )
+
+
+def test_step_configurations_without_deployment_are_stored(
+    clean_client, sample_pipeline_run_request_model, sample_step_request_model
+):
+    """Tests that step runs store their configuration if it isn't part of
+    the deployment of their run."""
+    sample_pipeline_run_request_model.user = clean_client.active_user.id
+    sample_pipeline_run_request_model.workspace = (
+        clean_client.active_workspace.id
+    )
+    clean_client.zen_store.create_run(sample_pipeline_run_request_model)
+
+    sample_step_request_model.user = clean_client.active_user.id
+    sample_step_request_model.workspace = clean_client.active_workspace.id
+    sample_step_request_model.pipeline_run_id = (
+        sample_pipeline_run_request_model.id
+    )
+    step_run = clean_client.zen_store.create_run_step(
+        sample_step_request_model
+    )
+
+    assert _get_stored_step_configuration(clean_client, step_run.id)
+    assert (
+        clean_client.zen_store.get_run_step(step_run.id).config
+        == sample_step_request_model.config
+    )